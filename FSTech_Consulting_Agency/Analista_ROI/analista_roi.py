@@ -61,9 +61,12 @@ def run_analista_roi_task(task_description: str, context: dict = None):
         # Se não houver business_problem explícito, usar a transcrição como base
         if not context.get("business_problem"):
             context["business_problem"] = st.session_state.reuniao_transcricao
-        # Se não houver client_pain_points explícito, tentar extrair tópicos da transcrição (simples split)
+        # Se não houver client_pain_points explícito, usar os pontos de dor extraídos na ingestão
+        # (ou extraí-los agora, de forma limitada, de um resumo colado manualmente)
         if not context.get("client_pain_points"):
-            context["client_pain_points"] = [p.strip() for p in st.session_state.reuniao_transcricao.split("\n") if p.strip()]
+            from FSTech_Consulting_Agency.utils.transcript_ingest import extract_pain_points
+            context["client_pain_points"] = st.session_state.get("reuniao_pontos_dor") or \
+                extract_pain_points(st.session_state.reuniao_transcricao)
     # Simulação simplificada da escolha de ferramenta com base em keywords
     task_lower = task_description.lower()
     selected_tool = None
@@ -1,6 +1,7 @@
 # Agente: Arquiteto de Software
 
 import json
+import os
 
 # Importar ferramentas refatoradas
 from .tools import (
@@ -11,6 +12,10 @@ from .tools import (
     market_research_tool
 )
 
+# Teste de carga disparado pelo agente sem duração explícita: curto, para não travar a interface
+LOAD_TEST_DEFAULT_SECONDS = float(os.getenv("FSTECH_LOAD_TEST_DEFAULT_SECONDS", "30"))
+LOAD_TEST_DEFAULT_USERS = int(os.getenv("FSTECH_LOAD_TEST_DEFAULT_USERS", "10"))
+
 # --- Definição do Agente (Estilo OpenAI SDK) ---
 
 # Carregar instruções do arquivo .md (ou definir diretamente)
@@ -134,14 +139,19 @@ def run_arquiteto_task(task_description: str, context: dict = None):
     context = context or {}
     # NOVO: incorporar transcrição/resumo da reunião ao contexto, se disponível
     import streamlit as st
+    from FSTech_Consulting_Agency.utils.transcript_ingest import context_preview
     if hasattr(st, "session_state") and "reuniao_transcricao" in st.session_state and st.session_state.reuniao_transcricao:
         context["reuniao_transcricao"] = st.session_state.reuniao_transcricao
         # Se não houver requirements explícitos, usar a transcrição como base
         if not context.get("requirements"):
             context["requirements"] = [st.session_state.reuniao_transcricao]
+        # Componentes detectados na leitura do arquivo inteiro (o texto guardado pode estar truncado)
+        ingestao = st.session_state.get("reuniao_ingestao") or {}
+        if ingestao.get("components"):
+            context["reuniao_componentes"] = ingestao["components"]
     print(f"--- Executando Tarefa com Agente: {agent_def['name']} ---")
     print(f"Tarefa: {task_description}")
-    print(f"Contexto: {context}")
+    print(f"Contexto: {context_preview(context)}")
     print(f"Instruções do Agente: {agent_def['instructions'][:100]}...")
     print("Ferramentas Disponíveis:")
     for tool_func in agent_def['tools']:
@@ -157,6 +167,8 @@ def run_arquiteto_task(task_description: str, context: dict = None):
         args = {
             "requirements_text": context.get("reuniao_transcricao", "") or "\n".join(context.get("requirements", ["Requisito Padrão"]))
         }
+        if context.get("reuniao_transcricao") and context.get("reuniao_componentes"):
+            args["transcript_analysis"] = context["reuniao_componentes"]
     elif "blueprint" in task_lower or "especificação api" in task_lower:
         selected_tool = api_blueprint_generator.generate_api_blueprint
         args = {
@@ -165,12 +177,19 @@ def run_arquiteto_task(task_description: str, context: dict = None):
             "data_models": context.get("data_models", {})
         }
     elif "escalabilidade" in task_lower or "teste de carga" in task_lower:
+        # O teste envia tráfego real: sem endpoint explícito no contexto não há alvo padrão
+        if not context.get("endpoint"):
+            missing_endpoint = "Erro: informe o endpoint a ser testado no contexto ('endpoint'); o teste de carga envia requisições reais."
+            print(f"\n{missing_endpoint}")
+            return missing_endpoint, context
         selected_tool = scalability_tester.test_scalability
         args = {
-            "target_endpoint": context.get("endpoint", "http://example.com/api"),
-            "concurrent_users": context.get("users", 50),
-            "duration_minutes": context.get("duration", 2)
+            "target_endpoint": context["endpoint"],
+            "concurrent_users": context.get("users", LOAD_TEST_DEFAULT_USERS),
+            "duration_minutes": context.get("duration", 1)
         }
+        if "duration" not in context:
+            args["duration_seconds"] = LOAD_TEST_DEFAULT_SECONDS
     elif "segurança" in task_lower or "auditoria" in task_lower:
         selected_tool = security_audit_assistant.perform_security_audit
         args = {
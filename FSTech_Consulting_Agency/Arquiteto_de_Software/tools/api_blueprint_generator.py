@@ -1,5 +1,7 @@
 # Ferramenta: Gerador de Blueprint de API
 
+from FSTech_Consulting_Agency.utils.openapi_builder import BlueprintError, effective_format, generate_openapi_document
+
 # Simulação de um decorador para definir a ferramenta
 def function_tool(func):
     """Decorador simulado para registrar metadados da ferramenta."""
@@ -7,67 +9,40 @@ def function_tool(func):
     return func
 
 @function_tool
-def generate_api_blueprint(api_name: str, resources: list[dict], data_models: dict) -> str:
+def generate_api_blueprint(api_name: str, resources: list[dict], data_models: dict, output_format: str = "yaml") -> str:
     """Gera uma especificação de API (blueprint) no formato OpenAPI (Swagger).
 
     Use esta ferramenta para criar a documentação e definição formal de uma API
     com base nos recursos, endpoints e modelos de dados definidos.
 
     Args:
-        api_name: O nome da API (ex: 	API de Clientes FSTech	).
-        resources: Uma lista de dicionários descrevendo os recursos e endpoints (ex: [{	path	: 	/clientes	, 	methods	: [	GET	, 	POST	]}]).
-        data_models: Um dicionário definindo os modelos de dados (schemas) usados pela API (ex: {	Cliente	: {	properties	: {	name	: {	"type"	: 	"string"	}}}}).
+        api_name: O nome da API (ex: 'API de Clientes FSTech').
+        resources: Uma lista de dicionários descrevendo os recursos e endpoints (ex: [{'path': '/clientes', 'methods': ['GET', 'POST']}]).
+            Opcionalmente, 'model' indica o schema usado em corpo e respostas do recurso.
+        data_models: Um dicionário definindo os modelos de dados (schemas) usados pela API (ex: {'Cliente': {'properties': {'name': {'type': 'string'}}}}).
+        output_format: 'yaml' (padrão; sem o PyYAML, JSON com um comentário de aviso na primeira linha) ou 'json'.
 
     Returns:
-        Uma string contendo a especificação OpenAPI em formato YAML (simulado) ou uma mensagem de erro.
+        Uma string contendo a especificação OpenAPI 3.0 validada ou uma mensagem de erro.
     """
     # Validação básica
     if not api_name or not resources or not data_models:
         return "Erro: Nome da API (api_name), lista de recursos (resources) e modelos de dados (data_models) são necessários."
+    if output_format not in ("yaml", "json"):
+        return "Erro: output_format deve ser 'yaml' ou 'json'."
 
     print(f"Gerando blueprint OpenAPI para a API: {api_name}...")
+    try:
+        blueprint = generate_openapi_document(api_name, resources, data_models, output_format)
+    except BlueprintError as e:
+        return "Erro: a especificação gerada é inválida:\n" + "\n".join(f"- {problem}" for problem in e.problems)
 
-    # Lógica simulada para gerar OpenAPI YAML
-    openapi_spec = f"""openapi: 3.0.0
-info:
-  title: {api_name}
-  version: 1.0.0
-  description: API para gerenciar {api_name.split(	 	)[-2] if len(api_name.split()) > 2 else 	Recursos	} na FSTech.
-
-paths:"""
-
-    for resource in resources:
-        path = resource.get("path", "/unknown")
-        methods = resource.get("methods", ["GET"])
-        openapi_spec += f"\n  {path}:"
-        for method in methods:
-            method_lower = method.lower()
-            summary = f"{method.capitalize()} {path.split('/')[-1] if path != '/' else 'root'}"
-            operation_id = f"{method_lower}{path.replace('/', '_')}"
-            openapi_spec += f"\n    {method_lower}:"
-            openapi_spec += f"\n      summary: {summary}"
-            openapi_spec += f"\n      operationId: {operation_id}"
-            # Adicionar parâmetros e respostas simuladas básicas
-            if method_lower == "get":
-                openapi_spec += "\n      responses:\n        	200	:\n          description: Sucesso"
-            elif method_lower == "post":
-                 openapi_spec += "\n      requestBody:\n        content:\n          application/json:\n            schema:\n              $ref: 	#/components/schemas/{list(data_models.keys())[0] if data_models else 	DefaultModel	}	"
-                 openapi_spec += "\n      responses:\n        	201	:\n          description: Criado"
-
-    openapi_spec += "\n\ncomponents:\n  schemas:"
-    for model_name, model_details in data_models.items():
-        openapi_spec += f"\n    {model_name}:"
-        # Simplificação extrema da conversão do modelo
-        openapi_spec += f"\n      type: object"
-        if "properties" in model_details:
-            openapi_spec += "\n      properties:"
-            for prop_name, prop_details in model_details["properties"].items():
-                prop_type = prop_details.get("type", "string")
-                openapi_spec += f"\n        {prop_name}:\n          type: {prop_type}"
-
-    print("Blueprint OpenAPI (YAML simulado) gerado.")
-    # Em um cenário real, salvaria em arquivo .yaml
-    return openapi_spec
+    print(f"Blueprint OpenAPI gerado ({len(resources)} recursos).")
+    if effective_format(output_format) != output_format:
+        # Comentário YAML: o documento continua legível como YAML, e quem o recebe sabe do fallback
+        print("⚠️ PyYAML não instalado: blueprint gerado em JSON.")
+        return "# Aviso: PyYAML não está instalado; a especificação foi gerada em JSON (também é YAML válido).\n" + blueprint
+    return blueprint
 
 # Exemplo de uso (apenas para teste)
 if __name__ == "__main__":
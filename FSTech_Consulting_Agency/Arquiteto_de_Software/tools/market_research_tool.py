@@ -1,13 +1,17 @@
 # Ferramenta: Pesquisa de Mercado para Precificação e Estimativa de Prazos
 
-import os
 import re
 from dotenv import load_dotenv
-from openai import OpenAI
+
+from FSTech_Consulting_Agency.utils.openai_gateway import OpenAIConfigError, chat_completion
 
 # Carregar variáveis de ambiente
 load_dotenv()
 
+MARKET_RESEARCH_MODEL = "gpt-4.1"
+MARKET_RESEARCH_TEMPERATURE = 0.4
+MARKET_RESEARCH_SYSTEM_PROMPT = "Você é um especialista em pesquisa de mercado para projetos de tecnologia no Brasil, com amplo conhecimento sobre preços e prazos atuais."
+
 # Simulação de um decorador para definir a ferramenta
 def function_tool(func):
     """Decorador simulado para registrar metadados da ferramenta."""
@@ -29,19 +33,6 @@ def research_market_prices(project_description: str, complexity_level: str) -> d
         relevantes do mercado.
     """
     try:
-        # Verificar API key
-        openai_api_key = os.getenv("OPENAI_API_KEY")
-        if not openai_api_key:
-            return {
-                "status": "error",
-                "message": "OPENAI_API_KEY não encontrada nas variáveis de ambiente.",
-                "price_range": "R$ 8.000,00 - R$ 15.000,00",  # Valor fallback
-                "timeline": "4-8 semanas",                   # Timeline fallback
-                "market_factors": ["Valor baseado em estimativa padrão sem pesquisa de mercado"]
-            }
-        
-        client = OpenAI(api_key=openai_api_key)
-        
         # Criar prompt que simula uma pesquisa de mercado detalhada
         prompt = f"""
         Você é um especialista em pesquisa de mercado para projetos de tecnologia no Brasil.
@@ -64,19 +55,23 @@ def research_market_prices(project_description: str, complexity_level: str) -> d
         }}
         """
         
-        # Realizar a "pesquisa" (consulta ao modelo)
-        completion = client.chat.completions.create(
-            model="gpt-4.1",
-            messages=[
-                {"role": "system", "content": "Você é um especialista em pesquisa de mercado para projetos de tecnologia no Brasil, com amplo conhecimento sobre preços e prazos atuais."},
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.4
-        )
-        
-        # Extrair o conteúdo JSON da resposta
-        json_str = completion.choices[0].message.content
+        try:
+            # Realizar a "pesquisa" (consulta ao modelo via gateway compartilhado, com cache)
+            json_str = chat_completion(
+                prompt,
+                system_prompt=MARKET_RESEARCH_SYSTEM_PROMPT,
+                model=MARKET_RESEARCH_MODEL,
+                temperature=MARKET_RESEARCH_TEMPERATURE,
+                response_format="json_object"
+            )
+        except OpenAIConfigError:
+            return {
+                "status": "error",
+                "message": "OPENAI_API_KEY não encontrada nas variáveis de ambiente.",
+                "price_range": "R$ 8.000,00 - R$ 15.000,00",  # Valor fallback
+                "timeline": "4-8 semanas",                   # Timeline fallback
+                "market_factors": ["Valor baseado em estimativa padrão sem pesquisa de mercado"]
+            }
         
         # Usar regex para extrair apenas o JSON (caso haja texto antes ou depois)
         json_match = re.search(r'({.*})', json_str, re.DOTALL)
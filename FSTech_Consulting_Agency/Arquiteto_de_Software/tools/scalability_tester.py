@@ -1,7 +1,10 @@
 # Ferramenta: Testador de Escalabilidade
 
-import random
-import time
+from FSTech_Consulting_Agency.utils.load_generator import LoadGenerator, RequestSpec, format_report, run_distributed
+
+# Limites usados na conclusão do relatório
+ERROR_RATE_ALERT = 0.05      # fração de requisições com erro
+P95_ALERT_MS = 1000.0        # p95 acima disso indica degradação perceptível
 
 # Simulação de um decorador para definir a ferramenta
 def function_tool(func):
@@ -9,83 +12,99 @@ def function_tool(func):
     func._is_tool = True
     return func
 
+def _conclusion(result):
+    """Avaliação textual do resultado (limites ERROR_RATE_ALERT e P95_ALERT_MS)."""
+    if not result["requests"]:
+        return "Nenhuma requisição foi concluída no período; verifique se o endpoint está acessível."
+    error_rate = result["failures"] / result["requests"]
+    p95 = result["latency_ms"]["p95"]
+    problems = []
+    if error_rate > ERROR_RATE_ALERT:
+        problems.append(f"taxa de erro de {error_rate * 100:.1f}% (limite {ERROR_RATE_ALERT * 100:.0f}%)")
+    if p95 > P95_ALERT_MS:
+        problems.append(f"p95 de {p95:.0f} ms (limite {P95_ALERT_MS:.0f} ms)")
+    if result["dropped"]:
+        problems.append(f"{result['dropped']} chegadas descartadas por falta de capacidade")
+    if problems:
+        return "O sistema apresentou degradação sob a carga testada: " + "; ".join(problems) + "."
+    return (f"O sistema sustentou {result['throughput_rps']:.1f} reqs/seg com p95 de {p95:.0f} ms "
+            f"e taxa de erro de {error_rate * 100:.2f}% sob a carga testada.")
+
 @function_tool
-def test_scalability(target_endpoint: str, concurrent_users: int, duration_minutes: int) -> str:
-    """Realiza um teste de carga simulado para avaliar a escalabilidade de um endpoint.
+def test_scalability(target_endpoint: str, concurrent_users: int, duration_minutes: int,
+                     ramp_up_seconds: float = 0, requests_per_second: float = None,
+                     request_mix: list = None, duration_seconds: float = None, processes: int = 1) -> str:
+    """Realiza um teste de carga real para avaliar a escalabilidade de um endpoint.
 
-    Use esta ferramenta para simular o acesso de múltiplos usuários concorrentes a um
-    endpoint específico da aplicação e medir seu desempenho sob carga.
+    Use esta ferramenta para gerar acesso de múltiplos usuários concorrentes a um
+    endpoint específico da aplicação e medir seu desempenho sob carga
+    (utils/load_generator.py: asyncio, conexões keep-alive, histograma de latências).
 
     Args:
         target_endpoint: A URL completa do endpoint a ser testado.
-        concurrent_users: O número de usuários virtuais simultâneos a simular.
+        concurrent_users: O número de usuários virtuais simultâneos (no modelo aberto,
+            o máximo de requisições em andamento).
         duration_minutes: A duração do teste em minutos.
+        ramp_up_seconds: (Opcional) Segundos para subir a carga de zero ao alvo.
+        requests_per_second: (Opcional) Taxa de chegada fixa; se informada, usa o modelo
+            aberto em vez de usuários em ciclo fechado.
+        request_mix: (Opcional) Lista de requisições sorteadas por peso, ex:
+            [{"method": "GET", "path": "/produtos", "weight": 8},
+             {"method": "POST", "path": "/pedidos", "body": {...}, "weight": 2}].
+            Caminhos relativos usam o target_endpoint como base. Padrão: GET no target_endpoint.
+        duration_seconds: (Opcional) Duração em segundos; substitui duration_minutes
+            (útil para testes curtos).
+        processes: (Opcional) Processos geradores de carga (0 = um por CPU). Acima de 1, a
+            carga é dividida entre eles e os resultados somados num único relatório.
 
     Returns:
         Uma string formatada em Markdown com o resumo dos resultados do teste de carga ou uma mensagem de erro.
     """
     # Validação básica
-    if not target_endpoint or not concurrent_users or not duration_minutes:
+    if not target_endpoint or not concurrent_users or not (duration_minutes or duration_seconds):
         return "Erro: Endpoint (target_endpoint), número de usuários (concurrent_users) e duração (duration_minutes) são necessários."
     if not target_endpoint.startswith("http"): # Validação simples de URL
         return "Erro: target_endpoint deve ser uma URL válida (iniciando com http ou https)."
     if not isinstance(concurrent_users, int) or concurrent_users <= 0:
         return "Erro: concurrent_users deve ser um inteiro positivo."
-    if not isinstance(duration_minutes, int) or duration_minutes <= 0:
+    if duration_seconds is None and (not isinstance(duration_minutes, int) or duration_minutes <= 0):
         return "Erro: duration_minutes deve ser um inteiro positivo."
+    if requests_per_second is not None and requests_per_second <= 0:
+        return "Erro: requests_per_second deve ser positivo."
+    if not isinstance(processes, int) or processes < 0:
+        return "Erro: processes deve ser um inteiro maior ou igual a zero."
+
+    try:
+        if request_mix:
+            requests = [RequestSpec.from_dict(item, base_url=target_endpoint) for item in request_mix]
+        else:
+            requests = [RequestSpec("GET", target_endpoint)]
+        generator = LoadGenerator(
+            requests,
+            concurrency=concurrent_users,
+            duration=duration_seconds if duration_seconds is not None else duration_minutes * 60,
+            ramp_up=ramp_up_seconds or 0,
+            rate=requests_per_second,
+        )
+    except (ValueError, TypeError) as e:
+        return f"Erro: configuração de carga inválida: {e}"
 
     print(f"Iniciando teste de escalabilidade no endpoint: {target_endpoint}")
-    print(f"Configuração: {concurrent_users} usuários concorrentes por {duration_minutes} minutos...")
-
-    # Lógica simulada de teste de carga
-    # Em um cenário real, usaria ferramentas como k6, Locust, JMeter via linha de comando
-    start_time = time.time()
-    total_requests = 0
-    successful_requests = 0
-    failed_requests = 0
-    response_times = []
-
-    # Simular execução do teste
-    print("Teste em andamento (simulado)...")
-    time.sleep(min(duration_minutes * 2, 5)) # Simular duração (limitado a 5s para não bloquear)
-
-    # Gerar resultados simulados
-    total_requests = concurrent_users * duration_minutes * random.randint(30, 60) # Req/min simulado
-    failed_requests = int(total_requests * random.uniform(0.0, 0.05)) # Taxa de erro simulada < 5%
-    successful_requests = total_requests - failed_requests
-    avg_response_time = random.uniform(50, 500) # ms
-    p95_response_time = avg_response_time * random.uniform(1.5, 2.5)
-    throughput = successful_requests / (duration_minutes * 60) # Req/seg
-
-    end_time = time.time()
-    actual_duration_seconds = end_time - start_time
-
-    results_summary = f"""# Resumo do Teste de Escalabilidade (Simulado)
-
-**Endpoint Testado:** {target_endpoint}
-**Configuração:** {concurrent_users} usuários concorrentes
-**Duração Real (Simulada):** {actual_duration_seconds:.2f} segundos (Configurado para {duration_minutes} min)
-
-## Métricas Principais:
-- **Total de Requisições:** {total_requests}
-- **Requisições Bem-sucedidas:** {successful_requests}
-- **Requisições Falhas:** {failed_requests} ({ (failed_requests / total_requests * 100) if total_requests > 0 else 0 :.2f}%)
-- **Taxa de Transferência (Throughput):** {throughput:.2f} reqs/seg
-- **Tempo Médio de Resposta:** {avg_response_time:.2f} ms
-- **Percentil 95 (P95) Tempo de Resposta:** {p95_response_time:.2f} ms
-
-## Conclusão (Simulada):
-- [Avaliação simulada: Ex: O sistema demonstrou boa performance sob a carga testada, ou, O sistema apresentou degradação X...]
-
-*Nota: Este é um resultado de teste simulado.*
-"""
-
-    print("Teste de escalabilidade concluído (simulado).")
-    return results_summary
+    print(f"Configuração: {concurrent_users} usuários concorrentes por {generator.duration:g} segundos "
+          f"(modelo {generator.model}, ramp-up {generator.ramp_up:g}s)...")
+    if processes == 1:
+        result = generator.run()
+    else:
+        result = run_distributed(generator.requests, processes=processes or None, concurrency=generator.concurrency,
+                                 duration=generator.duration, ramp_up=generator.ramp_up, rate=generator.rate)
+    print(f"Teste de escalabilidade concluído: {result['requests']} requisições, "
+          f"{result['throughput_rps']} reqs/seg, p95 {result['latency_ms']['p95']} ms.")
+
+    return format_report(result, endpoint=target_endpoint) + f"\n## Conclusão:\n- {_conclusion(result)}\n"
 
 # Exemplo de uso (apenas para teste)
 if __name__ == "__main__":
     endpoint = "https://api.fstech.example.com/v1/process"
-    results = test_scalability(target_endpoint=endpoint, concurrent_users=100, duration_minutes=5)
+    results = test_scalability(target_endpoint=endpoint, concurrent_users=10, duration_minutes=1, duration_seconds=10)
     print(results)
 
@@ -1,6 +1,28 @@
 # Ferramenta: Assistente de Auditoria de Segurança
 
-import random
+import os
+
+from FSTech_Consulting_Agency.utils.security_scanner import (
+    SEVERITIES, compile_rules, recommendations_for, scan_text, scan_tree)
+
+# Achados listados por extenso no relatório (o restante aparece só nas contagens)
+MAX_REPORTED_FINDINGS = 50
+
+# Checklist por área de foco: (palavras que identificam a área, verificação, recomendação)
+FOCUS_CHECKLIST = [
+    (("autentica", "login", "identidade"), "Autenticação: MFA, política de senhas e expiração de sessões.",
+     "Implementar autenticação multifator (MFA) obrigatória para todos os acessos privilegiados."),
+    (("acesso", "autoriza", "permiss"), "Controle de Acesso: menor privilégio e segregação de funções.",
+     "Aplicar o princípio do menor privilégio (RBAC) e revisar permissões periodicamente."),
+    (("dados", "criptograf", "lgpd", "privacidade"), "Segurança de Dados: criptografia em repouso e em trânsito.",
+     "Garantir que todos os dados sensíveis sejam criptografados em repouso e em trânsito (TLS 1.2+)."),
+    (("rede", "vpc", "firewall", "security group"), "Configuração de Rede: exposição de portas e segmentação.",
+     "Restringir regras de entrada a origens conhecidas e isolar bancos de dados em sub-redes privadas."),
+    (("segredo", "credencia", "chave"), "Gestão de Segredos: segredos fora do código e rotação.",
+     "Centralizar segredos num cofre (Vault/Secrets Manager) e rotacioná-los periodicamente."),
+    (("log", "monitor", "auditoria"), "Logs e Monitoramento: trilha de auditoria e alertas.",
+     "Centralizar logs de acesso e configurar alertas para eventos de segurança."),
+]
 
 # Simulação de um decorador para definir a ferramenta
 def function_tool(func):
@@ -8,75 +30,90 @@ def function_tool(func):
     func._is_tool = True
     return func
 
+def _focus_checklist(audit_focus):
+    checks, recommendations = [], []
+    for focus in audit_focus:
+        lowered = focus.lower()
+        for keywords, check, recommendation in FOCUS_CHECKLIST:
+            if any(keyword in lowered for keyword in keywords) and check not in checks:
+                checks.append(check)
+                recommendations.append(recommendation)
+    return checks, recommendations
+
 @function_tool
-def perform_security_audit(target_system_description: str, audit_focus: list[str]) -> str:
-    """Realiza uma auditoria de segurança simulada em um sistema ou arquitetura.
+def perform_security_audit(target_system_description: str, audit_focus: list[str], source_path: str = None,
+                           incremental: bool = True, processes: int = None) -> str:
+    """Realiza uma auditoria de segurança em um sistema ou arquitetura.
 
     Use esta ferramenta para identificar potenciais vulnerabilidades de segurança
-    com base na descrição do sistema e nas áreas de foco especificadas.
+    com base na descrição do sistema e nas áreas de foco especificadas. Se `source_path`
+    apontar para o código-fonte ou pacote de configurações do cliente, a árvore é
+    escaneada por regras (segredos, configurações inseguras, chamadas perigosas) —
+    ver utils/security_scanner.py.
 
     Args:
         target_system_description: Uma descrição do sistema ou arquitetura a ser auditado.
-        audit_focus: Uma lista de áreas de foco para a auditoria (ex: [	Autenticação	, 	Controle de Acesso	, 	Segurança de Dados	, 	Configuração de Rede	]).
+        audit_focus: Uma lista de áreas de foco para a auditoria (ex: ['Autenticação', 'Controle de Acesso', 'Segurança de Dados', 'Configuração de Rede']).
+        source_path: (Opcional) Diretório local com o código/configurações a escanear.
+        incremental: (Opcional) Reescaneia apenas arquivos alterados desde a última auditoria do mesmo diretório.
+        processes: (Opcional) Processos usados no escaneamento (padrão: um por CPU).
 
     Returns:
-        Uma string formatada em Markdown com o relatório da auditoria de segurança simulada ou uma mensagem de erro.
+        Uma string formatada em Markdown com o relatório da auditoria de segurança ou uma mensagem de erro.
     """
     # Validação básica
     if not target_system_description or not audit_focus or not isinstance(audit_focus, list):
         return "Erro: Descrição do sistema (target_system_description) e lista de focos da auditoria (audit_focus) são necessários."
+    if source_path and not os.path.isdir(source_path):
+        return f"Erro: source_path '{source_path}' não é um diretório acessível."
 
     print(f"Iniciando auditoria de segurança no sistema descrito, com foco em: {audit_focus}...")
     print(f"Descrição do Sistema: {target_system_description[:100]}...")
 
-    # Lógica simulada de auditoria de segurança
-    # Em um cenário real, poderia usar LLMs para analisar a descrição contra checklists de segurança (OWASP, CIS), ou integrar com ferramentas de scan.
-
-    findings = []
-    recommendations = []
-
-    # Gerar descobertas e recomendações simuladas baseadas no foco
-    for focus in audit_focus:
-        risk_level = random.choice(["Informativo", "Baixo", "Médio", "Alto"])
-        finding_desc = f"[Simulado - {risk_level}] Potencial problema encontrado relacionado a {focus}."
-        recommendation_desc = f"[Simulado] Recomenda-se revisar as práticas de {focus} e aplicar [Melhor Prática Específica]."
-        
-        # Adicionar alguma variação
-        if "autenticação" in focus.lower() and risk_level in ["Médio", "Alto"]:
-            finding_desc += " Ex: Falta de MFA para usuários administrativos."
-            recommendation_desc = f"[Simulado] Implementar autenticação multifator (MFA) obrigatória para todos os acessos privilegiados."
-        elif "dados" in focus.lower() and risk_level in ["Médio", "Alto"]:
-             finding_desc += " Ex: Dados sensíveis podem não estar criptografados em repouso."
-             recommendation_desc = f"[Simulado] Garantir que todos os dados sensíveis sejam criptografados em repouso usando algoritmos fortes."
-        
-        findings.append(finding_desc)
-        recommendations.append(recommendation_desc)
-
-    audit_report = f"""# Relatório de Auditoria de Segurança (Simulado)
-
-**Sistema Auditado:** Descrito como "{target_system_description[:50]}..."
-**Foco da Auditoria:** { ", ".join(audit_focus) }
-
-## Descobertas Principais:
-"""
-    if findings:
-        for finding in findings:
-            audit_report += f"- {finding}\n"
+    rules = compile_rules()
+    stats = None
+    if source_path:
+        result = scan_tree(source_path, rules=rules, processes=processes, incremental=incremental)
+        findings, stats = result["findings"], result["stats"]
     else:
-        audit_report += "- Nenhuma descoberta significativa (simulado).\n"
-
-    audit_report += "\n## Recomendações:\n"
-
-    if recommendations:
-        for recommendation in recommendations:
-            audit_report += f"- {recommendation}\n"
+        # Sem código-fonte: as regras ainda valem para trechos de configuração colados na descrição
+        findings = scan_text(target_system_description, "descrição", rules)
+
+    checks, recommendations = _focus_checklist(audit_focus)
+    recommendations = recommendations_for(findings, rules) + recommendations
+
+    counts = {severity: sum(1 for f in findings if f["severity"] == severity) for severity in SEVERITIES}
+    lines = [
+        "# Relatório de Auditoria de Segurança", "",
+        f"**Sistema Auditado:** Descrito como \"{target_system_description[:50]}...\"",
+        f"**Foco da Auditoria:** {', '.join(audit_focus)}",
+    ]
+    if stats:
+        lines.append(f"**Código Analisado:** {source_path} — {stats['files']} arquivos "
+                     f"({stats['scanned']} escaneados, {stats['reused'] + stats['unchanged']} sem alteração desde "
+                     f"a última auditoria) em {stats['elapsed_seconds']:.2f}s")
+    lines += ["", "## Descobertas Principais:",
+              "**Por severidade:** " + ", ".join(f"{severity}: {count}" for severity, count in counts.items())]
+    if findings:
+        for finding in findings[:MAX_REPORTED_FINDINGS]:
+            lines.append(f"- [{finding['severity']}] {finding['title']} — `{finding['path']}:{finding['line']}` "
+                         f"(`{finding['snippet']}`)")
+        if len(findings) > MAX_REPORTED_FINDINGS:
+            lines.append(f"- ... e mais {len(findings) - MAX_REPORTED_FINDINGS} achados.")
     else:
-        audit_report += "- Nenhuma recomendação específica gerada (simulado).\n"
-
-    audit_report += "\n*Nota: Este é um relatório de auditoria simulado. Uma análise real requer ferramentas e expertise específicas.*\n"
-
-    print("Auditoria de segurança concluída (simulada).")
-    return audit_report
+        lines.append("- Nenhuma vulnerabilidade encontrada pelas regras automáticas.")
+
+    if checks:
+        lines += ["", "## Verificações Manuais por Foco:"] + [f"- {check}" for check in checks]
+    lines += ["", "## Recomendações:"]
+    lines += [f"- {recommendation}" for recommendation in recommendations] or \
+        ["- Nenhuma recomendação específica gerada."]
+    if not source_path:
+        lines += ["", "*Nota: sem código-fonte (source_path), apenas a descrição foi analisada; "
+                      "informe o diretório do projeto para uma auditoria das regras automáticas.*"]
+
+    print(f"Auditoria de segurança concluída: {len(findings)} achados.")
+    return "\n".join(lines) + "\n"
 
 # Exemplo de uso (apenas para teste)
 if __name__ == "__main__":
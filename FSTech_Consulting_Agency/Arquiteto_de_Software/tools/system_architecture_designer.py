@@ -1,6 +1,6 @@
 # Ferramenta: Designer de Arquitetura de Sistema e Avaliador de Complexidade
 
-import re
+from FSTech_Consulting_Agency.utils.component_catalog import get_component_catalog
 
 # Simulação de um decorador para definir a ferramenta
 def function_tool(func):
@@ -8,77 +8,40 @@ def function_tool(func):
     func._is_tool = True
     return func
 
-# Palavras-chave associadas a componentes comuns e sua pontuação de complexidade
-COMPONENT_KEYWORDS = {
-    "api": {"name": "API REST/GraphQL", "score": 2},
-    "banco de dados": {"name": "Banco de Dados (SQL/NoSQL)", "score": 2},
-    "database": {"name": "Banco de Dados (SQL/NoSQL)", "score": 2},
-    "sql": {"name": "Banco de Dados (SQL)", "score": 2},
-    "nosql": {"name": "Banco de Dados (NoSQL)", "score": 2},
-    "frontend": {"name": "Frontend Web (React/Vue/Angular)", "score": 2},
-    "interface web": {"name": "Frontend Web", "score": 2},
-    "site": {"name": "Frontend Web", "score": 1},
-    "aplicativo móvel": {"name": "Aplicativo Móvel (iOS/Android)", "score": 3},
-    "mobile app": {"name": "Aplicativo Móvel (iOS/Android)", "score": 3},
-    "inteligência artificial": {"name": "Componente de IA/ML", "score": 3},
-    "machine learning": {"name": "Componente de IA/ML", "score": 3},
-    "modelo de ia": {"name": "Componente de IA/ML", "score": 3},
-    "llm": {"name": "Integração com LLM", "score": 2},
-    "gpt": {"name": "Integração com LLM (GPT)", "score": 2},
-    "integração": {"name": "Integração com Sistema Externo", "score": 2},
-    "webhook": {"name": "Integração via Webhook", "score": 1},
-    "automação": {"name": "Fluxo de Automação", "score": 1},
-    "pagamento": {"name": "Integração de Pagamento", "score": 2},
-    "login": {"name": "Sistema de Autenticação", "score": 1},
-    "autenticação": {"name": "Sistema de Autenticação", "score": 1},
-    "dashboard": {"name": "Painel de Controle/Dashboard", "score": 1},
-    "relatórios": {"name": "Geração de Relatórios", "score": 1}
-}
-
-# Limites de pontuação para níveis de complexidade
-COMPLEXITY_THRESHOLDS = {
-    "baixa": 4,
-    "media": 8,
-    "alta": float("inf") # Qualquer coisa acima de 8
-}
+# Palavras-chave, pontuações e limites de complexidade ficam em Arquiteto_de_Software/component_catalog.json,
+# compilados uma única vez e recarregados automaticamente quando o arquivo muda (utils/component_catalog.py)
 
 @function_tool
-def design_architecture_and_assess_complexity(requirements_text: str) -> str:
+def design_architecture_and_assess_complexity(requirements_text: str, transcript_analysis: dict = None) -> str:
     """Analisa um texto de requisitos técnicos, sugere componentes de arquitetura
     e estima a complexidade geral (baixa, media, alta).
 
     Args:
         requirements_text: O texto descrevendo os requisitos técnicos do projeto.
+        transcript_analysis: (Opcional) Resultado do ComponentAnalyzer sobre a transcrição inteira
+            (utils/transcript_ingest.py), com "component_scores" e "score". Quando informado, é usado
+            no lugar da análise de requirements_text, que pode ser só o início de uma transcrição longa.
 
     Returns:
         Uma string contendo o esboço da arquitetura sugerida e o nível de complexidade estimado.
     """
-    if not requirements_text:
+    if not requirements_text and not transcript_analysis:
         return "Erro: O texto de requisitos não pode estar vazio."
 
-    detected_components = set()
-    total_score = 0
-    architecture_sketch = []
-
-    # Normalizar texto para minúsculas para busca case-insensitive
-    normalized_text = requirements_text.lower()
-
-    # Buscar palavras-chave no texto
-    for keyword, data in COMPONENT_KEYWORDS.items():
-        # Usar regex para encontrar palavras inteiras
-        if re.search(r"\b" + re.escape(keyword) + r"\b", normalized_text):
-            component_name = data["name"]
-            if component_name not in detected_components:
-                detected_components.add(component_name)
-                total_score += data["score"]
-                architecture_sketch.append(f"- {component_name} (Score: {data['score']})")
+    catalog = get_component_catalog()
+    if transcript_analysis and "component_scores" in transcript_analysis:
+        # Componentes já detectados durante a leitura do arquivo completo
+        scored_components = list(transcript_analysis["component_scores"].items())
+        total_score = transcript_analysis.get("score", sum(score for _, score in scored_components))
+    else:
+        # Componentes presentes no texto (todas as palavras-chave numa só passada), na ordem do catálogo
+        hits, total_score = catalog.score(requirements_text)
+        scored_components = [(catalog.components[index], score) for index, score in hits]
+    detected_components = [component for component, _ in scored_components]
+    architecture_sketch = [f"- {component} (Score: {score})" for component, score in scored_components]
 
     # Determinar nível de complexidade
-    complexity_level = "baixa" # Padrão
-    if total_score > COMPLEXITY_THRESHOLDS["media"]:
-        complexity_level = "alta"
-    elif total_score > COMPLEXITY_THRESHOLDS["baixa"]:
-        complexity_level = "media"
+    complexity_level = catalog.complexity_level(total_score)
 
     # Montar resultado
     if not architecture_sketch:
@@ -90,7 +90,8 @@ def build_proposal_markdown(
     architecture_sketch: str,
     price: str,
     estimated_timeline: str,
-    output_dir: str = "/home/ubuntu/proposals"
+    output_dir: str = "/home/ubuntu/proposals",
+    template: str = None
 ) -> str:
     """Gera um documento de proposta comercial em formato Markdown.
 
@@ -105,6 +106,7 @@ def build_proposal_markdown(
         price: O preço final calculado para a proposta (idealmente vindo do pricing_calculator).
         estimated_timeline: O prazo estimado para conclusão do projeto (ex: "4-6 semanas", "3 meses").
         output_dir: (Opcional) Diretório onde o arquivo .md será salvo (padrão: /home/ubuntu/proposals).
+        template: (Opcional) Template Markdown alternativo com os mesmos campos de PROPOSAL_TEMPLATE.
 
     Returns:
         O caminho absoluto para o arquivo Markdown da proposta gerada ou uma mensagem de erro.
@@ -119,7 +121,7 @@ def build_proposal_markdown(
     current_date = datetime.now().strftime("%d/%m/%Y")
 
     # Preencher o template
-    proposal_content = PROPOSAL_TEMPLATE.format(
+    proposal_content = (template or PROPOSAL_TEMPLATE).format(
         client_name=client_name,
         client_company=client_company,
         date=current_date,
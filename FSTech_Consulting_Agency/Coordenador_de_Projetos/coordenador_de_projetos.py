@@ -44,6 +44,7 @@ COORDENADOR_TOOLS = [
     project_timeline_manager.manage_project_timeline, # Pode precisar integrar com ClickUp também
     task_assignment_manager.manage_task_assignment, # Pode precisar integrar com ClickUp também
     progress_tracker.track_task_progress, # Integrado com ClickUp
+    progress_tracker.view_project_progress, # Integrado com ClickUp (projeto inteiro)
     client_update_sender.send_client_update,
     crm_project_status_updater.update_crm_project_status # Integrado com ClickUp
 ]
@@ -103,6 +104,12 @@ def run_coordenador_task(task_description: str, context: dict = None):
             "assignee_email": context.get("assignee_email"),
             "due_date": context.get("due_date")
         }
+    elif "progresso" in task_lower and "projeto" in task_lower and "tarefa" not in task_lower:
+        selected_tool = progress_tracker.view_project_progress
+        args = {
+            "list_id": context.get("list_id"),
+            "folder_id": context.get("folder_id"),
+        }
     elif ("progresso" in task_lower or "status" in task_lower) and "tarefa" in task_lower:
         # Esta ferramenta foi refatorada para ClickUp
         selected_tool = progress_tracker.track_task_progress
@@ -4,7 +4,7 @@ import datetime
 import random
 
 # Importar utilitário ClickUp
-from FSTech_Consulting_Agency.utils.clickup_client import get_clickup_client, update_task_status, STATUS_MAP
+from FSTech_Consulting_Agency.utils.clickup_client import get_clickup_client, get_task, update_task_status, STATUS_MAP
 
 # Simulação de um decorador para definir a ferramenta
 def function_tool(func):
@@ -12,10 +12,11 @@ def function_tool(func):
     func._is_tool = True
     return func
 
-# NOTA: A visualização de progresso do projeto (view_project_progress) 
-# precisaria buscar *todas* as tarefas do projeto via API, 
-# o que pode ser mais complexo e lento. 
-# Vamos focar em visualizar e atualizar status de tarefas individuais por enquanto.
+# NOTA: A visualização de status consulta primeiro o log de eventos recebidos por webhook
+# (utils/clickup_webhook.py), depois o espelho local do CRM (utils/crm_mirror.py), e só então
+# recorre à API do ClickUp. Webhook e espelho só respondem se o dado tiver menos de
+# CRM_MIRROR_MAX_AGE segundos; o evento de webhook, além disso, não pode ser anterior à
+# última sincronização do espelho.
 
 @function_tool
 def track_task_progress(task_id: str, new_status_key: str = None) -> str:
@@ -61,19 +62,96 @@ def track_task_progress(task_id: str, new_status_key: str = None) -> str:
     # Se new_status_key não for fornecido, apenas visualiza
     else:
         print(f"Executando ação de visualização de status para tarefa {task_id}...")
+        # Consulta primeiro o status recebido por webhook e o espelho local do CRM; só vai à API se não houver registro
         try:
-            task = client.get_task(task_id)
-            if task and task.status:
+            from FSTech_Consulting_Agency.utils.clickup_webhook import latest_task_status
+            via_webhook = latest_task_status(task_id)
+        except Exception:
+            via_webhook = None
+        from FSTech_Consulting_Agency.utils.crm_mirror import CRM_MIRROR_MAX_AGE, get_crm_mirror
+        try:
+            mirror = get_crm_mirror()
+            espelhada = mirror.get_task(task_id)
+            sincronizado_em = mirror.last_synced_at(espelhada["list_id"]) if espelhada else None
+        except Exception:
+            espelhada, sincronizado_em = None, None
+        agora = datetime.datetime.now().timestamp()
+        idade_espelho = None if sincronizado_em is None else max(0.0, agora - sincronizado_em)
+        # O evento de webhook vale pela mesma regra do espelho: recente e não anterior à última sincronização
+        # (nossas próprias escritas e as mudanças feitas com o receptor parado não chegam ao log)
+        if via_webhook:
+            evento_em = via_webhook["event_date"] / 1000
+            idade = max(0, int(agora - evento_em))
+            if idade <= CRM_MIRROR_MAX_AGE and (sincronizado_em is None or evento_em >= sincronizado_em):
+                nome = espelhada["name"][:30] if espelhada else ""
+                return f"Status atual da Tarefa {task_id} (	{nome}...	) no ClickUp: {via_webhook['status']} (via webhook, há {idade}s)"
+        # O espelho só responde se foi sincronizado há pouco; senão, a API tem a palavra final
+        if espelhada and idade_espelho is not None and idade_espelho <= CRM_MIRROR_MAX_AGE:
+            return (f"Status atual da Tarefa {task_id} (	{espelhada['name'][:30]}...	) no ClickUp: {espelhada['status']} "
+                    f"(espelho local, sincronizado há {int(idade_espelho)}s)")
+        try:
+            task = get_task(task_id)
+            if task and task.get("status"):
                 # Acessar o nome do status dentro do objeto status
-                current_status_name = task.status.status 
-                return f"Status atual da Tarefa {task_id} (	{task.name[:30]}...	) no ClickUp: {current_status_name}"
+                current_status_name = task["status"].get("status")
+                return f"Status atual da Tarefa {task_id} (	{task.get('name', '')[:30]}...	) no ClickUp: {current_status_name}"
             elif task:
                  return f"Tarefa {task_id} encontrada, mas sem informação de status clara na resposta: {task}"
+            elif espelhada:
+                # API sem resposta: mostra o espelho desatualizado, deixando clara a idade do dado
+                idade = "nunca sincronizado" if idade_espelho is None else f"sincronizado há {int(idade_espelho)}s"
+                return (f"Status da Tarefa {task_id} (	{espelhada['name'][:30]}...	) no espelho local: {espelhada['status']} "
+                        f"({idade}; não foi possível confirmar no ClickUp)")
             else:
                 return f"Erro: Tarefa com ID {task_id} não encontrada no ClickUp."
         except Exception as e:
             return f"Erro ao buscar status da tarefa {task_id} no ClickUp: {e}"
 
+@function_tool
+def view_project_progress(list_id: str = None, folder_id: str = None, refresh: bool = False) -> str:
+    """Mostra o progresso de um projeto inteiro no ClickUp (uma lista ou todas as listas de uma pasta).
+
+    Use esta ferramenta para acompanhar o andamento geral de um projeto: percentual concluído,
+    tarefas atrasadas e a distribuição por status, responsável e marco. As páginas de tarefas
+    são buscadas em paralelo e o resultado fica em cache por alguns segundos.
+
+    Args:
+        list_id: (Opcional) O ID da lista do projeto no ClickUp.
+        folder_id: (Opcional) O ID da pasta do projeto (agrega todas as listas dela).
+        refresh: (Opcional) Ignorar o cache e buscar os dados novamente.
+
+    Returns:
+        Um resumo do progresso do projeto ou uma mensagem de erro.
+    """
+    if not list_id and not folder_id:
+        return "Erro: Informe o ID da lista (list_id) ou da pasta (folder_id) do projeto."
+
+    print(f"Executando visão de progresso do projeto {list_id or folder_id}...")
+    try:
+        from FSTech_Consulting_Agency.utils.project_progress import get_progress_tracker
+        progresso = get_progress_tracker().project_progress(list_id=list_id, folder_id=folder_id, refresh=refresh)
+    except (ValueError, ConnectionError) as e:
+        return f"Erro ao conectar ao ClickUp: {e}"
+    except Exception as e:
+        return f"Erro ao buscar o progresso do projeto {list_id or folder_id} no ClickUp: {e}"
+
+    if not progresso["total"]:
+        return f"Projeto {list_id or folder_id}: nenhuma tarefa encontrada."
+
+    linhas = [
+        f"Progresso do projeto {list_id or folder_id} ({len(progresso['list_ids'])} lista(s)): "
+        f"{progresso['done']}/{progresso['total']} tarefas concluídas ({progresso['completion_pct']}%), "
+        f"{progresso['overdue']} atrasada(s).",
+        "Por status: " + ", ".join(f"{nome} ({qtd})" for nome, qtd in progresso["by_status"].items()),
+        "Por marco:",
+        *(f"  - {nome}: {dados['done']}/{dados['total']} ({dados['completion_pct']}%)"
+          for nome, dados in progresso["by_milestone"].items()),
+        "Por responsável:",
+        *(f"  - {nome}: {dados['done']}/{dados['total']} ({dados['completion_pct']}%)"
+          for nome, dados in progresso["by_assignee"].items()),
+    ]
+    return "\n".join(linhas)
+
 # Exemplo de uso (requer .env configurado e ID de tarefa válido)
 if __name__ == "__main__":
     # IMPORTANTE: Substitua por um ID de tarefa REAL do seu ClickUp para testar
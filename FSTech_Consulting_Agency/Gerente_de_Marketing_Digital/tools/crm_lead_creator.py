@@ -61,6 +61,36 @@ def create_crm_lead(lead_name: str, description: str = None, assignee_email: str
     except Exception as e:
         return f"Erro inesperado ao criar lead no ClickUp: {e}"
 
+@function_tool
+def import_crm_leads(file_path: str, concurrency: int = 8, per_minute: int = 90) -> str:
+    """Importa em massa um arquivo de leads (CSV ou JSONL) para a lista de CRM do ClickUp.
+
+    Use esta ferramenta após eventos ou campanhas, quando houver muitas leads para registrar.
+    As leads são deduplicadas (por e-mail ou nome) e criadas em paralelo, respeitando o
+    limite de requisições por minuto do ClickUp.
+
+    Args:
+        file_path: Caminho do arquivo .csv (com cabeçalho) ou .jsonl de leads.
+        concurrency: (Opcional) Número de criações simultâneas.
+        per_minute: (Opcional) Máximo de criações por minuto.
+
+    Returns:
+        Uma string com o resumo da importação (criadas, falhas, duplicadas).
+    """
+    from FSTech_Consulting_Agency.utils.lead_import import import_leads_file
+    if not file_path or not os.path.exists(file_path):
+        return f"Erro: arquivo de leads não encontrado: {file_path}"
+    try:
+        report = import_leads_file(file_path, concurrency=concurrency, per_minute=per_minute)
+    except Exception as e:
+        return f"Erro ao importar leads de {file_path}: {e}"
+    resumo = (f"Importação concluída em {report['elapsed_seconds']}s: {len(report['created'])} leads criadas, "
+              f"{len(report['failed'])} falhas, {report['duplicates']} duplicadas, "
+              f"{report['skipped_existing']} já existentes no CRM.")
+    if report["failed"]:
+        resumo += " Falhas: " + "; ".join(f"{f['name']} ({f['error']})" for f in report["failed"][:10])
+    return resumo
+
 # Exemplo de uso (requer .env configurado)
 if __name__ == "__main__":
     try:
@@ -1,18 +1,20 @@
 # Ferramenta: Gerenciador de Agendamentos (Cal.com)
 
 import os
-import requests
 import json
 from datetime import datetime
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
+from FSTech_Consulting_Agency.utils.calcom_availability import (
+    SlotUnavailableError, describe_suggestions, get_availability, parse_time)
+from FSTech_Consulting_Agency.utils.calcom_client import (
+    CALCOM_BATCH_CONCURRENCY, book_meetings_batch, calcom_api_key, create_booking)
+from FSTech_Consulting_Agency.utils.http_session import HTTPServiceError
+
 # Carregar variáveis de ambiente do .env
 load_dotenv(dotenv_path="/home/ubuntu/FSTech_Consulting_Agency/.env")
 
-# Constantes da API Cal.com
-CALCOM_API_URL = "https://api.cal.com/v2"
-CALCOM_API_KEY = os.getenv("CALCOM_API_KEY")
-
 # Simulação de um decorador para definir a ferramenta
 def function_tool(func):
     """Decorador simulado para registrar metadados da ferramenta."""
@@ -24,7 +26,9 @@ def schedule_meeting_calcom(event_type_id: int, start_time: str, end_time: str,
     """Agenda uma nova reunião (booking) no Cal.com usando a API v2.
 
     Use esta ferramenta para criar um agendamento diretamente no Cal.com após
-    o cliente confirmar a data/hora.
+    o cliente confirmar a data/hora. O horário é conferido antes na disponibilidade
+    em cache do tipo de evento; se estiver ocupado, nada é enviado e a resposta traz
+    os próximos horários livres.
 
     Args:
         event_type_id: O ID numérico do tipo de evento no Cal.com (ex: reunião de diagnóstico).
@@ -39,53 +43,30 @@ def schedule_meeting_calcom(event_type_id: int, start_time: str, end_time: str,
     Returns:
         Uma string confirmando o agendamento com o ID ou uma mensagem de erro.
     """
-    if not CALCOM_API_KEY:
+    if not calcom_api_key():
         return "Erro: Chave da API do Cal.com (CALCOM_API_KEY) não configurada no arquivo .env."
     if not all([event_type_id, start_time, end_time, attendee_name, attendee_email]):
         return "Erro: Os parâmetros event_type_id, start_time, end_time, attendee_name e attendee_email são obrigatórios."
 
-    headers = {
-        "Authorization": f"Bearer {CALCOM_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    payload = {
-        "eventTypeId": event_type_id,
-        "start": start_time,
-        "end": end_time,
-        "responses": {
-            "name": attendee_name,
-            "email": attendee_email
-        },
-        "timeZone": timezone,
-        "language": "en",
-        "status": "ACCEPTED",
-        "metadata": {"source": "api"}
-    }
-    # Adicionar título e descrição se fornecidos
-    if title:
-        payload["title"] = title
-    if description:
-        payload["description"] = description
-
-    endpoint = f"{CALCOM_API_URL}/bookings"
-
     print(f"Executando agendamento no Cal.com para {attendee_email} no evento {event_type_id}...")
 
     try:
-        response = requests.post(endpoint, headers=headers, json=payload)
-        response.raise_for_status() # Lança exceção para erros HTTP (4xx ou 5xx)
-
-        booking_data = response.json()
-        booking_id = booking_data.get("booking", {}).get("id")
-        booking_uid = booking_data.get("booking", {}).get("uid")
+        booking = get_availability().book(
+            event_type_id, parse_time(start_time, ZoneInfo(timezone)), parse_time(end_time, ZoneInfo(timezone)),
+            create_booking, attendee_name=attendee_name, attendee_email=attendee_email,
+            timezone=timezone, title=title, description=description,
+        )
+        booking_id = booking.get("id")
+        booking_uid = booking.get("uid")
 
         if booking_id or booking_uid:
             return f"Agendamento criado com sucesso no Cal.com! ID: {booking_id or booking_uid}"
         else:
-            return f"Agendamento pode ter sido criado, mas ID não encontrado na resposta: {booking_data}"
+            return f"Agendamento pode ter sido criado, mas ID não encontrado na resposta: {booking}"
 
-    except requests.exceptions.RequestException as e:
+    except SlotUnavailableError as e:
+        return f"Erro: {e} Próximos horários livres: {describe_suggestions(e.suggestions)}."
+    except HTTPServiceError as e:
         if e.response is not None:
             print("[DEBUG] Corpo da resposta de erro da Cal.com:")
             print(e.response.text)
@@ -96,6 +77,52 @@ def schedule_meeting_calcom(event_type_id: int, start_time: str, end_time: str,
     except Exception as e:
         return f"Erro inesperado ao agendar no Cal.com: {e}"
 
+@function_tool
+def schedule_meetings_batch(event_type_id: int, attendees: list, duration_minutes: int = 60, title: str = None, description: str = None, concurrency: int = CALCOM_BATCH_CONCURRENCY) -> str:
+    """Agenda reuniões no Cal.com para várias leads de uma vez (ex: diagnósticos após uma campanha).
+
+    Cada participante recebe o horário informado ou, na falta dele, o próximo horário livre
+    do tipo de evento. Os agendamentos são feitos em paralelo, respeitando o limite de
+    agendamentos por minuto (CALCOM_BOOKINGS_PER_MINUTE).
+
+    Args:
+        event_type_id: O ID numérico do tipo de evento no Cal.com.
+        attendees: Lista de dicts com "name" e "email" e, opcionalmente, "start_time"/"end_time" (ISO 8601).
+        duration_minutes: (Opcional) Duração das reuniões sem end_time (padrão: 60).
+        title: (Opcional) Título dos agendamentos ("{name}" é substituído pelo nome do participante).
+        description: (Opcional) Descrição comum a todos os agendamentos.
+        concurrency: (Opcional) Agendamentos simultâneos.
+
+    Returns:
+        Um resumo com os agendamentos criados e as falhas (com sugestões de horário).
+    """
+    if not calcom_api_key():
+        return "Erro: Chave da API do Cal.com (CALCOM_API_KEY) não configurada no arquivo .env."
+    meetings = []
+    for attendee in attendees or []:
+        if not attendee.get("name") or not attendee.get("email"):
+            return f"Erro: Cada participante precisa de 'name' e 'email' (recebido: {attendee})."
+        meetings.append({
+            "attendee_name": attendee["name"],
+            "attendee_email": attendee["email"],
+            "start_time": attendee.get("start_time"),
+            "end_time": attendee.get("end_time"),
+            "title": title.replace("{name}", attendee["name"]) if title else None,
+            "description": description,
+        })
+    if not meetings:
+        return "Erro: Nenhum participante informado."
+
+    print(f"Agendando {len(meetings)} reuniões no Cal.com (evento {event_type_id})...")
+    report = book_meetings_batch(meetings, event_type_id, duration_minutes=duration_minutes, concurrency=concurrency)
+    lines = [f"{len(report['booked'])} de {report['total']} reuniões agendadas em {report['elapsed_seconds']}s."]
+    for item in report["booked"]:
+        lines.append(f"- {item['attendee_email']}: {item['start']} (ID: {item['booking_id']})")
+    for item in report["failed"]:
+        suggestions = f" Próximos horários livres: {describe_suggestions(item['suggestions'])}." if item["suggestions"] else ""
+        lines.append(f"- FALHA {item['attendee_email']}: {item['error']}{suggestions}")
+    return "\n".join(lines)
+
 # Exemplo de uso (requer .env configurado e ID de tipo de evento válido)
 if __name__ == "__main__":
     # IMPORTANTE: Substitua por um ID de Tipo de Evento REAL do seu Cal.com
@@ -106,7 +133,7 @@ if __name__ == "__main__":
 
     if TEST_EVENT_TYPE_ID == 12345:
         print("### ATENÇÃO: Configure a variável TEST_EVENT_TYPE_ID com um ID de tipo de evento real do seu Cal.com para executar os testes. ###")
-    elif not CALCOM_API_KEY or CALCOM_API_KEY == "SUA_CHAVE_API_CALCOM_AQUI":
+    elif not calcom_api_key() or calcom_api_key() == "SUA_CHAVE_API_CALCOM_AQUI":
         print("### ATENÇÃO: Configure a variável CALCOM_API_KEY no arquivo .env com sua chave real do Cal.com para executar os testes. ###")
     else:
         try:
@@ -0,0 +1,202 @@
+"""
+Processamento em lote (sem interação) de leads da FSTech.
+
+Executa, para cada par briefing + ata, o pipeline completo
+arquitetura → pesquisa de mercado → ROI → proposta (build_proposal_markdown),
+distribuindo as leads em um pool de threads ou processos, e grava um manifesto
+com o resultado de cada lead.
+
+Formatos de entrada aceitos:
+    - Diretório com uma subpasta por lead contendo briefing_inicial.txt e ata_reuniao.txt
+      (o nome da subpasta vira o lead_id);
+    - Arquivo JSONL com um objeto por linha:
+      {"lead_id": "...", "briefing": "...", "ata_reuniao": "...",
+       "client_name": "...", "client_company": "..."}  (client_* opcionais)
+
+Uso:
+    python -m FSTech_Consulting_Agency.batch_fstech leads/ --output-dir saida/ --workers 8
+    python -m FSTech_Consulting_Agency.batch_fstech leads.jsonl --executor process --create-crm
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from FSTech_Consulting_Agency.utils.lead_checkpoint import get_lead_checkpoint
+from FSTech_Consulting_Agency.utils.lead_pipeline import build_lead_stages
+from FSTech_Consulting_Agency.utils.stage_graph import run_stage_graph
+
+BRIEFING_FILE = "briefing_inicial.txt"
+ATA_FILE = "ata_reuniao.txt"
+MANIFEST_FILE = "manifest.jsonl"
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "documentos_gerados", "lote")
+
+# Campos do contexto final copiados para o manifesto
+MANIFEST_FIELDS = [
+    "task_id", "industry", "main_challenge", "nivel_complexidade", "horas_estimadas",
+    "preco", "timeline", "proposal_path",
+]
+
+
+def load_leads(input_path):
+    """
+    Carrega os pares briefing + ata de um diretório ou arquivo JSONL.
+
+    Args:
+        input_path: Caminho do diretório de leads ou do arquivo .jsonl.
+
+    Returns:
+        list[dict]: Leads com lead_id, briefing, ata_reuniao e, se houver, client_name/client_company.
+    """
+    leads = []
+    if os.path.isdir(input_path):
+        for entry in sorted(os.listdir(input_path)):
+            lead_dir = os.path.join(input_path, entry)
+            briefing_path = os.path.join(lead_dir, BRIEFING_FILE)
+            ata_path = os.path.join(lead_dir, ATA_FILE)
+            if not (os.path.isfile(briefing_path) and os.path.isfile(ata_path)):
+                continue
+            with open(briefing_path, "r", encoding="utf-8") as f:
+                briefing = f.read().strip()
+            with open(ata_path, "r", encoding="utf-8") as f:
+                ata_reuniao = f.read().strip()
+            leads.append({"lead_id": entry, "briefing": briefing, "ata_reuniao": ata_reuniao})
+    else:
+        with open(input_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                lead = {
+                    "lead_id": str(record.get("lead_id") or f"lead_{line_number:05d}"),
+                    "briefing": (record.get("briefing") or "").strip(),
+                    "ata_reuniao": (record.get("ata_reuniao") or record.get("ata") or "").strip(),
+                }
+                for key in ("client_name", "client_company"):
+                    if record.get(key):
+                        lead[key] = record[key]
+                leads.append(lead)
+    return leads
+
+
+def _client_name_from_briefing(briefing):
+    match = re.search(r"Contratante:\s*([^\n]+)", briefing)
+    return match.group(1).strip() if match else ""
+
+
+def process_lead(lead, output_dir, create_crm=False, stage_workers=4, resume=True):
+    """
+    Executa o pipeline completo para uma lead, sem interação com o operador.
+
+    Args:
+        lead: Dict com lead_id, briefing, ata_reuniao (e opcionalmente client_name/client_company).
+        output_dir: Diretório base das propostas (cada lead ganha uma subpasta).
+        create_crm: Se True, registra a lead no ClickUp.
+        stage_workers: Etapas simultâneas dentro da lead.
+        resume: Se True, retoma a partir do checkpoint da lead (etapas concluídas não são refeitas).
+
+    Returns:
+        dict: Entrada do manifesto (status, tempo, campos principais ou erro).
+    """
+    start = time.perf_counter()
+    entry = {"lead_id": lead["lead_id"]}
+    if not lead.get("briefing") or not lead.get("ata_reuniao"):
+        entry.update(status="error", error="briefing e ata_reuniao são obrigatórios", elapsed_seconds=0.0)
+        return entry
+    context = {
+        "briefing": lead["briefing"],
+        "ata_reuniao": lead["ata_reuniao"],
+        "client_name": lead.get("client_name") or _client_name_from_briefing(lead["briefing"]) or "Cliente",
+        "client_company": lead.get("client_company") or "Empresa",
+        "output_dir": os.path.join(output_dir, re.sub(r"[^\w\-]+", "_", lead["lead_id"])),
+    }
+    try:
+        checkpoint = get_lead_checkpoint(lead["briefing"], lead_id=lead["lead_id"]) if resume else None
+        result = run_stage_graph(build_lead_stages(create_crm=create_crm), context,
+                                 max_workers=stage_workers, checkpoint=checkpoint)
+        entry["status"] = "success"
+        entry.update({key: result.get(key) for key in MANIFEST_FIELDS})
+    except Exception as e:
+        entry.update(status="error", error=str(e))
+    entry["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+def run_batch(leads, output_dir=DEFAULT_OUTPUT_DIR, workers=4, executor="thread", create_crm=False, stage_workers=4,
+              resume=True):
+    """
+    Processa uma lista de leads em paralelo e grava o manifesto em output_dir/manifest.jsonl.
+
+    Args:
+        leads: Lista retornada por load_leads.
+        output_dir: Diretório de saída das propostas e do manifesto.
+        workers: Tamanho do pool (leads processadas simultaneamente).
+        executor: 'thread' (chamadas de rede) ou 'process' (isolamento/CPU).
+        create_crm: Se True, registra cada lead no ClickUp.
+        stage_workers: Etapas simultâneas dentro de cada lead.
+        resume: Se True, leads já processadas (total ou parcialmente) retomam do checkpoint.
+
+    Returns:
+        dict: Resumo com totais, tempo total e caminho do manifesto.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    start = time.perf_counter()
+    succeeded = failed = 0
+
+    with open(manifest_path, "w", encoding="utf-8") as manifest, pool_class(max_workers=workers) as pool:
+        futures = [pool.submit(process_lead, lead, output_dir, create_crm, stage_workers, resume) for lead in leads]
+        for done, future in enumerate(as_completed(futures), start=1):
+            entry = future.result()
+            entry["finished_at"] = datetime.now().isoformat(timespec="seconds")
+            manifest.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            manifest.flush()
+            if entry["status"] == "success":
+                succeeded += 1
+            else:
+                failed += 1
+            print(f"[{done}/{len(leads)}] {entry['lead_id']}: {entry['status']} ({entry['elapsed_seconds']}s)")
+
+    return {
+        "total": len(leads),
+        "succeeded": succeeded,
+        "failed": failed,
+        "elapsed_seconds": round(time.perf_counter() - start, 3),
+        "manifest_path": manifest_path,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Processa em lote briefings + atas e gera propostas FSTech.")
+    parser.add_argument("input", help="Diretório de leads (uma subpasta por lead) ou arquivo .jsonl")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Diretório das propostas e do manifesto")
+    parser.add_argument("--workers", type=int, default=4, help="Leads processadas simultaneamente")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread", help="Tipo de pool")
+    parser.add_argument("--stage-workers", type=int, default=4, help="Etapas simultâneas dentro de cada lead")
+    parser.add_argument("--create-crm", action="store_true", help="Registrar cada lead no ClickUp")
+    parser.add_argument("--no-resume", action="store_true", help="Ignorar checkpoints e reprocessar todas as etapas")
+    args = parser.parse_args(argv)
+
+    leads = load_leads(args.input)
+    print(f"=== LOTE FSTech: {len(leads)} leads ({args.executor}, {args.workers} workers) ===")
+    summary = run_batch(
+        leads,
+        output_dir=args.output_dir,
+        workers=args.workers,
+        executor=args.executor,
+        create_crm=args.create_crm,
+        stage_workers=args.stage_workers,
+        resume=not args.no_resume,
+    )
+    print(f"Concluído: {summary['succeeded']} sucesso(s), {summary['failed']} falha(s) "
+          f"em {summary['elapsed_seconds']}s. Manifesto: {summary['manifest_path']}")
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1 @@
+# Benchmarks de desempenho da FSTech (executáveis via python -m)
@@ -0,0 +1,82 @@
+"""
+Benchmark do tempo de inicialização (cold start) do orquestrador.
+
+Cada cenário roda em um interpretador Python novo, para medir imports a frio:
+    - lazy:  o que o app.py faz hoje — importa o orquestrador e lista agentes/ferramentas
+             pelo registro, sem materializar nenhum agente;
+    - eager: o comportamento antigo — importa todas as ferramentas dos oito agentes, lê
+             todos os instructions.md e (se o SDK `agents` estiver instalado) constrói os
+             nove Agent.
+
+Uso:
+    python -m FSTech_Consulting_Agency.benchmarks.bench_import_time --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SCENARIOS = {
+    "lazy": """
+import FSTech_Consulting_Agency.orquestrador_fstech
+from FSTech_Consulting_Agency.utils.agent_registry import agent_tool_names, list_agents
+[agent_tool_names(key) for key in list_agents()]
+""",
+    "eager": """
+import importlib.util, os
+import FSTech_Consulting_Agency.orquestrador_fstech
+from FSTech_Consulting_Agency.utils.agent_registry import AGENT_SPECS, BASE_DIR, get_orquestrador, load_instructions, load_tool
+for spec in AGENT_SPECS.values():
+    load_instructions(os.path.join(BASE_DIR, spec["dir"], "instructions.md"))
+    [load_tool(tool) for tool in spec["tools"]]
+if importlib.util.find_spec("agents"):
+    get_orquestrador()
+""",
+}
+
+_TIMER = """
+import time
+_inicio = time.perf_counter()
+{code}
+print(time.perf_counter() - _inicio)
+"""
+
+
+def measure(code, runs=5):
+    """Executa `code` em `runs` interpretadores novos e retorna os tempos (segundos)."""
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    tempos = []
+    for _ in range(runs):
+        resultado = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(code=code)],
+            capture_output=True, text=True, cwd=PROJECT_ROOT, env=env, check=True
+        )
+        tempos.append(float(resultado.stdout.strip().splitlines()[-1]))
+    return tempos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o tempo de inicialização do orquestrador (lazy x eager).")
+    parser.add_argument("--runs", type=int, default=5, help="Execuções por cenário")
+    args = parser.parse_args(argv)
+
+    # Aquecimento: garante que os .pyc existam antes das medições
+    measure(SCENARIOS["eager"], runs=1)
+
+    medianas = {}
+    for nome, code in SCENARIOS.items():
+        tempos = measure(code, runs=args.runs)
+        medianas[nome] = statistics.median(tempos)
+        print(f"{nome:>6}: mediana {medianas[nome] * 1000:8.1f} ms | min {min(tempos) * 1000:8.1f} ms | max {max(tempos) * 1000:8.1f} ms")
+
+    reducao = 1 - medianas["lazy"] / medianas["eager"]
+    print(f"Redução no cold start: {reducao:.0%} ({medianas['eager'] * 1000:.1f} ms -> {medianas['lazy'] * 1000:.1f} ms)")
+    return medianas
+
+
+if __name__ == "__main__":
+    main()
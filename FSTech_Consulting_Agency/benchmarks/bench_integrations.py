@@ -0,0 +1,144 @@
+"""
+Benchmark da camada de integração (ClickUp e Cal.com) contra os stand-ins locais.
+
+Sobe os stand-ins em um processo separado (python -m FSTech_Consulting_Agency.standins),
+aponta os clientes para eles via CLICKUP_API_URL / CALCOM_API_URL e mede vazão e
+latência de:
+    - criação de leads (create_crm_task) com N threads;
+    - atualização de status (update_task_status) com N threads;
+    - listagem paginada da lista de CRM: sequencial (iter_list_tasks) x concorrente
+      (list_tasks_concurrently);
+    - agendamentos no Cal.com (schedule_meeting_calcom) nos horários livres calculados
+      localmente (find_free_slots), um a um e em lote (book_meetings_batch).
+
+Uso:
+    python -m FSTech_Consulting_Agency.benchmarks.bench_integrations --tasks 300 --workers 16 --latency-ms 80
+"""
+
+import argparse
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Stand-in não respondeu na porta {port}")
+
+
+def _timed(label, total, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34} {total:>5} chamadas em {elapsed:6.2f}s  ({total / elapsed:7.1f}/s)")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark das integrações ClickUp/Cal.com contra os stand-ins locais.")
+    parser.add_argument("--tasks", type=int, default=300, help="Leads criadas e atualizadas")
+    parser.add_argument("--bookings", type=int, default=50, help="Agendamentos no Cal.com")
+    parser.add_argument("--workers", type=int, default=16, help="Threads clientes")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=0, help="Chamadas por janela nos stand-ins (0 = sem limite)")
+    parser.add_argument("--rate-window", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    clickup_port, calcom_port = _free_port(), _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "FSTech_Consulting_Agency.standins",
+         "--clickup-port", str(clickup_port), "--calcom-port", str(calcom_port),
+         "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+         "--error-rate", str(args.error_rate), "--rate-limit", str(args.rate_limit),
+         "--rate-window", str(args.rate_window), "--seed", str(args.seed)],
+        cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL,
+    )
+    # Estado local (status, fila, espelho, eventos) vai para um diretório temporário: as tarefas
+    # falsas dos stand-ins não podem chegar aos bancos de produção em data/
+    state_dir = tempfile.mkdtemp(prefix="fstech-bench-")
+    try:
+        _wait_for_port(clickup_port)
+        _wait_for_port(calcom_port)
+        # Os clientes leem a URL base e os caminhos ao importar: configurar antes dos imports abaixo
+        os.environ.update({
+            "CLICKUP_API_URL": f"http://127.0.0.1:{clickup_port}/api/v2", "CLICKUP_API_KEY": "standin",
+            "CALCOM_API_URL": f"http://127.0.0.1:{calcom_port}/v2", "CALCOM_API_KEY": "standin",
+            "FSTECH_CRM_STATUS_CACHE_PATH": os.path.join(state_dir, "crm_status.sqlite3"),
+            "FSTECH_CRM_QUEUE_PATH": os.path.join(state_dir, "crm_status_queue.json"),
+            "FSTECH_CRM_MIRROR_PATH": os.path.join(state_dir, "crm_mirror.sqlite3"),
+            "FSTECH_CRM_EVENT_LOG_PATH": os.path.join(state_dir, "crm_events.sqlite3"),
+        })
+        from FSTech_Consulting_Agency.Suporte_Administrativo.tools.appointment_scheduler_manager import schedule_meeting_calcom
+        from FSTech_Consulting_Agency.utils.calcom_availability import get_availability
+        from FSTech_Consulting_Agency.utils.calcom_client import book_meetings_batch, get_calcom_metrics
+        from FSTech_Consulting_Agency.utils.clickup_async import list_tasks_concurrently
+        from FSTech_Consulting_Agency.utils.clickup_client import (
+            CRM_LIST_ID, create_crm_task, get_clickup_metrics, iter_list_tasks, update_task_status,
+        )
+
+        print(f"Stand-ins: latência {args.latency_ms}±{args.jitter_ms} ms, erros {args.error_rate:.0%}, "
+              f"rate limit {args.rate_limit or 'desligado'} | {args.workers} threads")
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            task_ids = _timed("create_crm_task", args.tasks, lambda: list(executor.map(
+                lambda i: create_crm_task(f"Lead - Benchmark {i}"), range(args.tasks))))
+            task_ids = [task_id for task_id in task_ids if task_id]
+            _timed("update_task_status", len(task_ids), lambda: list(executor.map(
+                lambda task_id: update_task_status(task_id, "contato_realizado"), task_ids)))
+
+            pages = -(-len(task_ids) // 100) or 1
+            _timed("iter_list_tasks (sequencial)", pages, lambda: [t for p in iter_list_tasks(CRM_LIST_ID) for t in p])
+            _timed("list_tasks_concurrently", pages, lambda: list_tasks_concurrently(CRM_LIST_ID))
+
+            # Horários livres calculados localmente (uma busca de disponibilidade): nenhum POST recusado
+            slots = _timed("find_free_slots", 1, lambda: get_availability().find_free_slots(1, count=args.bookings))
+
+            def book(i):
+                return schedule_meeting_calcom(
+                    event_type_id=1, start_time=slots[i]["start"], end_time=slots[i]["end"],
+                    attendee_name=f"Cliente {i}", attendee_email=f"cliente{i}@example.com",
+                )
+
+            _timed("schedule_meeting_calcom", len(slots), lambda: list(executor.map(book, range(len(slots)))))
+            # Lote sem horários definidos (outro tipo de evento): horários distribuídos localmente
+            meetings = [{"attendee_name": f"Lead {i}", "attendee_email": f"lead{i}@example.com"}
+                        for i in range(args.bookings)]
+            _timed("book_meetings_batch", args.bookings, lambda: book_meetings_batch(
+                meetings, event_type_id=2, concurrency=args.workers, per_minute=0))
+
+        print("\nMétricas do cliente ClickUp por endpoint:")
+        for label, metrics in get_clickup_metrics().items():
+            print(f"  {label:<28} {metrics}")
+        print("\nMétricas do cliente Cal.com por endpoint:")
+        for label, metrics in get_calcom_metrics().items():
+            print(f"  {label:<28} {metrics}")
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(state_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
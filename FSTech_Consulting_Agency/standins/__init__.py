@@ -0,0 +1,17 @@
+"""
+Servidores locais (stand-ins) das APIs do ClickUp e do Cal.com.
+
+Permitem medir vazão e latência da camada de integração (clickup_client, clickup_async,
+agendamento no Cal.com, fluxo_fstech) sem chamar os SaaS reais, com latência, taxa de
+erro e rate limiting configuráveis. Os clientes apontam para os stand-ins pelas URLs
+base CLICKUP_API_URL e CALCOM_API_URL.
+
+Uso:
+    python -m FSTech_Consulting_Agency.standins --latency-ms 80 --error-rate 0.02 --rate-limit 100
+"""
+
+from FSTech_Consulting_Agency.standins.base import FaultConfig, StandInServer
+from FSTech_Consulting_Agency.standins.calcom import CalcomStandIn
+from FSTech_Consulting_Agency.standins.clickup import ClickUpStandIn
+
+__all__ = ["FaultConfig", "StandInServer", "ClickUpStandIn", "CalcomStandIn"]
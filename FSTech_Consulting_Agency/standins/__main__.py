@@ -0,0 +1,49 @@
+"""Sobe os stand-ins do ClickUp e do Cal.com e imprime as variáveis de ambiente para apontar os clientes."""
+
+import argparse
+import time
+
+from FSTech_Consulting_Agency.standins.base import FaultConfig
+from FSTech_Consulting_Agency.standins.calcom import CalcomStandIn
+from FSTech_Consulting_Agency.standins.clickup import ClickUpStandIn
+from FSTech_Consulting_Agency.utils.clickup_client import CRM_LIST_ID
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidores locais que emulam as APIs do ClickUp e do Cal.com.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--clickup-port", type=int, default=8701)
+    parser.add_argument("--calcom-port", type=int, default=8702)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latência média por resposta")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Variação (±) da latência")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fração de respostas 5xx (0–1)")
+    parser.add_argument("--rate-limit", type=int, default=0, help="Chamadas por janela antes de responder 429 (0 = sem limite)")
+    parser.add_argument("--rate-window", type=float, default=60.0, help="Janela do rate limit, em segundos")
+    parser.add_argument("--seed", type=int, default=None, help="Semente das falhas simuladas")
+    parser.add_argument("--seed-tasks", type=int, default=0, help="Tarefas pré-criadas na lista de CRM")
+    args = parser.parse_args(argv)
+
+    def faults():
+        return FaultConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                           rate_limit=args.rate_limit, rate_window=args.rate_window, seed=args.seed)
+
+    clickup = ClickUpStandIn(faults(), host=args.host, port=args.clickup_port)
+    calcom = CalcomStandIn(faults(), host=args.host, port=args.calcom_port)
+    for i in range(args.seed_tasks):
+        clickup.add_task(CRM_LIST_ID, f"Lead - Empresa {i + 1}")
+
+    with clickup, calcom:
+        print("🧪 Stand-ins no ar. Aponte os clientes com:")
+        print(f"   export CLICKUP_API_URL={clickup.base_url} CLICKUP_API_KEY=standin")
+        print(f"   export CALCOM_API_URL={calcom.base_url} CALCOM_API_KEY=standin")
+        print(f"   Falhas simuladas: {clickup.faults.as_dict()}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"\nClickUp: {clickup.stats} | Cal.com: {calcom.stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
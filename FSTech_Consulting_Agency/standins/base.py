@@ -0,0 +1,219 @@
+"""
+Base dos servidores HTTP locais (stand-ins) que emulam as APIs externas.
+
+Cada stand-in roda um ThreadingHTTPServer em uma thread própria e injeta, de forma
+configurável e reprodutível (semente fixa), as falhas que o cliente real precisa tolerar:
+latência com jitter, respostas 5xx aleatórias e rate limiting por janela fixa com 429 e
+os cabeçalhos X-RateLimit-* / Retry-After.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class FaultConfig:
+    """
+    Falhas simuladas por um stand-in.
+
+    Args:
+        latency_ms: Latência média adicionada a cada resposta.
+        jitter_ms: Variação uniforme (±) em torno da latência média.
+        error_rate: Fração (0–1) das chamadas respondidas com erro 5xx.
+        error_status: Status HTTP usado nas falhas simuladas.
+        rate_limit: Máximo de chamadas por janela (0 desativa o rate limiting).
+        rate_window: Duração da janela de rate limit, em segundos.
+        seed: Semente do gerador aleatório (falhas reprodutíveis entre execuções).
+    """
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, error_status=503,
+                 rate_limit=0, rate_window=60.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.seed = seed
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+class StandInServer:
+    """
+    Servidor HTTP local com rotas registradas por regex e injeção de falhas.
+
+    As subclasses registram rotas com `route(method, pattern, handler)`; o handler recebe
+    (params do caminho, query, corpo JSON) e retorna (status, corpo) ou (status, corpo, headers).
+
+    Args:
+        prefix: Prefixo de caminho da API emulada (ex: '/api/v2').
+        faults: FaultConfig com as falhas a simular (padrão: nenhuma).
+        host: Interface de escuta.
+        port: Porta (0 escolhe uma porta livre).
+    """
+
+    name = "stand-in"
+
+    def __init__(self, prefix="", faults=None, host="127.0.0.1", port=0):
+        self.prefix = prefix.rstrip("/")
+        self.faults = faults or FaultConfig()
+        self._random = random.Random(self.faults.seed)
+        self._routes = []
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._window_count = 0
+        self.stats = {"requests": 0, "rate_limited": 0, "injected_errors": 0, "not_found": 0}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    # --- ciclo de vida ---
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.prefix}"
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), name=f"{self.name}-server", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- rotas ---
+
+    def route(self, method, pattern, handler):
+        self._routes.append((method, re.compile(f"^{pattern}$"), handler))
+
+    def _match(self, method, path):
+        for route_method, regex, handler in self._routes:
+            match = regex.match(path)
+            if match and route_method == method:
+                return handler, match.groupdict()
+        return None, None
+
+    # --- falhas simuladas ---
+
+    def _sleep_latency(self):
+        faults = self.faults
+        if faults.latency_ms or faults.jitter_ms:
+            with self._lock:
+                jitter = self._random.uniform(-faults.jitter_ms, faults.jitter_ms)
+            time.sleep(max(0.0, faults.latency_ms + jitter) / 1000)
+
+    def _rate_limit_headers(self):
+        """Conta a chamada na janela atual. Retorna (limitada?, cabeçalhos X-RateLimit-*)."""
+        faults = self.faults
+        if not faults.rate_limit:
+            return False, {}
+        with self._lock:
+            now = time.time()
+            if now - self._window_start >= faults.rate_window:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            reset_at = self._window_start + faults.rate_window
+            limited = self._window_count > faults.rate_limit
+            remaining = max(0, faults.rate_limit - self._window_count)
+        headers = {
+            "X-RateLimit-Limit": str(faults.rate_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": f"{reset_at:.3f}",
+        }
+        if limited:
+            headers["Retry-After"] = f"{max(0.0, reset_at - now):.3f}"
+        return limited, headers
+
+    def _inject_error(self):
+        if not self.faults.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.faults.error_rate
+
+    def rate_limit_body(self):
+        return {"error": "Too many requests"}
+
+    def dispatch(self, method, raw_path, body):
+        """Processa uma chamada. Retorna (status, corpo JSON, cabeçalhos)."""
+        with self._lock:
+            self.stats["requests"] += 1
+        self._sleep_latency()
+        limited, headers = self._rate_limit_headers()
+        if limited:
+            with self._lock:
+                self.stats["rate_limited"] += 1
+            return 429, self.rate_limit_body(), headers
+        if self._inject_error():
+            with self._lock:
+                self.stats["injected_errors"] += 1
+            return self.faults.error_status, {"error": "Simulated failure"}, headers
+
+        parts = urlsplit(raw_path)
+        path = parts.path
+        if self.prefix and path.startswith(self.prefix):
+            path = path[len(self.prefix):]
+        handler, params = self._match(method, "/" + path.strip("/"))
+        if handler is None:
+            with self._lock:
+                self.stats["not_found"] += 1
+            return 404, {"error": f"Route not found: {method} {path}"}, headers
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        result = handler(params, query, body)
+        status, payload = result[0], result[1]
+        if len(result) > 2:
+            headers.update(result[2])
+        return status, payload, headers
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, como as APIs reais
+            disable_nagle_algorithm = True  # sem isso, cabeçalho e corpo separados somam ~40 ms por resposta
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    body = json.loads(raw) if raw else {}
+                except ValueError:
+                    status, payload, headers = 400, {"error": "Invalid JSON body"}, {}
+                else:
+                    try:
+                        status, payload, headers = server.dispatch(self.command, self.path, body)
+                    except Exception as e:
+                        status, payload, headers = 500, {"error": f"Stand-in failure: {e}"}, {}
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
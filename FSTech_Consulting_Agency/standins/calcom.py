@@ -0,0 +1,144 @@
+"""
+Stand-in local da API v2 do Cal.com.
+
+Emula as rotas de agendamento usadas pelo Suporte Administrativo:
+    POST /bookings                 (recusa horários que conflitam com outro agendamento)
+    GET  /bookings
+    GET  /bookings/{uid}
+    POST /bookings/{uid}/cancel
+    GET  /slots/available          (eventTypeId, startTime, endTime)
+
+Os horários livres são gerados a partir de um expediente fixo (UTC) e descontam os
+agendamentos já aceitos.
+"""
+
+import itertools
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from FSTech_Consulting_Agency.standins.base import StandInServer
+
+
+def _parse_time(value):
+    value = str(value).strip()
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _format_time(value):
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class CalcomStandIn(StandInServer):
+    """
+    Servidor local que responde como a API de bookings do Cal.com.
+
+    Args:
+        slot_minutes: Duração dos slots oferecidos em /slots/available.
+        work_hours: Expediente (hora inicial, hora final) em UTC.
+    """
+
+    name = "calcom-standin"
+
+    def __init__(self, faults=None, host="127.0.0.1", port=0, prefix="/v2", slot_minutes=60, work_hours=(12, 21)):
+        super().__init__(prefix=prefix, faults=faults, host=host, port=port)
+        self.slot_minutes = slot_minutes
+        self.work_hours = work_hours
+        self.bookings = {}
+        self._ids = itertools.count(1)
+        self._bookings_lock = threading.Lock()
+        self.route("POST", r"/bookings", self._create_booking)
+        self.route("GET", r"/bookings", self._list_bookings)
+        self.route("GET", r"/bookings/(?P<uid>[^/]+)", self._get_booking)
+        self.route("POST", r"/bookings/(?P<uid>[^/]+)/cancel", self._cancel_booking)
+        self.route("GET", r"/slots/available", self._available_slots)
+
+    def rate_limit_body(self):
+        return {"status": "error", "error": {"code": "TooManyRequestsException", "message": "Too many requests"}}
+
+    @staticmethod
+    def _error(status, message):
+        return status, {"status": "error", "error": {"message": message}}
+
+    def _conflicts(self, event_type_id, start, end):
+        return any(
+            booking["eventTypeId"] == event_type_id and booking["status"] == "accepted"
+            and _parse_time(booking["start"]) < end and start < _parse_time(booking["end"])
+            for booking in self.bookings.values()
+        )
+
+    def _create_booking(self, params, query, body):
+        responses = body.get("responses") or body.get("attendee") or {}
+        try:
+            event_type_id = int(body["eventTypeId"])
+            start = _parse_time(body["start"])
+            end = _parse_time(body["end"]) if body.get("end") else start + timedelta(minutes=self.slot_minutes)
+        except (KeyError, TypeError, ValueError):
+            return self._error(400, "eventTypeId and a valid ISO 8601 start are required")
+        if not responses.get("name") or not responses.get("email"):
+            return self._error(400, "Attendee name and email are required")
+        if end <= start:
+            return self._error(400, "end must be after start")
+        with self._bookings_lock:
+            if self._conflicts(event_type_id, start, end):
+                return self._error(409, "no_available_users_found_error")
+            booking_id = next(self._ids)
+            booking = {
+                "id": booking_id,
+                "uid": uuid.uuid4().hex[:22],
+                "title": body.get("title") or f"Reunião com {responses['name']}",
+                "description": body.get("description") or "",
+                "eventTypeId": event_type_id,
+                "start": _format_time(start),
+                "end": _format_time(end),
+                "status": "accepted",
+                "attendees": [{"name": responses["name"], "email": responses["email"],
+                               "timeZone": body.get("timeZone", "UTC")}],
+                "metadata": body.get("metadata") or {},
+            }
+            self.bookings[booking["uid"]] = booking
+        return 201, {"status": "success", "data": dict(booking)}
+
+    def _list_bookings(self, params, query, body):
+        with self._bookings_lock:
+            bookings = sorted((dict(b) for b in self.bookings.values()), key=lambda b: b["start"])
+        return 200, {"status": "success", "data": bookings}
+
+    def _get_booking(self, params, query, body):
+        with self._bookings_lock:
+            booking = self.bookings.get(params["uid"])
+        if booking is None:
+            return self._error(404, "Booking not found")
+        return 200, {"status": "success", "data": dict(booking)}
+
+    def _cancel_booking(self, params, query, body):
+        with self._bookings_lock:
+            booking = self.bookings.get(params["uid"])
+            if booking is None:
+                return self._error(404, "Booking not found")
+            booking["status"] = "cancelled"
+            return 200, {"status": "success", "data": dict(booking)}
+
+    def _available_slots(self, params, query, body):
+        try:
+            event_type_id = int(query["eventTypeId"])
+            start = _parse_time(query["startTime"])
+            end = _parse_time(query["endTime"])
+        except (KeyError, TypeError, ValueError):
+            return self._error(400, "eventTypeId, startTime and endTime are required")
+        length = timedelta(minutes=self.slot_minutes)
+        slots = {}
+        day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        with self._bookings_lock:
+            while day < end:
+                slot = day.replace(hour=self.work_hours[0])
+                day_end = day.replace(hour=self.work_hours[1])
+                while slot + length <= day_end:
+                    if slot >= start and slot + length <= end and not self._conflicts(event_type_id, slot, slot + length):
+                        slots.setdefault(slot.date().isoformat(), []).append({"time": _format_time(slot)})
+                    slot += length
+                day += timedelta(days=1)
+        return 200, {"status": "success", "data": {"slots": slots}}
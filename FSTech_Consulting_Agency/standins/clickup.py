@@ -0,0 +1,134 @@
+"""
+Stand-in local da API v2 do ClickUp.
+
+Emula as rotas usadas por utils/clickup_client.py e utils/clickup_async.py:
+    GET  /team
+    GET  /folder/{folder_id}/list
+    POST /list/{list_id}/task
+    GET  /list/{list_id}/task     (page, date_updated_gt, include_closed; 100 por página)
+    GET  /task/{task_id}
+    PUT  /task/{task_id}          (status validado contra STATUS_MAP)
+
+As tarefas ficam em memória, com o mesmo formato de JSON do ClickUp (status, assignees,
+date_updated em epoch ms como string etc.).
+"""
+
+import itertools
+import threading
+import time
+
+from FSTech_Consulting_Agency.standins.base import StandInServer
+from FSTech_Consulting_Agency.utils.clickup_client import CLICKUP_PAGE_SIZE, STATUS_MAP
+
+# Status que o ClickUp trata como "closed" (excluídos quando include_closed=false)
+CLOSED_STATUSES = {STATUS_MAP["concluida"].lower(), STATUS_MAP["projeto_concluido"].lower()}
+_STATUS_NAMES = {name.lower(): name for name in STATUS_MAP.values()}
+
+
+class ClickUpStandIn(StandInServer):
+    """Servidor local que responde como a API do ClickUp (tarefas em memória)."""
+
+    name = "clickup-standin"
+
+    def __init__(self, faults=None, host="127.0.0.1", port=0, prefix="/api/v2"):
+        super().__init__(prefix=prefix, faults=faults, host=host, port=port)
+        self.tasks = {}
+        self.folders = {}  # folder_id -> [{"id", "name"}]
+        self._ids = itertools.count(1)
+        self._clock_ms = 0
+        self._tasks_lock = threading.Lock()
+        self.route("GET", r"/team", self._team)
+        self.route("GET", r"/folder/(?P<folder_id>[^/]+)/list", self._folder_lists)
+        self.route("POST", r"/list/(?P<list_id>[^/]+)/task", self._create_task)
+        self.route("GET", r"/list/(?P<list_id>[^/]+)/task", self._list_tasks)
+        self.route("GET", r"/task/(?P<task_id>[^/]+)", self._get_task)
+        self.route("PUT", r"/task/(?P<task_id>[^/]+)", self._update_task)
+
+    def rate_limit_body(self):
+        return {"err": "Rate limit reached", "ECODE": "APP_002"}
+
+    def _now_ms(self):
+        # Estritamente crescente: a sincronização incremental depende da ordem de date_updated
+        self._clock_ms = max(int(time.time() * 1000), self._clock_ms + 1)
+        return self._clock_ms
+
+    def add_task(self, list_id, name, status=STATUS_MAP["oportunidade_identificada"], description="", assignees=(),
+                 **fields):
+        """Cria uma tarefa diretamente (semeadura de dados para testes e benchmarks); `fields` sobrescreve o JSON."""
+        with self._tasks_lock:
+            now = self._now_ms()
+            task_id = f"86{next(self._ids):07x}"
+            task = {
+                "id": task_id,
+                "name": name,
+                "description": description or "",
+                "status": {"status": status, "type": "closed" if status.lower() in CLOSED_STATUSES else "custom"},
+                "date_created": str(now),
+                "date_updated": str(now),
+                "due_date": None,
+                "assignees": [{"id": int(a), "username": f"user{a}"} for a in assignees],
+                "list": {"id": str(list_id)},
+                "url": f"https://app.clickup.com/t/{task_id}",
+                **fields,
+            }
+            self.tasks[task_id] = task
+            return dict(task)
+
+    def add_list(self, folder_id, list_id, name=None):
+        """Registra uma lista numa pasta (projetos agrupados por cliente)."""
+        self.folders.setdefault(str(folder_id), []).append({"id": str(list_id), "name": name or f"Lista {list_id}"})
+
+    def _folder_lists(self, params, query, body):
+        if params["folder_id"] not in self.folders:
+            return 404, {"err": "Folder not found", "ECODE": "ACCESS_083"}
+        return 200, {"lists": [dict(item) for item in self.folders[params["folder_id"]]]}
+
+    def _team(self, params, query, body):
+        return 200, {"teams": [{"id": "1", "name": "FSTech (stand-in)"}]}
+
+    def _create_task(self, params, query, body):
+        if not body.get("name"):
+            return 400, {"err": "Task name invalid", "ECODE": "INPUT_005"}
+        status = _STATUS_NAMES.get(str(body.get("status") or STATUS_MAP["oportunidade_identificada"]).lower())
+        if status is None:
+            return 400, {"err": "Status does not exist", "ECODE": "CRTSK_001"}
+        return 200, self.add_task(params["list_id"], body["name"], status, body.get("description"),
+                                  body.get("assignees") or ())
+
+    def _list_tasks(self, params, query, body):
+        page = int(query.get("page") or 0)
+        updated_gt = int(query["date_updated_gt"]) if query.get("date_updated_gt") else None
+        include_closed = query.get("include_closed", "false").lower() == "true"
+        with self._tasks_lock:
+            matching = [
+                dict(task) for task in self.tasks.values()
+                if task["list"]["id"] == params["list_id"]
+                and (updated_gt is None or int(task["date_updated"]) > updated_gt)
+                and (include_closed or task["status"]["type"] != "closed")
+            ]
+        start = page * CLICKUP_PAGE_SIZE
+        page_tasks = matching[start:start + CLICKUP_PAGE_SIZE]
+        return 200, {"tasks": page_tasks, "last_page": start + CLICKUP_PAGE_SIZE >= len(matching)}
+
+    def _get_task(self, params, query, body):
+        with self._tasks_lock:
+            task = self.tasks.get(params["task_id"])
+            if task is None:
+                return 404, {"err": "Task not found, deleted", "ECODE": "ITEM_013"}
+            return 200, dict(task)
+
+    def _update_task(self, params, query, body):
+        with self._tasks_lock:
+            task = self.tasks.get(params["task_id"])
+            if task is None:
+                return 404, {"err": "Task not found, deleted", "ECODE": "ITEM_013"}
+            if "status" in body:
+                status = _STATUS_NAMES.get(str(body["status"]).lower())
+                if status is None:
+                    return 400, {"err": "Status does not exist", "ECODE": "CRTSK_001"}
+                task["status"] = {"status": status, "type": "closed" if status.lower() in CLOSED_STATUSES else "custom"}
+            for field in ("name", "description"):
+                if field in body:
+                    task[field] = body[field]
+            task["date_updated"] = str(self._now_ms())
+            return 200, dict(task)
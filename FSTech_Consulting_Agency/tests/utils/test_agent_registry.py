@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+from FSTech_Consulting_Agency.utils.agent_registry import AGENT_SPECS, agent_tool_names, list_agents, load_tool
+
+
+def test_todas_as_ferramentas_das_especificacoes_existem():
+    for key, spec in AGENT_SPECS.items():
+        for tool in spec["tools"]:
+            assert callable(load_tool(tool)), tool
+        assert agent_tool_names(key)
+
+
+def test_importar_orquestrador_nao_carrega_ferramentas():
+    code = (
+        "import sys\n"
+        "import FSTech_Consulting_Agency.orquestrador_fstech\n"
+        "from FSTech_Consulting_Agency.utils.agent_registry import list_agents\n"
+        "list_agents()\n"
+        "print(any('.tools' in name for name in sys.modules))\n"
+    )
+    resultado = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert resultado.stdout.strip() == "False"
+    assert len(list_agents()) == 8
+
+
+def test_fluxo_agenda_reuniao_sem_ferramentas_globais(monkeypatch):
+    from FSTech_Consulting_Agency import orquestrador_fstech
+    from FSTech_Consulting_Agency.Suporte_Administrativo.tools import appointment_scheduler_manager
+
+    chamadas = []
+
+    def schedule_meeting_calcom(**kwargs):
+        chamadas.append(kwargs)
+        return "Agendamento criado com sucesso! ID: 42"
+
+    monkeypatch.setattr(appointment_scheduler_manager, "schedule_meeting_calcom", schedule_meeting_calcom)
+    resposta = orquestrador_fstech.agendar_reuniao("2025-05-10T17:00:00.000Z", "2025-05-10T18:00:00.000Z",
+                                                   "Maria", "maria@cliente.com", "Lead", "Resumo")
+
+    assert resposta == "Agendamento criado com sucesso! ID: 42"
+    assert chamadas[0]["attendee_email"] == "maria@cliente.com"
+    assert chamadas[0]["event_type_id"] == 1585329
+
+
+def test_abrir_o_app_nao_carrega_integracoes_nem_sobe_webhook():
+    import os
+
+    app = os.path.join(os.path.dirname(__file__), "..", "..", "..", "app.py")
+    code = (
+        "import runpy, sys\n"
+        f"runpy.run_path({os.path.abspath(app)!r})\n"
+        "adiados = ('utils.clickup_webhook', 'utils.calcom_availability', 'utils.transcript_ingest',\n"
+        "           'tools.appointment_scheduler_manager')\n"
+        "print(sorted(m for m in sys.modules if m.endswith(adiados)))\n"
+    )
+    resultado = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert resultado.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_app_registra_transicao_de_status_recusada():
+    import os
+
+    app = os.path.join(os.path.dirname(__file__), "..", "..", "..", "app.py")
+    code = (
+        "import runpy\n"
+        f"app = runpy.run_path({os.path.abspath(app)!r})\n"
+        "app['st'].session_state.task_id = 't1'\n"
+        "for aceita in (True, False):\n"
+        "    app['_queue_crm_status'].__globals__['enqueue_task_status'] = lambda task_id, status_key: aceita\n"
+        "    app['_queue_crm_status']('proposta_enviada', 'Proposta Enviada')\n"
+        "    print('log:', app['st'].session_state.logs[-1]['message'])\n"
+    )
+    resultado = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    aceita, recusada = [linha[5:] for linha in resultado.stdout.splitlines() if linha.startswith("log: ")]
+    assert aceita == "Status atualizado no CRM para 'Proposta Enviada'"
+    assert recusada.startswith("Mudança de status no CRM para 'Proposta Enviada' recusada")
@@ -0,0 +1,71 @@
+import json
+import random
+
+from FSTech_Consulting_Agency.utils import architecture_scoring
+from FSTech_Consulting_Agency.utils.architecture_scoring import load_documents, score_documents, write_csv
+from FSTech_Consulting_Agency.utils.component_catalog import load_component_catalog
+from FSTech_Consulting_Agency.utils.keyword_matcher import tokenize
+
+CATALOGO = load_component_catalog()
+TRECHOS = ["login com autenticação", "dashboard de vendas", "api para parceiros", "aplicativo móvel",
+           "modelo de ia", "pagamento recorrente", "reunião de alinhamento", "banco de dados sql"]
+
+
+def _corpus(quantidade, semente=5):
+    gerador = random.Random(semente)
+    return {f"ata-{i}": ". ".join(gerador.sample(TRECHOS, gerador.randint(1, 5))) for i in range(quantidade)}
+
+
+def test_resultado_colunar_igual_ao_da_pontuacao_individual():
+    documentos = _corpus(50)
+    resultado = score_documents(documentos, catalog=CATALOGO, processes=1)
+    assert resultado["doc_ids"] == list(documentos) and resultado["components"] == CATALOGO.components
+    for posicao, texto in enumerate(documentos.values()):
+        hits, total = CATALOGO.score(texto)
+        assert resultado["scores"][posicao] == total
+        assert resultado["levels"][posicao] == CATALOGO.complexity_level(total)
+        assert {CATALOGO.components[i] for i, _ in hits} == {
+            nome for nome, coluna in resultado["hits"].items() if coluna[posicao]}
+    assert sum(resultado["level_counts"].values()) == 50
+
+
+def test_pool_de_processos_da_o_mesmo_resultado(monkeypatch):
+    monkeypatch.setattr(architecture_scoring, "ARCH_SCORING_PROCESS_THRESHOLD", 100)
+    documentos = list(_corpus(400).values())
+    em_processo = score_documents(documentos, catalog=CATALOGO, processes=1)
+    com_pool = score_documents(documentos, catalog=CATALOGO, processes=2, chunk_size=100)
+    assert com_pool["processes"] == 2
+    assert com_pool["scores"] == em_processo["scores"] and com_pool["hits"] == em_processo["hits"]
+
+
+def test_milhares_de_documentos_numa_passada_cada(monkeypatch):
+    documentos = list(_corpus(5000, semente=9).values())
+    varridas, palavras = [0], [0]
+    scan_tokens = CATALOGO.matcher.scan_tokens
+
+    def scan_tokens_contado(tokens):
+        varridas[0] += 1
+        palavras[0] += len(tokens)
+        return scan_tokens(tokens)
+
+    monkeypatch.setattr(CATALOGO.matcher, "scan_tokens", scan_tokens_contado)
+    resultado = score_documents(documentos, catalog=CATALOGO, processes=1)
+    assert len(resultado["scores"]) == 5000
+    # Cada documento é percorrido uma única vez, não uma vez por componente ou palavra-chave
+    assert varridas[0] == 5000
+    assert palavras[0] == sum(len(tokenize(texto)) for texto in documentos)
+
+
+def test_carrega_jsonl_e_grava_csv(tmp_path):
+    entrada = tmp_path / "atas.jsonl"
+    entrada.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in [
+        {"lead_id": "acme", "ata_reuniao": "Precisamos de login e dashboard"},
+        {"id": "beta", "text": "Aplicativo móvel com pagamento e API"},
+    ]), encoding="utf-8")
+    resultado = score_documents(load_documents(str(entrada)), catalog=CATALOGO)
+    assert resultado["doc_ids"] == ["acme", "beta"] and resultado["scores"] == [2, 7]
+
+    saida = tmp_path / "pontuacoes.csv"
+    write_csv(resultado, str(saida))
+    linhas = saida.read_text(encoding="utf-8").splitlines()
+    assert linhas[0].startswith("doc_id,API REST/GraphQL") and linhas[2].endswith(",7,media")
@@ -0,0 +1,109 @@
+import time
+
+import pytest
+import requests
+
+from FSTech_Consulting_Agency.standins import CalcomStandIn
+from FSTech_Consulting_Agency.utils.calcom_availability import (
+    CalcomAvailability, FreeIntervals, SlotUnavailableError, format_time, parse_time)
+
+HORA = 3600
+
+
+def test_intervalos_livres_unem_recortam_e_buscam_horarios():
+    livres = FreeIntervals.from_slots([0, HORA, 2 * HORA, 5 * HORA], HORA)
+    assert list(livres) == [(0, 3 * HORA), (5 * HORA, 6 * HORA)]
+    assert livres.contains(HORA, 3 * HORA) and not livres.contains(2 * HORA, 4 * HORA)
+
+    livres.remove(HORA, 2 * HORA)
+    assert list(livres) == [(0, HORA), (2 * HORA, 3 * HORA), (5 * HORA, 6 * HORA)]
+    assert livres.find(HORA, after=HORA // 2, step=HORA) == [2 * HORA, 5 * HORA]
+    assert livres.find(2 * HORA, step=HORA) == []
+
+    livres.add(HORA, 2 * HORA)
+    livres.add(3 * HORA, 5 * HORA)
+    assert list(livres) == [(0, 6 * HORA)]
+
+
+def test_formato_de_horarios_da_api():
+    assert parse_time("2025-05-10T14:00:00-03:00") == parse_time("2025-05-10T17:00:00.000Z")
+    assert parse_time("2025-05-10T14:00:00") == parse_time("2025-05-10T17:00:00Z")  # sem fuso: Brasília
+    assert format_time(parse_time("2025-05-10T14:00:00-03:00")) == "2025-05-10T17:00:00.000Z"
+
+
+@pytest.fixture
+def calcom():
+    with CalcomStandIn() as servidor:
+        yield servidor
+
+
+def _buscar_slots(servidor, chamadas):
+    def buscar(event_type_id, inicio, fim):
+        chamadas.append(event_type_id)
+        resposta = requests.get(f"{servidor.base_url}/slots/available", timeout=5, params={
+            "eventTypeId": event_type_id, "startTime": format_time(inicio), "endTime": format_time(fim)})
+        slots = resposta.json()["data"]["slots"]
+        return [parse_time(slot["time"]) for dia in slots.values() for slot in dia]
+    return buscar
+
+
+def _agendar(servidor):
+    def agendar(event_type_id, start_time, end_time, **dados):
+        resposta = requests.post(f"{servidor.base_url}/bookings", timeout=5, json={
+            "eventTypeId": event_type_id, "start": start_time, "end": end_time,
+            "responses": {"name": dados["attendee_name"], "email": dados["attendee_email"]}})
+        resposta.raise_for_status()
+        return resposta.json()["data"]
+    return agendar
+
+
+def test_busca_local_e_agendamento_somente_em_horarios_livres(calcom):
+    chamadas = []
+    disponibilidade = CalcomAvailability(fetch_slots=_buscar_slots(calcom, chamadas), days=3)
+    agendar = _agendar(calcom)
+
+    livres = disponibilidade.find_free_slots(1, count=3)
+    assert len(livres) == 3 and all(slot["start"] < slot["end"] for slot in livres)
+    inicio = time.perf_counter()
+    for _ in range(100):
+        disponibilidade.find_free_slots(1, count=3)
+    assert time.perf_counter() - inicio < 0.5
+    assert chamadas == [1]  # uma única busca na API
+
+    reserva = disponibilidade.book(1, livres[0]["start"], livres[0]["end"], agendar,
+                                   attendee_name="Cliente", attendee_email="cliente@example.com")
+    assert reserva["status"] == "accepted"
+    assert disponibilidade.is_available(1, livres[0]["start"], livres[0]["end"]) is False
+
+    # Horário já ocupado: recusado localmente, sem POST, com sugestões
+    with pytest.raises(SlotUnavailableError) as erro:
+        disponibilidade.book(1, livres[0]["start"], livres[0]["end"], agendar,
+                             attendee_name="Outro", attendee_email="outro@example.com")
+    assert erro.value.suggestions[0]["start"] == livres[1]["start"]
+    assert len(calcom.bookings) == 1 and chamadas == [1]
+
+
+def test_conflito_na_api_invalida_o_cache_e_sugere_horarios(calcom):
+    chamadas = []
+    disponibilidade = CalcomAvailability(fetch_slots=_buscar_slots(calcom, chamadas), days=3)
+    livre = disponibilidade.find_free_slots(1, count=1)[0]
+    # Outro canal ocupa o horário depois que a disponibilidade foi para o cache
+    _agendar(calcom)(1, livre["start"], livre["end"], attendee_name="Externo", attendee_email="x@example.com")
+
+    with pytest.raises(SlotUnavailableError) as erro:
+        disponibilidade.book(1, livre["start"], livre["end"], _agendar(calcom),
+                             attendee_name="Cliente", attendee_email="cliente@example.com")
+    assert chamadas == [1, 1]  # cache invalidado e disponibilidade rebuscada para as sugestões
+    assert erro.value.suggestions and erro.value.suggestions[0]["start"] != livre["start"]
+    assert disponibilidade.stats["conflicts"] == 1
+
+
+def test_falha_na_busca_de_disponibilidade_nao_bloqueia_agendamento():
+    def falhar(*args):
+        raise requests.ConnectionError("sem rede")
+
+    disponibilidade = CalcomAvailability(fetch_slots=falhar)
+    assert disponibilidade.is_available(1, "2030-01-01T12:00:00Z", "2030-01-01T13:00:00Z") is None
+    reserva = disponibilidade.book(1, "2030-01-01T12:00:00Z", "2030-01-01T13:00:00Z",
+                                   lambda **dados: {"id": 7, **dados})
+    assert reserva["id"] == 7 and reserva["start_time"] == "2030-01-01T12:00:00.000Z"
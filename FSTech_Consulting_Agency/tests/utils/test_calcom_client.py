@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from FSTech_Consulting_Agency.standins import CalcomStandIn, FaultConfig
+from FSTech_Consulting_Agency.utils import calcom_client
+from FSTech_Consulting_Agency.utils.calcom_availability import CalcomAvailability, fetch_available_slots
+
+
+@pytest.fixture
+def calcom(monkeypatch):
+    with CalcomStandIn() as servidor:
+        monkeypatch.setattr(calcom_client, "CALCOM_API_URL", servidor.base_url)
+        monkeypatch.setattr(calcom_client, "_http", None)
+        monkeypatch.setenv("CALCOM_API_KEY", "standin")
+        yield servidor
+        calcom_client._http.close()
+
+
+def test_chave_lida_no_uso_e_sessao_reaproveitada(calcom, monkeypatch):
+    monkeypatch.delenv("CALCOM_API_KEY")
+    with pytest.raises(ValueError):
+        calcom_client.get_calcom_http()
+
+    monkeypatch.setenv("CALCOM_API_KEY", "chave-1")
+    http = calcom_client.get_calcom_http()
+    assert calcom_client.get_calcom_http() is http
+    assert http.session.headers["Authorization"] == "Bearer chave-1"
+    monkeypatch.setenv("CALCOM_API_KEY", "chave-2")
+    assert calcom_client.get_calcom_http() is not http
+
+
+def test_agendamento_em_lote_distribui_horarios_livres(calcom):
+    disponibilidade = CalcomAvailability(fetch_slots=fetch_available_slots, days=3)
+    livres = disponibilidade.find_free_slots(7, count=2)
+    reuniao_marcada = {"attendee_name": "Cliente 0", "attendee_email": "c0@example.com",
+                       "start_time": livres[0]["start"], "end_time": livres[0]["end"]}
+    leads = [{"attendee_name": f"Lead {i}", "attendee_email": f"lead{i}@example.com"} for i in range(10)]
+
+    relatorio = calcom_client.book_meetings_batch([reuniao_marcada, *leads, dict(reuniao_marcada)], 7,
+                                                  concurrency=6, per_minute=0, availability=disponibilidade)
+
+    assert len(relatorio["booked"]) == 11 and len(calcom.bookings) == 11
+    assert len({item["start"] for item in relatorio["booked"]}) == 11
+    assert relatorio["booked"][0]["start"] == livres[0]["start"]
+    # Repetição do horário já reservado: recusada (localmente ou pela API) com sugestões
+    assert [item["index"] for item in relatorio["failed"]] == [11]
+    assert relatorio["failed"][0]["suggestions"]
+    metricas = calcom_client.get_calcom_metrics()
+    assert metricas["POST /bookings"]["count"] <= 12 and metricas["GET /slots/available"]["retries"] == 0
+
+
+def test_lote_respeita_concorrencia():
+    def agendar_lento(event_type_id, start_time, end_time, **dados):
+        time.sleep(0.1)
+        return {"id": dados["attendee_email"], "start": start_time}
+
+    disponibilidade = CalcomAvailability(fetch_slots=lambda *args: [])
+    reunioes = [{"attendee_name": f"L{i}", "attendee_email": f"l{i}@example.com",
+                 "start_time": f"2030-01-0{1 + i // 8}T{10 + i % 8}:00:00Z"} for i in range(16)]
+    inicio = time.perf_counter()
+    relatorio = calcom_client.book_meetings_batch(reunioes, 1, concurrency=8, per_minute=0,
+                                                  availability=disponibilidade, booker=agendar_lento)
+    assert time.perf_counter() - inicio < 0.8  # serial levaria ~1,6s
+    assert len(relatorio["booked"]) == 16 and not relatorio["failed"]
+
+
+def test_busca_de_disponibilidade_retenta_falhas_transitorias(monkeypatch):
+    with CalcomStandIn(FaultConfig(error_rate=0.5, seed=3)) as servidor:
+        monkeypatch.setattr(calcom_client, "CALCOM_API_URL", servidor.base_url)
+        monkeypatch.setattr(calcom_client, "_http", None)
+        monkeypatch.setenv("CALCOM_API_KEY", "standin")
+        http = calcom_client.get_calcom_http()
+        http._backoff = lambda attempt: 0.0
+        http.max_retries = 10
+        disponibilidade = CalcomAvailability(days=2)
+        for _ in range(4):
+            disponibilidade.invalidate()
+            assert disponibilidade.find_free_slots(1, count=1)
+        http.close()
+    assert servidor.stats["injected_errors"] > 0
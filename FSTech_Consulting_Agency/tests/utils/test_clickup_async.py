@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from FSTech_Consulting_Agency.utils.clickup_async import AsyncClickUpClient
+from FSTech_Consulting_Agency.utils.clickup_client import StatusWriteQueue
+from FSTech_Consulting_Agency.utils.crm_status import CRMStatusMachine
+from FSTech_Consulting_Agency.utils.http_session import HTTPClient
+
+
+class _ClickUpLento(BaseHTTPRequestHandler):
+    def _json(self, corpo):
+        dados = json.dumps(corpo).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.startswith("/list/"):
+            pagina = int(parse_qs(url.query)["page"][0])
+            tarefas = [{"id": f"p{pagina}-{i}"} for i in range(100 if pagina < 2 else 30)] if pagina < 3 else []
+            self._json({"tasks": tarefas, "last_page": pagina >= 2})
+        else:
+            time.sleep(0.1)
+            self._json({"id": url.path.rsplit("/", 1)[-1], "status": {"status": "Projeto em Andamento"}})
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._json({"id": self.path.rsplit("/", 1)[-1]})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ClickUpLento)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield HTTPClient(f"http://127.0.0.1:{httpd.server_port}", name="teste")
+    httpd.shutdown()
+
+
+def test_busca_de_varias_tarefas_em_paralelo(http):
+    async def executar():
+        async with AsyncClickUpClient(concurrency=10, http=http, status_machine=CRMStatusMachine()) as client:
+            return await client.get_tasks([f"t{i}" for i in range(10)])
+
+    inicio = time.perf_counter()
+    tarefas = asyncio.run(executar())
+    assert time.perf_counter() - inicio < 0.6  # serial levaria ~1s
+    assert tarefas["t7"]["status"]["status"] == "Projeto em Andamento"
+
+
+def test_listagem_paginada_e_atualizacoes_em_lote(http):
+    async def executar():
+        async with AsyncClickUpClient(concurrency=2, http=http, status_machine=CRMStatusMachine()) as client:
+            tarefas = await client.list_tasks("901311371093")
+            atualizacoes = await client.update_statuses({"a1": "projeto_concluido", "a2": "status_invalido"})
+            return tarefas, atualizacoes
+
+    tarefas, atualizacoes = asyncio.run(executar())
+    assert len(tarefas) == 230
+    assert atualizacoes == {"a1": True, "a2": False}
+
+
+def test_atualizacao_assincrona_descarta_transicao_pendente(http, tmp_path):
+    maquina = CRMStatusMachine()
+    maquina.record("t1", "proposta_enviada")
+    enviados = []
+    fila = StatusWriteQueue(path=str(tmp_path / "fila.json"), flush_interval=60,
+                            sender=lambda *args: enviados.append(args) or True)
+    fila.enqueue("t1", "proposta_aceita")
+
+    async def executar():
+        async with AsyncClickUpClient(http=http, status_machine=maquina, status_queue=fila) as client:
+            recusada = await client.update_task_status("t1", "contato_realizado")  # retrocesso
+            pendentes = fila.pending()
+            return recusada, pendentes, await client.update_task_status("t1", "venda_realizada")
+
+    recusada, pendentes, aceita = asyncio.run(executar())
+    assert not recusada and pendentes == {"t1": "proposta_aceita"}
+    assert aceita and fila.pending() == {}
+    assert fila.flush() == 0 and enviados == []  # a pendência obsoleta não sobrescreve o PUT
+    assert maquina.known_status("t1") == "venda_realizada"
+    fila.close(flush=False)
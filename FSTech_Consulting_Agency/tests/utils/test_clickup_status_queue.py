@@ -0,0 +1,66 @@
+import time
+
+from FSTech_Consulting_Agency.utils.clickup_client import StatusWriteQueue
+
+
+def test_transicoes_seguidas_sao_coalescidas_no_estado_final(tmp_path):
+    enviados = []
+    fila = StatusWriteQueue(path=str(tmp_path / "fila.json"), flush_interval=0.2,
+                            sender=lambda task_id, status: enviados.append((task_id, status)) or True)
+    inicio = time.perf_counter()
+    assert fila.enqueue("t1", "proposta_enviada")
+    assert fila.enqueue("t1", "aguardando_resposta")
+    assert fila.enqueue("t2", "contato_realizado")
+    assert time.perf_counter() - inicio < 0.1  # não bloqueia
+
+    time.sleep(0.6)
+    assert sorted(enviados) == [("t1", "aguardando_resposta"), ("t2", "contato_realizado")]
+    assert fila.pending() == {}
+    fila.close()
+
+
+def test_pendencias_persistem_entre_execucoes(tmp_path):
+    caminho = str(tmp_path / "fila.json")
+    fila = StatusWriteQueue(path=caminho, flush_interval=60, sender=lambda *_: False)
+    fila.enqueue("t1", "reuniao_agendada")
+    assert not fila.enqueue("t1", "status_inexistente")
+    fila.close(flush=False)
+
+    enviados = []
+    nova = StatusWriteQueue(path=caminho, flush_interval=60, sender=lambda *args: enviados.append(args) or True)
+    assert nova.pending() == {"t1": "reuniao_agendada"}
+    assert nova.flush() == 1
+    assert enviados == [("t1", "reuniao_agendada")]
+    nova.close()
+
+
+def test_falhas_sao_retentadas_e_descartadas_apos_limite(tmp_path):
+    fila = StatusWriteQueue(path=str(tmp_path / "fila.json"), flush_interval=60, max_attempts=2,
+                            sender=lambda *_: False)
+    fila.enqueue("t1", "venda_realizada")
+    fila.flush()
+    assert fila.pending() == {"t1": "venda_realizada"}
+    fila.flush()
+    assert fila.pending() == {} and fila.stats["dropped"] == 1
+    fila.close(flush=False)
+
+
+def test_gravacao_em_disco_fica_na_thread_de_envio(tmp_path):
+    import json
+    import threading
+
+    caminho = tmp_path / "fila.json"
+    fila = StatusWriteQueue(path=str(caminho), flush_interval=60, sender=lambda *_: True)
+    threads = []
+    gravar = fila._persist
+    fila._persist = lambda: threads.append(threading.current_thread().name) or gravar()
+
+    fila.enqueue("t1", "proposta_enviada")
+    fila.enqueue("t2", "contato_realizado")
+    for _ in range(100):
+        if caminho.exists() and len(json.loads(caminho.read_text(encoding="utf-8"))) == 2:
+            break
+        time.sleep(0.01)
+    assert set(json.loads(caminho.read_text(encoding="utf-8"))) == {"t1", "t2"}
+    assert threads and set(threads) == {"crm-status-queue"}
+    fila.close(flush=False)
@@ -0,0 +1,71 @@
+import json
+import time
+
+import pytest
+import requests
+
+from FSTech_Consulting_Agency.utils.clickup_webhook import (
+    ClickUpWebhookHandler, ClickUpWebhookServer, TaskEventLog, sign_payload, verify_signature,
+)
+from FSTech_Consulting_Agency.utils.crm_mirror import CRMMirror
+from FSTech_Consulting_Agency.utils.crm_status import CRMStatusMachine
+
+SEGREDO = "segredo-de-teste"
+AGORA = int(time.time() * 1000)
+
+
+def _evento(task_id, antes, depois, data, item_id):
+    return {
+        "event": "taskStatusUpdated", "task_id": task_id, "webhook_id": "wh1",
+        "history_items": [{"id": item_id, "field": "status", "date": str(data),
+                           "before": {"status": antes}, "after": {"status": depois}}],
+    }
+
+
+@pytest.fixture
+def receptor():
+    maquina = CRMStatusMachine()
+    espelho = CRMMirror(path=":memory:", fetch_pages=lambda *a, **k: iter(()))
+    espelho.upsert_tasks("lista", [{"id": "t1", "name": "Lead - ACME", "status": {"status": "Contato Realizado"}}])
+    handler = ClickUpWebhookHandler(TaskEventLog(":memory:"), status_machine=maquina, mirror=espelho)
+    servidor = ClickUpWebhookServer(handler, secret=SEGREDO, port=0).start()
+    yield servidor, maquina, espelho
+    servidor.stop()
+
+
+def _enviar(url, evento, segredo=SEGREDO):
+    corpo = json.dumps(evento).encode()
+    return requests.post(url, data=corpo, headers={"X-Signature": sign_payload(corpo, segredo)}, timeout=5)
+
+
+def test_evento_assinado_atualiza_status_espelho_e_log(receptor):
+    servidor, maquina, espelho = receptor
+    resposta = _enviar(servidor.url, _evento("t1", "Contato Realizado", "Reunião Agendada", AGORA + 2000, "h1"))
+    assert resposta.status_code == 200 and resposta.json() == {"applied": 1}
+    assert maquina.known_status("t1") == "reuniao_agendada"
+    assert espelho.get_task("t1")["status_key"] == "reuniao_agendada"
+    assert espelho.get_raw_task("t1")["status"]["status"] == "Reunião Agendada"
+    assert servidor.handler.event_log.latest_status("t1")["status"] == "Reunião Agendada"
+
+
+def test_assinatura_invalida_e_recusada(receptor):
+    servidor, maquina, _ = receptor
+    resposta = _enviar(servidor.url, _evento("t1", "a", "Proposta Enviada", AGORA + 2000, "h1"), segredo="outro")
+    assert resposta.status_code == 401
+    assert maquina.known_status("t1") is None
+    assert not verify_signature(b"{}", "", SEGREDO)
+
+
+def test_reenvios_e_eventos_fora_de_ordem(receptor):
+    servidor, maquina, _ = receptor
+    _enviar(servidor.url, _evento("t1", "Reunião Agendada", "Proposta Enviada", AGORA + 3000, "h2"))
+    assert _enviar(servidor.url, _evento("t1", "Reunião Agendada", "Proposta Enviada", AGORA + 3000, "h2")).json() == {"applied": 0}
+    _enviar(servidor.url, _evento("t1", "Contato Realizado", "Reunião Agendada", AGORA + 2000, "h1"))  # atrasado
+    assert maquina.known_status("t1") == "proposta_enviada"
+    assert servidor.handler.stats == {"received": 3, "duplicates": 1, "status_updates": 1}
+
+
+def test_tarefa_excluida_sai_do_espelho(receptor):
+    servidor, _, espelho = receptor
+    _enviar(servidor.url, {"event": "taskDeleted", "task_id": "t1", "history_items": []})
+    assert espelho.get_task("t1") is None
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from FSTech_Consulting_Agency.utils.component_catalog import (
+    CatalogError, CatalogStore, ComponentCatalog, load_component_catalog)
+
+
+def _catalogo(versao, componentes, baixa=2, media=4):
+    return {"version": versao, "complexity_thresholds": {"baixa": baixa, "media": media}, "components": componentes}
+
+
+def test_catalogo_padrao_compila_sinonimos_pesos_e_categorias():
+    catalogo = load_component_catalog()
+    assert catalogo.keywords["site"] == {"name": "Frontend Web", "score": 1, "category": "frontend"}
+    assert catalogo.keywords["interface web"]["score"] == 2
+    assert catalogo.matcher.matches("Painel web com login e relatórios") == {"login", "relatórios"}
+    assert [catalogo.complexity_level(p) for p in (4, 5, 8, 9)] == ["baixa", "media", "media", "alta"]
+
+
+def test_recarrega_quando_o_arquivo_muda_e_mantem_o_anterior_se_invalido(tmp_path):
+    caminho = tmp_path / "catalogo.json"
+    caminho.write_text(json.dumps(_catalogo("v1", [{"name": "API", "score": 2, "keywords": ["api"]}])))
+    store = CatalogStore(str(caminho), check_seconds=0)
+    primeiro = store.get()
+    assert store.get() is primeiro and store.stats["loads"] == 1  # sem mudança: sem recompilar
+
+    caminho.write_text(json.dumps(_catalogo("v2", [{"name": "Fila", "score": 3, "keywords": ["kafka", "fila"]}])))
+    segundo = store.get()
+    assert segundo.version == "v2" and segundo.matcher.matches("fila no Kafka") == {"kafka", "fila"}
+
+    caminho.write_text("{ quebrado")
+    assert store.get() is segundo and store.stats["reload_errors"] == 1
+    assert store.get() is segundo and store.stats["reload_errors"] == 1  # não relê o mesmo arquivo inválido
+
+
+def test_cache_evita_stat_a_cada_chamada(tmp_path):
+    caminho = tmp_path / "catalogo.json"
+    caminho.write_text(json.dumps(_catalogo("v1", [{"name": "API", "score": 2, "keywords": ["api"]}])))
+    store = CatalogStore(str(caminho), check_seconds=60)
+    store.get()
+    caminho.write_text(json.dumps(_catalogo("v2", [{"name": "API", "score": 2, "keywords": ["api"]}])))
+    assert store.get().version == "v1"
+
+
+def test_validacao_e_yaml(tmp_path):
+    with pytest.raises(CatalogError):
+        ComponentCatalog(_catalogo("v1", [{"name": "API", "keywords": ["api"]}]))  # sem pontuação
+    with pytest.raises(CatalogError):
+        ComponentCatalog(_catalogo("v1", [], baixa=9, media=4))
+
+    caminho = tmp_path / "catalogo.yaml"
+    caminho.write_text(
+        "version: y1\ncomplexity_thresholds: {baixa: 1, media: 2}\n"
+        "components:\n  - name: Webhook\n    score: 1\n    keywords: [webhook]\n",
+        encoding="utf-8",
+    )
+    pytest.importorskip("yaml")
+    assert load_component_catalog(str(caminho)).keywords["webhook"]["category"] == "geral"
+
+
+# Catálogo que ficava no código antes de ir para o JSON: os escores existentes não podem mudar
+_CATALOGO_ANTERIOR = {
+    "api": ("API REST/GraphQL", 2), "banco de dados": ("Banco de Dados (SQL/NoSQL)", 2),
+    "database": ("Banco de Dados (SQL/NoSQL)", 2), "sql": ("Banco de Dados (SQL)", 2),
+    "nosql": ("Banco de Dados (NoSQL)", 2), "frontend": ("Frontend Web (React/Vue/Angular)", 2),
+    "interface web": ("Frontend Web", 2), "site": ("Frontend Web", 1),
+    "aplicativo móvel": ("Aplicativo Móvel (iOS/Android)", 3), "mobile app": ("Aplicativo Móvel (iOS/Android)", 3),
+    "inteligência artificial": ("Componente de IA/ML", 3), "machine learning": ("Componente de IA/ML", 3),
+    "modelo de ia": ("Componente de IA/ML", 3), "llm": ("Integração com LLM", 2),
+    "gpt": ("Integração com LLM (GPT)", 2), "integração": ("Integração com Sistema Externo", 2),
+    "webhook": ("Integração via Webhook", 1), "automação": ("Fluxo de Automação", 1),
+    "pagamento": ("Integração de Pagamento", 2), "login": ("Sistema de Autenticação", 1),
+    "autenticação": ("Sistema de Autenticação", 1), "dashboard": ("Painel de Controle/Dashboard", 1),
+    "relatórios": ("Geração de Relatórios", 1),
+}
+
+
+def test_catalogo_padrao_reproduz_os_escores_anteriores():
+    import random
+
+    catalogo = load_component_catalog()
+    assert {k: (v["name"], v["score"]) for k, v in catalogo.keywords.items()} == _CATALOGO_ANTERIOR
+    assert catalogo.thresholds == {"baixa": 4, "media": 8}
+
+    extras = ["GraphQL", "PostgreSQL", "MySQL", "MongoDB", "React", "Android", "Stripe", "OAuth", "relatório"]
+    sorteio = random.Random(7)
+    for _ in range(300):
+        texto = " e ".join(sorteio.sample(list(_CATALOGO_ANTERIOR) + extras, sorteio.randint(1, 8)))
+        encontradas = catalogo.matcher.matches(texto)
+        esperado = {}
+        for palavra, (nome, pontos) in _CATALOGO_ANTERIOR.items():
+            if palavra in encontradas:
+                esperado.setdefault(nome, pontos)
+        _, total = catalogo.score(texto)
+        assert total == sum(esperado.values()), texto
@@ -0,0 +1,122 @@
+import pytest
+
+from FSTech_Consulting_Agency.utils.crm_mirror import CRMMirror
+
+
+def _tarefa(i, status="Contato Realizado", atualizado=1_700_000_000_000, responsavel=None):
+    return {
+        "id": f"t{i}",
+        "name": f"Lead {i}",
+        "status": {"status": status},
+        "date_created": "1700000000000",
+        "date_updated": str(atualizado + i * 60_000),
+        "assignees": [{"id": responsavel, "username": f"user{responsavel}"}] if responsavel else [],
+    }
+
+
+class _ClickUpFalso:
+    def __init__(self, tarefas):
+        self.tarefas = tarefas
+        self.chamadas = []
+
+    def __call__(self, list_id, date_updated_gt=None):
+        self.chamadas.append((list_id, date_updated_gt))
+        selecionadas = [t for t in self.tarefas if date_updated_gt is None or int(t["date_updated"]) > date_updated_gt]
+        for inicio in range(0, len(selecionadas), 100):
+            yield selecionadas[inicio:inicio + 100]
+
+
+def test_carga_inicial_paginada_e_consultas_locais():
+    api = _ClickUpFalso([_tarefa(i, responsavel=7 if i % 2 else None) for i in range(250)])
+    espelho = CRMMirror(":memory:", fetch_pages=api)
+    assert espelho.sync(list_ids=["crm"]) == {"crm": 250}
+    assert api.chamadas == [("crm", None)]
+    assert espelho.status_counts("crm") == {"Contato Realizado": 250}
+    assert espelho.assignee_counts("crm") == {"user7": 125}
+    assert len(espelho.find_tasks(list_id="crm", status_key="contato_realizado", assignee_id=7)) == 125
+    assert espelho.get_task("t3")["status_key"] == "contato_realizado"
+
+
+def test_sincronizacao_incremental_usa_date_updated_gt():
+    api = _ClickUpFalso([_tarefa(i) for i in range(10)])
+    espelho = CRMMirror(":memory:", fetch_pages=api)
+    espelho.sync(list_ids=["crm"])
+
+    api.tarefas.append(_tarefa(3, status="Proposta Enviada", atualizado=1_800_000_000_000))
+    # Só a tarefa alterada e a última já vista (margem de sobreposição do cursor)
+    assert espelho.sync(list_ids=["crm"]) == {"crm": 2}
+    assert api.chamadas[-1][1] is not None
+    assert espelho.get_task("t3")["status_key"] == "proposta_enviada"
+    assert espelho.find_tasks(list_id="crm", limit=1)[0]["id"] == "t3"
+
+
+def test_carga_completa_que_falha_preserva_espelho_e_cursor():
+    api = _ClickUpFalso([_tarefa(i) for i in range(250)])
+    espelho = CRMMirror(":memory:", fetch_pages=api)
+    espelho.sync(list_ids=["crm"])
+    cursor = espelho._cursor("crm")
+
+    def falha_na_segunda_pagina(list_id, date_updated_gt=None):
+        paginas = api(list_id, date_updated_gt)
+        yield next(paginas)
+        raise ConnectionError("queda no meio da paginação")
+
+    espelho._fetch_pages = falha_na_segunda_pagina
+    with pytest.raises(ConnectionError):
+        espelho.sync(list_ids=["crm"], full=True)
+    assert espelho.status_counts("crm") == {"Contato Realizado": 250}
+    assert espelho._cursor("crm") == cursor
+
+    espelho._fetch_pages = api
+    api.tarefas = api.tarefas[:5]
+    assert espelho.sync(list_ids=["crm"], full=True) == {"crm": 5}
+    assert espelho.status_counts("crm") == {"Contato Realizado": 5}
+
+
+def test_status_do_espelho_so_vale_enquanto_recente(monkeypatch):
+    from FSTech_Consulting_Agency.Coordenador_de_Projetos.tools import progress_tracker
+    from FSTech_Consulting_Agency.utils import clickup_webhook, crm_mirror
+
+    espelho = CRMMirror(":memory:", fetch_pages=_ClickUpFalso([_tarefa(1)]))
+    espelho.sync(list_ids=["crm"])
+    api = {"t1": {"name": "Lead 1", "status": {"status": "Proposta Enviada"}}}
+    monkeypatch.setattr(crm_mirror, "get_crm_mirror", lambda: espelho)
+    monkeypatch.setattr(clickup_webhook, "latest_task_status", lambda task_id: None)
+    monkeypatch.setattr(progress_tracker, "get_clickup_client", lambda: True)
+    monkeypatch.setattr(progress_tracker, "get_task", lambda task_id: api.get(task_id))
+
+    assert "Contato Realizado (espelho local, sincronizado há 0s)" in progress_tracker.track_task_progress("t1")
+
+    monkeypatch.setattr(crm_mirror, "CRM_MIRROR_MAX_AGE", -1)
+    assert progress_tracker.track_task_progress("t1").endswith("no ClickUp: Proposta Enviada")
+    api.clear()
+    assert "no espelho local: Contato Realizado (sincronizado há 0s" in progress_tracker.track_task_progress("t1")
+
+
+def test_evento_de_webhook_antigo_nao_mascara_espelho_nem_api(monkeypatch):
+    import time
+
+    from FSTech_Consulting_Agency.Coordenador_de_Projetos.tools import progress_tracker
+    from FSTech_Consulting_Agency.utils import clickup_webhook, crm_mirror
+
+    espelho = CRMMirror(":memory:", fetch_pages=_ClickUpFalso([_tarefa(1)]))
+    espelho.sync(list_ids=["crm"])
+    evento = {"status": "Negociação", "event_date": int((espelho.last_synced_at("crm") + 1) * 1000)}
+    monkeypatch.setattr(crm_mirror, "get_crm_mirror", lambda: espelho)
+    monkeypatch.setattr(clickup_webhook, "latest_task_status", lambda task_id: evento)
+    monkeypatch.setattr(progress_tracker, "get_clickup_client", lambda: True)
+    monkeypatch.setattr(progress_tracker, "get_task",
+                        lambda task_id: {"name": "Lead 1", "status": {"status": "Proposta Enviada"}})
+
+    # Evento recente, posterior à sincronização: vale o webhook
+    assert "Negociação (via webhook, há 0s)" in progress_tracker.track_task_progress("t1")
+
+    # Evento anterior à última sincronização: vale o espelho
+    evento["event_date"] = int((espelho.last_synced_at("crm") - 60) * 1000)
+    assert "Contato Realizado (espelho local" in progress_tracker.track_task_progress("t1")
+
+    # Evento antigo e espelho vencido: vale a API
+    monkeypatch.setattr(crm_mirror, "CRM_MIRROR_MAX_AGE", 30)
+    espelho._conn.execute("UPDATE sync_state SET synced_at = synced_at - 3600")
+    evento["event_date"] = int((time.time() - 600) * 1000)
+    assert progress_tracker.track_task_progress("t1").endswith("no ClickUp: Proposta Enviada")
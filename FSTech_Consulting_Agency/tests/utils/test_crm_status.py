@@ -0,0 +1,79 @@
+import pytest
+
+from FSTech_Consulting_Agency.utils import clickup_client, crm_status
+from FSTech_Consulting_Agency.utils.crm_status import INVALID, NOOP, OK, CRMStatusMachine, status_key_for
+
+
+@pytest.fixture
+def maquina(monkeypatch):
+    maquina = CRMStatusMachine()
+    monkeypatch.setattr(crm_status, "_machine", maquina)
+    return maquina
+
+
+def test_transicoes_do_funil():
+    maquina = CRMStatusMachine()
+    maquina.record("t1", "reuniao_agendada")
+    assert maquina.check("t1", "reuniao_agendada") == NOOP
+    assert maquina.check("t1", "proposta_enviada") == OK  # avanço, mesmo pulando etapa
+    assert maquina.check("t1", "contato_realizado") == INVALID  # retrocesso
+    assert maquina.check("t1", "aguardando_futuro_contato") == OK  # lead esfriou
+    assert maquina.check("t1", "status_inexistente") == INVALID
+    assert maquina.check("desconhecida", "contato_realizado") == OK
+    maquina.record("t2", "venda_realizada")
+    assert maquina.check("t2", "aguardando_futuro_contato") == INVALID
+    assert maquina.stats == {"noop": 1, "invalid": 3, "ok": 3}
+
+
+def test_status_conhecido_persiste_e_expira(tmp_path):
+    caminho = str(tmp_path / "status.sqlite3")
+    CRMStatusMachine(path=caminho).record("t1", "proposta_enviada", updated_at=1000.0)
+    assert CRMStatusMachine(path=caminho, ttl_seconds=0).known_status("t1") == "proposta_enviada"
+    assert CRMStatusMachine(path=caminho, ttl_seconds=60).known_status("t1") is None
+    assert status_key_for("Proposta Enviada") == "proposta_enviada"
+
+
+def test_update_task_status_nao_envia_put_redundante(maquina, monkeypatch):
+    puts = []
+
+    def clickup_request(method, endpoint, **kwargs):
+        puts.append(kwargs["json"]["status"])
+        return {"id": endpoint.rsplit("/", 1)[-1]}
+
+    monkeypatch.setattr(clickup_client, "clickup_request", clickup_request)
+    assert clickup_client.update_task_status("t1", "reuniao_agendada")
+    assert clickup_client.update_task_status("t1", "reuniao_agendada")
+    assert not clickup_client.update_task_status("t1", "contato_realizado")
+    assert clickup_client.update_task_status("t1", "contato_realizado", force=True)
+    assert puts == ["Reunião Agendada", "Contato Realizado"]
+    assert maquina.known_status("t1") == "contato_realizado"
+
+
+def test_fila_valida_a_partir_da_transicao_pendente(maquina, monkeypatch, tmp_path):
+    fila = clickup_client.StatusWriteQueue(path=str(tmp_path / "fila.json"), flush_interval=60, sender=lambda *_: True)
+    monkeypatch.setattr(clickup_client, "_status_queue", fila)
+    maquina.record("t1", "contato_realizado")
+    assert clickup_client.enqueue_task_status("t1", "contato_realizado")  # redundante: não entra na fila
+    assert fila.pending() == {}
+    assert clickup_client.enqueue_task_status("t1", "proposta_aceita")
+    assert not clickup_client.enqueue_task_status("t1", "proposta_enviada")  # retrocesso em relação à pendência
+    assert fila.pending() == {"t1": "proposta_aceita"}
+    fila.close(flush=False)
+
+
+def test_atualizacao_sincrona_recusada_nao_descarta_pendencia(maquina, monkeypatch, tmp_path):
+    puts = []
+    monkeypatch.setattr(clickup_client, "clickup_request",
+                        lambda method, endpoint, **kwargs: puts.append(kwargs["json"]["status"]) or {"id": "t1"})
+    fila = clickup_client.StatusWriteQueue(path=str(tmp_path / "fila.json"), flush_interval=60, sender=lambda *_: True)
+    monkeypatch.setattr(clickup_client, "_status_queue", fila)
+    maquina.record("t1", "proposta_enviada")
+    assert clickup_client.enqueue_task_status("t1", "proposta_aceita")
+
+    assert not clickup_client.update_task_status("t1", "contato_realizado")  # retrocesso: recusado
+    assert clickup_client.update_task_status("t1", "proposta_enviada")  # redundante: nada a enviar
+    assert fila.pending() == {"t1": "proposta_aceita"} and puts == []
+
+    assert clickup_client.update_task_status("t1", "venda_realizada")
+    assert fila.pending() == {} and puts == ["Venda Realizada"]
+    fila.close(flush=False)
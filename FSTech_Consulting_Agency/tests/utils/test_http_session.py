@@ -0,0 +1,62 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from FSTech_Consulting_Agency.utils.http_session import HTTPClient, HTTPServiceError, endpoint_label
+
+
+class _Servidor(BaseHTTPRequestHandler):
+    respostas = []
+    chamadas = []
+
+    def _responder(self):
+        self.chamadas.append((self.command, self.path))
+        status, headers = self.respostas.pop(0) if self.respostas else (200, {})
+        corpo = json.dumps({"id": self.path.rsplit("/", 1)[-1]}).encode()
+        self.send_response(status)
+        for nome, valor in headers.items():
+            self.send_header(nome, valor)
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    do_GET = do_PUT = do_POST = _responder
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor():
+    _Servidor.respostas = []
+    _Servidor.chamadas = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Servidor)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+def test_retenta_429_respeitando_retry_after(servidor):
+    _Servidor.respostas = [(429, {"Retry-After": "0.1"}), (503, {})]
+    client = HTTPClient(servidor, name="teste", max_retries=3)
+    client._backoff = lambda attempt: 0.01
+    assert client.request_json("PUT", "task/86abc123", json={"status": "x"}) == {"id": "86abc123"}
+    metricas = client.get_metrics()["PUT /task/{id}"]
+    assert metricas["count"] == 3 and metricas["retries"] == 2 and metricas["last_status"] == 200
+
+
+def test_post_nao_e_repetido_em_5xx(servidor):
+    _Servidor.respostas = [(500, {})]
+    client = HTTPClient(servidor, name="teste")
+    with pytest.raises(HTTPServiceError) as erro:
+        client.request("POST", "list/901311371093/task", json={})
+    assert erro.value.status_code == 500
+    assert len(_Servidor.chamadas) == 1
+
+
+def test_endpoint_label_agrupa_ids():
+    assert endpoint_label("get", "list/901311371093/task?page=2") == "GET /list/{id}/task"
+    assert endpoint_label("POST", "/team") == "POST /team"
@@ -0,0 +1,68 @@
+import random
+import re
+
+from FSTech_Consulting_Agency.Arquiteto_de_Software.tools.system_architecture_designer import (
+    design_architecture_and_assess_complexity)
+from FSTech_Consulting_Agency.utils.component_catalog import load_component_catalog
+from FSTech_Consulting_Agency.utils.keyword_matcher import KeywordMatcher, normalize_text, tokenize
+
+COMPONENT_KEYWORDS = load_component_catalog().keywords
+
+
+def test_palavras_inteiras_sem_acento_e_sobrepostas():
+    matcher = KeywordMatcher(["api", "banco de dados", "dados", "relatórios", "machine learning", "learning"])
+    texto = "A API rápida grava no Banco de Dados; RELATORIOS e machine-learning. Rapidapi e dadoss não contam."
+    assert matcher.counts(texto) == {"api": 1, "banco de dados": 1, "dados": 1, "relatórios": 1,
+                                     "machine learning": 1, "learning": 1}
+    assert list(KeywordMatcher(["a b a"]).scan("x a b a b a y")) == [(3, "a b a"), (5, "a b a")]
+
+
+def test_equivale_a_busca_por_regex_de_cada_palavra_chave():
+    vocabulario = [normalize_text(k) for k in COMPONENT_KEYWORDS] + ["sistema", "de", "web", "para", "rapida", "dados"]
+    gerador = random.Random(11)
+    matcher = KeywordMatcher(COMPONENT_KEYWORDS)
+    for _ in range(200):
+        texto = " ".join(gerador.choice(vocabulario) for _ in range(gerador.randint(1, 30)))
+        esperado = {k for k in COMPONENT_KEYWORDS if re.search(r"\b" + re.escape(normalize_text(k)) + r"\b", texto)}
+        assert matcher.matches(texto) == esperado
+
+
+class _TransicoesContadas(dict):
+    """Tabela de transições que conta as consultas feitas pelo autômato."""
+
+    def __init__(self, transicoes, consultas):
+        super().__init__(transicoes)
+        self.consultas = consultas
+
+    def __contains__(self, palavra):
+        self.consultas[0] += 1
+        return super().__contains__(palavra)
+
+    def get(self, palavra, padrao=None):
+        self.consultas[0] += 1
+        return super().get(palavra, padrao)
+
+
+def _conta_consultas(matcher):
+    consultas = [0]
+    matcher._goto = [_TransicoesContadas(transicoes, consultas) for transicoes in matcher._goto]
+    return consultas
+
+
+def test_custo_linear_no_tamanho_do_texto_com_catalogo_grande():
+    catalogo = [f"componente {i} especial" for i in range(2000)] + list(COMPONENT_KEYWORDS)
+    matcher = KeywordMatcher(catalogo)
+    texto = "integração com api e dashboard, componente 7 especial e login. " * 4000  # ~40 mil palavras
+    consultas = _conta_consultas(matcher)
+    contagem = matcher.counts(texto)
+    # Aho–Corasick: no máximo uma transição de avanço e as de falha que ela amortiza, por palavra
+    assert consultas[0] <= 3 * len(tokenize(texto))
+    assert contagem["componente 7 especial"] == 4000 and contagem["api"] == 4000
+
+
+def test_ferramenta_de_arquitetura_usa_o_catalogo_compilado():
+    resultado = design_architecture_and_assess_complexity(
+        "Aplicativo movel com autenticacao, integracao de pagamento e relatorios; rapidapi nao conta.")
+    assert "Aplicativo Móvel (iOS/Android)" in resultado and "Integração de Pagamento" in resultado
+    assert "API REST/GraphQL" not in resultado
+    assert "Pontuação Total de Complexidade: 9" in resultado and "ALTA" in resultado
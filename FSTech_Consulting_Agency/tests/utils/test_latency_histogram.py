@@ -0,0 +1,43 @@
+import math
+import random
+
+import pytest
+
+from FSTech_Consulting_Agency.utils.latency_histogram import LatencyHistogram
+
+
+def test_percentis_dentro_da_precisao_garantida():
+    gerador = random.Random(3)
+    valores = [int(gerador.lognormvariate(9, 1.2)) for _ in range(20000)]
+    histograma = LatencyHistogram()
+    for valor in valores:
+        histograma.record(valor)
+    ordenados = sorted(valores)
+    for percentil in (50, 90, 95, 99, 99.9):
+        exato = ordenados[math.ceil(round(len(ordenados) * percentil / 100, 9)) - 1]
+        assert abs(histograma.percentile(percentil) - exato) <= exato * 0.001 + 1
+    assert histograma.percentile(100) == histograma.max == max(valores)
+    assert histograma.min == min(valores) and histograma.count == 20000
+    assert len(histograma._counts) <= 1024 * (histograma.max.bit_length() - 10)  # limitado pela faixa, não pelas amostras
+
+
+def test_merge_equivale_a_gravar_tudo_num_so():
+    a, b, unico = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for valor in range(0, 50000, 7):
+        (a if valor % 2 else b).record(valor)
+        unico.record(valor)
+    a.merge(b)
+    assert a._counts == unico._counts and (a.count, a.total, a.min, a.max) == (
+        unico.count, unico.total, unico.min, unico.max)
+    assert a.summary_ms() == unico.summary_ms()
+
+    with pytest.raises(ValueError):
+        a.merge(LatencyHistogram(significant_digits=2))
+
+
+def test_histograma_vazio_e_valores_pequenos():
+    histograma = LatencyHistogram()
+    assert histograma.percentile(99) == 0 and histograma.summary_ms()["max"] == 0
+    histograma.record_seconds(0.000123)
+    histograma.record(5, count=3)
+    assert histograma.percentile(50) == 5 and histograma.percentile(99) == 123
@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from FSTech_Consulting_Agency.utils.lead_checkpoint import LeadCheckpoint
+from FSTech_Consulting_Agency.utils.stage_graph import Stage, StageGraphError, run_stage_graph
+
+
+def _grafo(chamadas, falhar_pesquisa=False):
+    def arquitetura(ata_reuniao):
+        chamadas.append("arquitetura")
+        return {"esboco": f"esboço de {ata_reuniao}"}
+
+    def pesquisa(esboco):
+        chamadas.append("pesquisa")
+        if falhar_pesquisa:
+            raise RuntimeError("API fora do ar")
+        return {"preco": "R$ 10.000,00"}
+
+    def setor(briefing):
+        chamadas.append("setor")
+        return {"industry": "Varejo"}
+
+    return [
+        Stage("arquitetura", arquitetura, inputs=["ata_reuniao"], outputs=["esboco"]),
+        Stage("pesquisa", pesquisa, inputs=["esboco"], outputs=["preco"]),
+        Stage("setor", setor, inputs=["briefing"], outputs=["industry"],
+              fallback=lambda e, briefing: {"industry": ""}),
+    ]
+
+
+def test_rerun_retoma_da_primeira_etapa_incompleta(tmp_path):
+    contexto = {"briefing": "b", "ata_reuniao": "ata"}
+    chamadas = []
+    with pytest.raises(StageGraphError):
+        run_stage_graph(_grafo(chamadas, falhar_pesquisa=True), contexto,
+                        checkpoint=LeadCheckpoint("lead", str(tmp_path)))
+
+    chamadas.clear()
+    resultado = run_stage_graph(_grafo(chamadas), contexto, checkpoint=LeadCheckpoint("lead", str(tmp_path)))
+    assert chamadas == ["pesquisa"]
+    assert resultado["esboco"] == "esboço de ata" and resultado["preco"] == "R$ 10.000,00"
+
+
+def test_entradas_alteradas_invalidam_apenas_etapas_afetadas(tmp_path):
+    chamadas = []
+    run_stage_graph(_grafo(chamadas), {"briefing": "b", "ata_reuniao": "ata"},
+                    checkpoint=LeadCheckpoint("lead", str(tmp_path)))
+
+    chamadas.clear()
+    run_stage_graph(_grafo(chamadas), {"briefing": "b", "ata_reuniao": "nova ata"},
+                    checkpoint=LeadCheckpoint("lead", str(tmp_path)))
+    assert sorted(chamadas) == ["arquitetura", "pesquisa"]
+
+
+def test_saidas_de_fallback_nao_sao_gravadas(tmp_path):
+    def setor_falha(briefing):
+        raise RuntimeError("sem chave")
+
+    stages = [Stage("setor", setor_falha, inputs=["briefing"], outputs=["industry"],
+                    fallback=lambda e, briefing: {"industry": ""})]
+    checkpoint = LeadCheckpoint("lead", str(tmp_path))
+    run_stage_graph(stages, {"briefing": "b"}, checkpoint=checkpoint)
+    assert checkpoint.completed_stages() == []
+
+
+def test_proposta_apagada_e_gerada_de_novo(tmp_path):
+    from FSTech_Consulting_Agency.utils.lead_pipeline import proposal_file_exists
+
+    chamadas = []
+
+    def proposta(esboco):
+        caminho = tmp_path / f"proposta-{len(chamadas)}.md"
+        caminho.write_text(esboco, encoding="utf-8")
+        chamadas.append(str(caminho))
+        return {"proposal_path": str(caminho)}
+
+    stages = [Stage("proposal", proposta, inputs=["esboco"], outputs=["proposal_path"],
+                    restore_check=proposal_file_exists)]
+    caminho = run_stage_graph(stages, {"esboco": "e"}, checkpoint=LeadCheckpoint("lead", str(tmp_path)))["proposal_path"]
+    assert run_stage_graph(stages, {"esboco": "e"},
+                           checkpoint=LeadCheckpoint("lead", str(tmp_path)))["proposal_path"] == caminho
+    assert len(chamadas) == 1
+
+    os.remove(caminho)
+    novo = run_stage_graph(stages, {"esboco": "e"}, checkpoint=LeadCheckpoint("lead", str(tmp_path)))["proposal_path"]
+    assert len(chamadas) == 2 and os.path.exists(novo)
+
+
+def test_leads_do_lote_com_mesmo_briefing_nao_compartilham_checkpoint(tmp_path):
+    a = LeadCheckpoint.for_briefing("mesmo briefing", str(tmp_path), lead_id="lead_a")
+    b = LeadCheckpoint.for_briefing("mesmo briefing", str(tmp_path), lead_id="lead_b")
+    assert a.path != b.path
+    a.save("arquitetura", {"ata_reuniao": "ata a"}, {"esboco": "a"})
+    b.save("arquitetura", {"ata_reuniao": "ata b"}, {"esboco": "b"})
+
+    assert LeadCheckpoint.for_briefing("mesmo briefing", str(tmp_path), lead_id="lead_a").load(
+        "arquitetura", {"ata_reuniao": "ata a"}) == {"esboco": "a"}
+    assert LeadCheckpoint.for_briefing("mesmo briefing", str(tmp_path), lead_id="lead_b").load(
+        "arquitetura", {"ata_reuniao": "ata b"}) == {"esboco": "b"}
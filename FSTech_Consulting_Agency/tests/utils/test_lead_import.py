@@ -0,0 +1,41 @@
+import threading
+import time
+
+from FSTech_Consulting_Agency.utils.lead_import import import_leads, load_lead_records
+
+
+def test_csv_deduplicado_e_importado_em_paralelo(tmp_path):
+    arquivo = tmp_path / "leads.csv"
+    arquivo.write_text(
+        "Nome,E-mail,Empresa\n"
+        "Ana,ana@x.com,ACME\n"
+        "Ana Souza,ANA@X.COM,ACME\n"
+        "João,,Beta\n"
+        "joao,,Beta\n"
+        "Carla,carla@y.com,Gama\n"
+        "Falha,falha@z.com,Delta\n"
+        ",semnome@z.com,\n",
+        encoding="utf-8",
+    )
+    registros = load_lead_records(str(arquivo))
+    simultaneas = {"atual": 0, "max": 0}
+    lock = threading.Lock()
+
+    def criar(nome, descricao, responsavel):
+        with lock:
+            simultaneas["atual"] += 1
+            simultaneas["max"] = max(simultaneas["max"], simultaneas["atual"])
+        time.sleep(0.05)
+        with lock:
+            simultaneas["atual"] -= 1
+        if nome == "Falha":
+            raise RuntimeError("HTTP 500")
+        return f"id-{nome}"
+
+    relatorio = import_leads(registros, concurrency=2, per_minute=0, creator=criar,
+                             existing_keys={"name:carla"}, on_progress=None)
+    assert relatorio["duplicates"] == 2 and relatorio["invalid"] == 1
+    assert relatorio["skipped_existing"] == 1  # Carla já está no CRM (tarefas são comparadas pelo nome)
+    assert sorted(c["task_id"] for c in relatorio["created"]) == ["id-Ana", "id-João"]
+    assert relatorio["failed"][0]["error"] == "HTTP 500"
+    assert simultaneas["max"] == 2
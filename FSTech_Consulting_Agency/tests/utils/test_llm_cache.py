@@ -0,0 +1,67 @@
+import time
+
+from FSTech_Consulting_Agency.utils.llm_cache import LLMCache, make_cache_key
+
+
+def test_cache_key_depende_de_todos_os_parametros():
+    base = make_cache_key("gpt-4.1", 0.13, "sistema", "usuario")
+    assert base == make_cache_key("gpt-4.1", 0.13, "sistema", "usuario")
+    assert base != make_cache_key("gpt-4.1", 0.4, "sistema", "usuario")
+    assert base != make_cache_key("gpt-4.1", 0.13, "outro sistema", "usuario")
+    assert base != make_cache_key("gpt-4.1", 0.13, "sistema", "usuario", response_format="json_object")
+
+
+def test_get_or_compute_conta_acertos_e_erros(tmp_path):
+    cache = LLMCache(path=str(tmp_path / "cache.sqlite3"))
+    chamadas = []
+
+    def compute():
+        chamadas.append(1)
+        return "Setor: Saúde\nDesafio: Agendamento manual"
+
+    for _ in range(3):
+        resposta = cache.get_or_compute("gpt-4.1", 0.13, "sistema", "briefing", compute)
+        assert resposta.startswith("Setor: Saúde")
+
+    assert len(chamadas) == 1
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_ttl_e_despejo_por_tamanho(tmp_path):
+    cache = LLMCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=3600, max_entries=2)
+    for i in range(3):
+        cache.set(f"k{i}", f"v{i}")
+        time.sleep(0.01)
+    assert cache.stats()["entries"] == 2
+    assert cache.get("k0") is None
+    assert cache.get("k2") == "v2"
+
+    cache.ttl_seconds = 0.001
+    time.sleep(0.01)
+    assert cache.get("k2") is None
+
+
+def test_gateway_expoe_os_contadores_do_cache(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from FSTech_Consulting_Agency.utils import llm_cache, openai_gateway
+
+    chamadas = []
+
+    def create(**kwargs):
+        chamadas.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Setor: Saúde"))])
+
+    cliente = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(llm_cache, "_default_cache", LLMCache(path=str(tmp_path / "cache.sqlite3")))
+    monkeypatch.setattr(openai_gateway, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(openai_gateway, "get_openai_client", lambda: cliente)
+
+    for _ in range(3):
+        assert openai_gateway.chat_completion("briefing", system_prompt="sistema") == "Setor: Saúde"
+    assert len(chamadas) == 1
+    cache = openai_gateway.get_gateway_stats()["cache"]
+    assert cache["hits"] == 2 and cache["misses"] == 1 and cache["entries"] == 1
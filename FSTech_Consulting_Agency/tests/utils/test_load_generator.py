@@ -0,0 +1,101 @@
+import pytest
+
+from FSTech_Consulting_Agency.Arquiteto_de_Software.tools import scalability_tester
+from FSTech_Consulting_Agency.standins import FaultConfig, StandInServer
+from FSTech_Consulting_Agency.utils.latency_histogram import LatencyHistogram
+from FSTech_Consulting_Agency.utils.load_generator import (
+    LoadGenerator, LoadTestStats, RequestSpec, format_report, run_distributed, write_timeline_csv)
+
+
+def _servidor(**falhas):
+    servidor = StandInServer(faults=FaultConfig(seed=1, **falhas))
+    servidor.route("GET", r"/produtos", lambda params, query, body: (200, {"itens": [1, 2, 3]}))
+    servidor.route("POST", r"/pedidos", lambda params, query, body: (201, {"recebido": body}))
+    return servidor
+
+
+def test_modelo_fechado_com_mix_e_conexoes_reaproveitadas():
+    with _servidor(latency_ms=2) as servidor:
+        mix = [RequestSpec("GET", servidor.base_url + "/produtos", weight=3),
+               RequestSpec("POST", servidor.base_url + "/pedidos", body={"qtd": 1}, weight=1)]
+        resultado = LoadGenerator(mix, concurrency=4, duration=0.6, ramp_up=0.2, seed=7).run()
+    assert resultado["requests"] == servidor.stats["requests"] > 20
+    assert resultado["failures"] == 0 and set(resultado["status_counts"]) == {200, 201}
+    assert resultado["by_request"]["GET /produtos"]["requests"] > resultado["by_request"]["POST /pedidos"]["requests"]
+    assert resultado["connections_opened"] <= 4
+    latencia = resultado["latency_ms"]
+    assert 2 <= latencia["p50"] <= latencia["p95"] <= latencia["p99"] <= latencia["max"]
+    assert resultado["histogram"].count == resultado["requests"]
+
+
+def test_modelo_aberto_segue_a_taxa_e_detalha_erros():
+    with _servidor(error_rate=0.3) as servidor:
+        spec = RequestSpec("GET", servidor.base_url + "/produtos")
+        resultado = LoadGenerator([spec], concurrency=10, duration=1.0, rate=100).run()
+    assert 90 <= resultado["requests"] <= 100 and resultado["model"] == "open"
+    assert resultado["errors"] == {"HTTP 503": resultado["failures"]} and 10 < resultado["failures"] < 60
+    assert "HTTP 503" in format_report(resultado)
+
+
+def test_ramp_up_do_modelo_aberto_distribui_as_chegadas():
+    gerador = LoadGenerator([RequestSpec("GET", "http://127.0.0.1:1/")], duration=10, ramp_up=4, rate=50)
+    instantes = [gerador._arrival_time(n) for n in range(1, 501)]
+    assert instantes == sorted(instantes)
+    assert sum(1 for t in instantes if t <= 4) == 100  # metade da taxa-alvo, em média, durante o ramp-up
+    assert instantes[399] == pytest.approx(10.0)  # depois, 50/s: 100 + 50 * 6 chegadas até 10 s
+
+
+def test_erros_de_conexao_e_ferramenta():
+    resultado = LoadGenerator([RequestSpec("GET", "http://127.0.0.1:9/")], concurrency=2, duration=0.2).run()
+    assert resultado["successes"] == 0 and all(nome.startswith("conexão") for nome in resultado["errors"])
+
+    assert scalability_tester.test_scalability("ftp://x", 1, 1).startswith("Erro")
+    with _servidor() as servidor:
+        relatorio = scalability_tester.test_scalability(servidor.base_url, 3, 1, duration_seconds=0.3,
+                                            request_mix=[{"path": "produtos"}, {"path": "/pedidos", "method": "POST"}])
+    assert "**Endpoint Testado:**" in relatorio and "p99" in relatorio and "sustentou" in relatorio
+
+
+def test_varios_processos_somam_histogramas_e_series():
+    with _servidor(latency_ms=1) as servidor:
+        spec = RequestSpec("GET", servidor.base_url + "/produtos")
+        resultado = run_distributed([spec], processes=2, concurrency=4, duration=1.5)
+    assert resultado["processes"] == 2
+    assert resultado["requests"] == servidor.stats["requests"] == resultado["histogram"].count
+    serie = resultado["timeline"]
+    assert [linha["second"] for linha in serie] == list(range(len(serie))) and len(serie) >= 2
+    assert sum(linha["requests"] for linha in serie) == resultado["requests"]
+    assert max(linha["max_ms"] for linha in serie) == resultado["latency_ms"]["max"]
+    assert "## Série Temporal:" in format_report(resultado) and "2 processos" in format_report(resultado)
+
+
+def test_merge_de_estatisticas_e_csv_da_serie(tmp_path):
+    a, b = LoadTestStats(start=0.0), LoadTestStats(start=0.0)
+    a.timeline = {0: [3, 1, LatencyHistogram()], 2: [1, 0, LatencyHistogram()]}
+    b.timeline = {0: [2, 0, LatencyHistogram()]}
+    a.timeline[0][2].record(1500)
+    b.timeline[0][2].record(2500)
+    a.elapsed, b.elapsed = 2.5, 2.1
+    a.merge(b)
+    linhas = a.timeline_rows()
+    assert [(l["second"], l["requests"], l["errors"]) for l in linhas] == [(0, 5, 1), (1, 0, 0), (2, 1, 0)]
+    assert linhas[0]["max_ms"] == 2.5 and a.elapsed == 2.5
+
+    caminho = tmp_path / "serie.csv"
+    write_timeline_csv({"timeline": linhas}, str(caminho))
+    assert caminho.read_text(encoding="utf-8").splitlines()[0] == "second,requests,errors,p50_ms,p95_ms,p99_ms,max_ms"
+
+
+def test_agente_exige_endpoint_e_usa_duracao_curta(monkeypatch):
+    from FSTech_Consulting_Agency.Arquiteto_de_Software import arquiteto_de_software
+
+    chamadas = []
+    monkeypatch.setattr(scalability_tester, "test_scalability", lambda **kwargs: chamadas.append(kwargs) or "ok")
+
+    resultado, _ = arquiteto_de_software.run_arquiteto_task("Avaliar escalabilidade do sistema", {})
+    assert resultado.startswith("Erro") and not chamadas
+
+    resultado, _ = arquiteto_de_software.run_arquiteto_task("Executar teste de carga", {"endpoint": "http://localhost:1/"})
+    assert resultado == "ok"
+    assert chamadas[0]["duration_seconds"] == arquiteto_de_software.LOAD_TEST_DEFAULT_SECONDS
+    assert chamadas[0]["concurrent_users"] == arquiteto_de_software.LOAD_TEST_DEFAULT_USERS
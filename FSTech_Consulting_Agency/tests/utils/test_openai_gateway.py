@@ -0,0 +1,143 @@
+import asyncio
+from types import SimpleNamespace
+
+import openai
+import pytest
+
+from FSTech_Consulting_Agency.utils import openai_gateway
+
+
+class _Balde:
+    """Token bucket sem espera que registra as penalidades por Retry-After."""
+
+    def __init__(self):
+        self.penalidades = []
+
+    def acquire(self, amount=1):
+        return 0
+
+    async def acquire_async(self, amount=1):
+        return 0
+
+    def penalize(self, seconds):
+        self.penalidades.append(seconds)
+
+
+def _erro(classe, status, cabecalhos=None):
+    resposta = SimpleNamespace(status_code=status, headers=cabecalhos or {}, request=None)
+    return classe(f"HTTP {status}", response=resposta, body=None)
+
+
+def _resposta(texto):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=texto))])
+
+
+class _ClienteFalso:
+    """Cliente OpenAI que levanta os erros da lista, em ordem, e depois responde."""
+
+    def __init__(self, erros, assincrono=False):
+        self.erros = list(erros)
+        self.chamadas = 0
+        create = self._create_async if assincrono else self._create
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+    def _create(self, **kwargs):
+        self.chamadas += 1
+        if self.erros:
+            raise self.erros.pop(0)
+        return _resposta("ok")
+
+    async def _create_async(self, **kwargs):
+        return self._create(**kwargs)
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    esperas = []
+    balde = _Balde()
+    monkeypatch.setattr(openai_gateway, "_stats", {"requests": 0, "retries": 0, "rate_limited": 0, "errors": 0})
+    monkeypatch.setattr(openai_gateway, "_request_bucket", balde)
+    monkeypatch.setattr(openai_gateway, "_token_bucket", _Balde())
+    monkeypatch.setattr(openai_gateway, "MAX_RETRIES", 2)
+    monkeypatch.setattr(openai_gateway, "time", SimpleNamespace(sleep=esperas.append))
+    return SimpleNamespace(esperas=esperas, balde=balde, monkeypatch=monkeypatch)
+
+
+def _usar_cliente(gateway, cliente):
+    gateway.monkeypatch.setattr(openai_gateway, "get_openai_client", lambda: cliente)
+    gateway.monkeypatch.setattr(openai_gateway, "get_async_openai_client", lambda: cliente)
+
+
+def test_429_com_retry_after_espera_o_tempo_do_servidor(gateway):
+    cliente = _ClienteFalso([_erro(openai.RateLimitError, 429, {"retry-after": "7"})])
+    _usar_cliente(gateway, cliente)
+
+    assert openai_gateway.chat_completion("p", use_cache=False) == "ok"
+    assert cliente.chamadas == 2
+    assert len(gateway.esperas) == 1
+    assert 7 <= gateway.esperas[0] <= 7 + openai_gateway.BACKOFF_BASE_SECONDS
+    assert gateway.balde.penalidades == [7.0]
+    stats = openai_gateway.get_gateway_stats()
+    assert (stats["requests"], stats["retries"], stats["rate_limited"], stats["errors"]) == (2, 1, 1, 0)
+
+
+def test_retry_after_ms_tem_prioridade(gateway):
+    erro = _erro(openai.RateLimitError, 429, {"retry-after-ms": "250", "retry-after": "9"})
+    _usar_cliente(gateway, _ClienteFalso([erro]))
+
+    assert openai_gateway.chat_completion("p", use_cache=False) == "ok"
+    assert 0.25 <= gateway.esperas[0] <= 0.25 + openai_gateway.BACKOFF_BASE_SECONDS
+
+
+def test_429_sem_retry_after_usa_backoff_exponencial(gateway):
+    erros = [_erro(openai.RateLimitError, 429) for _ in range(2)]
+    _usar_cliente(gateway, _ClienteFalso(erros))
+
+    assert openai_gateway.chat_completion("p", use_cache=False) == "ok"
+    base = openai_gateway.BACKOFF_BASE_SECONDS
+    assert base / 2 <= gateway.esperas[0] <= base
+    assert base <= gateway.esperas[1] <= 2 * base
+    assert gateway.balde.penalidades == []
+    stats = openai_gateway.get_gateway_stats()
+    assert stats["rate_limited"] == 2 and stats["retries"] == 2
+
+
+def test_5xx_desiste_apos_o_maximo_de_tentativas(gateway):
+    cliente = _ClienteFalso([_erro(openai.InternalServerError, 503) for _ in range(5)])
+    _usar_cliente(gateway, cliente)
+
+    with pytest.raises(openai.InternalServerError):
+        openai_gateway.chat_completion("p", use_cache=False)
+    assert cliente.chamadas == 3  # 1 tentativa + MAX_RETRIES
+    assert len(gateway.esperas) == 2
+    stats = openai_gateway.get_gateway_stats()
+    assert (stats["requests"], stats["retries"], stats["rate_limited"], stats["errors"]) == (3, 2, 0, 1)
+
+
+def test_erro_nao_retentavel_falha_na_hora(gateway):
+    cliente = _ClienteFalso([_erro(openai.BadRequestError, 400)])
+    _usar_cliente(gateway, cliente)
+
+    with pytest.raises(openai.BadRequestError):
+        openai_gateway.chat_completion("p", use_cache=False)
+    assert cliente.chamadas == 1 and gateway.esperas == []
+    assert openai_gateway.get_gateway_stats()["errors"] == 1
+
+
+def test_versao_assincrona_retenta_com_retry_after(gateway):
+    esperas = []
+
+    async def sleep(segundos):
+        esperas.append(segundos)
+
+    gateway.monkeypatch.setattr(openai_gateway.asyncio, "sleep", sleep)
+    cliente = _ClienteFalso([_erro(openai.RateLimitError, 429, {"retry-after": "3"}),
+                             _erro(openai.InternalServerError, 502)], assincrono=True)
+    _usar_cliente(gateway, cliente)
+
+    assert asyncio.run(openai_gateway.achat_completion("p", use_cache=False)) == "ok"
+    assert cliente.chamadas == 3
+    assert 3 <= esperas[0] <= 3 + openai_gateway.BACKOFF_BASE_SECONDS
+    assert gateway.balde.penalidades == [3.0]
+    stats = openai_gateway.get_gateway_stats()
+    assert (stats["retries"], stats["rate_limited"], stats["errors"]) == (2, 1, 0)
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from FSTech_Consulting_Agency.Arquiteto_de_Software.tools.api_blueprint_generator import generate_api_blueprint
+from FSTech_Consulting_Agency.utils import openapi_builder
+from FSTech_Consulting_Agency.utils.openapi_builder import (
+    BlueprintCache, BlueprintError, build_openapi_spec, dump_spec, generate_openapi_document, validate_openapi_spec)
+
+RECURSOS = [{"path": "/clientes", "methods": ["GET", "POST"]},
+            {"path": "/clientes/{id}", "methods": ["GET", "PUT", "DELETE"]},
+            {"path": "/clientes/{id}/pedidos", "methods": ["GET"], "model": "Pedido"}]
+MODELOS = {"Cliente": {"properties": {"nome": {"type": "string"}, "email": {"type": "string", "format": "email"}},
+                       "required": ["nome"]},
+           "Pedido": {"properties": {"itens": {"type": "array", "items": {"type": "string"}}, "total": {}}}}
+
+
+def _api_grande(quantidade):
+    recursos = [{"path": f"/recurso{i}/{{id}}", "methods": ["GET", "PUT", "DELETE"], "model": f"Modelo{i % 20}"}
+                for i in range(quantidade)]
+    modelos = {f"Modelo{i}": {"properties": {"campo": {"type": "string"}}} for i in range(20)}
+    return recursos, modelos
+
+
+def test_especificacao_estruturada_e_valida():
+    spec = build_openapi_spec("API de Clientes FSTech", RECURSOS, MODELOS)
+    assert validate_openapi_spec(spec) == []
+    lista = spec["paths"]["/clientes"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert lista == {"type": "array", "items": {"$ref": "#/components/schemas/Cliente"}}
+    assert spec["paths"]["/clientes/{id}"]["delete"]["responses"]["204"]["description"] == "Removido"
+    assert [p["name"] for p in spec["paths"]["/clientes/{id}/pedidos"]["get"]["parameters"]] == ["id"]
+    assert spec["components"]["schemas"]["Cliente"]["required"] == ["nome"]
+    assert spec["components"]["schemas"]["Pedido"]["properties"]["total"] == {"type": "string"}
+    ids = [op["operationId"] for item in spec["paths"].values() for op in item.values()]
+    assert len(ids) == len(set(ids)) == 6
+
+
+def test_validacao_aponta_os_problemas():
+    spec = build_openapi_spec("API", [{"path": "clientes", "methods": ["FETCH"]},
+                                      {"path": "/x", "methods": ["POST"], "model": "Inexistente"}], MODELOS)
+    problemas = validate_openapi_spec(spec)
+    assert any("começar com '/'" in p for p in problemas) and any("FETCH" in p for p in problemas)
+    assert any("Inexistente" in p for p in problemas)
+    with pytest.raises(BlueprintError):
+        generate_openapi_document("API", [{"path": "/x", "methods": ["POST"], "model": "Nada"}], MODELOS,
+                                  cache=BlueprintCache())
+
+
+def test_yaml_e_json_sem_aliases():
+    spec = build_openapi_spec("API de Clientes FSTech", RECURSOS, MODELOS)
+    yaml = pytest.importorskip("yaml")
+    texto = dump_spec(spec, "yaml")
+    assert "&id" not in texto and yaml.safe_load(texto) == spec
+    assert json.loads(dump_spec(spec, "json")) == spec
+
+
+def test_sem_pyyaml_cai_em_json_com_aviso(monkeypatch):
+    monkeypatch.setattr(openapi_builder, "yaml", None)
+    spec = build_openapi_spec("API", RECURSOS, MODELOS)
+    assert json.loads(dump_spec(spec, "yaml")) == spec
+
+    documento = generate_api_blueprint("API sem PyYAML", RECURSOS, MODELOS, "yaml")
+    aviso, corpo = documento.split("\n", 1)
+    assert aviso.startswith("# Aviso: PyYAML não está instalado")
+    assert json.loads(corpo)["openapi"] == "3.0.3"
+
+
+def test_api_grande_e_cache():
+    recursos, modelos = _api_grande(250)
+    cache = BlueprintCache()
+    documento = generate_openapi_document("API de Integração", recursos, modelos, cache=cache)
+    assert documento.count("operationId:") == 750
+
+    assert generate_openapi_document("API de Integração", recursos, modelos, cache=cache) is documento
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert generate_openapi_document("API de Integração", recursos, modelos, "json", cache=cache) is not documento
+
+
+def test_ferramenta():
+    assert generate_api_blueprint("API", [], {}).startswith("Erro")
+    assert generate_api_blueprint("API", RECURSOS, MODELOS, output_format="xml").startswith("Erro")
+    assert "Referência sem schema" in generate_api_blueprint("API", [{"path": "/a", "model": "X"}], MODELOS)
+    assert json.loads(generate_api_blueprint("API de Clientes FSTech", RECURSOS, MODELOS, "json"))["openapi"] == "3.0.3"
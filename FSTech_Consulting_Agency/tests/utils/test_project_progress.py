@@ -0,0 +1,57 @@
+import threading
+import time
+
+from FSTech_Consulting_Agency.standins import ClickUpStandIn
+from FSTech_Consulting_Agency.utils.http_session import HTTPClient
+from FSTech_Consulting_Agency.utils.project_progress import ProjectProgressTracker, aggregate_progress
+
+
+def test_agregacao_por_status_responsavel_e_marco():
+    agora = int(time.time() * 1000)
+    tarefas = [
+        {"id": "m1", "name": "Fase 1", "status": {"status": "Concluída", "type": "closed"}},
+        {"id": "a", "parent": "m1", "status": {"status": "Concluída", "type": "closed"},
+         "assignees": [{"id": 1, "username": "ana"}]},
+        {"id": "b", "parent": "m1", "status": {"status": "Em andamento", "type": "custom"},
+         "assignees": [{"id": 1, "username": "ana"}], "due_date": str(agora - 1000)},
+        {"id": "c", "status": {"status": "Em andamento", "type": "custom"},
+         "custom_fields": [{"name": "Marco", "value": 1,
+                            "type_config": {"options": [{"name": "Kick-off", "orderindex": 0},
+                                                        {"name": "Go-live", "orderindex": 1}]}}]},
+    ]
+    progresso = aggregate_progress(tarefas, now_ms=agora)
+    assert (progresso["total"], progresso["done"], progresso["completion_pct"], progresso["overdue"]) == (4, 2, 50.0, 1)
+    assert progresso["by_status"] == {"Concluída": 2, "Em andamento": 2}
+    assert progresso["by_assignee"]["ana"] == {"total": 2, "done": 1, "completion_pct": 50.0}
+    assert progresso["by_milestone"]["Fase 1"]["total"] == 2
+    assert progresso["by_milestone"]["Go-live"]["total"] == 1
+    assert progresso["by_milestone"]["Sem marco"]["total"] == 1
+
+
+def test_pasta_com_varias_listas_e_cache_compartilhado():
+    with ClickUpStandIn() as clickup:
+        for projeto in range(5):
+            clickup.add_list("f1", f"L{projeto}")
+            for i in range(120 if projeto == 0 else 10):
+                clickup.add_task(f"L{projeto}", f"Tarefa {i}",
+                                 status="Concluída" if i % 2 else "Projeto em Andamento")
+        rastreador = ProjectProgressTracker(concurrency=8, ttl_seconds=30,
+                                            http=HTTPClient(clickup.base_url, name="stand-in"))
+
+        resultados = []
+        threads = [threading.Thread(target=lambda: resultados.append(rastreador.project_progress(folder_id="f1")))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        chamadas = clickup.stats["requests"]
+
+        assert [r["total"] for r in resultados] == [160] * 4
+        assert resultados[0]["done"] == 80 and len(resultados[0]["list_ids"]) == 5
+        assert chamadas == 8  # pasta + 5 listas + janela de 2 páginas da lista maior, uma única vez
+        # As listas da pasta também ficam em cache individualmente
+        assert rastreador.projects_progress(["L0", "L3"])["L0"]["total"] == 120
+        assert clickup.stats["requests"] == chamadas
+        assert rastreador.project_progress(list_id="L3", refresh=True)["total"] == 10
+        assert clickup.stats["requests"] == chamadas + 1
@@ -0,0 +1,29 @@
+import asyncio
+import time
+
+from FSTech_Consulting_Agency.utils.rate_limiter import TokenBucket
+
+
+def test_rajada_dentro_da_capacidade_nao_espera():
+    bucket = TokenBucket(rate_per_minute=600, capacity=5)
+    inicio = time.monotonic()
+    for _ in range(5):
+        assert bucket.acquire() == 0
+    assert time.monotonic() - inicio < 0.05
+
+
+def test_acima_da_capacidade_aguarda_reposicao():
+    bucket = TokenBucket(rate_per_minute=600, capacity=1)  # 10 por segundo
+    bucket.acquire()
+    espera = bucket.acquire()
+    assert 0.05 < espera <= 0.11
+
+
+def test_aquisicao_assincrona_e_limite_desativado():
+    async def adquirir():
+        bucket = TokenBucket(rate_per_minute=600, capacity=1)
+        return [await bucket.acquire_async() for _ in range(3)]
+
+    esperas = asyncio.run(adquirir())
+    assert esperas[0] == 0 and all(e > 0 for e in esperas[1:])
+    assert TokenBucket(None).acquire(10_000) == 0
@@ -0,0 +1,111 @@
+import os
+import subprocess
+import sys
+
+from FSTech_Consulting_Agency.Arquiteto_de_Software.tools.security_audit_assistant import perform_security_audit
+from FSTech_Consulting_Agency.utils import security_scanner
+from FSTech_Consulting_Agency.utils.security_scanner import compile_rules, scan_text, scan_tree
+
+# Montados em tempo de execução para que este arquivo não dispare as próprias regras
+CHAVE_AWS = "AKIA" + "Q" * 16
+SENHA = "s3nh4-" + "F0rte!"
+
+ARQUIVOS = {
+    "app/settings.py": f'DEBUG = True\nDB_PASSWORD = "{SENHA}"\nAPI_KEY = os.getenv("API_KEY")\n',
+    "app/views.py": "import subprocess\nsubprocess.run(cmd, shell=True)\nvalor = eval(expr)  # nosec\n"
+                    "cursor.execute(f\"SELECT * FROM t WHERE id = {id}\")\n",
+    "app/util.js": "el.innerHTML = html;\nconst x = eval(code);\n",  # nosec
+    "infra/main.tf": 'cidr_blocks = ["0.0.0.0/0"]\n',
+    "infra/k8s.yaml": "securityContext:\n  privileged: true\n",
+    "config/.env": f"AWS_KEY={CHAVE_AWS}\n",
+    "config/.env.example": "OPENAI_API_KEY=COLOQUE_AQUI_A_CHAVE_DE_VERDADE\n",
+    "docs/LEIAME.md": "Nenhum problema aqui: eval(x) em texto não é código.\n",  # nosec
+    "img/logo.png": "\0binário",
+}
+
+
+def _arvore(raiz, arquivos=ARQUIVOS):
+    for caminho, conteudo in arquivos.items():
+        destino = raiz / caminho
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        destino.write_text(conteudo, encoding="utf-8")
+    return raiz
+
+
+def _achados(resultado):
+    return {(f["path"], f["rule"]) for f in resultado["findings"]}
+
+
+def test_regras_encontram_segredos_configuracoes_e_chamadas(tmp_path):
+    resultado = scan_tree(str(_arvore(tmp_path / "repo")), incremental=False, processes=1)
+    assert _achados(resultado) == {
+        ("app/settings.py", "debug-enabled"), ("app/settings.py", "hardcoded-secret"),
+        ("app/views.py", "shell-injection"), ("app/views.py", "sql-string-format"),
+        ("app/util.js", "inner-html"), ("app/util.js", "eval-exec"),
+        ("infra/main.tf", "open-ingress"), ("infra/k8s.yaml", "privileged-container"),
+        ("config/.env", "aws-access-key"), ("config/.env", "env-file-secret"),
+    }
+    assert resultado["findings"][0]["severity"] == "Alto"
+    segredo = next(f for f in resultado["findings"] if f["rule"] == "aws-access-key")
+    assert CHAVE_AWS not in segredo["snippet"] and segredo["line"] == 1
+    assert resultado["stats"]["files"] == 8  # o .png nem é listado
+
+
+def test_modo_incremental_reescaneia_apenas_o_que_mudou(tmp_path):
+    raiz = _arvore(tmp_path / "repo")
+    cache = str(tmp_path / "cache")
+    primeiro = scan_tree(str(raiz), cache_dir=cache, processes=1)
+    assert primeiro["stats"]["scanned"] == 8
+
+    segundo = scan_tree(str(raiz), cache_dir=cache, processes=1)
+    assert segundo["stats"]["reused"] == 8 and segundo["stats"]["scanned"] == 0
+    assert _achados(segundo) == _achados(primeiro)
+
+    (raiz / "app/views.py").write_text("print('ok')\n", encoding="utf-8")
+    mesmo = raiz / "infra/main.tf"
+    os.utime(mesmo, ns=(mesmo.stat().st_atime_ns, mesmo.stat().st_mtime_ns + 10 ** 9))  # só o mtime muda
+    (raiz / "config/.env").unlink()
+    terceiro = scan_tree(str(raiz), cache_dir=cache, processes=1)
+    assert (terceiro["stats"]["scanned"], terceiro["stats"]["unchanged"], terceiro["stats"]["files"]) == (1, 1, 7)
+    assert not any(path in ("app/views.py", "config/.env") for path, _ in _achados(terceiro))
+    assert ("infra/main.tf", "open-ingress") in _achados(terceiro)
+
+
+def test_pool_de_processos_da_o_mesmo_resultado(tmp_path, monkeypatch):
+    arquivos = {f"pkg{i}/mod{i}.py": ARQUIVOS["app/views.py"] if i % 3 else "x = 1\n" for i in range(40)}
+    raiz = _arvore(tmp_path / "repo", arquivos)
+    monkeypatch.setattr(security_scanner, "SECURITY_SCAN_PROCESS_THRESHOLD", 10)
+    sequencial = scan_tree(str(raiz), incremental=False, processes=1)
+    paralelo = scan_tree(str(raiz), incremental=False, processes=2, chunk_size=8)
+    assert paralelo["stats"]["processes"] == 2
+    assert paralelo["findings"] == sequencial["findings"] and len(sequencial["findings"]) == 26 * 2
+
+
+def test_valores_de_exemplo_nao_sao_segredos():
+    regras = compile_rules()
+    assert scan_text('password = "SUA_SENHA_AQUI"\ntoken = "${TOKEN}"\n', "a.py", regras) == []
+
+
+def test_ferramenta_de_auditoria(tmp_path, monkeypatch):
+    monkeypatch.setattr(security_scanner, "SECURITY_SCAN_CACHE_DIR", str(tmp_path / "cache"))
+    relatorio = perform_security_audit("API em Django", ["Autenticação", "Configuração de Rede"],
+                                       source_path=str(_arvore(tmp_path / "repo")), incremental=False)
+    assert "`infra/main.tf:1`" in relatorio and "Alto: 5" in relatorio
+    assert "MFA" in relatorio and "Limitar regras de entrada" in relatorio
+    assert perform_security_audit("x", ["Geral"], source_path=str(tmp_path / "nao-existe")).startswith("Erro")
+
+    sem_codigo = perform_security_audit("Nginx com Access-Control-Allow-Origin: *", ["Dados"])
+    assert relatorio != sem_codigo and "sem código-fonte" in sem_codigo
+
+
+def test_linha_longa_sem_backtracking_quadratico():
+    # Antes do prefixo limitado, uma linha assim levava horas; o subprocesso falha pelo timeout
+    codigo = (
+        "from FSTech_Consulting_Agency.utils.security_scanner import applicable_rules, compile_rules, scan_text\n"
+        "linha = 'a.' * 200000 + 'b-' * 100000\n"
+        f"texto = linha + '\\ndb_password = \"{SENHA}\"\\n'\n"
+        "regras = applicable_rules('bundle.min.js', compile_rules())\n"
+        "print(sorted({f['rule'] for f in scan_text(texto, 'bundle.min.js', regras)}))\n"
+    )
+    resultado = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True, timeout=60)
+    assert resultado.stdout.strip() == "['hardcoded-secret']"
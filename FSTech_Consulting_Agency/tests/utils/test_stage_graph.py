@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+from FSTech_Consulting_Agency.utils.stage_graph import Stage, StageGraphError, run_stage_graph, validate_stage_graph
+
+
+def _lento(segundos, **saidas):
+    def etapa(**_):
+        time.sleep(segundos)
+        return saidas
+    return etapa
+
+
+def test_etapas_independentes_rodam_em_paralelo():
+    stages = [
+        Stage("crm", _lento(0.2, task_id="123"), inputs=["briefing"], outputs=["task_id"]),
+        Stage("ia", _lento(0.2, industry="Saúde"), inputs=["briefing"], outputs=["industry"]),
+        Stage("junta", lambda task_id, industry: {"resumo": f"{task_id}-{industry}"},
+              inputs=["task_id", "industry"], outputs=["resumo"]),
+    ]
+    inicio = time.perf_counter()
+    contexto = run_stage_graph(stages, {"briefing": "texto"})
+    assert time.perf_counter() - inicio < 0.35
+    assert contexto["resumo"] == "123-Saúde"
+
+
+def test_fallback_e_callback_por_etapa():
+    def falha(briefing):
+        raise RuntimeError("API fora do ar")
+
+    concluidas = []
+    stages = [Stage("ia", falha, inputs=["briefing"], outputs=["industry"],
+                    fallback=lambda erro, briefing: {"industry": ""})]
+    contexto = run_stage_graph(stages, {"briefing": "x"},
+                               on_stage_complete=lambda nome, saidas, seg: concluidas.append(nome))
+    assert contexto["industry"] == ""
+    assert concluidas == ["ia"]
+
+
+def test_falha_sem_fallback_interrompe_o_grafo():
+    def falha(briefing):
+        raise RuntimeError("erro")
+
+    with pytest.raises(StageGraphError) as exc:
+        run_stage_graph([Stage("ia", falha, inputs=["briefing"], outputs=["industry"])], {"briefing": "x"})
+    assert exc.value.stage == "ia"
+
+
+def test_validacao_detecta_entradas_ausentes_e_ciclos():
+    with pytest.raises(StageGraphError):
+        validate_stage_graph([Stage("a", dict, inputs=["nada"], outputs=["x"])])
+    with pytest.raises(StageGraphError):
+        validate_stage_graph([
+            Stage("a", dict, inputs=["y"], outputs=["x"]),
+            Stage("b", dict, inputs=["x"], outputs=["y"]),
+        ])
+    ordem = validate_stage_graph([
+        Stage("b", dict, inputs=["x"], outputs=["y"]),
+        Stage("a", dict, inputs=["briefing"], outputs=["x"]),
+    ], available_keys=["briefing"])
+    assert ordem == ["a", "b"]
@@ -0,0 +1,85 @@
+import pytest
+import requests
+
+from FSTech_Consulting_Agency.standins import CalcomStandIn, ClickUpStandIn, FaultConfig
+from FSTech_Consulting_Agency.utils.clickup_async import AsyncClickUpClient
+from FSTech_Consulting_Agency.utils.clickup_client import CRM_LIST_ID, STATUS_MAP
+from FSTech_Consulting_Agency.utils.crm_status import CRMStatusMachine
+from FSTech_Consulting_Agency.utils.http_session import HTTPClient, HTTPServiceError
+
+
+@pytest.fixture
+def clickup():
+    with ClickUpStandIn() as servidor:
+        yield servidor
+
+
+def test_clickup_cria_atualiza_e_lista_tarefas(clickup):
+    http = HTTPClient(clickup.base_url, name="stand-in")
+    criada = http.request_json("POST", f"list/{CRM_LIST_ID}/task", json={"name": "Lead - ACME"})
+    assert criada["status"]["status"] == STATUS_MAP["oportunidade_identificada"]
+
+    atualizada = http.request_json("PUT", f"task/{criada['id']}", json={"status": STATUS_MAP["proposta_enviada"]})
+    assert atualizada["status"]["status"] == "Proposta Enviada"
+    assert int(atualizada["date_updated"]) > int(criada["date_updated"])
+
+    for i in range(150):
+        clickup.add_task(CRM_LIST_ID, f"Lead {i}")
+    pagina = http.request_json("GET", f"list/{CRM_LIST_ID}/task", params={"page": 1, "include_closed": "true"})
+    assert len(pagina["tasks"]) == 51 and pagina["last_page"] is True
+
+    with pytest.raises(HTTPServiceError) as erro:
+        http.request("PUT", f"task/{criada['id']}", json={"status": "Inexistente"})
+    assert erro.value.status_code == 400
+
+
+def test_clickup_rate_limit_responde_429_com_cabecalhos():
+    with ClickUpStandIn(FaultConfig(rate_limit=2, rate_window=30)) as servidor:
+        respostas = [requests.get(f"{servidor.base_url}/team", timeout=5) for _ in range(3)]
+    assert [r.status_code for r in respostas] == [200, 200, 429]
+    assert respostas[1].headers["X-RateLimit-Remaining"] == "0"
+    assert float(respostas[2].headers["Retry-After"]) > 0
+    assert servidor.stats["rate_limited"] == 1
+
+
+def test_clickup_falhas_injetadas_sao_retentadas_pelo_cliente():
+    with ClickUpStandIn(FaultConfig(error_rate=0.3, seed=7)) as servidor:
+        tarefa = servidor.add_task(CRM_LIST_ID, "Lead - Retry")
+        http = HTTPClient(servidor.base_url, name="stand-in", max_retries=8)
+        http._backoff = lambda attempt: 0.0
+        for _ in range(6):
+            assert http.request_json("GET", f"task/{tarefa['id']}")["id"] == tarefa["id"]
+    assert servidor.stats["injected_errors"] > 0
+    assert http.get_metrics()["GET /task/{id}"]["retries"] == servidor.stats["injected_errors"]
+
+
+def test_cliente_async_lista_paginas_do_stand_in(clickup):
+    import asyncio
+
+    for i in range(230):
+        clickup.add_task(CRM_LIST_ID, f"Lead {i}")
+
+    async def listar():
+        http = HTTPClient(clickup.base_url, name="stand-in")
+        async with AsyncClickUpClient(concurrency=4, http=http, status_machine=CRMStatusMachine()) as client:
+            return await client.list_tasks(CRM_LIST_ID)
+
+    assert len(asyncio.run(listar())) == 230
+
+
+def test_calcom_agenda_e_recusa_conflito():
+    with CalcomStandIn() as servidor:
+        http = HTTPClient(servidor.base_url, name="stand-in")
+        corpo = {"eventTypeId": 42, "start": "2030-05-10T14:00:00.000Z", "end": "2030-05-10T15:00:00.000Z",
+                 "responses": {"name": "Cliente", "email": "cliente@example.com"}}
+        reserva = http.request_json("POST", "bookings", json=corpo)["data"]
+        assert reserva["status"] == "accepted"
+
+        with pytest.raises(HTTPServiceError) as erro:
+            http.request("POST", "bookings", json=dict(corpo, start="2030-05-10T14:30:00.000Z", end="2030-05-10T15:30:00.000Z"))
+        assert erro.value.status_code == 409
+
+        slots = http.request_json("GET", "slots/available", params={
+            "eventTypeId": 42, "startTime": "2030-05-10T00:00:00Z", "endTime": "2030-05-11T00:00:00Z"})
+        horarios = [s["time"] for s in slots["data"]["slots"]["2030-05-10"]]
+        assert "2030-05-10T14:00:00.000Z" not in horarios and "2030-05-10T15:00:00.000Z" in horarios
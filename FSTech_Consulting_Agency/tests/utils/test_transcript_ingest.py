@@ -0,0 +1,137 @@
+import io
+
+import pytest
+
+from FSTech_Consulting_Agency.utils.component_catalog import load_component_catalog
+from FSTech_Consulting_Agency.utils.meeting_service import process_transcription_upload
+from FSTech_Consulting_Agency.utils.transcript_ingest import (
+    ComponentAnalyzer, PainPointAnalyzer, TranscriptFormatError, context_preview, extract_pain_points,
+    ingest_transcript)
+
+CATALOGO = load_component_catalog()
+
+VTT = """WEBVTT
+
+1
+00:00:01.000 --> 00:00:04.000
+Cliente: Hoje o fechamento é todo manual e temos muito retrabalho.
+
+2
+00:00:04.000 --> 00:00:07.000
+Cliente: Hoje o fechamento é todo manual e temos muito retrabalho.
+
+3
+00:00:07.000 --> 00:00:09.000
+[inaudível]
+
+4
+00:00:09.000 --> 00:00:12.000
+Consultor: Então um dashboard com login resolveria?
+"""
+
+
+class _Sessao(dict):
+    __getattr__ = dict.get
+
+    def __setattr__(self, nome, valor):
+        self[nome] = valor
+
+
+def test_descarta_marcacoes_e_repeticoes_de_legenda():
+    ingestor = ingest_transcript(io.BytesIO(VTT.encode("utf-8")), chunk_bytes=16)
+    assert ingestor.text.splitlines() == [
+        "Cliente: Hoje o fechamento é todo manual e temos muito retrabalho.",
+        "Consultor: Então um dashboard com login resolveria?",
+    ]
+    assert ingestor.stats["duplicates"] == 1 and ingestor.stats["boilerplate"] >= 9
+    assert ingestor.stats["bytes_read"] == len(VTT.encode("utf-8"))
+
+
+@pytest.mark.parametrize("codificacao", ["utf-8", "utf-8-sig", "utf-16", "cp1252"])
+def test_detecta_codificacao_mesmo_com_blocos_pequenos(codificacao):
+    texto = "Reunião de alinhamento\r\nA integração com o ERP é lenta e cheia de erros.\r\n"
+    ingestor = ingest_transcript(io.BytesIO(texto.encode(codificacao)), chunk_bytes=3)
+    assert ingestor.text == "Reunião de alinhamento\nA integração com o ERP é lenta e cheia de erros."
+
+
+def test_palavra_chave_quebrada_entre_linhas_e_blocos():
+    texto = "[00:01:02] Precisamos de um banco de\n[00:01:05] dados novo e de uma API.\n"
+    componentes = ComponentAnalyzer(CATALOGO)
+    ingestor = ingest_transcript(io.BytesIO(texto.encode("utf-8")), analyzers=[componentes], chunk_bytes=5)
+    assert ingestor.text.startswith("Precisamos de um banco de\n")
+    resultado = ingestor.results()["components"]
+    assert resultado["components"] == ["API REST/GraphQL", "Banco de Dados (SQL/NoSQL)"]
+    assert resultado["score"] == sum(resultado["component_scores"].values()) == 4
+    assert resultado["complexity_level"] == "baixa"
+
+
+def test_numeros_soltos_nao_sao_indices_de_legenda():
+    texto = "Ano de referência:\n2024\nFaturamento anual estimado\n150000\n1\n00:00:01.000 --> 00:00:02.000\nOk\n7\n"
+    ingestor = ingest_transcript(io.BytesIO(texto.encode("utf-8")))
+    assert ingestor.text.splitlines() == ["Ano de referência:", "2024", "Faturamento anual estimado", "150000",
+                                          "Ok", "7"]
+    assert ingestor.stats["boilerplate"] == 2
+
+
+def test_memoria_limitada_em_transcricao_grande():
+    linhas = "".join(f"Trecho {i}: o processo de aprovação demora e gera retrabalho no time {i}.\n"
+                     for i in range(50000))
+    dores = PainPointAnalyzer(limit=5)
+    ingestor = ingest_transcript(io.BytesIO(linhas.encode("utf-8")), analyzers=[dores],
+                                 max_chars=10000, dedup_window=100)
+    assert ingestor.stats["truncated"] and len(ingestor.text) <= 10000
+    assert ingestor.stats["segments"] == 50000
+    assert len(dores.points) == 5 and dores.total == 50000
+    assert len(ingestor._seen) == 100
+
+
+def test_linha_enorme_sem_quebra_vira_varios_segmentos():
+    texto = ("palavra " * 5000).encode("utf-8")
+    ingestor = ingest_transcript(io.BytesIO(texto), dedup_window=0, chunk_bytes=1000)
+    assert all(len(linha) <= 2000 for linha in ingestor.text.splitlines())
+    assert ingestor.text.replace("\n", " ").split() == ["palavra"] * 5000
+
+
+def test_pdf_e_recusado():
+    with pytest.raises(TranscriptFormatError):
+        ingest_transcript(io.BytesIO(b"%PDF-1.7\n..."))
+
+
+def test_upload_guarda_texto_limpo_e_pontos_de_dor():
+    sessao = _Sessao(logs=[])
+    arquivo = io.BytesIO(VTT.encode("utf-8"))
+    sucesso, mensagem = process_transcription_upload(arquivo, sessao)
+    assert sucesso, mensagem
+    assert sessao.reuniao_transcricao.count("retrabalho") == 1
+    assert sessao.reuniao_pontos_dor == ["Cliente: Hoje o fechamento é todo manual e temos muito retrabalho."]
+    assert "Painel de Controle/Dashboard" in sessao.reuniao_ingestao["components"]["components"]
+    assert "1 repetidos" in sessao.logs[-1]["message"]
+
+    sucesso, mensagem = process_transcription_upload(io.BytesIO(b"%PDF-1.4"), _Sessao(logs=[]))
+    assert not sucesso and "PDF" in mensagem
+
+
+def test_resumo_manual_e_preview_do_contexto():
+    assert extract_pain_points("Tudo ótimo.\nO problema é o atraso nas entregas.") == [
+        "O problema é o atraso nas entregas."]
+    preview = context_preview({"reuniao_transcricao": "x" * 1000, "requirements": ["y" * 1000], "users": 50})
+    assert preview["reuniao_transcricao"].endswith("(1000 caracteres)") and len(preview["reuniao_transcricao"]) < 250
+    assert preview["requirements"][0].endswith("(1000 caracteres)") and preview["users"] == 50
+
+
+def test_arquiteto_usa_componentes_do_arquivo_inteiro():
+    from FSTech_Consulting_Agency.Arquiteto_de_Software.tools.system_architecture_designer import (
+        design_architecture_and_assess_complexity)
+
+    # Só o início fica guardado; o componente citado no fim vem da análise em streaming
+    texto = ("Precisamos de um dashboard.\n"
+             + "".join(f"Conversa sem requisitos técnicos, trecho {i}.\n" for i in range(200))
+             + "E também de uma integração com o ERP.\n")
+    componentes = ComponentAnalyzer(CATALOGO)
+    ingestor = ingest_transcript(io.BytesIO(texto.encode("utf-8")), analyzers=[componentes], max_chars=200)
+    assert ingestor.stats["truncated"] and "ERP" not in ingestor.text
+
+    resultado = design_architecture_and_assess_complexity(ingestor.text, transcript_analysis=componentes.result())
+    for componente in componentes.result()["components"]:
+        assert componente in resultado
+    assert len(componentes.result()["components"]) == 2
@@ -0,0 +1,196 @@
+"""
+Registro preguiçoso (lazy) dos agentes da FSTech.
+
+Os agentes são descritos por especificações leves (nome, pasta das instruções e caminhos
+"modulo:funcao" das ferramentas). Nada é importado nem lido do disco ao importar este
+módulo: as ferramentas, o instructions.md e o objeto Agent de cada agente só são
+materializados no primeiro uso e ficam em cache pelo resto do processo.
+
+Isso reduz o tempo de inicialização do app.py (o Streamlit reexecuta o script a cada
+interação) e os cold starts do container — a barra lateral lista agentes e ferramentas
+a partir das especificações, sem construir nenhum Agent.
+"""
+
+import importlib
+import os
+import threading
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PKG = "FSTech_Consulting_Agency"
+
+AGENT_SPECS = {
+    "consultor": {
+        "name": "Consultor de Diagnóstico",
+        "dir": "Consultor_de_Diagnostico",
+        "tools": [
+            f"{_PKG}.Consultor_de_Diagnostico.tools.client_intake_form_generator:generate_client_intake_form",
+            f"{_PKG}.Consultor_de_Diagnostico.tools.crm_status_updater:update_crm_task_status",
+            f"{_PKG}.Consultor_de_Diagnostico.tools.pricing_calculator:calculate_proposal_price",
+            f"{_PKG}.Consultor_de_Diagnostico.tools.proposal_builder:build_proposal_markdown",
+        ],
+        "tool_description": "Ferramentas do Consultor de Diagnóstico: intake de clientes, cálculo de preço, propostas.",
+    },
+    "suporte": {
+        "name": "Suporte Administrativo",
+        "dir": "Suporte_Administrativo",
+        "tools": [
+            f"{_PKG}.Suporte_Administrativo.tools.client_support_bot:handle_client_support_query",
+            f"{_PKG}.Suporte_Administrativo.tools.appointment_scheduler_manager:schedule_meeting_calcom",
+            f"{_PKG}.Suporte_Administrativo.tools.appointment_scheduler_manager:schedule_meetings_batch",
+            f"{_PKG}.Suporte_Administrativo.tools.subscription_tracker:track_subscription",
+            f"{_PKG}.Suporte_Administrativo.tools.feedback_collector:collect_feedback",
+        ],
+        "tool_description": "Ferramentas do Suporte: agendamento, feedback, suporte ao cliente.",
+    },
+    "marketing": {
+        "name": "Gerente de Marketing Digital",
+        "dir": "Gerente_de_Marketing_Digital",
+        "tools": [
+            f"{_PKG}.Gerente_de_Marketing_Digital.tools.content_calendar_manager:manage_content_calendar",
+            f"{_PKG}.Gerente_de_Marketing_Digital.tools.social_media_post_generator:generate_social_media_post",
+            f"{_PKG}.Gerente_de_Marketing_Digital.tools.ad_campaign_launcher:launch_ad_campaign",
+            f"{_PKG}.Gerente_de_Marketing_Digital.tools.seo_optimizer:optimize_seo",
+            f"{_PKG}.Gerente_de_Marketing_Digital.tools.crm_lead_creator:create_crm_lead",
+            f"{_PKG}.Gerente_de_Marketing_Digital.tools.crm_lead_creator:import_crm_leads",
+        ],
+        "tool_description": "Ferramentas de Marketing: conteúdo, social media, SEO, campanhas.",
+    },
+    "coordenador": {
+        "name": "Coordenador de Projetos",
+        "dir": "Coordenador_de_Projetos",
+        "tools": [
+            f"{_PKG}.Coordenador_de_Projetos.tools.project_timeline_manager:manage_project_timeline",
+            f"{_PKG}.Coordenador_de_Projetos.tools.task_assignment_manager:manage_task_assignment",
+            f"{_PKG}.Coordenador_de_Projetos.tools.progress_tracker:track_task_progress",
+            f"{_PKG}.Coordenador_de_Projetos.tools.progress_tracker:view_project_progress",
+            f"{_PKG}.Coordenador_de_Projetos.tools.client_update_sender:send_client_update",
+            f"{_PKG}.Coordenador_de_Projetos.tools.crm_project_status_updater:update_crm_project_status",
+        ],
+        "tool_description": "Ferramentas do Coordenador de Projetos: cronograma, tarefas, progresso.",
+    },
+    "especialista": {
+        "name": "Especialista Técnico",
+        "dir": "Especialista_Tecnico",
+        "tools": [
+            f"{_PKG}.Especialista_Tecnico.tools.automation_setup_wizard:setup_automation",
+            f"{_PKG}.Especialista_Tecnico.tools.llm_fine_tuner:fine_tune_llm",
+            f"{_PKG}.Especialista_Tecnico.tools.prompt_engineering_assistant:optimize_prompt",
+            f"{_PKG}.Especialista_Tecnico.tools.api_integrator:integrate_api",
+            f"{_PKG}.Especialista_Tecnico.tools.platform_configuration_manager:configure_platform",
+        ],
+        "tool_description": "Ferramentas do Especialista Técnico: automação, APIs, plataformas, fine-tuning.",
+    },
+    "arquiteto": {
+        "name": "Arquiteto de Software",
+        "dir": "Arquiteto_de_Software",
+        "tools": [
+            f"{_PKG}.Arquiteto_de_Software.tools.system_architecture_designer:design_architecture_and_assess_complexity",
+            f"{_PKG}.Arquiteto_de_Software.tools.api_blueprint_generator:generate_api_blueprint",
+            f"{_PKG}.Arquiteto_de_Software.tools.scalability_tester:test_scalability",
+            f"{_PKG}.Arquiteto_de_Software.tools.security_audit_assistant:perform_security_audit",
+        ],
+        "tool_description": "Ferramentas do Arquiteto: arquitetura, APIs, segurança, escalabilidade.",
+    },
+    "ceo": {
+        "name": "CEO",
+        "dir": "CEO",
+        "tools": [
+            f"{_PKG}.CEO.tools.business_strategy_builder:build_strategy",
+            f"{_PKG}.CEO.tools.client_relationship_manager:manage_client_vip",
+            f"{_PKG}.CEO.tools.kpi_dashboard_manager:manage_kpi_dashboard",
+            f"{_PKG}.CEO.tools.risk_assessment_tool:assess_risk",
+        ],
+        "tool_description": "Ferramentas do CEO: estratégia, clientes VIP, KPIs, riscos.",
+    },
+    "analista_roi": {
+        "name": "Analista de ROI",
+        "dir": "Analista_ROI",
+        "tools": [
+            f"{_PKG}.Analista_ROI.tools.roi_calculator:calculate_roi",
+            f"{_PKG}.Analista_ROI.tools.benefit_projection:project_benefits",
+            f"{_PKG}.Analista_ROI.tools.cost_reduction_estimator:estimate_cost_reduction",
+            f"{_PKG}.Analista_ROI.tools.payback_period_analyzer:analyze_payback_period",
+            f"{_PKG}.Analista_ROI.tools.value_proposition_builder:build_value_proposition",
+        ],
+        "tool_description": "Ferramentas do Analista de ROI: cálculo de ROI, projeção de benefícios, análise de payback, proposta de valor.",
+    },
+}
+
+ORQUESTRADOR_NAME = "Orquestrador FSTech"
+ORQUESTRADOR_INSTRUCTIONS = (
+    "Você é o orquestrador da FSTech. Use as ferramentas/agentes disponíveis para delegar "
+    "tarefas conforme o fluxo operacional."
+)
+
+_agents = {}
+_instructions = {}
+_lock = threading.RLock()
+
+
+def load_instructions(path):
+    """Lê um arquivo de instruções em Markdown (com cache por caminho)."""
+    with _lock:
+        if path not in _instructions:
+            with open(path, "r", encoding="utf-8") as f:
+                _instructions[path] = f.read()
+        return _instructions[path]
+
+
+def load_tool(spec):
+    """Importa e retorna a ferramenta descrita por 'pacote.modulo:funcao'."""
+    module_name, attr = spec.split(":", 1)
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def list_agents():
+    """Retorna {chave: nome de exibição} sem materializar nenhum agente."""
+    return {key: spec["name"] for key, spec in AGENT_SPECS.items()}
+
+
+def agent_tool_names(key):
+    """Nomes das ferramentas de um agente, obtidos da especificação (sem importar nada)."""
+    return [tool.split(":", 1)[1] for tool in AGENT_SPECS[key]["tools"]]
+
+
+def get_agent(key):
+    """
+    Retorna o Agent da chave informada, construindo-o no primeiro uso.
+
+    Args:
+        key: Chave em AGENT_SPECS (ex: 'arquiteto') ou 'orquestrador'.
+
+    Raises:
+        KeyError: Se a chave não existir.
+    """
+    if key == "orquestrador":
+        return get_orquestrador()
+    spec = AGENT_SPECS[key]
+    with _lock:
+        agent = _agents.get(key)
+        if agent is None:
+            from agents import Agent
+            agent = Agent(
+                name=spec["name"],
+                instructions=load_instructions(os.path.join(BASE_DIR, spec["dir"], "instructions.md")),
+                tools=[load_tool(tool) for tool in spec["tools"]],
+            )
+            _agents[key] = agent
+        return agent
+
+
+def get_orquestrador():
+    """Retorna o orquestrador central; os agentes delegados são construídos nesse momento."""
+    with _lock:
+        agent = _agents.get("orquestrador")
+        if agent is None:
+            from agents import Agent
+            agent = Agent(
+                name=ORQUESTRADOR_NAME,
+                instructions=ORQUESTRADOR_INSTRUCTIONS,
+                tools=[
+                    get_agent(key).as_tool(tool_name=key, tool_description=spec["tool_description"])
+                    for key, spec in AGENT_SPECS.items()
+                ],
+            )
+            _agents["orquestrador"] = agent
+        return agent
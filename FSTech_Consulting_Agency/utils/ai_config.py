@@ -36,3 +36,12 @@ def get_model_config(task_type="balanced"):
         "model": DEFAULT_MODEL,
         "temperature": TEMPERATURES.get(task_type, 0.17)
     }
+
+# Limites de uso da API OpenAI, aplicados pelo gateway compartilhado (utils/openai_gateway.py)
+OPENAI_LIMITS = {
+    "requests_per_minute": 500,   # Limite de requisições por minuto (RPM)
+    "tokens_per_minute": 200000,  # Limite de tokens por minuto (TPM)
+    "max_concurrency": 8,         # Chamadas simultâneas permitidas
+    "max_retries": 5,             # Novas tentativas em 429/5xx/erros de conexão
+    "timeout_seconds": 60         # Timeout por requisição
+}
@@ -39,6 +39,8 @@ def reset_session(session_state):
     session_state.roi_summary = ""
     session_state.meeting_id = None
     session_state.reuniao_transcricao = ""
+    session_state.reuniao_pontos_dor = []
+    session_state.reuniao_ingestao = None
 
 def initialize_session_state(session_state):
     """
@@ -79,3 +81,7 @@ def initialize_session_state(session_state):
         session_state.meeting_id = None
     if 'reuniao_transcricao' not in session_state:
         session_state.reuniao_transcricao = ""
+    if 'reuniao_pontos_dor' not in session_state:
+        session_state.reuniao_pontos_dor = []
+    if 'reuniao_ingestao' not in session_state:
+        session_state.reuniao_ingestao = None
@@ -0,0 +1,183 @@
+"""
+Pontuação de arquitetura em lote sobre muitos documentos de requisitos (ex: atas históricas).
+
+Todos os documentos são pontuados com o mesmo catálogo compilado (utils/component_catalog.py):
+em memória para lotes pequenos e, a partir de ARCH_SCORING_PROCESS_THRESHOLD documentos, num
+pool de processos — cada processo recebe o catálogo compilado uma única vez (initializer) e
+pontua blocos de documentos. Nada é impresso por documento.
+
+O resultado é colunar, pronto para recalibrar os limites de complexidade com projetos passados:
+
+    {"catalog_version": "2025.06.1", "thresholds": {...}, "doc_ids": [...],
+     "components": [nome, ...],
+     "hits": {nome: [0/1 por documento]},      # matriz componente x documento
+     "scores": [pontuação por documento], "levels": ["baixa" | "media" | "alta", ...],
+     "level_counts": {...}, "elapsed_seconds": ..., "processes": ...}
+
+Uso:
+    python -m FSTech_Consulting_Agency.utils.architecture_scoring atas/ --processes 4 --output pontuacoes.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from FSTech_Consulting_Agency.utils.component_catalog import COMPLEXITY_LEVELS, get_component_catalog
+
+# Abaixo disso, o custo de subir processos supera o ganho
+ARCH_SCORING_PROCESS_THRESHOLD = int(os.getenv("FSTECH_ARCH_SCORING_PROCESS_THRESHOLD", "500"))
+ARCH_SCORING_CHUNK_SIZE = int(os.getenv("FSTECH_ARCH_SCORING_CHUNK_SIZE", "200"))
+
+_worker_catalog = None
+
+
+def _init_worker(catalog):
+    global _worker_catalog
+    _worker_catalog = catalog
+
+
+def _score_chunk(texts, catalog=None):
+    """Pontua um bloco de textos. Retorna [(índices dos componentes, pontuação)]."""
+    catalog = catalog or _worker_catalog
+    rows = []
+    for text in texts:
+        hits, total = catalog.score(text)
+        rows.append(([index for index, _ in hits], total))
+    return rows
+
+
+def _split_documents(documents):
+    if isinstance(documents, dict):
+        return [str(doc_id) for doc_id in documents], list(documents.values())
+    documents = list(documents)
+    if documents and isinstance(documents[0], (tuple, list)):
+        return [str(doc_id) for doc_id, _ in documents], [text for _, text in documents]
+    return [str(index) for index in range(len(documents))], documents
+
+
+def score_documents(documents, catalog=None, processes=None, chunk_size=ARCH_SCORING_CHUNK_SIZE):
+    """
+    Pontua vários documentos de requisitos de uma vez.
+
+    Args:
+        documents: Lista de textos, lista de pares (id, texto) ou dict {id: texto}.
+        catalog: ComponentCatalog a usar (padrão: o catálogo compartilhado e atual).
+        processes: Processos do pool (padrão: os.cpu_count()); 1 pontua no processo atual.
+            O pool só é usado a partir de ARCH_SCORING_PROCESS_THRESHOLD documentos.
+        chunk_size: Documentos por tarefa enviada ao pool.
+
+    Returns:
+        dict: Resultado colunar (ver docstring do módulo).
+    """
+    start = time.perf_counter()
+    catalog = catalog or get_component_catalog()
+    doc_ids, texts = _split_documents(documents)
+    processes = processes or os.cpu_count() or 1
+    use_pool = processes > 1 and len(texts) >= ARCH_SCORING_PROCESS_THRESHOLD
+
+    workers = 1
+    if use_pool:
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        workers = min(processes, len(chunks))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(catalog,)) as pool:
+            rows = [row for chunk_rows in pool.map(_score_chunk, chunks) for row in chunk_rows]
+    else:
+        rows = _score_chunk(texts, catalog)
+
+    hits = {name: [0] * len(rows) for name in catalog.components}
+    columns = [hits[name] for name in catalog.components]
+    scores, levels = [], []
+    for position, (components, total) in enumerate(rows):
+        for index in components:
+            columns[index][position] = 1
+        scores.append(total)
+        levels.append(catalog.complexity_level(total))
+
+    return {
+        "catalog_version": catalog.version,
+        "thresholds": dict(catalog.thresholds),
+        "doc_ids": doc_ids,
+        "components": list(catalog.components),
+        "hits": hits,
+        "scores": scores,
+        "levels": levels,
+        "level_counts": {level: levels.count(level) for level in COMPLEXITY_LEVELS},
+        "elapsed_seconds": round(time.perf_counter() - start, 3),
+        "processes": workers,
+    }
+
+
+def to_dataframe(result):
+    """Resultado de score_documents como pandas.DataFrame (uma linha por documento). Requer pandas."""
+    import pandas as pd
+    frame = pd.DataFrame(result["hits"], index=result["doc_ids"])
+    frame["score"] = result["scores"]
+    frame["level"] = result["levels"]
+    return frame
+
+
+def load_documents(input_path):
+    """
+    Carrega documentos de um diretório (cada .txt, recursivamente; id = caminho relativo) ou de um
+    arquivo JSONL (id em "id"/"lead_id"; texto em "text"/"ata_reuniao"/"requirements_text").
+    """
+    documents = []
+    if os.path.isdir(input_path):
+        for root, _, files in sorted(os.walk(input_path)):
+            for name in sorted(files):
+                if name.endswith(".txt"):
+                    path = os.path.join(root, name)
+                    with open(path, "r", encoding="utf-8", errors="replace") as f:
+                        documents.append((os.path.relpath(path, input_path), f.read()))
+        return documents
+    with open(input_path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            text = record.get("text") or record.get("ata_reuniao") or record.get("requirements_text") or ""
+            documents.append((str(record.get("id") or record.get("lead_id") or number), text))
+    return documents
+
+
+def write_csv(result, path):
+    """Grava o resultado colunar em CSV (id, componentes 0/1, score, level)."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["doc_id", *result["components"], "score", "level"])
+        columns = [result["hits"][name] for name in result["components"]]
+        for position, doc_id in enumerate(result["doc_ids"]):
+            writer.writerow([doc_id, *(column[position] for column in columns),
+                             result["scores"][position], result["levels"][position]])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pontua em lote documentos de requisitos com o catálogo de componentes.")
+    parser.add_argument("input", help="Diretório de .txt ou arquivo .jsonl")
+    parser.add_argument("--processes", type=int, default=None, help="Processos do pool (padrão: CPUs)")
+    parser.add_argument("--output", help="CSV de saída (uma linha por documento)")
+    args = parser.parse_args(argv)
+
+    result = score_documents(load_documents(args.input), processes=args.processes)
+    total = len(result["doc_ids"])
+    print(f"{total} documentos pontuados em {result['elapsed_seconds']}s "
+          f"({result['processes']} processo(s), catálogo {result['catalog_version']}).")
+    print(f"Níveis: {result['level_counts']} | limites atuais: {result['thresholds']}")
+    if total:
+        ordered = sorted(result["scores"])
+        print("Pontuação p25/p50/p75/p90: " + "/".join(
+            str(ordered[min(total - 1, int(total * q))]) for q in (0.25, 0.5, 0.75, 0.9)))
+        frequency = {name: sum(column) for name, column in result["hits"].items()}
+        print("Componentes mais frequentes: " + ", ".join(
+            f"{name} ({count})" for name, count in sorted(frequency.items(), key=lambda item: -item[1])[:5]))
+    if args.output:
+        write_csv(result, args.output)
+        print(f"Resultado salvo em {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
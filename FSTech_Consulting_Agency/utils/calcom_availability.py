@@ -0,0 +1,313 @@
+"""
+Cache de disponibilidade do Cal.com e busca local de horários livres.
+
+A disponibilidade de um tipo de evento é buscada uma vez (GET /slots/available para os
+próximos CALCOM_AVAILABILITY_DAYS dias) e guardada por alguns segundos
+(CALCOM_AVAILABILITY_TTL_SECONDS) como intervalos livres ordenados e disjuntos. A partir
+daí, "esse horário está livre?" e "quais os próximos horários livres?" são respondidos
+localmente por busca binária, sem nova chamada à API.
+
+Agendamentos passam por CalcomAvailability.book: horários já ocupados são recusados antes
+do POST (com sugestões de horários livres); um conflito devolvido pela API invalida o
+cache do tipo de evento; agendamentos bem-sucedidos são descontados dos intervalos livres.
+"""
+
+import bisect
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+CALCOM_EVENT_TYPE_ID = int(os.getenv("CALCOM_EVENT_TYPE_ID", "1585329"))
+CALCOM_AVAILABILITY_TTL_SECONDS = float(os.getenv("CALCOM_AVAILABILITY_TTL_SECONDS", "120"))
+CALCOM_AVAILABILITY_DAYS = int(os.getenv("CALCOM_AVAILABILITY_DAYS", "14"))
+CALCOM_SLOT_MINUTES = int(os.getenv("CALCOM_SLOT_MINUTES", "60"))
+
+LOCAL_TIMEZONE = ZoneInfo("America/Sao_Paulo")
+
+# Mensagens com que a API recusa um horário já ocupado (além do status 409)
+_CONFLICT_MARKERS = ("no_available_users", "already has booking", "not available")
+
+
+def parse_time(value, tz=LOCAL_TIMEZONE):
+    """Converte ISO 8601 (com 'Z', offset ou sem fuso — interpretado em `tz`) ou datetime em epoch (s)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, datetime):
+        value = str(value).strip()
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=tz)
+    return value.timestamp()
+
+
+def format_time(epoch):
+    """Epoch (s) -> ISO 8601 em UTC no formato da API do Cal.com."""
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def format_local(epoch):
+    """Epoch (s) -> 'dd/mm/aaaa HH:MM' no horário de Brasília (mensagens ao operador)."""
+    return datetime.fromtimestamp(epoch, LOCAL_TIMEZONE).strftime("%d/%m/%Y %H:%M")
+
+
+def fetch_available_slots(event_type_id, start, end):
+    """
+    Busca os horários disponíveis de um tipo de evento no Cal.com.
+
+    Returns:
+        list: Inícios dos slots livres (epoch s), em ordem.
+    """
+    from FSTech_Consulting_Agency.utils.calcom_client import calcom_request
+    body = calcom_request("GET", "slots/available", params={
+        "eventTypeId": event_type_id, "startTime": format_time(start), "endTime": format_time(end)})
+    slots = ((body.get("data") or {}).get("slots")) or {}
+    return sorted(parse_time(slot["time"]) for day in slots.values() for slot in day)
+
+
+class FreeIntervals:
+    """Intervalos livres [início, fim) em epoch (s), ordenados e disjuntos."""
+
+    def __init__(self):
+        self._starts = []
+        self._ends = []
+
+    @classmethod
+    def from_slots(cls, slot_starts, slot_seconds):
+        """Une slots consecutivos em intervalos contínuos."""
+        intervals = cls()
+        for start in sorted(slot_starts):
+            if intervals._ends and start <= intervals._ends[-1]:
+                intervals._ends[-1] = max(intervals._ends[-1], start + slot_seconds)
+            else:
+                intervals._starts.append(start)
+                intervals._ends.append(start + slot_seconds)
+        return intervals
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __iter__(self):
+        return iter(zip(self._starts, self._ends))
+
+    def add(self, start, end):
+        """Marca [start, end) como livre, unindo intervalos que se tocam."""
+        left = bisect.bisect_left(self._ends, start)
+        right = bisect.bisect_right(self._starts, end)
+        if left < right:
+            start = min(start, self._starts[left])
+            end = max(end, self._ends[right - 1])
+        self._starts[left:right] = [start]
+        self._ends[left:right] = [end]
+
+    def remove(self, start, end):
+        """Marca [start, end) como ocupado, recortando os intervalos afetados."""
+        left = bisect.bisect_right(self._ends, start)
+        right = bisect.bisect_left(self._starts, end)
+        if left >= right:
+            return
+        pieces = []
+        if self._starts[left] < start:
+            pieces.append((self._starts[left], start))
+        if self._ends[right - 1] > end:
+            pieces.append((end, self._ends[right - 1]))
+        self._starts[left:right] = [piece[0] for piece in pieces]
+        self._ends[left:right] = [piece[1] for piece in pieces]
+
+    def contains(self, start, end):
+        """True se [start, end) cabe inteiramente num intervalo livre."""
+        index = bisect.bisect_right(self._starts, start) - 1
+        return index >= 0 and self._ends[index] >= end
+
+    def find(self, duration, after=None, step=None, limit=5):
+        """
+        Próximos inícios (epoch s) em que cabe uma reunião de `duration` segundos.
+
+        Args:
+            after: Só considera inícios a partir deste instante.
+            step: Grade dos inícios dentro de cada intervalo (padrão: a própria duração).
+            limit: Máximo de horários retornados.
+        """
+        step = step or duration
+        found = []
+        index = bisect.bisect_right(self._ends, after) if after is not None else 0
+        for start, end in zip(self._starts[index:], self._ends[index:]):
+            candidate = start
+            if after is not None and after > start:
+                candidate = start + -(-(after - start) // step) * step
+            while candidate + duration <= end:
+                found.append(candidate)
+                if len(found) >= limit:
+                    return found
+                candidate += step
+        return found
+
+
+class SlotUnavailableError(Exception):
+    """Horário ocupado (no cache local ou segundo a API); `suggestions` traz horários livres próximos."""
+
+    def __init__(self, message, suggestions=()):
+        super().__init__(message)
+        self.suggestions = list(suggestions)
+
+
+def _is_conflict(error):
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status == 409:
+        return True
+    text = (getattr(response, "text", None) or str(error)).lower()
+    return status == 400 and any(marker in text for marker in _CONFLICT_MARKERS)
+
+
+class CalcomAvailability:
+    """
+    Disponibilidade por tipo de evento, em cache de TTL curto.
+
+    Args:
+        fetch_slots: Função (event_type_id, início, fim) -> inícios dos slots livres (epoch s).
+        ttl_seconds: Validade da disponibilidade em cache.
+        days: Janela buscada a partir de agora, em dias.
+        slot_minutes: Duração de cada slot devolvido pela API.
+    """
+
+    def __init__(self, fetch_slots=fetch_available_slots, ttl_seconds=CALCOM_AVAILABILITY_TTL_SECONDS,
+                 days=CALCOM_AVAILABILITY_DAYS, slot_minutes=CALCOM_SLOT_MINUTES):
+        self._fetch_slots = fetch_slots
+        self.ttl_seconds = ttl_seconds
+        self.days = days
+        self.slot_seconds = slot_minutes * 60
+        self._cache = {}  # event_type_id -> (expira_em, início da janela, fim da janela, FreeIntervals)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.stats = {"hits": 0, "fetches": 0, "rejected": 0, "conflicts": 0, "booked": 0}
+
+    def _key_lock(self, event_type_id):
+        with self._lock:
+            return self._key_locks.setdefault(event_type_id, threading.Lock())
+
+    def _entry(self, event_type_id, refresh=False):
+        event_type_id = int(event_type_id)
+        with self._key_lock(event_type_id):
+            entry = self._cache.get(event_type_id)
+            if entry and not refresh and entry[0] > time.monotonic():
+                self.stats["hits"] += 1
+                return entry
+            start = time.time()
+            end = start + self.days * 86400
+            slots = self._fetch_slots(event_type_id, start, end)
+            entry = (time.monotonic() + self.ttl_seconds, start, end,
+                     FreeIntervals.from_slots(slots, self.slot_seconds))
+            with self._lock:
+                self.stats["fetches"] += 1
+                self._cache[event_type_id] = entry
+            return entry
+
+    def intervals(self, event_type_id, refresh=False):
+        """Intervalos livres do tipo de evento (buscados na API se o cache expirou)."""
+        return self._entry(event_type_id, refresh)[3]
+
+    def invalidate(self, event_type_id=None):
+        """Descarta a disponibilidade de um tipo de evento (ou de todos)."""
+        with self._lock:
+            if event_type_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(int(event_type_id), None)
+
+    def find_free_slots(self, event_type_id, duration_minutes=None, after=None, count=5):
+        """
+        Próximos horários livres, calculados localmente.
+
+        Returns:
+            list: [{"start": ISO UTC, "end": ISO UTC, "label": horário de Brasília}].
+        """
+        duration = (duration_minutes * 60) if duration_minutes else self.slot_seconds
+        after = parse_time(after) if after is not None else time.time()
+        starts = self.intervals(event_type_id).find(duration, after=after, step=self.slot_seconds, limit=count)
+        return [{"start": format_time(s), "end": format_time(s + duration), "label": format_local(s)} for s in starts]
+
+    def is_available(self, event_type_id, start, end):
+        """
+        True/False conforme o cache local; None quando não é possível afirmar
+        (falha ao buscar a disponibilidade ou horário fora da janela buscada).
+        """
+        start, end = parse_time(start), parse_time(end)
+        try:
+            _, window_start, window_end, intervals = self._entry(event_type_id)
+        except Exception as e:
+            print(f"⚠️ Não foi possível consultar a disponibilidade do Cal.com: {e}")
+            return None
+        if start < window_start or end > window_end:
+            return None
+        return intervals.contains(start, end)
+
+    def mark_booked(self, event_type_id, start, end):
+        """Desconta um agendamento confirmado dos intervalos livres em cache."""
+        entry = self._cache.get(int(event_type_id))
+        if entry:
+            with self._key_lock(int(event_type_id)):
+                entry[3].remove(parse_time(start), parse_time(end))
+
+    def book(self, event_type_id, start, end, booker, **kwargs):
+        """
+        Agenda um horário somente se ele estiver livre.
+
+        Args:
+            booker: Função (event_type_id, start_time, end_time, **kwargs) que cria o agendamento
+                na API (horários em ISO UTC) e lança exceção em caso de erro HTTP.
+
+        Returns:
+            O retorno de `booker` (o agendamento criado).
+
+        Raises:
+            SlotUnavailableError: Horário ocupado (localmente ou segundo a API), com sugestões.
+        """
+        start_epoch, end_epoch = parse_time(start), parse_time(end)
+        duration_minutes = max(1, round((end_epoch - start_epoch) / 60))
+        if self.is_available(event_type_id, start_epoch, end_epoch) is False:
+            self.stats["rejected"] += 1
+            raise SlotUnavailableError(
+                f"Horário {format_local(start_epoch)} indisponível no Cal.com.",
+                self.find_free_slots(event_type_id, duration_minutes, after=start_epoch),
+            )
+        try:
+            booking = booker(event_type_id=event_type_id, start_time=format_time(start_epoch),
+                             end_time=format_time(end_epoch), **kwargs)
+        except Exception as e:
+            if not _is_conflict(e):
+                raise
+            self.stats["conflicts"] += 1
+            self.invalidate(event_type_id)
+            try:
+                suggestions = self.find_free_slots(event_type_id, duration_minutes, after=start_epoch)
+            except Exception:
+                suggestions = []
+            raise SlotUnavailableError(
+                f"Horário {format_local(start_epoch)} foi ocupado por outro agendamento.", suggestions
+            ) from e
+        self.stats["booked"] += 1
+        self.mark_booked(event_type_id, start_epoch, end_epoch)
+        return booking
+
+
+def describe_suggestions(suggestions):
+    """Sugestões de horários em texto, para mensagens das ferramentas."""
+    return ", ".join(slot["label"] for slot in suggestions) or "nenhum horário livre na janela consultada"
+
+
+_availability = None
+_availability_lock = threading.Lock()
+
+
+def get_availability():
+    """Retorna o cache de disponibilidade compartilhado do processo."""
+    global _availability
+    if _availability is None:
+        with _availability_lock:
+            if _availability is None:
+                _availability = CalcomAvailability()
+    return _availability
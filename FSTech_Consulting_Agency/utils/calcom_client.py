@@ -0,0 +1,211 @@
+"""
+Cliente da API v2 do Cal.com.
+
+Usa uma sessão HTTP compartilhada (utils/http_session.py): conexões reaproveitadas,
+timeouts de conexão/leitura e retentativas com backoff em 429/5xx. POST de agendamento
+só é repetido em 429 — o servidor garante que não o processou —, para nunca duplicar
+uma reunião. A chave (CALCOM_API_KEY) é lida no primeiro uso, não na importação.
+
+book_meetings_batch agenda reuniões de várias leads em paralelo (ex: diagnósticos após
+uma campanha), com concorrência limitada e orçamento de agendamentos por minuto, validando
+cada horário na disponibilidade em cache (utils/calcom_availability.py). Leads sem horário
+definido recebem os próximos horários livres, distribuídos localmente antes do envio.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from dotenv import load_dotenv
+
+from FSTech_Consulting_Agency.utils.calcom_availability import (
+    SlotUnavailableError, format_time, get_availability, parse_time)
+from FSTech_Consulting_Agency.utils.http_session import HTTPClient
+from FSTech_Consulting_Agency.utils.rate_limiter import TokenBucket
+
+load_dotenv()
+
+# URL base configurável (ex: stand-in local de testes)
+CALCOM_API_URL = os.getenv("CALCOM_API_URL", "https://api.cal.com/v2").rstrip("/")
+CALCOM_CONNECT_TIMEOUT = float(os.getenv("CALCOM_CONNECT_TIMEOUT", "5"))
+CALCOM_READ_TIMEOUT = float(os.getenv("CALCOM_READ_TIMEOUT", "30"))
+CALCOM_MAX_RETRIES = int(os.getenv("CALCOM_MAX_RETRIES", "4"))
+CALCOM_BATCH_CONCURRENCY = int(os.getenv("CALCOM_BATCH_CONCURRENCY", "8"))
+# Folga em relação ao limite da API do Cal.com (120 requisições/minuto por chave)
+CALCOM_BOOKINGS_PER_MINUTE = int(os.getenv("CALCOM_BOOKINGS_PER_MINUTE", "60"))
+
+_http = None
+_http_key = None
+_http_lock = threading.Lock()
+
+
+def calcom_api_key():
+    """Chave da API do Cal.com, lida do ambiente a cada chamada (permite configurar após a importação)."""
+    return os.getenv("CALCOM_API_KEY")
+
+
+def get_calcom_http() -> HTTPClient:
+    """
+    Retorna o cliente HTTP compartilhado do Cal.com (sessão persistente, criada no primeiro uso
+    e recriada se a chave mudar).
+
+    Raises:
+        ValueError: Se CALCOM_API_KEY não estiver configurada.
+    """
+    global _http, _http_key
+    api_key = calcom_api_key()
+    if not api_key:
+        raise ValueError("Chave da API do Cal.com (CALCOM_API_KEY) não configurada no ambiente.")
+    if _http is None or _http_key != api_key:
+        with _http_lock:
+            if _http is None or _http_key != api_key:
+                if _http is not None:
+                    _http.close()
+                _http = HTTPClient(
+                    CALCOM_API_URL,
+                    name="Cal.com",
+                    headers={"Authorization": f"Bearer {api_key}"},
+                    timeout=(CALCOM_CONNECT_TIMEOUT, CALCOM_READ_TIMEOUT),
+                    max_retries=CALCOM_MAX_RETRIES,
+                )
+                _http_key = api_key
+    return _http
+
+
+def calcom_request(method, endpoint, **kwargs):
+    """
+    Chamada à API do Cal.com pela sessão compartilhada. Retorna o corpo JSON.
+
+    Raises:
+        ValueError: Se CALCOM_API_KEY não estiver configurada.
+        HTTPServiceError: Se a chamada falhar após todas as tentativas.
+    """
+    return get_calcom_http().request_json(method, endpoint, **kwargs)
+
+
+def get_calcom_metrics() -> dict:
+    """Métricas de latência por endpoint do Cal.com (contagem, erros, retentativas, p50/p95/máx)."""
+    return _http.get_metrics() if _http is not None else {}
+
+
+def booking_payload(event_type_id, start_time, end_time, attendee_name, attendee_email,
+                    timezone="America/Sao_Paulo", title=None, description=None):
+    """Corpo do POST /bookings."""
+    payload = {
+        "eventTypeId": event_type_id,
+        "start": start_time,
+        "end": end_time,
+        "responses": {"name": attendee_name, "email": attendee_email},
+        "timeZone": timezone,
+        "language": "en",
+        "status": "ACCEPTED",
+        "metadata": {"source": "api"},
+    }
+    if title:
+        payload["title"] = title
+    if description:
+        payload["description"] = description
+    return payload
+
+
+def create_booking(event_type_id, start_time, end_time, attendee_name, attendee_email,
+                   timezone="America/Sao_Paulo", title=None, description=None):
+    """
+    Cria o agendamento na API (sem validação de disponibilidade).
+
+    Returns:
+        dict: O agendamento criado.
+
+    Raises:
+        ValueError: Se CALCOM_API_KEY não estiver configurada.
+        HTTPServiceError: Erro HTTP (ex: 409 quando o horário já está ocupado) ou de conexão.
+    """
+    booking_data = calcom_request("POST", "bookings", json=booking_payload(
+        event_type_id, start_time, end_time, attendee_name, attendee_email, timezone, title, description))
+    # A API v2 devolve o agendamento em "data"; versões anteriores usavam "booking"
+    return booking_data.get("data") or booking_data.get("booking") or {}
+
+
+def _assign_free_slots(meetings, event_type_id, availability, duration_minutes):
+    """Preenche start_time/end_time das reuniões sem horário com os próximos horários livres, sem repetir."""
+    pending = [meeting for meeting in meetings if not meeting.get("start_time")]
+    if not pending:
+        return
+    taken = {format_time(parse_time(meeting["start_time"])) for meeting in meetings if meeting.get("start_time")}
+    slots = availability.find_free_slots(event_type_id, duration_minutes, count=len(pending) + len(taken))
+    free = iter(slot for slot in slots if slot["start"] not in taken)
+    for meeting in pending:
+        slot = next(free, None)
+        if slot is None:
+            break
+        meeting["start_time"], meeting["end_time"] = slot["start"], slot["end"]
+
+
+def book_meetings_batch(meetings, event_type_id, duration_minutes=60, concurrency=CALCOM_BATCH_CONCURRENCY,
+                        per_minute=CALCOM_BOOKINGS_PER_MINUTE, availability=None, booker=create_booking,
+                        on_progress=None):
+    """
+    Agenda várias reuniões em paralelo.
+
+    Args:
+        meetings: Lista de dicts com attendee_name, attendee_email e, opcionalmente, start_time,
+            end_time, title, description e timezone. Sem start_time, a reunião recebe o próximo
+            horário livre do tipo de evento.
+        event_type_id: Tipo de evento do Cal.com.
+        duration_minutes: Duração das reuniões sem end_time.
+        concurrency: Agendamentos simultâneos.
+        per_minute: Orçamento de agendamentos por minuto (None ou 0: sem limite).
+        availability: CalcomAvailability a usar (padrão: o cache compartilhado).
+        booker: Função que cria o agendamento na API (padrão: create_booking).
+        on_progress: (Opcional) callback(concluídas, total, agendadas, falhas).
+
+    Returns:
+        dict: total, booked [{index, attendee_email, start, booking_id}],
+        failed [{index, attendee_email, error, suggestions}] e elapsed_seconds.
+    """
+    availability = availability or get_availability()
+    start = time.perf_counter()
+    meetings = [dict(meeting) for meeting in meetings]
+    report = {"total": len(meetings), "booked": [], "failed": []}
+    try:
+        _assign_free_slots(meetings, event_type_id, availability, duration_minutes)
+    except Exception as e:
+        print(f"⚠️ Não foi possível calcular horários livres no Cal.com: {e}")
+    bucket = TokenBucket(per_minute)
+
+    def book(meeting):
+        if not meeting.get("start_time"):
+            raise SlotUnavailableError("Sem horário livre disponível para esta reunião.")
+        if not meeting.get("end_time"):
+            meeting["end_time"] = parse_time(meeting["start_time"]) + duration_minutes * 60
+        bucket.acquire()
+        return availability.book(
+            event_type_id, meeting["start_time"], meeting["end_time"], booker,
+            attendee_name=meeting["attendee_name"], attendee_email=meeting["attendee_email"],
+            timezone=meeting.get("timezone") or "America/Sao_Paulo",
+            title=meeting.get("title"), description=meeting.get("description"),
+        )
+
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="calcom-batch") as executor:
+        futures = {executor.submit(book, meeting): index for index, meeting in enumerate(meetings)}
+        for future in as_completed(futures):
+            index = futures[future]
+            meeting = meetings[index]
+            try:
+                booking = future.result()
+                report["booked"].append({"index": index, "attendee_email": meeting["attendee_email"],
+                                         "start": booking.get("start") or meeting["start_time"],
+                                         "booking_id": booking.get("id") or booking.get("uid")})
+            except Exception as e:
+                report["failed"].append({"index": index, "attendee_email": meeting.get("attendee_email"),
+                                         "error": str(e), "suggestions": getattr(e, "suggestions", [])})
+            done += 1
+            if on_progress:
+                on_progress(done, len(meetings), len(report["booked"]), len(report["failed"]))
+
+    report["booked"].sort(key=lambda item: item["index"])
+    report["failed"].sort(key=lambda item: item["index"])
+    report["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    return report
@@ -0,0 +1,210 @@
+"""
+Cliente asyncio do ClickUp para leituras e atualizações concorrentes.
+
+Mesma superfície do cliente síncrono (criar tarefa, atualizar status, buscar tarefa,
+listar tarefas com paginação), mas com fan-out limitado por semáforo: operações sobre
+muitas tarefas — como atualizar o status de todos os projetos ativos — rodam em paralelo.
+
+As chamadas usam o mesmo HTTPClient do cliente síncrono (utils/clickup_client.py), ou
+seja, compartilham o pool de conexões keep-alive, os timeouts, as retentativas em
+429/5xx e as métricas por endpoint. Como o projeto não depende de uma biblioteca HTTP
+assíncrona, cada chamada roda num executor de threads dedicado, dimensionado pelo
+limite de concorrência.
+
+Exemplo:
+    async with AsyncClickUpClient(concurrency=10) as client:
+        tarefas = await client.get_tasks(ids)
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from FSTech_Consulting_Agency.utils.clickup_client import (
+    CRM_LIST_ID,
+    CLICKUP_PAGE_SIZE,
+    STATUS_MAP,
+    crm_task_payload,
+    get_clickup_http,
+    list_tasks_params,
+)
+
+CLICKUP_ASYNC_CONCURRENCY = int(os.getenv("CLICKUP_ASYNC_CONCURRENCY", "10"))
+
+
+class AsyncClickUpClient:
+    """
+    Cliente assíncrono do ClickUp.
+
+    Args:
+        concurrency: Máximo de chamadas simultâneas ao ClickUp.
+        http: (Opcional) HTTPClient a usar; padrão: o cliente compartilhado do ClickUp.
+        status_machine: (Opcional) CRMStatusMachine; padrão: a máquina de estados compartilhada.
+        status_queue: (Opcional) StatusWriteQueue; padrão: a fila write-behind compartilhada, se já criada.
+    """
+
+    def __init__(self, concurrency=CLICKUP_ASYNC_CONCURRENCY, http=None, status_machine=None, status_queue=None):
+        self.concurrency = max(1, concurrency)
+        self._http = http
+        self._machine = status_machine
+        self._queue = status_queue
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="clickup-async")
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def _status_machine(self):
+        if self._machine is None:
+            from FSTech_Consulting_Agency.utils.crm_status import get_status_machine
+            self._machine = get_status_machine()
+        return self._machine
+
+    def _discard_pending(self, task_id):
+        """Descarta a transição pendente da tarefa na fila write-behind, que o PUT torna obsoleta."""
+        queue = self._queue
+        if queue is None:
+            from FSTech_Consulting_Agency.utils import clickup_client
+            queue = clickup_client._status_queue  # só existe se algo já foi enfileirado
+        if queue is not None:
+            queue.discard(task_id)
+
+    def _get_semaphore(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def request(self, method, endpoint, **kwargs):
+        """Executa uma chamada à API (com retentativas) e retorna o JSON da resposta."""
+        http = self._http or get_clickup_http()
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(http.request_json, method, endpoint, **kwargs))
+
+    # --- mesma superfície do cliente síncrono ---
+
+    async def create_task(self, task_name, description=None, assignee_id=None, list_id=CRM_LIST_ID):
+        """Cria uma lead (status inicial) e retorna o ID da tarefa, ou None em caso de erro."""
+        try:
+            task = await self.request("POST", f"list/{list_id}/task",
+                                      json=crm_task_payload(task_name, description, assignee_id))
+        except Exception as e:
+            print(f"⚠️ Falha ao criar tarefa '{task_name}' no ClickUp: {e}")
+            return None
+        task_id = task.get("id") if isinstance(task, dict) else None
+        if task_id:
+            self._status_machine().record(task_id, "oportunidade_identificada")
+        return task_id
+
+    async def update_task_status(self, task_id, status_key, force=False):
+        """
+        Atualiza o status de uma tarefa. Retorna True em caso de sucesso.
+
+        Transições redundantes (tarefa já no status) ou fora do funil são resolvidas pela
+        máquina de estados do CRM sem chamada de rede, como no cliente síncrono. Se a transição
+        for aceita, a pendente para a mesma tarefa na fila write-behind é descartada.
+        """
+        target_status_name = STATUS_MAP.get(status_key.lower())
+        if not target_status_name:
+            return False
+        machine = self._status_machine()
+        if not force:
+            decision = machine.check(task_id, status_key)
+            if decision != "ok":
+                return decision == "noop"
+        self._discard_pending(task_id)
+        try:
+            response = await self.request("PUT", f"task/{task_id}", json={"status": target_status_name})
+        except Exception as e:
+            machine.forget(task_id)
+            print(f"⚠️ Falha ao atualizar status da tarefa {task_id} para '{status_key}': {e}")
+            return False
+        ok = isinstance(response, dict) and response.get("id") == task_id
+        if ok:
+            machine.record(task_id, status_key)
+        return ok
+
+    async def get_task(self, task_id):
+        """Busca uma tarefa pelo ID. Retorna o JSON da tarefa ou None em caso de erro."""
+        try:
+            task = await self.request("GET", f"task/{task_id}")
+        except Exception as e:
+            print(f"⚠️ Falha ao buscar a tarefa {task_id} no ClickUp: {e}")
+            return None
+        self._status_machine().record_task(task)
+        return task
+
+    async def get_folder_lists(self, folder_id):
+        """Listas de uma pasta do ClickUp (ex: uma pasta por cliente, uma lista por projeto)."""
+        data = await self.request("GET", f"folder/{folder_id}/list", params={"archived": "false"})
+        return data.get("lists") or []
+
+    async def list_tasks_page(self, list_id, page=0, date_updated_gt=None, include_closed=True):
+        """Busca uma página de tarefas de uma lista: {"tasks": [...], "last_page": bool}."""
+        return await self.request("GET", f"list/{list_id}/task",
+                                  params=list_tasks_params(page, date_updated_gt, include_closed))
+
+    async def list_tasks(self, list_id=CRM_LIST_ID, date_updated_gt=None, include_closed=True):
+        """
+        Retorna todas as tarefas de uma lista.
+
+        O total de páginas não é conhecido de antemão: a primeira página é buscada sozinha
+        (a maioria das listas cabe nela) e as seguintes em janelas de páginas simultâneas que
+        dobram a cada rodada (2, 4, 8... até `concurrency`) até que uma delas seja a última —
+        listas médias desperdiçam no máximo uma requisição e listas grandes chegam ao paralelismo máximo.
+        """
+        first = await self.list_tasks_page(list_id, 0, date_updated_gt, include_closed)
+        tasks = list(first.get("tasks") or [])
+        if not tasks or first.get("last_page", len(tasks) < CLICKUP_PAGE_SIZE):
+            return tasks
+        page = 1
+        size = 1
+        while True:
+            size = min(self.concurrency, size * 2)
+            window = range(page, page + size)
+            results = await asyncio.gather(*(
+                self.list_tasks_page(list_id, p, date_updated_gt, include_closed) for p in window
+            ))
+            for data in results:
+                page_tasks = data.get("tasks") or []
+                tasks.extend(page_tasks)
+                if not page_tasks or data.get("last_page", len(page_tasks) < CLICKUP_PAGE_SIZE):
+                    return tasks
+            page += size
+
+    # --- operações em lote ---
+
+    async def get_tasks(self, task_ids):
+        """Busca várias tarefas em paralelo. Retorna {task_id: tarefa ou None}."""
+        task_ids = list(dict.fromkeys(task_ids))
+        results = await asyncio.gather(*(self.get_task(task_id) for task_id in task_ids))
+        return dict(zip(task_ids, results))
+
+    async def update_statuses(self, updates):
+        """Aplica várias transições {task_id: status_key} em paralelo. Retorna {task_id: bool}."""
+        items = list(updates.items())
+        results = await asyncio.gather(*(self.update_task_status(task_id, key) for task_id, key in items))
+        return {task_id: ok for (task_id, _), ok in zip(items, results)}
+
+
+def fetch_tasks_concurrently(task_ids, concurrency=CLICKUP_ASYNC_CONCURRENCY):
+    """Atalho síncrono: busca várias tarefas em paralelo. Retorna {task_id: tarefa ou None}."""
+    async def _run():
+        async with AsyncClickUpClient(concurrency=concurrency) as client:
+            return await client.get_tasks(task_ids)
+    return asyncio.run(_run())
+
+
+def list_tasks_concurrently(list_id=CRM_LIST_ID, date_updated_gt=None, concurrency=CLICKUP_ASYNC_CONCURRENCY):
+    """Atalho síncrono: todas as tarefas de uma lista, com páginas buscadas em paralelo."""
+    async def _run():
+        async with AsyncClickUpClient(concurrency=concurrency) as client:
+            return await client.list_tasks(list_id, date_updated_gt=date_updated_gt)
+    return asyncio.run(_run())
@@ -1,13 +1,31 @@
 # Utilitário para interação com a API do ClickUp
 
+import atexit
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from dotenv import load_dotenv
-import requests
+
+from FSTech_Consulting_Agency.utils.http_session import HTTPClient
 
 # Carregar variáveis de ambiente do arquivo .env
 load_dotenv()
 
 CLICKUP_API_KEY = os.getenv("CLICKUP_API_KEY")
+# URL base configurável (ex: servidor local de testes)
+CLICKUP_API_URL = os.getenv("CLICKUP_API_URL", "https://api.clickup.com/api/v2")
+CLICKUP_CONNECT_TIMEOUT = float(os.getenv("CLICKUP_CONNECT_TIMEOUT", "5"))
+CLICKUP_READ_TIMEOUT = float(os.getenv("CLICKUP_READ_TIMEOUT", "30"))
+CLICKUP_MAX_RETRIES = int(os.getenv("CLICKUP_MAX_RETRIES", "4"))
+CLICKUP_PAGE_SIZE = 100  # tamanho fixo das páginas de GET list/{id}/task
+
+# Fila write-behind de status (ver StatusWriteQueue)
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CRM_STATUS_QUEUE_PATH = os.getenv("FSTECH_CRM_QUEUE_PATH", os.path.join(_BASE_DIR, "data", "crm_status_queue.json"))
+CRM_STATUS_FLUSH_SECONDS = float(os.getenv("FSTECH_CRM_QUEUE_FLUSH_SECONDS", "2"))
+CRM_STATUS_MAX_ATTEMPTS = int(os.getenv("FSTECH_CRM_QUEUE_MAX_ATTEMPTS", "5"))
 
 # IDs das Listas (fornecidos pelo usuário)
 CRM_LIST_ID = "901311371093"
@@ -29,21 +47,45 @@ STATUS_MAP = {
     "concluida": "Concluída"
 }
 
+_http = None
+_http_lock = threading.Lock()
+
+
+def get_clickup_http() -> HTTPClient:
+    """Retorna o cliente HTTP compartilhado do ClickUp (sessão persistente, criada no primeiro uso)."""
+    global _http
+    if not CLICKUP_API_KEY:
+        raise ValueError("Chave da API do ClickUp (CLICKUP_API_KEY) não encontrada no ambiente.")
+    if _http is None:
+        with _http_lock:
+            if _http is None:
+                _http = HTTPClient(
+                    CLICKUP_API_URL,
+                    name="ClickUp",
+                    headers={"Authorization": CLICKUP_API_KEY},
+                    timeout=(CLICKUP_CONNECT_TIMEOUT, CLICKUP_READ_TIMEOUT),
+                    max_retries=CLICKUP_MAX_RETRIES,
+                )
+    return _http
+
+
 def clickup_request(method, endpoint, **kwargs):
     """
     Helper to send requests to the ClickUp API.
+
+    Usa a sessão compartilhada: conexões reaproveitadas, timeout padrão e retentativas
+    em 429/5xx respeitando os cabeçalhos de rate limit do ClickUp.
+
+    Raises:
+        ValueError: Se CLICKUP_API_KEY não estiver configurada.
+        HTTPServiceError: Se a chamada falhar após todas as tentativas.
     """
-    if not CLICKUP_API_KEY:
-        raise ValueError("Chave da API do ClickUp (CLICKUP_API_KEY) não encontrada no ambiente.")
-    url = f"https://api.clickup.com/api/v2/{endpoint.lstrip('/')}"
-    headers = kwargs.pop("headers", {})
-    headers["Authorization"] = CLICKUP_API_KEY
-    response = requests.request(method, url, headers=headers, **kwargs)
-    try:
-        response.raise_for_status()
-    except Exception:
-        raise
-    return response.json()
+    return get_clickup_http().request_json(method, endpoint, **kwargs)
+
+
+def get_clickup_metrics() -> dict:
+    """Métricas de latência por endpoint do ClickUp (contagem, erros, retentativas, p50/p95/máx)."""
+    return _http.get_metrics() if _http is not None else {}
 
 def get_clickup_client():
     """Retorna uma instância inicializada do cliente ClickUp."""
@@ -55,16 +97,8 @@ def get_clickup_client():
     except Exception as e:
         raise ConnectionError(f"Falha ao conectar ao ClickUp: {e}")
 
-def update_task_status(task_id: str, status_key: str) -> bool:
-    """Atualiza o status de uma tarefa no ClickUp.
-
-    Args:
-        task_id: O ID da tarefa no ClickUp.
-        status_key: A chave do status desejado (ex: 'proposta_enviada', 'concluida').
-
-    Returns:
-        True se a atualização foi bem-sucedida, False caso contrário.
-    """
+def _put_task_status(task_id: str, status_key: str) -> bool:
+    """Envia o PUT de status ao ClickUp (sem passar pela fila)."""
     target_status_name = STATUS_MAP.get(status_key.lower())
     if not target_status_name:
         return False
@@ -72,43 +106,357 @@ def update_task_status(task_id: str, status_key: str) -> bool:
         payload = {"status": target_status_name}
         response = clickup_request("PUT", f"task/{task_id}", json=payload)
         if response and isinstance(response, dict) and response.get('id') == task_id:
+            _status_machine().record(task_id, status_key)
             return True
         else:
             return False
-    except Exception:
+    except Exception as e:
+        # O PUT pode ter sido aplicado ou não: o status conhecido deixa de ser confiável
+        _status_machine().forget(task_id)
+        print(f"⚠️ Falha ao atualizar status da tarefa {task_id} para '{status_key}': {e}")
         return False
 
 
-def create_crm_task(task_name: str, description: str = None, assignee_id: int = None) -> str | None:
-    """Cria uma nova tarefa na lista de CRM com status inicial.
+def _status_machine():
+    # Import tardio: utils/crm_status importa STATUS_MAP deste módulo
+    from FSTech_Consulting_Agency.utils.crm_status import get_status_machine
+    return get_status_machine()
+
+
+def check_status_transition(task_id: str, status_key: str, current_key: str = None) -> str:
+    """Consulta a máquina de estados do CRM sem chamada de rede: 'noop', 'invalid' ou 'ok'.
+
+    Imprime o motivo quando a transição é descartada ('noop') ou recusada ('invalid').
+    """
+    machine = _status_machine()
+    current_key = current_key or machine.known_status(task_id)
+    decision = machine.check(task_id, status_key, current_key=current_key)
+    if decision == "noop":
+        print(f"⏭️ Tarefa {task_id} já está em '{status_key}'; atualização de status ignorada.")
+    elif decision == "invalid":
+        print(f"⚠️ Transição de status inválida para a tarefa {task_id}: '{current_key}' -> '{status_key}'.")
+    return decision
+
+
+def update_task_status(task_id: str, status_key: str, force: bool = False) -> bool:
+    """Atualiza o status de uma tarefa no ClickUp.
+
+    Chamada síncrona: aguarda a resposta da API. Se a transição for aceita, uma transição
+    pendente para a mesma tarefa na fila write-behind é descartada, pois fica obsoleta. Para não bloquear
+    (ex: na interface Streamlit), use enqueue_task_status.
+
+    A transição passa antes pela máquina de estados do CRM (utils/crm_status.py): se a
+    tarefa já está no status pedido, nenhum PUT é feito; se o funil não permite a
+    transição, ela é recusada sem chamada de rede.
 
     Args:
-        task_name: O nome da nova tarefa (ex: Lead - Nome da Empresa).
-        description: (Opcional) Descrição detalhada da tarefa.
-        assignee_id: (Opcional) ID numérico do usuário do ClickUp a ser atribuído.
+        task_id: O ID da tarefa no ClickUp.
+        status_key: A chave do status desejado (ex: 'proposta_enviada', 'concluida').
+        force: Se True, envia o PUT mesmo que a transição seja redundante ou fora do funil.
 
     Returns:
-        O ID da tarefa criada ou None em caso de erro.
+        True se a atualização foi bem-sucedida (ou a tarefa já estava no status), False caso contrário.
     """
-    initial_status = STATUS_MAP.get("oportunidade_identificada")
-    if not initial_status:
-        return None
+    if not force:
+        decision = check_status_transition(task_id, status_key)
+        if decision != "ok":
+            return decision == "noop"
+    # Só uma transição aceita torna a pendente obsoleta; recusada ou redundante, a fila segue valendo
+    if _status_queue is not None:
+        _status_queue.discard(task_id)
+    return _put_task_status(task_id, status_key)
+
+
+def crm_task_payload(task_name: str, description: str = None, assignee_id: int = None) -> dict:
+    """Corpo do POST de criação de uma lead (status inicial 'Oportunidade Identificada')."""
     payload = {
         "name": task_name,
-        "status": initial_status,
+        "status": STATUS_MAP["oportunidade_identificada"],
     }
     if description:
         payload["description"] = description
     if assignee_id:
         payload["assignees"] = [assignee_id]
+    return payload
+
+
+def create_crm_task(task_name: str, description: str = None, assignee_id: int = None,
+                    raise_errors: bool = False) -> str | None:
+    """Cria uma nova tarefa na lista de CRM com status inicial.
+
+    Args:
+        task_name: O nome da nova tarefa (ex: Lead - Nome da Empresa).
+        description: (Opcional) Descrição detalhada da tarefa.
+        assignee_id: (Opcional) ID numérico do usuário do ClickUp a ser atribuído.
+        raise_errors: Se True, propaga a exceção da API em vez de retornar None.
+
+    Returns:
+        O ID da tarefa criada ou None em caso de erro.
+    """
+    payload = crm_task_payload(task_name, description, assignee_id)
     try:
         task = clickup_request("POST", f"list/{CRM_LIST_ID}/task", json=payload)
         if task and isinstance(task, dict) and task.get('id'):
+            _status_machine().record(task['id'], "oportunidade_identificada")
             return task['id']
         else:
             return None
-    except Exception:
+    except Exception as e:
+        if raise_errors:
+            raise
+        print(f"⚠️ Falha ao criar tarefa '{task_name}' no ClickUp: {e}")
+        return None
+
+
+def get_task(task_id: str) -> dict | None:
+    """Busca uma tarefa do ClickUp pelo ID. Retorna o JSON da tarefa ou None em caso de erro."""
+    try:
+        task = clickup_request("GET", f"task/{task_id}")
+    except Exception as e:
+        print(f"⚠️ Falha ao buscar a tarefa {task_id} no ClickUp: {e}")
         return None
+    _status_machine().record_task(task)
+    return task
+
+
+def list_tasks_page(list_id: str, page: int = 0, date_updated_gt: int = None, include_closed: bool = True) -> dict:
+    """Busca uma página (até 100 tarefas) de uma lista do ClickUp.
+
+    Args:
+        list_id: ID da lista (ex: CRM_LIST_ID).
+        page: Número da página, a partir de 0.
+        date_updated_gt: (Opcional) Só tarefas atualizadas depois deste instante (epoch em ms).
+        include_closed: Incluir tarefas fechadas.
+
+    Returns:
+        O JSON da resposta: {"tasks": [...], "last_page": bool}.
+    """
+    return clickup_request("GET", f"list/{list_id}/task", params=list_tasks_params(page, date_updated_gt, include_closed))
+
+
+def list_tasks_params(page: int = 0, date_updated_gt: int = None, include_closed: bool = True) -> dict:
+    """Parâmetros de consulta de GET list/{id}/task (mais recentes primeiro)."""
+    params = {"page": page, "include_closed": str(include_closed).lower(), "subtasks": "true",
+              "order_by": "updated", "reverse": "true"}
+    if date_updated_gt is not None:
+        params["date_updated_gt"] = int(date_updated_gt)
+    return params
+
+
+def iter_list_tasks(list_id: str, date_updated_gt: int = None, include_closed: bool = True):
+    """Percorre todas as páginas de uma lista do ClickUp, produzindo uma página (lista de tarefas) por vez."""
+    page = 0
+    while True:
+        data = list_tasks_page(list_id, page=page, date_updated_gt=date_updated_gt, include_closed=include_closed)
+        tasks = data.get("tasks") or []
+        if tasks:
+            yield tasks
+        if not tasks or data.get("last_page", len(tasks) < CLICKUP_PAGE_SIZE):
+            return
+        page += 1
+
+
+# --- Fila write-behind de status ---
+
+class StatusWriteQueue:
+    """
+    Fila write-behind para transições de status no CRM.
+
+    enqueue() retorna imediatamente; uma thread em segundo plano envia as transições
+    após CRM_STATUS_FLUSH_SECONDS (ou no encerramento do processo). Transições seguidas
+    da mesma tarefa são coalescidas no estado final (ex: 'proposta_enviada' seguida de
+    'aguardando_resposta' gera um único PUT). As pendências são gravadas em disco pela
+    própria thread de envio (nunca na thread de quem chama enqueue) e reenviadas na próxima
+    execução, para que nada se perca se o processo cair.
+    """
+
+    def __init__(self, path=CRM_STATUS_QUEUE_PATH, flush_interval=CRM_STATUS_FLUSH_SECONDS,
+                 max_attempts=CRM_STATUS_MAX_ATTEMPTS, sender=None):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._sender = sender or _put_task_status
+        self._pending = OrderedDict()  # task_id -> {"status_key", "attempts", "queued_at"}
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._persist_lock = threading.Lock()
+        self._version = 0            # incrementada a cada mudança nas pendências
+        self._persisted_version = 0  # última versão gravada em disco
+        self._thread = None
+        self._closed = False
+        self.stats = {"enqueued": 0, "coalesced": 0, "sent": 0, "failed": 0, "dropped": 0}
+        self._load()
+
+    # --- persistência ---
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for task_id, item in json.load(f).items():
+                    self._pending[task_id] = item
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Fila de status do CRM ilegível em {self.path}: {e}")
+            return
+        if self._pending:
+            print(f"♻️ {len(self._pending)} atualização(ões) de status pendente(s) recuperada(s) da fila do CRM.")
+            self._ensure_worker()
+
+    def _persist(self):
+        """Grava as pendências, se mudaram desde a última gravação (chamar sem self._cond)."""
+        with self._persist_lock:
+            with self._cond:
+                if self._version == self._persisted_version:
+                    return
+                version = self._version
+                snapshot = {task_id: dict(item) for task_id, item in self._pending.items()}
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            with self._cond:
+                self._persisted_version = version
+
+    # --- API pública ---
+
+    def enqueue(self, task_id, status_key) -> bool:
+        """Agenda a transição de status sem bloquear. Retorna False se a chave for inválida."""
+        if not task_id or status_key.lower() not in STATUS_MAP:
+            return False
+        with self._cond:
+            if task_id in self._pending:
+                self.stats["coalesced"] += 1
+            self._pending[task_id] = {"status_key": status_key.lower(), "attempts": 0, "queued_at": time.time()}
+            self._pending.move_to_end(task_id)
+            self.stats["enqueued"] += 1
+            self._version += 1
+            self._cond.notify()
+        self._ensure_worker()
+        return True
+
+    def discard(self, task_id):
+        """Remove a transição pendente de uma tarefa (ex: sobrescrita por uma atualização síncrona)."""
+        with self._cond:
+            if self._pending.pop(task_id, None) is not None:
+                self._version += 1
+                self._cond.notify()
+
+    def pending(self) -> dict:
+        """Retorna {task_id: status_key} das transições ainda não enviadas."""
+        with self._cond:
+            return {task_id: item["status_key"] for task_id, item in self._pending.items()}
+
+    def flush(self) -> int:
+        """Envia agora todas as transições pendentes. Retorna quantas foram enviadas com sucesso."""
+        with self._flush_lock:
+            with self._cond:
+                batch = [(task_id, dict(item)) for task_id, item in self._pending.items()]
+            sent = 0
+            for task_id, item in batch:
+                ok = self._sender(task_id, item["status_key"])
+                with self._cond:
+                    current = self._pending.get(task_id)
+                    # Uma transição mais nova chegou durante o envio: mantém a pendência
+                    if current is None or current["queued_at"] != item["queued_at"]:
+                        continue
+                    self._version += 1
+                    if ok:
+                        del self._pending[task_id]
+                        self.stats["sent"] += 1
+                        sent += 1
+                    else:
+                        self.stats["failed"] += 1
+                        current["attempts"] += 1
+                        if current["attempts"] >= self.max_attempts:
+                            del self._pending[task_id]
+                            self.stats["dropped"] += 1
+                            print(f"❌ Status '{item['status_key']}' da tarefa {task_id} descartado após {current['attempts']} tentativas.")
+            self._persist()
+            return sent
+
+    def close(self, flush=True):
+        """Para a thread de envio (enviando as pendências, por padrão)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if flush:
+            self.flush()
+        else:
+            self._persist()
+
+    # --- thread de envio ---
+
+    def _ensure_worker(self):
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._closed = False
+                self._thread = threading.Thread(target=self._run, name="crm-status-queue", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        deadline = None  # fim da janela de coalescência das pendências atuais
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    if not self._pending:
+                        deadline = None
+                    elif deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                    due = deadline is not None and time.monotonic() >= deadline
+                    if due or self._version != self._persisted_version:
+                        break
+                    self._cond.wait(timeout=None if deadline is None else deadline - time.monotonic())
+            # Disco e rede fora do lock: enqueue() nunca espera por eles
+            self._persist()
+            if due:
+                self.flush()
+                # Falhas continuam pendentes e são tentadas de novo após outra janela
+                deadline = None
+
+
+_status_queue = None
+_status_queue_lock = threading.Lock()
+
+
+def get_status_queue() -> StatusWriteQueue:
+    """Retorna a fila write-behind compartilhada (criada no primeiro uso; enviada no encerramento)."""
+    global _status_queue
+    if _status_queue is None:
+        with _status_queue_lock:
+            if _status_queue is None:
+                _status_queue = StatusWriteQueue()
+                atexit.register(_status_queue.close)
+    return _status_queue
+
+
+def enqueue_task_status(task_id: str, status_key: str, force: bool = False) -> bool:
+    """Agenda a atualização de status de uma tarefa sem bloquear (ver StatusWriteQueue).
+
+    A transição é validada pela máquina de estados do CRM a partir do status pendente na
+    fila (ou, sem pendência, do último status conhecido); transições redundantes não
+    entram na fila.
+
+    Returns:
+        True se a transição foi aceita na fila (ou a tarefa já estava no status),
+        False se a chave de status for inválida ou a transição não for permitida.
+    """
+    queue = get_status_queue()
+    if not force and task_id:
+        decision = check_status_transition(task_id, status_key, current_key=queue.pending().get(task_id))
+        if decision != "ok":
+            return decision == "noop"
+    return queue.enqueue(task_id, status_key)
+
+
+def flush_status_queue() -> int:
+    """Envia imediatamente as transições pendentes. Retorna quantas foram enviadas."""
+    return get_status_queue().flush()
 
 
 # Adicionar mais funções utilitárias conforme necessário (ex: get_task, find_contact, etc.)
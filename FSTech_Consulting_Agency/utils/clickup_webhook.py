@@ -0,0 +1,369 @@
+"""
+Receptor de webhooks do ClickUp: atualizações de tarefas por push, em vez de polling.
+
+O ClickUp envia um POST a cada evento de tarefa (taskCreated, taskStatusUpdated,
+taskUpdated, taskDeleted...), assinado com HMAC-SHA256 do corpo (cabeçalho X-Signature)
+usando o segredo devolvido na criação do webhook. Cada evento válido:
+    - é gravado no log de eventos local (SQLite, deduplicado pelo ID do item de histórico,
+      pois o ClickUp reenvia eventos quando não recebe 200 a tempo);
+    - atualiza o último status conhecido da máquina de estados do CRM (utils/crm_status.py);
+    - atualiza o espelho local do CRM (utils/crm_mirror.py), se a tarefa estiver espelhada.
+
+As ferramentas (ex: track_task_progress) leem o status desse log antes de consultar a API.
+
+Uso:
+    python -m FSTech_Consulting_Agency.utils.clickup_webhook --port 8710
+    # e registre a URL pública (ex: túnel) com register_webhook("https://.../webhooks/clickup")
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLICKUP_WEBHOOK_SECRET = os.getenv("CLICKUP_WEBHOOK_SECRET")
+CLICKUP_WEBHOOK_HOST = os.getenv("CLICKUP_WEBHOOK_HOST", "127.0.0.1")
+CLICKUP_WEBHOOK_PORT = int(os.getenv("CLICKUP_WEBHOOK_PORT", "8710"))
+CLICKUP_WEBHOOK_PATH = "/webhooks/clickup"
+CLICKUP_TEAM_ID = os.getenv("CLICKUP_TEAM_ID")
+CRM_EVENT_LOG_PATH = os.getenv("FSTECH_CRM_EVENT_LOG_PATH", os.path.join(BASE_DIR, "data", "crm_events.sqlite3"))
+
+WEBHOOK_EVENTS = ["taskCreated", "taskStatusUpdated", "taskUpdated", "taskDeleted"]
+# Corpo máximo aceito (eventos do ClickUp têm poucos KB)
+MAX_BODY_BYTES = 1024 * 1024
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    """Assinatura do ClickUp: HMAC-SHA256 hexadecimal do corpo bruto."""
+    return hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body: bytes, signature: str, secret: str) -> bool:
+    """Confere o cabeçalho X-Signature (comparação em tempo constante)."""
+    if not secret or not signature:
+        return False
+    return hmac.compare_digest(sign_payload(body, secret), signature.strip().lower())
+
+
+class TaskEventLog:
+    """Log local (SQLite) dos eventos de tarefas recebidos por webhook."""
+
+    def __init__(self, path=CRM_EVENT_LOG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS task_events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_id TEXT UNIQUE NOT NULL,
+                task_id TEXT NOT NULL,
+                event TEXT NOT NULL,
+                field TEXT,
+                before_value TEXT,
+                after_value TEXT,
+                event_date INTEGER,
+                received_at REAL NOT NULL,
+                raw TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_task_events_task ON task_events(task_id, event_date);
+            """
+        )
+        self._conn.commit()
+
+    def append(self, event_id, task_id, event, field=None, before=None, after=None, event_date=None, raw=None):
+        """Grava um evento. Retorna False se o mesmo evento já foi recebido (reenvio do ClickUp)."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO task_events (event_id, task_id, event, field, before_value, after_value, "
+                "event_date, received_at, raw) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (event_id, task_id, event, field, before, after, event_date, time.time(),
+                 json.dumps(raw or {}, ensure_ascii=False, separators=(",", ":"))),
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def latest_status(self, task_id):
+        """Último status recebido por webhook: {status, event_date, received_at} ou None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT after_value, event_date, received_at FROM task_events "
+                "WHERE task_id = ? AND field = 'status' ORDER BY event_date DESC, seq DESC LIMIT 1",
+                (task_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"status": row["after_value"], "event_date": row["event_date"], "received_at": row["received_at"]}
+
+    def events(self, task_id=None, limit=50):
+        """Eventos mais recentes (de uma tarefa ou de todas)."""
+        sql = "SELECT seq, event_id, task_id, event, field, before_value, after_value, event_date, received_at FROM task_events"
+        params = []
+        if task_id is not None:
+            sql += " WHERE task_id = ?"
+            params.append(task_id)
+        sql += " ORDER BY seq DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _status_name(value):
+    if isinstance(value, dict):
+        return value.get("status")
+    return value
+
+
+def _history_value(item, key):
+    value = item.get(key)
+    if item.get("field") == "status":
+        return _status_name(value)
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+class ClickUpWebhookHandler:
+    """
+    Aplica os eventos recebidos ao log, à máquina de estados e ao espelho do CRM.
+
+    Args:
+        event_log: TaskEventLog onde os eventos são gravados.
+        status_machine: (Opcional) CRMStatusMachine; padrão: a compartilhada.
+        mirror: (Opcional) CRMMirror a manter atualizado; padrão: o compartilhado.
+    """
+
+    def __init__(self, event_log, status_machine=None, mirror=None):
+        self.event_log = event_log
+        self._machine = status_machine
+        self._mirror = mirror
+        self.stats = {"received": 0, "duplicates": 0, "status_updates": 0}
+
+    def _status_machine(self):
+        if self._machine is None:
+            from FSTech_Consulting_Agency.utils.crm_status import get_status_machine
+            self._machine = get_status_machine()
+        return self._machine
+
+    def _crm_mirror(self):
+        if self._mirror is None:
+            from FSTech_Consulting_Agency.utils.crm_mirror import get_crm_mirror
+            self._mirror = get_crm_mirror()
+        return self._mirror
+
+    def handle(self, payload):
+        """
+        Processa o JSON de um webhook do ClickUp.
+
+        Returns:
+            int: Quantos itens de histórico novos foram aplicados.
+        """
+        from FSTech_Consulting_Agency.utils.crm_status import status_key_for
+
+        event = payload.get("event") or "unknown"
+        task_id = payload.get("task_id")
+        if not task_id:
+            return 0
+        self.stats["received"] += 1
+        items = payload.get("history_items") or [{}]
+        applied = 0
+        for item in items:
+            event_date = int(item["date"]) if str(item.get("date") or "").isdigit() else int(time.time() * 1000)
+            event_id = item.get("id") or f"{payload.get('webhook_id')}:{event}:{task_id}:{event_date}"
+            field = item.get("field") or ("status" if event == "taskStatusUpdated" else None)
+            after = _history_value(item, "after")
+            if not self.event_log.append(event_id, task_id, event, field, _history_value(item, "before"), after,
+                                         event_date, raw=payload):
+                self.stats["duplicates"] += 1
+                continue
+            applied += 1
+            if event == "taskDeleted":
+                self._status_machine().forget(task_id)
+                self._crm_mirror().delete_task(task_id)
+            elif field == "status" and after:
+                # Eventos podem chegar fora de ordem: só o mais recente define o status atual
+                latest = self.event_log.latest_status(task_id)
+                if latest and latest["event_date"] > event_date:
+                    continue
+                self._status_machine().record(task_id, status_key_for(after), source="webhook",
+                                              updated_at=event_date / 1000)
+                self._crm_mirror().update_status(task_id, after, date_updated=event_date)
+                self.stats["status_updates"] += 1
+        return applied
+
+
+class ClickUpWebhookServer:
+    """
+    Servidor HTTP embutido que recebe os webhooks do ClickUp em CLICKUP_WEBHOOK_PATH.
+
+    Responde 401 para assinaturas inválidas, 400 para corpos inválidos e 200 para
+    eventos aceitos (inclusive duplicados, para que o ClickUp não os reenvie).
+    """
+
+    def __init__(self, handler, secret=CLICKUP_WEBHOOK_SECRET, host=CLICKUP_WEBHOOK_HOST, port=CLICKUP_WEBHOOK_PORT):
+        if not secret:
+            raise ValueError("Segredo do webhook do ClickUp (CLICKUP_WEBHOOK_SECRET) não configurado.")
+        self.handler = handler
+        self.secret = secret
+        self._httpd = ThreadingHTTPServer((host, port), self._request_handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{CLICKUP_WEBHOOK_PATH}"
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.2,),
+                                            name="clickup-webhook", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def _request_handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, body):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                if self.path.split("?", 1)[0].rstrip("/") != CLICKUP_WEBHOOK_PATH:
+                    return self._reply(404, {"error": "not found"})
+                length = int(self.headers.get("Content-Length") or 0)
+                if length > MAX_BODY_BYTES:
+                    return self._reply(413, {"error": "payload too large"})
+                body = self.rfile.read(length)
+                if not verify_signature(body, self.headers.get("X-Signature", ""), server.secret):
+                    return self._reply(401, {"error": "invalid signature"})
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    return self._reply(400, {"error": "invalid JSON"})
+                try:
+                    applied = server.handler.handle(payload)
+                except Exception as e:
+                    print(f"⚠️ Falha ao processar webhook do ClickUp ({payload.get('event')}): {e}")
+                    return self._reply(500, {"error": "processing failed"})
+                return self._reply(200, {"applied": applied})
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+_event_log = None
+_server = None
+_lock = threading.Lock()
+
+
+def get_event_log():
+    """Retorna o log de eventos compartilhado (aberto no primeiro uso)."""
+    global _event_log
+    if _event_log is None:
+        with _lock:
+            if _event_log is None:
+                _event_log = TaskEventLog()
+    return _event_log
+
+
+def start_webhook_server(host=CLICKUP_WEBHOOK_HOST, port=CLICKUP_WEBHOOK_PORT, secret=CLICKUP_WEBHOOK_SECRET):
+    """
+    Sobe o receptor de webhooks em segundo plano (uma única vez por processo).
+
+    Returns:
+        ClickUpWebhookServer, ou None se o segredo não estiver configurado ou a porta estiver ocupada.
+    """
+    global _server
+    with _lock:
+        if _server is None:
+            if not secret:
+                return None
+            try:
+                _server = ClickUpWebhookServer(ClickUpWebhookHandler(get_event_log()), secret=secret,
+                                               host=host, port=port).start()
+            except OSError as e:
+                print(f"⚠️ Receptor de webhooks do ClickUp não iniciado em {host}:{port}: {e}")
+                return None
+            print(f"📡 Receptor de webhooks do ClickUp em {_server.url}")
+    return _server
+
+
+def latest_task_status(task_id):
+    """Último status de uma tarefa recebido por webhook ({status, event_date, received_at}) ou None."""
+    if _event_log is None and not os.path.exists(CRM_EVENT_LOG_PATH):
+        return None
+    return get_event_log().latest_status(task_id)
+
+
+def register_webhook(endpoint_url, events=None, team_id=CLICKUP_TEAM_ID, list_id=None):
+    """
+    Cria o webhook no ClickUp apontando para endpoint_url.
+
+    Returns:
+        dict: Resposta da API, incluindo o 'secret' a configurar em CLICKUP_WEBHOOK_SECRET.
+    """
+    from FSTech_Consulting_Agency.utils.clickup_client import clickup_request
+
+    if not team_id:
+        raise ValueError("ID do workspace do ClickUp (CLICKUP_TEAM_ID) não configurado.")
+    payload = {"endpoint": endpoint_url, "events": events or WEBHOOK_EVENTS}
+    if list_id:
+        payload["list_id"] = int(list_id)
+    return clickup_request("POST", f"team/{team_id}/webhook", json=payload)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Receptor de webhooks do ClickUp (status de tarefas por push).")
+    parser.add_argument("--host", default=CLICKUP_WEBHOOK_HOST)
+    parser.add_argument("--port", type=int, default=CLICKUP_WEBHOOK_PORT)
+    parser.add_argument("--register", metavar="URL_PUBLICA", help="Registra o webhook no ClickUp e imprime o segredo")
+    args = parser.parse_args(argv)
+
+    if args.register:
+        webhook = register_webhook(args.register)
+        print(f"Webhook criado: {webhook.get('id')} | defina CLICKUP_WEBHOOK_SECRET={webhook.get('webhook', webhook).get('secret')}")
+        return 0
+    if not start_webhook_server(args.host, args.port):
+        print("Configure CLICKUP_WEBHOOK_SECRET com o segredo retornado na criação do webhook.")
+        return 1
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+"""
+Catálogo de componentes do Arquiteto de Software, externo ao código e recarregado a quente.
+
+O catálogo (Arquiteto_de_Software/component_catalog.json, ou o arquivo em
+FSTECH_COMPONENT_CATALOG_PATH — .json ou, com PyYAML instalado, .yaml) traz versão, limites
+de complexidade e componentes com categoria, pontuação e sinônimos:
+
+    {"version": "2025.06.1",
+     "complexity_thresholds": {"baixa": 4, "media": 8},
+     "components": [{"name": "Frontend Web", "category": "frontend", "score": 2,
+                     "keywords": ["interface web", {"keyword": "site", "score": 1}]}]}
+
+Ao carregar, as palavras-chave são compiladas num KeywordMatcher (utils/keyword_matcher.py).
+get_component_catalog() devolve o catálogo em cache e só recompila quando o arquivo muda
+(mtime/tamanho, verificados no máximo a cada FSTECH_COMPONENT_CATALOG_CHECK_SECONDS): o
+ajuste semanal do catálogo entra no ar sem reiniciar o Streamlit. Um arquivo inválido é
+recusado com aviso e o catálogo anterior continua valendo.
+"""
+
+import json
+import os
+import threading
+import time
+
+from FSTech_Consulting_Agency.utils.keyword_matcher import KeywordMatcher, tokenize
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMPONENT_CATALOG_PATH = os.getenv(
+    "FSTECH_COMPONENT_CATALOG_PATH", os.path.join(BASE_DIR, "Arquiteto_de_Software", "component_catalog.json")
+)
+COMPONENT_CATALOG_CHECK_SECONDS = float(os.getenv("FSTECH_COMPONENT_CATALOG_CHECK_SECONDS", "2"))
+
+COMPLEXITY_LEVELS = ("baixa", "media", "alta")
+
+
+class CatalogError(ValueError):
+    """Arquivo de catálogo ausente, ilegível ou com estrutura inválida."""
+
+
+class ComponentCatalog:
+    """
+    Catálogo compilado (imutável depois de criado).
+
+    Attributes:
+        version: Versão declarada no arquivo.
+        keywords: {palavra-chave: {"name", "score", "category"}}, na ordem do arquivo.
+        thresholds: {"baixa": limite, "media": limite}.
+        matcher: KeywordMatcher com todas as palavras-chave.
+        components: Nomes dos componentes, sem repetição, na ordem do arquivo.
+    """
+
+    def __init__(self, data, source=None):
+        if not isinstance(data, dict) or not isinstance(data.get("components"), list):
+            raise CatalogError("O catálogo precisa de uma lista 'components'.")
+        thresholds = data.get("complexity_thresholds") or {}
+        try:
+            self.thresholds = {"baixa": float(thresholds["baixa"]), "media": float(thresholds["media"])}
+        except (KeyError, TypeError, ValueError):
+            raise CatalogError("'complexity_thresholds' precisa de limites numéricos 'baixa' e 'media'.")
+        if self.thresholds["baixa"] > self.thresholds["media"]:
+            raise CatalogError("O limite 'baixa' não pode ser maior que 'media'.")
+
+        self.version = str(data.get("version") or "sem versão")
+        self.source = source
+        self.keywords = {}
+        for position, component in enumerate(data["components"]):
+            if not isinstance(component, dict) or not component.get("name") or not component.get("keywords"):
+                raise CatalogError(f"Componente #{position} precisa de 'name' e 'keywords'.")
+            for entry in component["keywords"]:
+                keyword, score = (entry.get("keyword"), entry.get("score", component.get("score"))) \
+                    if isinstance(entry, dict) else (entry, component.get("score"))
+                if not isinstance(keyword, str) or not keyword.strip():
+                    raise CatalogError(f"Palavra-chave inválida no componente '{component['name']}': {entry!r}")
+                if not isinstance(score, (int, float)) or isinstance(score, bool):
+                    raise CatalogError(f"Pontuação inválida para '{keyword}' em '{component['name']}'.")
+                self.keywords.setdefault(keyword.strip(), {
+                    "name": component["name"], "score": score, "category": component.get("category") or "geral",
+                })
+        self.matcher = KeywordMatcher(self.keywords)
+        self.components = list(dict.fromkeys(item["name"] for item in self.keywords.values()))
+        # Índice compilado: palavra-chave do matcher -> (componente, pontuação)
+        column = {name: index for index, name in enumerate(self.components)}
+        self._keyword_component = [column[self.keywords[k]["name"]] for k in self.matcher.keywords]
+        self._keyword_score = [self.keywords[k]["score"] for k in self.matcher.keywords]
+
+    def score(self, text):
+        """
+        Componentes presentes no texto e pontuação total.
+
+        Cada componente conta uma vez, com a pontuação da primeira de suas palavras-chave
+        (na ordem do catálogo) encontrada no texto.
+
+        Returns:
+            tuple: ([(índice do componente em `components`, pontuação)], pontuação total).
+        """
+        return self.score_keywords({index for _, index in self.matcher.scan_tokens(tokenize(text))})
+
+    def score_keywords(self, keyword_indices):
+        """Como `score`, a partir dos índices (em matcher.keywords) já encontrados — ex: busca incremental."""
+        detected = {}
+        for index in sorted(keyword_indices):
+            detected.setdefault(self._keyword_component[index], self._keyword_score[index])
+        hits = sorted(detected.items())
+        return hits, sum(score for _, score in hits)
+
+    def complexity_level(self, score):
+        """Nível de complexidade ('baixa', 'media' ou 'alta') de uma pontuação total."""
+        if score > self.thresholds["media"]:
+            return "alta"
+        if score > self.thresholds["baixa"]:
+            return "media"
+        return "baixa"
+
+
+def _read_catalog_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise CatalogError("Catálogo em YAML requer o pacote PyYAML (pip install pyyaml).")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def load_component_catalog(path=COMPONENT_CATALOG_PATH):
+    """Lê e compila o catálogo. Raises: CatalogError."""
+    try:
+        data = _read_catalog_file(path)
+    except CatalogError:
+        raise
+    except Exception as e:
+        raise CatalogError(f"Não foi possível ler o catálogo {path}: {e}") from e
+    return ComponentCatalog(data, source=path)
+
+
+class CatalogStore:
+    """Mantém o catálogo compilado em cache e o recarrega quando o arquivo muda."""
+
+    def __init__(self, path=COMPONENT_CATALOG_PATH, check_seconds=COMPONENT_CATALOG_CHECK_SECONDS):
+        self.path = path
+        self.check_seconds = check_seconds
+        self._catalog = None
+        self._signature = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self.stats = {"loads": 0, "reload_errors": 0}
+
+    def _file_signature(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self):
+        """Catálogo atual (recompilado apenas se o arquivo mudou desde a última leitura)."""
+        now = time.monotonic()
+        if self._catalog is not None and now < self._next_check:
+            return self._catalog
+        with self._lock:
+            if self._catalog is not None and now < self._next_check:
+                return self._catalog
+            self._next_check = now + self.check_seconds
+            try:
+                signature = self._file_signature()
+                if signature == self._signature and self._catalog is not None:
+                    return self._catalog
+                # Registrada antes de compilar: um arquivo inválido só é relido quando mudar de novo
+                self._signature = signature
+                self._catalog = load_component_catalog(self.path)
+                self.stats["loads"] += 1
+                print(f"📚 Catálogo de componentes carregado: versão {self._catalog.version}, "
+                      f"{len(self._catalog.keywords)} palavras-chave.")
+            except (OSError, CatalogError) as e:
+                if self._catalog is None:
+                    raise CatalogError(str(e)) from e
+                self.stats["reload_errors"] += 1
+                print(f"⚠️ Catálogo de componentes não recarregado ({e}); mantendo a versão {self._catalog.version}.")
+            return self._catalog
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_component_catalog():
+    """Retorna o catálogo compartilhado do processo (recarregado a quente quando o arquivo muda)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CatalogStore()
+    return _store.get()
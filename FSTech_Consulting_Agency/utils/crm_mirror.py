@@ -0,0 +1,320 @@
+"""
+Espelho local (SQLite) das listas de CRM e Contatos do ClickUp.
+
+A primeira sincronização carrega todas as páginas da lista; as seguintes buscam apenas
+as tarefas alteradas desde a última (parâmetro date_updated_gt da API). As tarefas ficam
+indexadas por status, responsável e data de atualização, de modo que ferramentas e
+painéis consultam o funil localmente em milissegundos, sem uma chamada HTTP por tarefa.
+
+Observação: a sincronização incremental não detecta tarefas excluídas no ClickUp; com o
+receptor de webhooks (utils/clickup_webhook.py) ativo, exclusões e mudanças de status chegam
+por push. Sem ele, use sync(full=True) periodicamente para reconstruir a lista do zero.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from FSTech_Consulting_Agency.utils.clickup_client import CONTACTS_LIST_ID, CRM_LIST_ID, STATUS_MAP, iter_list_tasks
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CRM_MIRROR_PATH = os.getenv("FSTECH_CRM_MIRROR_PATH", os.path.join(BASE_DIR, "data", "crm_mirror.sqlite3"))
+# Idade máxima (s) do espelho para consultas de status; acima disso as ferramentas vão à API
+CRM_MIRROR_MAX_AGE = float(os.getenv("FSTECH_CRM_MIRROR_MAX_AGE", "300"))
+# Margem (ms) subtraída do cursor incremental para não perder tarefas atualizadas no mesmo instante
+SYNC_OVERLAP_MS = 1000
+
+# Nome do status no ClickUp (minúsculo) -> chave do STATUS_MAP
+_STATUS_KEYS = {name.lower(): key for key, name in STATUS_MAP.items()}
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _task_row(list_id, task):
+    status_name = ((task.get("status") or {}).get("status") or "").strip()
+    return (
+        task["id"],
+        list_id,
+        task.get("name") or "",
+        status_name,
+        _STATUS_KEYS.get(status_name.lower()),
+        _to_int(task.get("date_created")),
+        _to_int(task.get("date_updated")),
+        _to_int(task.get("due_date")),
+        task.get("url"),
+        json.dumps(task, ensure_ascii=False, separators=(",", ":")),
+    )
+
+
+class CRMMirror:
+    """Espelho SQLite das tarefas do ClickUp com sincronização incremental."""
+
+    def __init__(self, path=CRM_MIRROR_PATH, fetch_pages=iter_list_tasks):
+        """
+        Args:
+            path: Caminho do banco SQLite (':memory:' para testes).
+            fetch_pages: Função (list_id, date_updated_gt=None) que produz páginas de tarefas.
+        """
+        self.path = path
+        self._fetch_pages = fetch_pages
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                list_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                status TEXT,
+                status_key TEXT,
+                date_created INTEGER,
+                date_updated INTEGER,
+                due_date INTEGER,
+                url TEXT,
+                raw TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS task_assignees (
+                task_id TEXT NOT NULL,
+                assignee_id INTEGER NOT NULL,
+                username TEXT,
+                PRIMARY KEY (task_id, assignee_id)
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                list_id TEXT PRIMARY KEY,
+                cursor INTEGER,
+                synced_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_list_status ON tasks(list_id, status_key);
+            CREATE INDEX IF NOT EXISTS idx_tasks_updated ON tasks(date_updated);
+            CREATE INDEX IF NOT EXISTS idx_task_assignees_assignee ON task_assignees(assignee_id);
+            """
+        )
+        self._conn.commit()
+
+    # --- sincronização ---
+
+    def _write_tasks(self, list_id, tasks):
+        """Grava as tarefas na transação corrente (chamar com o lock). Retorna o maior date_updated."""
+        rows = [_task_row(list_id, task) for task in tasks if task.get("id")]
+        if not rows:
+            return None
+        assignees = [
+            (task["id"], assignee["id"], assignee.get("username"))
+            for task in tasks if task.get("id")
+            for assignee in task.get("assignees") or [] if assignee.get("id") is not None
+        ]
+        self._conn.executemany("INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self._conn.executemany("DELETE FROM task_assignees WHERE task_id = ?", [(row[0],) for row in rows])
+        self._conn.executemany("INSERT OR REPLACE INTO task_assignees VALUES (?, ?, ?)", assignees)
+        return max((row[6] for row in rows if row[6] is not None), default=None)
+
+    def upsert_tasks(self, list_id, tasks):
+        """Grava (ou atualiza) tarefas no espelho. Retorna o maior date_updated visto."""
+        with self._lock, self._conn:
+            return self._write_tasks(list_id, tasks)
+
+    def _cursor(self, list_id):
+        with self._lock:
+            row = self._conn.execute("SELECT cursor FROM sync_state WHERE list_id = ?", (list_id,)).fetchone()
+        return row["cursor"] if row else None
+
+    def _save_cursor(self, list_id, cursor):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sync_state (list_id, cursor, synced_at) VALUES (?, ?, ?)",
+            (list_id, cursor, time.time()),
+        )
+
+    def _full_sync(self, list_id):
+        """
+        Recarrega a lista do zero. Todas as páginas são buscadas antes de tocar no banco e a troca
+        (apagar + gravar + cursor) é uma única transação: se a busca falhar no meio, o espelho e o
+        cursor anteriores ficam intactos.
+        """
+        tasks = [task for page in self._fetch_pages(list_id, date_updated_gt=None) for task in page]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM task_assignees WHERE task_id IN (SELECT id FROM tasks WHERE list_id = ?)", (list_id,)
+            )
+            self._conn.execute("DELETE FROM tasks WHERE list_id = ?", (list_id,))
+            self._save_cursor(list_id, self._write_tasks(list_id, tasks))
+        return len(tasks)
+
+    def sync(self, list_ids=(CRM_LIST_ID, CONTACTS_LIST_ID), full=False):
+        """
+        Sincroniza as listas com o ClickUp.
+
+        Args:
+            list_ids: Listas a sincronizar.
+            full: Se True, recarrega todas as páginas e substitui o espelho da lista (atomicamente).
+
+        Returns:
+            dict: {list_id: quantidade de tarefas recebidas}.
+        """
+        result = {}
+        for list_id in list_ids:
+            if full:
+                result[list_id] = self._full_sync(list_id)
+                continue
+            cursor = self._cursor(list_id)
+            since = cursor - SYNC_OVERLAP_MS if cursor else None
+            received = 0
+            newest = cursor
+            for page in self._fetch_pages(list_id, date_updated_gt=since):
+                page_newest = self.upsert_tasks(list_id, page)
+                received += len(page)
+                if page_newest is not None and (newest is None or page_newest > newest):
+                    newest = page_newest
+            with self._lock, self._conn:
+                self._save_cursor(list_id, newest)
+            result[list_id] = received
+        return result
+
+    def refresh_tasks(self, task_ids, list_id=CRM_LIST_ID, concurrency=None):
+        """
+        Rebusca tarefas específicas no ClickUp em paralelo (ex: todos os projetos ativos)
+        e atualiza o espelho. Retorna quantas foram atualizadas.
+        """
+        from FSTech_Consulting_Agency.utils.clickup_async import CLICKUP_ASYNC_CONCURRENCY, fetch_tasks_concurrently
+        tasks = fetch_tasks_concurrently(task_ids, concurrency=concurrency or CLICKUP_ASYNC_CONCURRENCY)
+        fetched = [task for task in tasks.values() if task]
+        self.upsert_tasks(list_id, fetched)
+        return len(fetched)
+
+    def update_status(self, task_id, status_name, date_updated=None):
+        """Aplica uma mudança de status recebida por webhook. Retorna False se a tarefa não estiver espelhada."""
+        status_name = (status_name or "").strip()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET status = ?, status_key = ?, date_updated = COALESCE(?, date_updated), "
+                "raw = json_set(raw, '$.status.status', ?) WHERE id = ?",
+                (status_name, _STATUS_KEYS.get(status_name.lower()), _to_int(date_updated), status_name, task_id),
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def delete_task(self, task_id):
+        """Remove uma tarefa excluída no ClickUp (evento de webhook)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM task_assignees WHERE task_id = ?", (task_id,))
+            self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            self._conn.commit()
+
+    # --- consultas ---
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    def get_task(self, task_id):
+        """Retorna a tarefa espelhada (sem o JSON bruto) ou None."""
+        rows = self._query(
+            "SELECT id, list_id, name, status, status_key, date_created, date_updated, due_date, url "
+            "FROM tasks WHERE id = ?", (task_id,)
+        )
+        return rows[0] if rows else None
+
+    def get_raw_task(self, task_id):
+        """Retorna o JSON completo da tarefa, como recebido do ClickUp, ou None."""
+        rows = self._query("SELECT raw FROM tasks WHERE id = ?", (task_id,))
+        return json.loads(rows[0]["raw"]) if rows else None
+
+    def find_tasks(self, list_id=None, status_key=None, assignee_id=None, updated_after=None, limit=None):
+        """
+        Consulta tarefas por lista, status, responsável e/ou data de atualização (epoch ms),
+        das mais recentes para as mais antigas.
+        """
+        sql = ("SELECT DISTINCT t.id, t.list_id, t.name, t.status, t.status_key, t.date_created, "
+               "t.date_updated, t.due_date, t.url FROM tasks t")
+        where, params = [], []
+        if assignee_id is not None:
+            sql += " JOIN task_assignees a ON a.task_id = t.id"
+            where.append("a.assignee_id = ?")
+            params.append(assignee_id)
+        if list_id is not None:
+            where.append("t.list_id = ?")
+            params.append(list_id)
+        if status_key is not None:
+            where.append("t.status_key = ?")
+            params.append(status_key)
+        if updated_after is not None:
+            where.append("t.date_updated > ?")
+            params.append(updated_after)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY t.date_updated DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._query(sql, params)
+
+    def status_counts(self, list_id=CRM_LIST_ID):
+        """Quantidade de tarefas por status (nome exibido no ClickUp) — o funil de vendas."""
+        rows = self._query(
+            "SELECT status, COUNT(*) AS total FROM tasks WHERE list_id = ? GROUP BY status ORDER BY total DESC",
+            (list_id,),
+        )
+        return {row["status"]: row["total"] for row in rows}
+
+    def assignee_counts(self, list_id=CRM_LIST_ID):
+        """Quantidade de tarefas por responsável (username ou ID)."""
+        rows = self._query(
+            "SELECT COALESCE(a.username, CAST(a.assignee_id AS TEXT)) AS assignee, COUNT(*) AS total "
+            "FROM task_assignees a JOIN tasks t ON t.id = a.task_id WHERE t.list_id = ? "
+            "GROUP BY a.assignee_id ORDER BY total DESC",
+            (list_id,),
+        )
+        return {row["assignee"]: row["total"] for row in rows}
+
+    def last_synced_at(self, list_id=CRM_LIST_ID):
+        """Epoch (s) da última sincronização da lista, ou None."""
+        rows = self._query("SELECT synced_at FROM sync_state WHERE list_id = ?", (list_id,))
+        return rows[0]["synced_at"] if rows else None
+
+    def age(self, list_id=CRM_LIST_ID):
+        """Segundos desde a última sincronização da lista, ou None se nunca sincronizada."""
+        synced_at = self.last_synced_at(list_id)
+        return None if synced_at is None else max(0.0, time.time() - synced_at)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_mirror = None
+_mirror_lock = threading.Lock()
+
+
+def get_crm_mirror():
+    """Retorna o espelho compartilhado do CRM (aberto no primeiro uso)."""
+    global _mirror
+    if _mirror is None:
+        with _mirror_lock:
+            if _mirror is None:
+                _mirror = CRMMirror()
+    return _mirror
+
+
+def sync_crm_mirror(full=False):
+    """Sincroniza as listas de CRM e Contatos com o ClickUp. Retorna {list_id: tarefas recebidas}."""
+    return get_crm_mirror().sync(full=full)
+
+
+if __name__ == "__main__":
+    import sys
+    inicio = time.perf_counter()
+    resultado = sync_crm_mirror(full="--full" in sys.argv)
+    print(f"Sincronização concluída em {time.perf_counter() - inicio:.1f}s: {resultado}")
+    print(f"Funil (CRM): {get_crm_mirror().status_counts()}")
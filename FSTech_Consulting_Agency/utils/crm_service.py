@@ -1,4 +1,4 @@
-from FSTech_Consulting_Agency.utils.clickup_client import create_crm_task, update_task_status
+from FSTech_Consulting_Agency.utils.clickup_client import create_crm_task, enqueue_task_status
 from FSTech_Consulting_Agency.utils.app_helpers import add_log
 
 def create_lead_in_crm(session_state, task_name, description):
@@ -27,7 +27,7 @@ def create_lead_in_crm(session_state, task_name, description):
 
 def update_crm_status(session_state, task_id, status):
     """
-    Atualiza o status de uma tarefa no CRM (ClickUp).
+    Agenda a atualização de status de uma tarefa no CRM (ClickUp) sem bloquear a interface.
     
     Args:
         session_state: Objeto session_state do Streamlit
@@ -35,13 +35,15 @@ def update_crm_status(session_state, task_id, status):
         status: Novo status a ser definido
         
     Returns:
-        bool: True se o status foi atualizado com sucesso, False caso contrário
+        bool: True se a atualização foi aceita na fila, False caso contrário
     """
     if not task_id:
         return False
         
     try:
-        update_task_status(task_id, status)
+        if not enqueue_task_status(task_id, status):
+            add_log(session_state, f"Status de CRM inválido: '{status}'", "Sistema")
+            return False
         add_log(session_state, f"Status atualizado no CRM para '{status}'", "CRM")
         return True
     except Exception as e:
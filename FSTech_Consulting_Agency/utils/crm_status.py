@@ -0,0 +1,212 @@
+"""
+Máquina de estados dos status do CRM (funil do STATUS_MAP) com cache do último status conhecido.
+
+Cada tarefa tem seu último status conhecido guardado em memória e, opcionalmente, em
+SQLite (sobrevive a reinícios do Streamlit e ao fluxo em lote). Antes de um PUT de status,
+o cliente do ClickUp consulta a máquina de estados:
+    - 'noop': a tarefa já está no status pedido — o PUT é descartado no cliente;
+    - 'invalid': a transição não é permitida pelo funil (ex: voltar de 'venda_realizada'
+      para 'contato_realizado') — recusada sem chamada de rede;
+    - 'ok': a transição é válida ou o status atual é desconhecido — o PUT segue.
+
+O status conhecido expira após CRM_STATUS_TTL_SECONDS, já que a tarefa pode ser alterada
+diretamente no ClickUp; nesse caso a transição volta a ser enviada (e o cache, atualizado).
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from FSTech_Consulting_Agency.utils.clickup_client import STATUS_MAP
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CRM_STATUS_CACHE_PATH = os.getenv("FSTECH_CRM_STATUS_CACHE_PATH", os.path.join(BASE_DIR, "data", "crm_status.sqlite3"))
+CRM_STATUS_STORE_ENABLED = os.getenv("FSTECH_CRM_STATUS_STORE_ENABLED", "1") not in ("0", "false", "False")
+CRM_STATUS_TTL_SECONDS = float(os.getenv("FSTECH_CRM_STATUS_TTL_SECONDS", "3600"))
+
+# Ordem do funil de vendas e de execução do projeto ('concluida' é o status genérico de tarefas)
+FUNNEL_ORDER = [
+    "oportunidade_identificada",
+    "contato_realizado",
+    "aguardando_futuro_contato",
+    "reuniao_agendada",
+    "reuniao_realizada",
+    "proposta_enviada",
+    "aguardando_resposta",
+    "proposta_aceita",
+    "venda_realizada",
+    "projeto_em_andamento",
+    "projeto_concluido",
+]
+
+# Retrocessos permitidos (além de qualquer avanço no funil)
+BACKWARD_TRANSITIONS = {
+    # Lead esfriou: volta a aguardar contato futuro a partir de qualquer etapa pré-venda
+    **{key: {"aguardando_futuro_contato"} for key in FUNNEL_ORDER[:FUNNEL_ORDER.index("proposta_aceita")]},
+    # Retomada de um contato em espera
+    "aguardando_futuro_contato": {"contato_realizado"},
+    # Reunião remarcada ou nova rodada de proposta
+    "reuniao_realizada": {"reuniao_agendada", "aguardando_futuro_contato"},
+    "aguardando_resposta": {"proposta_enviada", "aguardando_futuro_contato"},
+}
+
+NOOP, INVALID, OK = "noop", "invalid", "ok"
+
+
+def build_transitions():
+    """Monta {status_atual: {status permitidos}} a partir da ordem do funil e dos retrocessos."""
+    transitions = {}
+    for index, key in enumerate(FUNNEL_ORDER):
+        transitions[key] = set(FUNNEL_ORDER[index + 1:]) | BACKWARD_TRANSITIONS.get(key, set()) | {"concluida"}
+    transitions["concluida"] = set()
+    return transitions
+
+
+STATUS_TRANSITIONS = build_transitions()
+
+_STATUS_KEYS = {name.lower(): key for key, name in STATUS_MAP.items()}
+
+
+def status_key_for(status_name):
+    """Converte o nome exibido no ClickUp (ex: 'Proposta Enviada') na chave do STATUS_MAP, ou None."""
+    return _STATUS_KEYS.get(str(status_name or "").strip().lower())
+
+
+class CRMStatusMachine:
+    """
+    Último status conhecido por tarefa (memória + SQLite opcional) e validação de transições.
+
+    Args:
+        path: Caminho do SQLite, ou None para manter o cache só em memória.
+        ttl_seconds: Validade do status conhecido (0 = sem expiração).
+        transitions: Mapa {status: {status permitidos}} (padrão: STATUS_TRANSITIONS).
+    """
+
+    def __init__(self, path=None, ttl_seconds=CRM_STATUS_TTL_SECONDS, transitions=None):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.transitions = transitions or STATUS_TRANSITIONS
+        self._known = {}  # task_id -> (status_key, updated_at)
+        self._lock = threading.Lock()
+        self.stats = {"noop": 0, "invalid": 0, "ok": 0}
+        self._conn = None
+        if path:
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS task_status (
+                    task_id TEXT PRIMARY KEY,
+                    status_key TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    source TEXT
+                )
+                """
+            )
+            self._conn.commit()
+
+    # --- cache do último status ---
+
+    def known_status(self, task_id):
+        """Último status conhecido (chave do STATUS_MAP) da tarefa, ou None se desconhecido/expirado."""
+        with self._lock:
+            entry = self._known.get(task_id)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT status_key, updated_at FROM task_status WHERE task_id = ?", (task_id,)
+                ).fetchone()
+                if row:
+                    entry = self._known[task_id] = (row[0], row[1])
+        if entry is None:
+            return None
+        status_key, updated_at = entry
+        if self.ttl_seconds and time.time() - updated_at > self.ttl_seconds:
+            return None
+        return status_key
+
+    def record(self, task_id, status_key, source="api", updated_at=None):
+        """Registra o status atual de uma tarefa (após um PUT bem-sucedido, leitura ou webhook)."""
+        status_key = (status_key or "").lower()
+        if not task_id or status_key not in STATUS_MAP:
+            return
+        updated_at = updated_at or time.time()
+        with self._lock:
+            self._known[task_id] = (status_key, updated_at)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO task_status (task_id, status_key, updated_at, source) VALUES (?, ?, ?, ?)",
+                    (task_id, status_key, updated_at, source),
+                )
+                self._conn.commit()
+
+    def record_task(self, task, source="api"):
+        """Registra o status a partir do JSON de uma tarefa do ClickUp."""
+        if isinstance(task, dict) and task.get("id"):
+            self.record(task["id"], status_key_for((task.get("status") or {}).get("status")), source=source)
+
+    def forget(self, task_id):
+        """Esquece o status conhecido (ex: PUT falhou e o estado real ficou incerto)."""
+        with self._lock:
+            self._known.pop(task_id, None)
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM task_status WHERE task_id = ?", (task_id,))
+                self._conn.commit()
+
+    # --- transições ---
+
+    def is_allowed(self, current_key, target_key):
+        """Indica se o funil permite ir de current_key para target_key (sem consultar o cache)."""
+        return target_key in self.transitions.get(current_key, set())
+
+    def check(self, task_id, target_key, current_key=None):
+        """
+        Decide o que fazer com uma transição, sem chamada de rede.
+
+        Args:
+            task_id: ID da tarefa no ClickUp.
+            target_key: Chave do status desejado.
+            current_key: (Opcional) Status de partida; padrão: o último status conhecido.
+
+        Returns:
+            str: NOOP, INVALID ou OK.
+        """
+        target_key = (target_key or "").lower()
+        current_key = current_key or self.known_status(task_id)
+        if target_key not in STATUS_MAP:
+            decision = INVALID
+        elif current_key is None:
+            decision = OK
+        elif current_key == target_key:
+            decision = NOOP
+        elif self.is_allowed(current_key, target_key):
+            decision = OK
+        else:
+            decision = INVALID
+        with self._lock:
+            self.stats[decision] += 1
+        return decision
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_machine = None
+_machine_lock = threading.Lock()
+
+
+def get_status_machine():
+    """Retorna a máquina de estados compartilhada (com o cache em SQLite, se habilitado)."""
+    global _machine
+    if _machine is None:
+        with _machine_lock:
+            if _machine is None:
+                _machine = CRMStatusMachine(path=CRM_STATUS_CACHE_PATH if CRM_STATUS_STORE_ENABLED else None)
+    return _machine
@@ -0,0 +1,260 @@
+"""
+Cliente HTTP compartilhado para as integrações REST (ClickUp, Cal.com).
+
+Mantém uma `requests.Session` persistente por serviço (keep-alive e pool de conexões,
+sem novo handshake TCP/TLS a cada chamada), aplica timeouts configuráveis, refaz
+chamadas em 429/5xx com backoff exponencial com jitter — respeitando Retry-After e os
+cabeçalhos de rate limit (X-RateLimit-Remaining / X-RateLimit-Reset) — e coleta métricas
+de latência por endpoint.
+"""
+
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = (5.0, 30.0)  # (conexão, leitura) em segundos
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_POOL_SIZE = 16
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+# Espera máxima aceita ao respeitar um reset de rate limit informado pelo servidor
+MAX_RATE_LIMIT_WAIT_SECONDS = 60.0
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Segmentos de caminho que são IDs (ex: 901311371093, 86a1b2c3d): contêm dígitos e têm 4+ caracteres
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[\w-]{4,}$")
+
+_LATENCY_SAMPLES = 512
+
+
+class HTTPServiceError(Exception):
+    """Falha definitiva de uma chamada HTTP (após as retentativas)."""
+
+    def __init__(self, message, status_code=None, response=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = response
+
+
+def endpoint_label(method, path):
+    """Normaliza método + caminho para agrupar métricas (IDs viram '{id}')."""
+    path = path.split("?", 1)[0].strip("/")
+    segments = ["{id}" if _ID_SEGMENT.match(seg) else seg for seg in path.split("/") if seg]
+    return f"{method.upper()} /{'/'.join(segments)}"
+
+
+def _parse_retry_after(value):
+    """Retry-After pode vir em segundos ou como data HTTP."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def rate_limit_wait(response):
+    """
+    Calcula quanto esperar antes de nova chamada, a partir dos cabeçalhos da resposta.
+
+    Retorna None quando o servidor não informa nada (usa-se então o backoff exponencial).
+    """
+    headers = response.headers
+    if headers.get("Retry-After"):
+        wait = _parse_retry_after(headers["Retry-After"])
+        if wait is not None:
+            return min(wait, MAX_RATE_LIMIT_WAIT_SECONDS)
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            reset = float(reset)
+        except ValueError:
+            return None
+        # ClickUp envia o instante do reset em epoch (segundos); alguns serviços enviam segundos restantes
+        wait = reset - time.time() if reset > 1e9 else reset
+        return min(max(0.0, wait), MAX_RATE_LIMIT_WAIT_SECONDS)
+    return None
+
+
+class _EndpointStats:
+    __slots__ = ("count", "errors", "retries", "total", "max", "samples", "last_status")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=_LATENCY_SAMPLES)
+        self.last_status = None
+
+    def snapshot(self):
+        ordered = sorted(self.samples)
+
+        def pct(p):
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000 if ordered else 0.0
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "avg_ms": round(self.total / self.count * 1000, 2) if self.count else 0.0,
+            "p50_ms": round(pct(0.50), 2),
+            "p95_ms": round(pct(0.95), 2),
+            "max_ms": round(self.max * 1000, 2),
+            "last_status": self.last_status,
+        }
+
+
+class HTTPClient:
+    """
+    Cliente HTTP com sessão persistente, retentativas e métricas por endpoint.
+
+    Args:
+        base_url: URL base do serviço (ex: 'https://api.clickup.com/api/v2').
+        name: Nome do serviço (usado em mensagens de log).
+        headers: Cabeçalhos fixos enviados em todas as chamadas.
+        timeout: Timeout padrão (segundos ou tupla conexão/leitura).
+        max_retries: Número máximo de retentativas por chamada.
+        pool_size: Conexões mantidas abertas por host.
+    """
+
+    def __init__(self, base_url, name="http", headers=None, timeout=DEFAULT_TIMEOUT,
+                 max_retries=DEFAULT_MAX_RETRIES, pool_size=DEFAULT_POOL_SIZE):
+        self.base_url = base_url.rstrip("/")
+        self.name = name
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+
+    # --- métricas ---
+
+    def _record(self, label, elapsed=None, status=None, error=False, retry=False):
+        with self._lock:
+            stats = self._stats.setdefault(label, _EndpointStats())
+            if elapsed is not None:
+                stats.count += 1
+                stats.total += elapsed
+                stats.max = max(stats.max, elapsed)
+                stats.samples.append(elapsed)
+            if status is not None:
+                stats.last_status = status
+            if error:
+                stats.errors += 1
+            if retry:
+                stats.retries += 1
+
+    def get_metrics(self):
+        """Retorna {endpoint: {count, errors, retries, avg_ms, p50_ms, p95_ms, max_ms, last_status}}."""
+        with self._lock:
+            return {label: stats.snapshot() for label, stats in sorted(self._stats.items())}
+
+    def reset_metrics(self):
+        with self._lock:
+            self._stats.clear()
+
+    # --- rate limit ---
+
+    def _wait_if_blocked(self):
+        with self._lock:
+            wait = self._blocked_until - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+    def _block_for(self, seconds):
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def _observe_rate_limit(self, response):
+        """Se a cota acabou (X-RateLimit-Remaining = 0), segura as próximas chamadas até o reset."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.strip() == "0":
+            wait = rate_limit_wait(response)
+            if wait:
+                self._block_for(wait)
+
+    # --- chamadas ---
+
+    def _backoff(self, attempt):
+        ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def request(self, method, path, retry_non_idempotent=False, **kwargs):
+        """
+        Executa uma chamada com retentativas e retorna a `requests.Response` de sucesso.
+
+        Chamadas não idempotentes (POST/PATCH) só são repetidas em 429 — quando o
+        servidor garante que não processou o pedido —, a menos que retry_non_idempotent=True.
+
+        Raises:
+            HTTPServiceError: Se a chamada falhar após todas as tentativas.
+        """
+        method = method.upper()
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        label = endpoint_label(method, path)
+        kwargs.setdefault("timeout", self.timeout)
+        can_retry_any = retry_non_idempotent or method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            self._wait_if_blocked()
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(label, time.perf_counter() - start, error=True)
+                if not can_retry_any or attempt >= self.max_retries:
+                    raise HTTPServiceError(f"{self.name}: falha de conexão em {label}: {e}") from e
+                self._record(label, retry=True)
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            self._record(label, time.perf_counter() - start, status=response.status_code,
+                         error=response.status_code >= 400)
+            self._observe_rate_limit(response)
+            if response.status_code < 400:
+                return response
+
+            retryable = response.status_code == 429 or (can_retry_any and response.status_code in RETRYABLE_STATUS)
+            if not retryable or attempt >= self.max_retries:
+                if response.status_code == 429:
+                    print(f"⚠️ {self.name}: limite de requisições excedido em {label} após {attempt + 1} tentativa(s).")
+                raise HTTPServiceError(
+                    f"{self.name}: {label} retornou HTTP {response.status_code}: {response.text[:300]}",
+                    status_code=response.status_code, response=response
+                )
+            wait = rate_limit_wait(response)
+            if wait is None:
+                wait = self._backoff(attempt)
+            elif response.status_code == 429:
+                self._block_for(wait)
+            self._record(label, retry=True)
+            time.sleep(wait + random.uniform(0, BACKOFF_BASE_SECONDS / 2))
+            attempt += 1
+
+    def request_json(self, method, path, **kwargs):
+        """Como `request`, mas retorna o corpo JSON (ou {} se vazio)."""
+        response = self.request(method, path, **kwargs)
+        return response.json() if response.content else {}
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,111 @@
+"""
+Busca de várias palavras-chave num texto em uma única passada (Aho–Corasick por palavras).
+
+O texto é normalizado (minúsculas, sem acentos) e quebrado em palavras; as palavras-chave,
+que podem ter várias palavras ("banco de dados"), viram um autômato de Aho–Corasick cujas
+transições são palavras inteiras. Assim:
+    - a busca percorre o texto uma única vez, com custo linear no número de palavras,
+      independentemente de quantas palavras-chave o catálogo tenha;
+    - vale a semântica de palavra inteira de r"\\b...\\b" ("api" não casa com "rapido");
+    - "relatorios" casa com "relatórios" e vice-versa;
+    - ocorrências sobrepostas são todas encontradas ("machine learning" e "learning").
+
+Pontuação dentro das palavras-chave é tratada como separador ("node.js" equivale a "node js").
+"""
+
+import re
+import unicodedata
+from collections import deque
+
+_WORD = re.compile(r"\w+")
+_COMBINING_MARKS = re.compile(r"[\u0300-\u036f]")
+
+
+def normalize_text(text):
+    """Minúsculas e sem acentos (mantém os demais caracteres)."""
+    return _COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", str(text or ""))).casefold()
+
+
+def tokenize(text):
+    """Palavras do texto normalizado."""
+    return _WORD.findall(normalize_text(text))
+
+
+class KeywordMatcher:
+    """
+    Autômato de Aho–Corasick sobre palavras, compilado uma vez a partir do catálogo.
+
+    Args:
+        keywords: Palavras-chave (iterável de strings ou dict cujas chaves são as palavras-chave).
+            Palavras-chave que diferem só em acentos/maiúsculas são reportadas juntas.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = []
+        self._goto = [{}]      # estado -> {palavra: próximo estado}
+        self._fail = [0]
+        self._output = [()]    # estado -> índices das palavras-chave reconhecidas
+        for keyword in keywords:
+            tokens = tokenize(keyword)
+            if not tokens:
+                continue
+            self._insert(tokens, len(self.keywords))
+            self.keywords.append(keyword)
+        self._build_failure_links()
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def _insert(self, tokens, index):
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = nxt
+        self._output[state] += (index,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] += self._output[self._fail[nxt]]
+
+    def scan_tokens(self, tokens):
+        """Gera (posição da última palavra, índice da palavra-chave) para cada ocorrência."""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for position, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for index in output[state]:
+                yield position, index
+
+    def scan(self, text):
+        """Gera (posição da última palavra, palavra-chave) para cada ocorrência no texto."""
+        for position, index in self.scan_tokens(tokenize(text)):
+            yield position, self.keywords[index]
+
+    def counts(self, text):
+        """{palavra-chave: ocorrências} das palavras-chave presentes no texto."""
+        found = {}
+        for _, index in self.scan_tokens(tokenize(text)):
+            keyword = self.keywords[index]
+            found[keyword] = found.get(keyword, 0) + 1
+        return found
+
+    def matches(self, text):
+        """Conjunto das palavras-chave presentes no texto."""
+        return set(self.counts(text))
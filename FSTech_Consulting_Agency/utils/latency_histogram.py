@@ -0,0 +1,102 @@
+"""
+Histograma de latências no estilo HdrHistogram: memória fixa, precisão relativa garantida.
+
+Os valores (inteiros, em microssegundos) caem em baldes log-lineares: cada potência de 2 é
+dividida em 2**sub_bucket_bits sub-baldes, o que garante `significant_digits` algarismos
+significativos (3 → erro relativo < 0,1%) do menor ao maior valor registrado. Gravar é O(1),
+os percentis saem dos contadores sem guardar as amostras, e dois histogramas com a mesma
+precisão se somam balde a balde (`merge`) — o que permite juntar medições de várias tarefas
+ou processos sem perder exatidão.
+
+Uso:
+    histograma = LatencyHistogram()
+    histograma.record_seconds(0.0123)
+    histograma.percentile(99)  # microssegundos
+"""
+
+import math
+
+
+class LatencyHistogram:
+    """
+    Histograma log-linear de valores inteiros não negativos (microssegundos).
+
+    Args:
+        significant_digits: Algarismos significativos preservados (1 a 5).
+    """
+
+    def __init__(self, significant_digits=3):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits deve estar entre 1 e 5.")
+        self.significant_digits = significant_digits
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._half = 1 << (self._sub_bucket_bits - 1)
+        self._counts = {}  # índice do balde -> ocorrências (esparso: só os baldes usados)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value):
+        shift = max(0, value.bit_length() - self._sub_bucket_bits)
+        return shift * self._half + (value >> shift)
+
+    def _highest_equivalent(self, index):
+        """Maior valor que cai no mesmo balde do índice."""
+        shift = max(0, index // self._half - 1)
+        sub = index - shift * self._half
+        return ((sub + 1) << shift) - 1
+
+    def record(self, value, count=1):
+        """Registra `count` ocorrências de um valor (inteiro, microssegundos)."""
+        value = int(value)
+        if value < 0:
+            raise ValueError("Latência negativa.")
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def record_seconds(self, seconds):
+        self.record(round(seconds * 1_000_000))
+
+    def merge(self, other):
+        """Soma outro histograma (de mesma precisão) a este. Retorna self."""
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("Só é possível juntar histogramas com a mesma precisão.")
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, percent):
+        """Valor abaixo do qual estão `percent`% das amostras (0 se vazio)."""
+        if not self.count:
+            return 0
+        if percent >= 100:
+            return self.max
+        target = max(1, math.ceil(round(percent / 100 * self.count, 9)))  # sem ruído de ponto flutuante
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def summary_ms(self, percentiles=(50, 90, 95, 99)):
+        """{"min", "mean", "p50", ..., "max"} em milissegundos."""
+        summary = {"min": (self.min or 0) / 1000, "mean": round(self.mean / 1000, 3)}
+        for percent in percentiles:
+            summary[f"p{percent:g}"] = self.percentile(percent) / 1000
+        summary["max"] = (self.max or 0) / 1000
+        return summary
@@ -0,0 +1,111 @@
+"""
+Checkpoints por lead para o pipeline de propostas.
+
+Cada etapa concluída do grafo (task_id, setor/desafio, esboço da arquitetura, pesquisa
+de mercado, resumo de ROI, caminho da proposta...) é gravada num arquivo JSON compacto
+por lead. Ao rodar o fluxo novamente para o mesmo briefing, as etapas já concluídas são
+puladas e a execução recomeça na primeira etapa incompleta — sem recriar a tarefa no
+ClickUp nem repetir chamadas à IA.
+
+Cada registro guarda um hash das entradas da etapa: se o operador ajustar o setor ou
+carregar outra ata, apenas as etapas afetadas são refeitas. Saídas produzidas por
+fallback não são gravadas, para que a etapa seja tentada de novo no próximo rerun.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHECKPOINT_DIR = os.getenv("FSTECH_CHECKPOINT_DIR", os.path.join(BASE_DIR, "data", "checkpoints"))
+CHECKPOINT_ENABLED = os.getenv("FSTECH_CHECKPOINT_ENABLED", "1") not in ("0", "false", "False")
+
+
+def _fingerprint(value):
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def lead_key_for(briefing, lead_id=None):
+    """
+    Identificador estável de uma lead a partir do texto do briefing.
+
+    No lote, leads distintas podem ter o mesmo briefing: o lead_id entra na chave para que
+    cada uma tenha seu próprio arquivo.
+    """
+    if lead_id is None:
+        return _fingerprint(briefing.strip())
+    return _fingerprint([str(lead_id), briefing.strip()])
+
+
+class LeadCheckpoint:
+    """
+    Arquivo de checkpoint de uma lead (compatível com o parâmetro `checkpoint` de run_stage_graph).
+
+    Formato: {"lead_key": ..., "updated_at": ..., "stages": {nome: {"inputs": hash, "outputs": {...}}}}
+    """
+
+    def __init__(self, lead_key, directory=CHECKPOINT_DIR):
+        self.lead_key = lead_key
+        self.path = os.path.join(directory, f"{lead_key}.json")
+        self._lock = threading.Lock()
+        self._stages = self._read()
+
+    @classmethod
+    def for_briefing(cls, briefing, directory=CHECKPOINT_DIR, lead_id=None):
+        return cls(lead_key_for(briefing, lead_id), directory)
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f).get("stages", {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Checkpoint ilegível em {self.path} ({e}); recomeçando do zero.")
+            return {}
+
+    def _write(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {"lead_key": self.lead_key, "updated_at": time.time(), "stages": self._stages}
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"), default=str)
+        # Substituição atômica: um processo interrompido nunca deixa o arquivo pela metade
+        os.replace(tmp_path, self.path)
+
+    def load(self, stage_name, inputs):
+        """Retorna as saídas gravadas da etapa, se as entradas forem as mesmas; senão None."""
+        with self._lock:
+            record = self._stages.get(stage_name)
+        if record and record.get("inputs") == _fingerprint(inputs):
+            return record["outputs"]
+        return None
+
+    def save(self, stage_name, inputs, outputs):
+        """Grava as saídas de uma etapa concluída."""
+        with self._lock:
+            self._stages[stage_name] = {"inputs": _fingerprint(inputs), "outputs": outputs}
+            self._write()
+
+    def completed_stages(self):
+        """Nomes das etapas com checkpoint gravado."""
+        with self._lock:
+            return sorted(self._stages)
+
+    def clear(self):
+        """Remove o checkpoint da lead (ex: após a proposta ser enviada)."""
+        with self._lock:
+            self._stages = {}
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def get_lead_checkpoint(briefing, lead_id=None):
+    """Retorna o checkpoint da lead (por briefing e, no lote, lead_id) ou None se os checkpoints estiverem desativados."""
+    if not CHECKPOINT_ENABLED:
+        return None
+    return LeadCheckpoint.for_briefing(briefing, lead_id=lead_id)
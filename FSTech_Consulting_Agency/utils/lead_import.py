@@ -0,0 +1,201 @@
+"""
+Importação em massa de leads (CSV ou JSONL) para o CRM no ClickUp.
+
+As leads são normalizadas e deduplicadas (por e-mail ou, na falta dele, pelo nome sem
+acentos/maiúsculas), opcionalmente comparadas com as já existentes no espelho local do
+CRM (utils/crm_mirror.py), e criadas em paralelo com concorrência limitada e orçamento
+de requisições por minuto — respeitando o limite da API do ClickUp.
+
+Uso:
+    python -m FSTech_Consulting_Agency.utils.lead_import leads.csv --concurrency 8 --per-minute 90
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from FSTech_Consulting_Agency.utils.clickup_client import CRM_LIST_ID, create_crm_task
+from FSTech_Consulting_Agency.utils.rate_limiter import TokenBucket
+
+DEFAULT_CONCURRENCY = int(os.getenv("FSTECH_IMPORT_CONCURRENCY", "8"))
+# ClickUp limita a 100 requisições/minuto por token nos planos básicos; deixa folga para o resto do sistema
+DEFAULT_PER_MINUTE = int(os.getenv("FSTECH_IMPORT_PER_MINUTE", "90"))
+
+# Nomes de coluna aceitos para cada campo (CSV exportado de formulários, planilhas de eventos etc.)
+FIELD_ALIASES = {
+    "name": ("name", "lead_name", "nome", "lead", "empresa", "company"),
+    "email": ("email", "e-mail", "e_mail"),
+    "phone": ("phone", "telefone", "celular", "whatsapp"),
+    "company": ("company", "empresa", "organizacao", "organização"),
+    "description": ("description", "descricao", "descrição", "observacoes", "observações", "notes"),
+    "source": ("source", "origem", "evento"),
+    "assignee_id": ("assignee_id", "responsavel_id"),
+}
+
+
+def normalize_text(value):
+    """Minúsculas, sem acentos e com espaços colapsados (base da deduplicação)."""
+    value = unicodedata.normalize("NFKD", str(value or "")).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"\s+", " ", value).strip().casefold()
+
+
+def normalize_record(raw):
+    """Mapeia as colunas de entrada para os campos padrão (name, email, phone, company, description, source)."""
+    lowered = {normalize_text(key): value for key, value in raw.items() if key is not None}
+    record = {}
+    for field, aliases in FIELD_ALIASES.items():
+        for alias in aliases:
+            value = lowered.get(normalize_text(alias))
+            if value not in (None, ""):
+                record[field] = str(value).strip()
+                break
+    if "email" in record:
+        record["email"] = record["email"].lower()
+    return record
+
+
+def dedupe_key(record):
+    """Chave de deduplicação: e-mail, se houver; senão o nome normalizado."""
+    if record.get("email"):
+        return f"email:{record['email']}"
+    return f"name:{normalize_text(record.get('name'))}"
+
+
+def load_lead_records(path):
+    """Lê leads de um arquivo .csv (cabeçalho na primeira linha) ou .jsonl (um objeto por linha)."""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.lower().endswith((".jsonl", ".ndjson", ".json")):
+            raw_records = [json.loads(line) for line in f if line.strip()]
+        else:
+            raw_records = list(csv.DictReader(f))
+    return [normalize_record(raw) for raw in raw_records]
+
+
+def build_task_description(record):
+    """Monta a descrição da tarefa do ClickUp a partir dos dados de contato da lead."""
+    lines = [record["description"]] if record.get("description") else []
+    for label, field in (("Empresa", "company"), ("E-mail", "email"), ("Telefone", "phone"), ("Origem", "source")):
+        if record.get(field):
+            lines.append(f"{label}: {record[field]}")
+    return "\n".join(lines) or None
+
+
+def existing_crm_keys():
+    """Chaves de deduplicação das leads já presentes no espelho local do CRM (nomes das tarefas)."""
+    from FSTech_Consulting_Agency.utils.crm_mirror import get_crm_mirror
+    return {f"name:{normalize_text(task['name'])}" for task in get_crm_mirror().find_tasks(list_id=CRM_LIST_ID)}
+
+
+def _default_progress(done, total, created, failed):
+    if done == total or done % 25 == 0:
+        print(f"📥 Importação: {done}/{total} processadas | {created} criadas | {failed} falhas")
+
+
+def import_leads(records, concurrency=DEFAULT_CONCURRENCY, per_minute=DEFAULT_PER_MINUTE,
+                 existing_keys=(), creator=None, on_progress=_default_progress):
+    """
+    Cria as leads no CRM em paralelo.
+
+    Args:
+        records: Leads normalizadas (ver load_lead_records / normalize_record).
+        concurrency: Máximo de criações simultâneas.
+        per_minute: Orçamento de criações por minuto (0 desativa o limite).
+        existing_keys: Chaves de deduplicação já existentes no CRM (ver existing_crm_keys).
+        creator: Função (task_name, description, assignee_id) -> task_id; padrão: create_crm_task.
+        on_progress: Callback (processadas, total, criadas, falhas) chamado a cada lead.
+
+    Returns:
+        dict: Relatório com total, duplicates, skipped_existing, invalid, created
+        [{name, key, task_id}], failed [{name, key, error}] e elapsed_seconds.
+    """
+    if creator is None:
+        def creator(task_name, description, assignee_id):
+            return create_crm_task(task_name, description, assignee_id, raise_errors=True)
+
+    start = time.perf_counter()
+    report = {"total": len(records), "duplicates": 0, "skipped_existing": 0, "invalid": 0, "created": [], "failed": []}
+    existing_keys = set(existing_keys)
+    seen = set()
+    unique = []
+    for record in records:
+        if not record.get("name"):
+            report["invalid"] += 1
+            continue
+        key = dedupe_key(record)
+        name_key = f"name:{normalize_text(record['name'])}"
+        if key in seen:
+            report["duplicates"] += 1
+            continue
+        seen.add(key)
+        if key in existing_keys or name_key in existing_keys:
+            report["skipped_existing"] += 1
+            continue
+        unique.append((key, record))
+
+    bucket = TokenBucket(per_minute)
+    done = 0
+
+    def create(record):
+        bucket.acquire()
+        assignee_id = int(record["assignee_id"]) if str(record.get("assignee_id", "")).isdigit() else None
+        task_id = creator(record["name"], build_task_description(record), assignee_id)
+        if not task_id:
+            raise RuntimeError("ClickUp não retornou o ID da tarefa")
+        return task_id
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="lead-import") as executor:
+        futures = {executor.submit(create, record): (key, record) for key, record in unique}
+        for future in as_completed(futures):
+            key, record = futures[future]
+            try:
+                report["created"].append({"name": record["name"], "key": key, "task_id": future.result()})
+            except Exception as e:
+                report["failed"].append({"name": record["name"], "key": key, "error": str(e)})
+            done += 1
+            if on_progress:
+                on_progress(done, len(unique), len(report["created"]), len(report["failed"]))
+
+    report["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    return report
+
+
+def import_leads_file(path, concurrency=DEFAULT_CONCURRENCY, per_minute=DEFAULT_PER_MINUTE, skip_existing=True):
+    """Lê o arquivo, deduplica (inclusive contra o espelho do CRM) e importa as leads. Retorna o relatório."""
+    records = load_lead_records(path)
+    existing = set()
+    if skip_existing:
+        try:
+            existing = existing_crm_keys()
+        except Exception as e:
+            print(f"⚠️ Espelho do CRM indisponível ({e}); deduplicando apenas dentro do arquivo.")
+    return import_leads(records, concurrency=concurrency, per_minute=per_minute, existing_keys=existing)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importa leads em massa (CSV/JSONL) para o CRM no ClickUp.")
+    parser.add_argument("input", help="Arquivo .csv ou .jsonl de leads")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Criações simultâneas")
+    parser.add_argument("--per-minute", type=int, default=DEFAULT_PER_MINUTE, help="Orçamento de criações por minuto")
+    parser.add_argument("--no-skip-existing", action="store_true", help="Não comparar com as leads já espelhadas do CRM")
+    parser.add_argument("--report", help="Caminho para gravar o relatório JSON (IDs criados e falhas)")
+    args = parser.parse_args(argv)
+
+    report = import_leads_file(args.input, concurrency=args.concurrency, per_minute=args.per_minute,
+                               skip_existing=not args.no_skip_existing)
+    print(f"Importação concluída em {report['elapsed_seconds']}s: {len(report['created'])} criadas, "
+          f"{len(report['failed'])} falhas, {report['duplicates']} duplicadas, "
+          f"{report['skipped_existing']} já existentes, {report['invalid']} inválidas.")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Relatório salvo em {args.report}")
+    return 0 if not report["failed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
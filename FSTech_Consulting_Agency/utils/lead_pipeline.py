@@ -0,0 +1,382 @@
+"""
+Etapas de análise de uma lead expressas como grafo declarativo (utils/stage_graph.py).
+
+As funções deste módulo não interagem com o operador (sem input()), podendo ser usadas
+tanto pelo fluxo interativo (orquestrador_fstech.fluxo_fstech) quanto por execuções
+sem interface. Cada etapa recebe apenas as chaves de contexto que declara como entrada.
+"""
+
+import os
+
+from FSTech_Consulting_Agency.utils.stage_graph import Stage, run_stage_graph
+
+# Valores padrão usados quando a pesquisa de mercado não está disponível
+DEFAULT_PRICE_RANGE = "R$ 8.000,00 - R$ 15.000,00"
+DEFAULT_TIMELINE = "4-8 semanas"
+
+HORAS_POR_COMPLEXIDADE = {"baixa": 40, "media": 100, "alta": 180}
+MARGEM_POR_COMPLEXIDADE = {"baixa": 20, "media": 30, "alta": 35}
+TIMELINE_POR_COMPLEXIDADE = {"baixa": "2-3 semanas", "media": "4-6 semanas", "alta": "8-12 semanas"}
+
+DESAFIOS_PONTOS_CHAVE = """
+Com base na análise dos requisitos, identificamos o seguinte desafio central:
+
+O cliente necessita de uma ferramenta automatizada em Python para monitoramento e auditoria de conteúdo web com as seguintes capacidades essenciais:
+
+1. **Monitoramento automático** de páginas web selecionadas com agendamento personalizável
+2. **Detecção inteligente** de atualizações de conteúdo e mudanças estruturais (HTML/CSS)
+3. **Captura e arquivamento** de versões das páginas para comparação histórica
+4. **Geração de relatórios** detalhados em formatos estruturados (Excel/PDF)
+
+A solução precisa operar de forma completamente offline, sem dependências de serviços externos pagos, e deve implementar práticas avançadas de web scraping respeitando boas práticas da web.
+"""
+
+
+def lead_title_and_summary(briefing):
+    """Deriva o título da lead (primeira frase) e a breve descrição a partir do briefing."""
+    titulo = briefing.strip().split(".")[0][:80] if "." in briefing else briefing.strip()[:80]
+    breve_descricao = briefing[:150] + ("..." if len(briefing) > 150 else "")
+    return titulo, breve_descricao
+
+
+def complexity_from_sketch(esboco_solucao):
+    """Extrai o nível de complexidade ('baixa', 'media', 'alta') do esboço do arquiteto."""
+    if esboco_solucao:
+        if "ALTA" in esboco_solucao:
+            return "alta"
+        if "BAIXA" in esboco_solucao:
+            return "baixa"
+    return "media"
+
+
+# --- Etapas ---
+
+def stage_crm_lead(briefing):
+    """Cria a lead no CRM (ClickUp) com o status inicial."""
+    from FSTech_Consulting_Agency.utils.clickup_client import create_crm_task, update_task_status
+    titulo, breve_descricao = lead_title_and_summary(briefing)
+    task_id = create_crm_task(titulo, breve_descricao, assignee_id=None)
+    if task_id:
+        print("\nLead CRM criada no ClickUp com sucesso!")
+        update_task_status(task_id, "oportunidade_identificada")
+    else:
+        print("\n[ERRO] Não foi possível criar lead no ClickUp.")
+    return {"task_id": task_id}
+
+
+def fallback_crm_lead(error, briefing):
+    print("\n[ERRO] Falha ao criar tarefa no ClickUp.")
+    return {"task_id": None}
+
+
+def stage_industry(briefing):
+    """Extrai setor e principal desafio do briefing via IA."""
+    from FSTech_Consulting_Agency.utils.openai_extractor import extract_industry_and_challenge
+    industry, main_challenge = extract_industry_and_challenge(briefing)
+    return {"industry": industry, "main_challenge": main_challenge}
+
+
+def fallback_industry(error, briefing):
+    print(f" Erro ao usar IA para extrair setor/desafio: {error}")
+    return {"industry": "", "main_challenge": ""}
+
+
+def stage_architecture(ata_reuniao):
+    """Analisa a ata e gera o esboço de arquitetura com o nível de complexidade."""
+    from FSTech_Consulting_Agency.Arquiteto_de_Software.tools.system_architecture_designer import design_architecture_and_assess_complexity
+    esboco_solucao = design_architecture_and_assess_complexity(ata_reuniao)
+    if not esboco_solucao or "Nenhum componente técnico" in esboco_solucao:
+        # Solucao padrão se o esboço não tem detalhes suficientes
+        arquitetura_proposta = "Solução web modular baseada em Python, com exportação de relatórios em formatos padronizados."
+    else:
+        arquitetura_proposta = esboco_solucao.split("Pontuação Total")[0].strip()
+    return {
+        "esboco_solucao": esboco_solucao,
+        "nivel_complexidade": complexity_from_sketch(esboco_solucao),
+        "arquitetura_proposta": arquitetura_proposta,
+    }
+
+
+def stage_market_research(briefing, ata_reuniao, esboco_solucao, nivel_complexidade):
+    """Pesquisa de mercado para preço e prazo com base no briefing, ata e solução proposta."""
+    from FSTech_Consulting_Agency.Arquiteto_de_Software.tools.market_research_tool import research_market_prices
+    contexto_projeto = f"Briefing: {briefing}\n\nAta da Reunião: {ata_reuniao}\n\nSolução Proposta: {esboco_solucao}"
+    resultado = research_market_prices(project_description=contexto_projeto, complexity_level=nivel_complexidade)
+    return {"pesquisa_mercado": resultado}
+
+
+def fallback_market_research(error, **_):
+    return {"pesquisa_mercado": {
+        "status": "error",
+        "message": str(error),
+        "price_range": DEFAULT_PRICE_RANGE,
+        "timeline": DEFAULT_TIMELINE,
+        "market_factors": ["Estimativa baseada em projetos similares"],
+    }}
+
+
+def _parse_price_range(price_range):
+    """Converte 'R$ 8.000,00 - R$ 15.000,00' em (8000.0, 15000.0) ou None."""
+    if not price_range or " - " not in price_range:
+        return None
+    valores = price_range.split(" - ")
+    try:
+        valor_minimo = float(valores[0].replace("R$ ", "").replace(".", "").replace(",", "."))
+        valor_maximo = float(valores[1].replace("R$ ", "").replace(".", "").replace(",", "."))
+    except ValueError:
+        return None
+    return valor_minimo, valor_maximo
+
+
+def _format_brl(valor):
+    return f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def stage_pricing(pesquisa_mercado, nivel_complexidade):
+    """Define preço, investimento, esforço e prazo a partir da pesquisa de mercado (com fallback na calculadora)."""
+    horas_estimadas = HORAS_POR_COMPLEXIDADE.get(nivel_complexidade, 80)
+    faixa = _parse_price_range((pesquisa_mercado or {}).get("price_range", ""))
+    if faixa:
+        investimento_inicial = (faixa[0] + faixa[1]) / 2
+        preco = _format_brl(investimento_inicial)
+    else:
+        from FSTech_Consulting_Agency.Consultor_de_Diagnostico.tools.pricing_calculator import calculate_proposal_price
+        margem_lucro = MARGEM_POR_COMPLEXIDADE.get(nivel_complexidade, 25)
+        investimento_inicial = horas_estimadas * 150 * (1 + margem_lucro / 100)
+        resultado_preco = calculate_proposal_price(
+            estimated_effort_hours=horas_estimadas,
+            complexity_level=nivel_complexidade,
+            desired_margin_percentage=margem_lucro
+        )
+        if "preço calculado para a proposta é" in resultado_preco:
+            preco = resultado_preco.split("preço calculado para a proposta é")[1].strip().rstrip(".")
+        else:
+            preco = _format_brl(investimento_inicial)
+    timeline = (pesquisa_mercado or {}).get("timeline") or TIMELINE_POR_COMPLEXIDADE.get(nivel_complexidade, DEFAULT_TIMELINE)
+    return {
+        "horas_estimadas": horas_estimadas,
+        "investimento_inicial": investimento_inicial,
+        "preco": preco,
+        "timeline": timeline,
+    }
+
+
+def stage_payback(investimento_inicial):
+    """Analisa o período de retorno do investimento."""
+    from FSTech_Consulting_Agency.Analista_ROI.tools.payback_period_analyzer import analyze_payback_period
+    roi_analysis = analyze_payback_period(
+        initial_investment=investimento_inicial,
+        monthly_benefits=investimento_inicial * 0.15,  # 15% do investimento inicial como benefício mensal
+        consider_time_value=True,
+        discount_rate=0.08  # Taxa de desconto anual padrão
+    )
+    return {"roi_analysis": roi_analysis}
+
+
+def fallback_payback(error, investimento_inicial):
+    print(f"⚠️ Não foi possível analisar o payback: {error}")
+    return {"roi_analysis": {}}
+
+
+def stage_benefits(briefing, arquitetura_proposta, industry):
+    """Projeta os benefícios financeiros da solução proposta."""
+    from FSTech_Consulting_Agency.Analista_ROI.tools.benefit_projection import project_benefits
+    benefits_analysis = project_benefits(
+        business_problem=briefing,
+        solution_description=arquitetura_proposta,
+        industry=industry or "Tecnologia",
+        company_size="Média"
+    )
+    return {"benefits_analysis": benefits_analysis}
+
+
+def fallback_benefits(error, **_):
+    print(f"⚠️ Não foi possível projetar benefícios: {error}")
+    return {"benefits_analysis": {}}
+
+
+def stage_value_proposition(roi_analysis, nivel_complexidade):
+    """Constrói a proposta de valor por stakeholder."""
+    from FSTech_Consulting_Agency.Analista_ROI.tools.value_proposition_builder import build_value_proposition
+    pain_points = ["Processos manuais e ineficientes", "Custos operacionais elevados",
+                   "Falta de escalabilidade" if "escala" in nivel_complexidade else "Limitações técnicas atuais"]
+    solution_benefits = ["Automatização de processos críticos",
+                         "Redução de custos operacionais",
+                         f"Retorno de investimento em {roi_analysis.get('effective_payback_months', 12)} meses",
+                         "Arquitetura tecnológica moderna e escalável"]
+    value_proposition = build_value_proposition(
+        client_pain_points=pain_points,
+        solution_benefits=solution_benefits,
+        target_stakeholders=["Técnico", "Financeiro", "Executivo"]
+    )
+    return {"value_proposition": value_proposition}
+
+
+def stage_roi_summary(roi_analysis, benefits_analysis, value_proposition):
+    """Monta o resumo de ROI (markdown) a ser incorporado na proposta."""
+    roi_summary = "\n## Análise de Retorno sobre Investimento\n\n"
+    roi_summary += f"* **Período de retorno estimado (payback):** {roi_analysis.get('effective_payback_months', 'N/A')} meses\n"
+    roi_summary += f"* **ROI anualizado:** {roi_analysis.get('irr_percentage_estimate', 'N/A')}%\n"
+    roi_summary += f"* **Avaliação de retorno:** {roi_analysis.get('payback_assessment', 'N/A')}\n\n"
+    roi_summary += f"**Proposta de Valor Principal:** {value_proposition.get('main_value_proposition', '')}\n\n"
+    if benefits_analysis and 'benefits_summary' in benefits_analysis:
+        roi_summary += f"**Benefícios Projetados:** {benefits_analysis.get('benefits_summary', '')}\n"
+        roi_summary += f"**Benefício total projetado (3 anos):** {benefits_analysis.get('total_projected_benefit_3_years', '')}\n\n"
+    for stakeholder, prop in value_proposition.get('stakeholder_propositions', {}).items():
+        roi_summary += f"**Para {stakeholder}:** {prop.get('headline', '')}\n"
+    return {"roi_summary": roi_summary}
+
+
+def fallback_roi_summary(error, **_):
+    print(f"⚠️ Análise de ROI não disponível: {error}")
+    return {"roi_summary": ""}
+
+
+def stage_solution_description(esboco_solucao):
+    """Gera o entendimento do desafio e a descrição detalhada da solução para a proposta."""
+    componentes = [linha.strip() for linha in (esboco_solucao or "").split('\n')
+                   if linha.strip().startswith('-')]
+    if not componentes or "Nenhum componente técnico" in esboco_solucao:
+        descricao_solucao = """
+Propomos uma solução modular e escalável desenvolvida em Python:
+
+1. **Camada de Captura de Dados**: Interface para leitura e processamento dos arquivos/sites alvo
+2. **Processamento Central**: Lógica de negócio para análise e transformação dos dados coletados
+3. **Visualização & Relatórios**: Exportação em formatos estruturados conforme requisitos
+
+A arquitetura seguirá o padrão MVC para facilitar manutenção e expansões futuras.
+"""
+    else:
+        descritor_componentes = "\n".join(componentes)
+        descricao_solucao = f"""
+Com base na análise técnica detalhada da sua necessidade, propomos uma solução composta pelos seguintes componentes:
+
+{descritor_componentes}
+
+Estes componentes serão integrados em uma arquitetura modular que permite:
+
+1. **Flexibilidade**: Adaptação às mudanças de requisitos ou tecnologias
+2. **Escalonamento**: Capacidade de crescer conforme o volume de dados/usuários aumenta
+3. **Manutenção Simplificada**: Separação lógica que facilita atualizações e correções
+
+Vamos implementar usando as melhores práticas atuais de desenvolvimento, com documentação completa e înfase na segurança e confiabilidade.
+"""
+    return {"desafios_pontos_chave": DESAFIOS_PONTOS_CHAVE, "descricao_solucao": descricao_solucao}
+
+
+def fallback_solution_description(error, esboco_solucao):
+    return {
+        "desafios_pontos_chave": "Com base em nossa análise, identificamos a necessidade de uma solução de monitoramento web automatizado com geração de relatórios e operação offline.",
+        "descricao_solucao": "A solução será desenvolvida usando tecnologias modernas e robustas, priorizando escalabilidade, desempenho e facilidade de uso conforme os requisitos discutidos.",
+    }
+
+
+def render_proposal_template(desafios_pontos_chave, descricao_solucao):
+    """Adapta o template da proposta com o entendimento do desafio e a descrição da solução do arquiteto."""
+    from FSTech_Consulting_Agency.Consultor_de_Diagnostico.tools.proposal_builder import PROPOSAL_TEMPLATE
+    template = PROPOSAL_TEMPLATE.replace(
+        "Com base em nossa conversa e análise inicial, compreendemos que o principal desafio enfrentado por {client_company} é:\n\n```\n{problem_description}\n```",
+        desafios_pontos_chave
+    )
+    return template.replace(
+        "*(Detalhar aqui como os componentes se conectam e resolvem o problema do cliente)*",
+        descricao_solucao
+    )
+
+
+def stage_proposal(briefing, client_name, client_company, arquitetura_proposta, roi_summary,
+                   desafios_pontos_chave, descricao_solucao, preco, timeline, output_dir):
+    """Gera o arquivo Markdown da proposta comercial e retorna seu caminho."""
+    from FSTech_Consulting_Agency.Consultor_de_Diagnostico.tools.proposal_builder import build_proposal_markdown
+    arch_sketch = arquitetura_proposta + ("\n\n" + roi_summary if roi_summary else "")
+    resultado = build_proposal_markdown(
+        client_name=client_name or "Cliente",
+        client_company=client_company or "Empresa",
+        problem_description=briefing or "Briefing não disponível",
+        architecture_sketch=arch_sketch or "Descrição da solução não disponível",
+        price=preco or "Preço a definir",
+        estimated_timeline=timeline or DEFAULT_TIMELINE,
+        output_dir=output_dir,
+        template=render_proposal_template(desafios_pontos_chave, descricao_solucao)
+    )
+    if "salva com sucesso em:" not in resultado:
+        raise RuntimeError(resultado)
+    return {"proposal_path": resultado.split("salva com sucesso em:", 1)[1].strip()}
+
+
+def proposal_file_exists(outputs):
+    """Uma proposta restaurada do checkpoint só vale se o arquivo ainda existir; senão, é gerada de novo."""
+    return bool(outputs.get("proposal_path")) and os.path.exists(outputs["proposal_path"])
+
+
+# --- Grafos ---
+
+def build_intake_stages():
+    """Etapas disparadas ao receber o briefing: CRM e extração via IA rodam em paralelo."""
+    return [
+        Stage("crm_lead", stage_crm_lead, inputs=["briefing"], outputs=["task_id"], fallback=fallback_crm_lead),
+        Stage("industry", stage_industry, inputs=["briefing"], outputs=["industry", "main_challenge"], fallback=fallback_industry),
+    ]
+
+
+def build_analysis_stages():
+    """
+    Etapas de análise após a reunião (requer briefing, ata_reuniao e industry no contexto).
+
+    Dependências:
+        architecture -> market_research -> pricing -> payback -> value_proposition -> roi_summary
+        architecture -> benefits (em paralelo com pesquisa de mercado/precificação)
+        architecture -> solution_description
+    """
+    return [
+        Stage("architecture", stage_architecture, inputs=["ata_reuniao"],
+              outputs=["esboco_solucao", "nivel_complexidade", "arquitetura_proposta"]),
+        Stage("market_research", stage_market_research,
+              inputs=["briefing", "ata_reuniao", "esboco_solucao", "nivel_complexidade"],
+              outputs=["pesquisa_mercado"], fallback=fallback_market_research),
+        Stage("pricing", stage_pricing, inputs=["pesquisa_mercado", "nivel_complexidade"],
+              outputs=["horas_estimadas", "investimento_inicial", "preco", "timeline"]),
+        Stage("payback", stage_payback, inputs=["investimento_inicial"], outputs=["roi_analysis"], fallback=fallback_payback),
+        Stage("benefits", stage_benefits, inputs=["briefing", "arquitetura_proposta", "industry"],
+              outputs=["benefits_analysis"], fallback=fallback_benefits),
+        Stage("value_proposition", stage_value_proposition, inputs=["roi_analysis", "nivel_complexidade"],
+              outputs=["value_proposition"]),
+        Stage("roi_summary", stage_roi_summary, inputs=["roi_analysis", "benefits_analysis", "value_proposition"],
+              outputs=["roi_summary"], fallback=fallback_roi_summary),
+        Stage("solution_description", stage_solution_description, inputs=["esboco_solucao"],
+              outputs=["desafios_pontos_chave", "descricao_solucao"], fallback=fallback_solution_description),
+    ]
+
+
+def build_lead_stages(create_crm=True):
+    """
+    Grafo completo de uma lead sem interação (entrada → análise → proposta).
+
+    Requer no contexto: briefing, ata_reuniao, client_name, client_company e output_dir.
+    Com create_crm=False a lead não é registrada no ClickUp (task_id fica None).
+    """
+    stages = build_intake_stages() + build_analysis_stages()
+    if not create_crm:
+        stages = [s for s in stages if s.name != "crm_lead"]
+        # Nome distinto para que o checkpoint de uma execução sem CRM não seja reaproveitado com CRM
+        stages.append(Stage("crm_lead_skipped", lambda briefing: {"task_id": None}, inputs=["briefing"], outputs=["task_id"]))
+    stages.append(Stage(
+        "proposal", stage_proposal,
+        inputs=["briefing", "client_name", "client_company", "arquitetura_proposta", "roi_summary",
+                "desafios_pontos_chave", "descricao_solucao", "preco", "timeline", "output_dir"],
+        outputs=["proposal_path"], restore_check=proposal_file_exists
+    ))
+    return stages
+
+
+def run_intake(briefing, max_workers=4, on_stage_complete=None, checkpoint=None):
+    """Executa as etapas de entrada da lead e retorna o contexto resultante."""
+    return run_stage_graph(build_intake_stages(), {"briefing": briefing}, max_workers=max_workers,
+                           on_stage_complete=on_stage_complete, checkpoint=checkpoint)
+
+
+def run_analysis(briefing, ata_reuniao, industry="", max_workers=4, on_stage_complete=None, checkpoint=None):
+    """Executa as etapas de análise (arquitetura, mercado, ROI) e retorna o contexto resultante."""
+    context = {"briefing": briefing, "ata_reuniao": ata_reuniao, "industry": industry}
+    return run_stage_graph(build_analysis_stages(), context, max_workers=max_workers,
+                           on_stage_complete=on_stage_complete, checkpoint=checkpoint)
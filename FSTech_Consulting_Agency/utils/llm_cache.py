@@ -0,0 +1,190 @@
+"""
+Cache persistente (SQLite) para respostas de modelos de linguagem.
+
+As respostas são endereçadas pelo conteúdo: a chave é um hash SHA-256 do modelo,
+temperatura, prompt de sistema e prompt do usuário. Assim, reprocessar o mesmo
+briefing/ata (rerun do Streamlit ou nova tentativa do fluxo_fstech) devolve a
+resposta salva em milissegundos, sem nova chamada à API.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Configurações padrão (podem ser sobrescritas via variáveis de ambiente)
+LLM_CACHE_PATH = os.getenv("FSTECH_LLM_CACHE_PATH", os.path.join(BASE_DIR, "data", "llm_cache.sqlite3"))
+LLM_CACHE_TTL_SECONDS = int(os.getenv("FSTECH_LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("FSTECH_LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_ENABLED = os.getenv("FSTECH_LLM_CACHE_ENABLED", "1") not in ("0", "false", "False")
+
+
+def make_cache_key(model, temperature, system_prompt, user_prompt, **extra):
+    """
+    Gera a chave de cache a partir dos parâmetros que determinam a resposta do modelo.
+
+    Args:
+        model: Nome do modelo (ex: 'gpt-4.1').
+        temperature: Temperatura usada na chamada.
+        system_prompt: Conteúdo da mensagem de sistema.
+        user_prompt: Conteúdo da mensagem do usuário.
+        **extra: Parâmetros adicionais que alteram a resposta (ex: response_format).
+
+    Returns:
+        str: Hash SHA-256 hexadecimal.
+    """
+    payload = {
+        "model": model,
+        "temperature": round(float(temperature), 4) if temperature is not None else None,
+        "system": system_prompt or "",
+        "user": user_prompt or "",
+        "extra": extra,
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Cache de respostas em SQLite com expiração (TTL) e despejo por tamanho (LRU)."""
+
+    def __init__(self, path=LLM_CACHE_PATH, ttl_seconds=LLM_CACHE_TTL_SECONDS, max_entries=LLM_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+        self._conn.commit()
+
+    def get(self, key):
+        """Retorna a resposta armazenada para a chave ou None (ausente ou expirada)."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            response, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return response
+
+    def set(self, key, response, model=None):
+        """Armazena a resposta e aplica o despejo por tamanho, se necessário."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, model, response, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, model, response, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Remove entradas expiradas e, acima do limite, as menos acessadas recentemente."""
+        if self.ttl_seconds:
+            self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        if self.max_entries:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)",
+                    (excess,),
+                )
+
+    def get_or_compute(self, model, temperature, system_prompt, user_prompt, compute, **extra):
+        """
+        Retorna a resposta em cache ou executa `compute()` e armazena o resultado.
+
+        Args:
+            model: Nome do modelo.
+            temperature: Temperatura da chamada.
+            system_prompt: Mensagem de sistema.
+            user_prompt: Mensagem do usuário.
+            compute: Função sem argumentos que chama o modelo e retorna o texto da resposta.
+            **extra: Parâmetros adicionais que fazem parte da chave.
+
+        Returns:
+            str: Texto da resposta.
+        """
+        key = make_cache_key(model, temperature, system_prompt, user_prompt, **extra)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        response = compute()
+        if response is not None:
+            self.set(key, response, model=model)
+        return response
+
+    def stats(self):
+        """Retorna contadores de acerto/erro e o número de entradas armazenadas."""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "entries": entries,
+        }
+
+    def clear(self):
+        """Remove todas as entradas e zera os contadores."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """Retorna a instância compartilhada do cache (criada no primeiro uso)."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = LLMCache()
+    return _default_cache
+
+
+def get_llm_cache_stats():
+    """Retorna os contadores de acerto/erro do cache compartilhado."""
+    return get_llm_cache().stats()
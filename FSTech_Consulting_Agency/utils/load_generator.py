@@ -0,0 +1,574 @@
+"""
+Gerador de carga HTTP em asyncio, usado pelo Testador de Escalabilidade do Arquiteto.
+
+Dois modelos de carga:
+    - fechado ("closed"): `concurrency` usuários virtuais, cada um enviando a próxima
+      requisição assim que recebe a resposta anterior (mais um `think_time` opcional);
+    - aberto ("open"): requisições chegam a uma taxa fixa (`rate` por segundo), independente
+      das respostas. A latência é medida a partir do instante *planejado* de envio, para não
+      esconder filas (coordinated omission); chegadas sem conexão livre em `concurrency`
+      requisições simultâneas são contadas como "descartadas".
+Em ambos, `ramp_up` sobe a carga linearmente (usuários ou taxa) durante os primeiros segundos.
+
+As requisições são sorteadas de um mix ponderado (RequestSpec) e enviadas por um cliente
+HTTP/1.1 mínimo sobre asyncio.open_connection, com pool de conexões keep-alive por host
+(sem dependências externas). Cada latência vai para um LatencyHistogram
+(utils/latency_histogram.py): p50/p95/p99/máximo saem do histograma, não de amostras, e
+cada segundo do teste tem seu próprio histograma (série temporal de vazão e latência).
+
+Para passar do limite de um laço de eventos (uma CPU), `run_distributed` divide a carga entre
+vários processos e soma histogramas, contadores e séries no fim.
+
+Uso:
+    resultado = run_load_test([RequestSpec("GET", "http://localhost:8080/health")],
+                              concurrency=50, duration=30, ramp_up=5)
+    print(format_report(resultado))
+
+    python -m FSTech_Consulting_Agency.utils.load_generator http://localhost:8080/health \\
+        --users 400 --duration 60 --processes 4 --timeline-csv serie.csv
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import ssl
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
+
+from FSTech_Consulting_Agency.utils.latency_histogram import LatencyHistogram
+
+LOAD_TEST_TIMEOUT = float(os.getenv("FSTECH_LOAD_TEST_TIMEOUT", "10"))
+LOAD_TEST_MAX_DURATION = float(os.getenv("FSTECH_LOAD_TEST_MAX_DURATION", "900"))
+# Folga para todos os processos do teste distribuído subirem antes do início sincronizado
+LOAD_TEST_START_DELAY = float(os.getenv("FSTECH_LOAD_TEST_START_DELAY", "1.0"))
+
+USER_AGENT = "FSTech-LoadTest/1.0"
+# Linhas da série temporal no relatório em Markdown (testes longos são agrupados em blocos)
+TIMELINE_REPORT_ROWS = 30
+
+
+class RequestSpec:
+    """
+    Uma requisição do mix de carga.
+
+    Args:
+        method: Método HTTP.
+        url: URL completa (http ou https).
+        body: Corpo opcional (dict/list viram JSON; str/bytes vão como estão).
+        headers: Cabeçalhos adicionais.
+        weight: Peso relativo no sorteio do mix.
+    """
+
+    def __init__(self, method, url, body=None, headers=None, weight=1.0):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"URL inválida para o teste de carga: {url}")
+        if weight <= 0:
+            raise ValueError("O peso de cada requisição do mix deve ser positivo.")
+        self.method = method.upper()
+        self.url = url
+        self.key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        self.target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self.host_header = parts.netloc.rsplit("@", 1)[-1]
+        self.weight = weight
+        if isinstance(body, (dict, list)):
+            body, content_type = json.dumps(body).encode("utf-8"), "application/json"
+        elif isinstance(body, str):
+            body, content_type = body.encode("utf-8"), "text/plain; charset=utf-8"
+        else:
+            content_type = "application/octet-stream"
+        self.label = f"{self.method} {self.target}"
+        self._raw = self._build(body or b"", content_type if body else None, headers or {})
+
+    @classmethod
+    def from_dict(cls, data, base_url=None):
+        """Cria a partir de {"method", "url" ou "path", "body", "headers", "weight"}."""
+        url = data.get("url") or (base_url or "").rstrip("/") + "/" + str(data.get("path", "")).lstrip("/")
+        return cls(data.get("method", "GET"), url, data.get("body"), data.get("headers"), data.get("weight", 1.0))
+
+    def _build(self, body, content_type, headers):
+        lines = [f"{self.method} {self.target} HTTP/1.1", f"Host: {self.host_header}",
+                 f"User-Agent: {USER_AGENT}", "Accept: */*", "Connection: keep-alive"]
+        if body or self.method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(body)}")
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        lines.extend(f"{key}: {value}" for key, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+
+class HTTPConnectionPool:
+    """
+    Pool de conexões HTTP/1.1 keep-alive sobre asyncio, por (esquema, host, porta).
+
+    Args:
+        timeout: Tempo máximo de cada requisição (conexão + resposta), em segundos.
+    """
+
+    def __init__(self, timeout=LOAD_TEST_TIMEOUT):
+        self.timeout = timeout
+        self._idle = {}
+        self._ssl = None
+        self.connections_opened = 0
+
+    async def _open(self, key):
+        scheme, host, port = key
+        context = None
+        if scheme == "https":
+            self._ssl = self._ssl or ssl.create_default_context()
+            context = self._ssl
+        reader, writer = await asyncio.open_connection(host, port, ssl=context)
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    async def request(self, spec):
+        """Envia a requisição e lê a resposta inteira. Retorna (status, bytes do corpo)."""
+        return await asyncio.wait_for(self._request(spec), self.timeout)
+
+    async def _request(self, spec):
+        idle = self._idle.setdefault(spec.key, [])
+        while idle:
+            connection = idle.pop()
+            try:
+                return await self._exchange(connection, spec)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # Conexão ociosa fechada pelo servidor: tenta a próxima (ou uma nova)
+                connection.close()
+            except BaseException:
+                connection.close()
+                raise
+        connection = await self._open(spec.key)
+        try:
+            return await self._exchange(connection, spec)
+        except BaseException:
+            connection.close()
+            raise
+
+    async def _exchange(self, connection, spec):
+        reader = connection.reader
+        connection.writer.write(spec._raw)
+        await connection.writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Conexão fechada pelo servidor.")
+        version, status = status_line.split(None, 2)[:2]
+        status = int(status)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        reusable = headers.get("connection", "").lower() != "close" and version != b"HTTP/1.0"
+        size = 0
+        if spec.method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            pass
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                length = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                if not length:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                size += len(await reader.readexactly(length + 2)) - 2
+        elif "content-length" in headers:
+            size = len(await reader.readexactly(int(headers["content-length"])))
+        else:
+            size = len(await reader.read())
+            reusable = False
+
+        if reusable:
+            self._idle[spec.key].append(connection)
+        else:
+            connection.close()
+        return status, size
+
+    def close(self):
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
+
+
+class LoadTestStats:
+    """
+    Contadores, histograma e série por segundo de uma execução (ou de várias, depois de `merge`).
+
+    A série temporal usa o segundo de conclusão de cada requisição, contado a partir de `start`
+    (perf_counter); processos que começam no mesmo instante de relógio produzem séries alinhadas.
+    """
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.successes = 0
+        self.dropped = 0
+        self.bytes_received = 0
+        self.status_counts = {}
+        self.errors = {}
+        self.by_request = {}
+        self.timeline = {}  # segundo -> [requisições, erros, LatencyHistogram]
+        self.elapsed = 0.0
+        self.connections_opened = 0
+
+    def record(self, label, latency, status=None, size=0, error=None):
+        self.requests += 1
+        self.histogram.record_seconds(latency)
+        second = int(time.perf_counter() - self.start)
+        bucket = self.timeline.get(second)
+        if bucket is None:
+            bucket = self.timeline[second] = [0, 0, LatencyHistogram()]
+        bucket[0] += 1
+        bucket[2].record_seconds(latency)
+        per_request = self.by_request.setdefault(label, {"requests": 0, "errors": 0})
+        per_request["requests"] += 1
+        if status is not None:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            self.bytes_received += size
+        if error is None and status is not None and status >= 400:
+            error = f"HTTP {status}"
+        if error is None:
+            self.successes += 1
+        else:
+            self.errors[error] = self.errors.get(error, 0) + 1
+            per_request["errors"] += 1
+            bucket[1] += 1
+
+    def merge(self, other):
+        """Soma as estatísticas de outra execução (ex: de outro processo). Retorna self."""
+        self.histogram.merge(other.histogram)
+        self.requests += other.requests
+        self.successes += other.successes
+        self.dropped += other.dropped
+        self.bytes_received += other.bytes_received
+        for status, count in other.status_counts.items():
+            self.status_counts[status] = self.status_counts.get(status, 0) + count
+        for error, count in other.errors.items():
+            self.errors[error] = self.errors.get(error, 0) + count
+        for label, data in other.by_request.items():
+            mine = self.by_request.setdefault(label, {"requests": 0, "errors": 0})
+            mine["requests"] += data["requests"]
+            mine["errors"] += data["errors"]
+        for second, (requests, errors, histogram) in other.timeline.items():
+            bucket = self.timeline.get(second)
+            if bucket is None:
+                bucket = self.timeline[second] = [0, 0, LatencyHistogram()]
+            bucket[0] += requests
+            bucket[1] += errors
+            bucket[2].merge(histogram)
+        self.elapsed = max(self.elapsed, other.elapsed)
+        self.connections_opened += other.connections_opened
+        return self
+
+    def timeline_rows(self):
+        """Série por segundo: [{"second", "requests", "errors", "p50_ms", "p95_ms", "p99_ms", "max_ms"}]."""
+        rows = []
+        for second in range(max(self.timeline, default=-1) + 1):
+            requests, errors, histogram = self.timeline.get(second) or (0, 0, LatencyHistogram())
+            rows.append({
+                "second": second, "requests": requests, "errors": errors,
+                "p50_ms": histogram.percentile(50) / 1000, "p95_ms": histogram.percentile(95) / 1000,
+                "p99_ms": histogram.percentile(99) / 1000, "max_ms": (histogram.max or 0) / 1000,
+            })
+        return rows
+
+
+def _error_name(exc):
+    if isinstance(exc, asyncio.TimeoutError):
+        return "timeout"
+    if isinstance(exc, (ConnectionError, asyncio.IncompleteReadError, OSError)):
+        return f"conexão ({type(exc).__name__})"
+    return type(exc).__name__
+
+
+class LoadGenerator:
+    """
+    Executa um teste de carga.
+
+    Args:
+        requests: Lista de RequestSpec (o mix).
+        concurrency: Usuários virtuais (modelo fechado) ou máximo de requisições em voo (aberto).
+        duration: Duração da fase de medição, em segundos (inclui o ramp-up).
+        ramp_up: Segundos para subir a carga de zero ao alvo.
+        rate: Requisições por segundo; se informado, usa o modelo aberto.
+        think_time: Pausa de cada usuário virtual entre requisições (modelo fechado).
+        timeout: Tempo máximo de cada requisição.
+        seed: Semente do sorteio do mix.
+    """
+
+    def __init__(self, requests, concurrency=10, duration=10.0, ramp_up=0.0, rate=None, think_time=0.0,
+                 timeout=LOAD_TEST_TIMEOUT, seed=None):
+        if not requests:
+            raise ValueError("O mix de requisições está vazio.")
+        if concurrency < 1 or duration <= 0:
+            raise ValueError("concurrency deve ser >= 1 e duration > 0.")
+        self.requests = list(requests)
+        self.concurrency = int(concurrency)
+        self.duration = min(float(duration), LOAD_TEST_MAX_DURATION)
+        self.ramp_up = max(0.0, min(float(ramp_up), self.duration))
+        self.rate = rate
+        self.think_time = think_time
+        self.timeout = timeout
+        self._random = random.Random(seed)
+        self._weights = [spec.weight for spec in self.requests]
+
+    @property
+    def model(self):
+        return "open" if self.rate else "closed"
+
+    def _pick(self):
+        if len(self.requests) == 1:
+            return self.requests[0]
+        return self._random.choices(self.requests, self._weights)[0]
+
+    async def _send(self, pool, stats, spec, started):
+        try:
+            status, size = await pool.request(spec)
+        except Exception as e:
+            stats.record(spec.label, time.perf_counter() - started, error=_error_name(e))
+        else:
+            stats.record(spec.label, time.perf_counter() - started, status=status, size=size)
+
+    async def _closed_user(self, pool, stats, index, deadline):
+        if self.ramp_up:
+            await asyncio.sleep(self.ramp_up * index / self.concurrency)
+        while time.perf_counter() < deadline:
+            await self._send(pool, stats, self._pick(), time.perf_counter())
+            if self.think_time:
+                await asyncio.sleep(self.think_time)
+
+    def _arrival_time(self, number):
+        """Instante (desde o início) da n-ésima chegada no modelo aberto, com ramp-up linear da taxa."""
+        ramp_arrivals = self.rate * self.ramp_up / 2
+        if number <= ramp_arrivals:
+            return (2 * self.ramp_up * number / self.rate) ** 0.5
+        return self.ramp_up + (number - ramp_arrivals) / self.rate
+
+    async def _open_arrivals(self, pool, stats, start, deadline):
+        in_flight = set()
+        number = 0
+        while True:
+            number += 1
+            planned = start + self._arrival_time(number)
+            if planned >= deadline:
+                break
+            delay = planned - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= self.concurrency:
+                stats.dropped += 1
+                continue
+            task = asyncio.ensure_future(self._send(pool, stats, self._pick(), planned))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+    async def run_stats_async(self, start_at=None):
+        """
+        Executa o teste e retorna as LoadTestStats brutas (mescláveis).
+
+        Args:
+            start_at: (Opcional) Instante de relógio (time.time()) em que a carga deve começar —
+                usado para alinhar vários processos.
+        """
+        if start_at is not None:
+            await asyncio.sleep(max(0.0, start_at - time.time()))
+        pool = HTTPConnectionPool(self.timeout)
+        stats = LoadTestStats()
+        deadline = stats.start + self.duration
+        try:
+            if self.rate:
+                await self._open_arrivals(pool, stats, stats.start, deadline)
+            else:
+                await asyncio.gather(*(self._closed_user(pool, stats, index, deadline)
+                                       for index in range(self.concurrency)))
+        finally:
+            pool.close()
+        stats.elapsed = time.perf_counter() - stats.start
+        stats.connections_opened = pool.connections_opened
+        return stats
+
+    async def run_async(self):
+        """Executa o teste e retorna o resultado (ver `result_from_stats`)."""
+        return self.result_from_stats(await self.run_stats_async())
+
+    def run(self):
+        return asyncio.run(self.run_async())
+
+    def result_from_stats(self, stats, processes=1):
+        elapsed = stats.elapsed
+        return {
+            "model": self.model,
+            "concurrency": self.concurrency,
+            "target_rate": self.rate,
+            "ramp_up_seconds": self.ramp_up,
+            "processes": processes,
+            "duration_seconds": round(elapsed, 3),
+            "requests": stats.requests,
+            "successes": stats.successes,
+            "failures": stats.requests - stats.successes,
+            "dropped": stats.dropped,
+            "throughput_rps": round(stats.requests / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": stats.histogram.summary_ms(),
+            "status_counts": dict(sorted(stats.status_counts.items())),
+            "errors": dict(sorted(stats.errors.items(), key=lambda item: -item[1])),
+            "by_request": stats.by_request,
+            "bytes_received": stats.bytes_received,
+            "connections_opened": stats.connections_opened,
+            "timeline": stats.timeline_rows(),
+            "histogram": stats.histogram,
+        }
+
+
+def _worker_run(requests, options, start_at):
+    """Executado em cada processo do teste distribuído: roda o próprio laço e devolve as estatísticas."""
+    return asyncio.run(LoadGenerator(requests, **options).run_stats_async(start_at))
+
+
+def _split(total, parts):
+    base, extra = divmod(total, parts)
+    return [base + (1 if index < extra else 0) for index in range(parts)]
+
+
+def run_distributed(requests, processes=None, concurrency=10, rate=None, seed=None, **kwargs):
+    """
+    Teste de carga com N processos, cada um com seu laço asyncio, e relatório único.
+
+    Um único laço de eventos satura uma CPU bem antes dos serviços avaliados; aqui a
+    concorrência (e a taxa, no modelo aberto) é dividida entre os processos, que começam no
+    mesmo instante de relógio. Os histogramas, contadores e séries por segundo de cada
+    processo são somados — percentis exatos do conjunto, não médias de percentis.
+
+    Args:
+        processes: Número de processos (padrão: os.cpu_count(); no máximo `concurrency`).
+        Demais argumentos: os de LoadGenerator, para a carga total.
+    """
+    generator = LoadGenerator(requests, concurrency=concurrency, rate=rate, seed=seed, **kwargs)
+    processes = max(1, min(processes or os.cpu_count() or 1, generator.concurrency))
+    if processes == 1:
+        return generator.run()
+
+    start_at = time.time() + LOAD_TEST_START_DELAY
+    options = dict(kwargs, duration=generator.duration, ramp_up=generator.ramp_up)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [
+            pool.submit(_worker_run, generator.requests, dict(
+                options, concurrency=share, rate=rate / processes if rate else None,
+                seed=None if seed is None else seed + index,
+            ), start_at)
+            for index, share in enumerate(_split(generator.concurrency, processes))
+        ]
+        merged = LoadTestStats()
+        for future in futures:
+            merged.merge(future.result())
+    return generator.result_from_stats(merged, processes=processes)
+
+
+def run_load_test(requests, **kwargs):
+    """Atalho: LoadGenerator(requests, **kwargs).run()."""
+    return LoadGenerator(requests, **kwargs).run()
+
+
+def format_report(result, title="Resumo do Teste de Escalabilidade", endpoint=None):
+    """Resultado de um teste de carga em Markdown."""
+    latency = result["latency_ms"]
+    total = result["requests"]
+    error_rate = result["failures"] / total * 100 if total else 0.0
+    model = (f"aberto, {result['target_rate']:g} req/s (máx. {result['concurrency']} em voo)"
+             if result["model"] == "open" else f"fechado, {result['concurrency']} usuários virtuais")
+    if result.get("processes", 1) > 1:
+        model += f", {result['processes']} processos"
+    lines = [f"# {title}", ""]
+    if endpoint:
+        lines.append(f"**Endpoint Testado:** {endpoint}")
+    lines += [
+        f"**Modelo de carga:** {model}",
+        f"**Duração:** {result['duration_seconds']:.2f} s (ramp-up de {result['ramp_up_seconds']:g} s)", "",
+        "## Métricas Principais:",
+        f"- **Total de Requisições:** {total}",
+        f"- **Requisições Bem-sucedidas:** {result['successes']}",
+        f"- **Requisições Falhas:** {result['failures']} ({error_rate:.2f}%)",
+        f"- **Taxa de Transferência (Throughput):** {result['throughput_rps']:.2f} reqs/seg",
+        f"- **Latência (ms):** mín {latency['min']:.2f} | média {latency['mean']:.2f} | p50 {latency['p50']:.2f} | "
+        f"p95 {latency['p95']:.2f} | p99 {latency['p99']:.2f} | máx {latency['max']:.2f}",
+    ]
+    if result["dropped"]:
+        lines.append(f"- **Chegadas Descartadas (limite de concorrência):** {result['dropped']}")
+    if result["status_counts"]:
+        lines.append("- **Status HTTP:** " + ", ".join(f"{s}: {n}" for s, n in result["status_counts"].items()))
+    if result["errors"]:
+        lines += ["", "## Erros:"] + [f"- {name}: {count}" for name, count in result["errors"].items()]
+    if len(result["by_request"]) > 1:
+        lines += ["", "## Por Requisição:"] + [
+            f"- `{label}`: {data['requests']} requisições, {data['errors']} erros"
+            for label, data in result["by_request"].items()]
+    timeline = result.get("timeline") or []
+    if len(timeline) > 1:
+        # Testes longos: blocos de vários segundos (vazão média, pior p95/p99 entre os segundos do bloco)
+        size = -(-len(timeline) // TIMELINE_REPORT_ROWS)
+        lines += ["", "## Série Temporal:", "",
+                  "| Segundos | Reqs/seg | Erros | p50 (ms) | p95 (ms) | p99 (ms) |", "|---|---|---|---|---|---|"]
+        for offset in range(0, len(timeline), size):
+            block = timeline[offset:offset + size]
+            span = f"{block[0]['second']}" if len(block) == 1 else f"{block[0]['second']}–{block[-1]['second']}"
+            lines.append(
+                f"| {span} | {sum(row['requests'] for row in block) / len(block):.1f} | "
+                f"{sum(row['errors'] for row in block)} | {max(row['p50_ms'] for row in block):.2f} | "
+                f"{max(row['p95_ms'] for row in block):.2f} | {max(row['p99_ms'] for row in block):.2f} |")
+    return "\n".join(lines) + "\n"
+
+
+def write_timeline_csv(result, path):
+    """Grava a série por segundo (vazão, erros e latências) em CSV."""
+    columns = ["second", "requests", "errors", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(result["timeline"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Teste de carga HTTP (asyncio, vários processos).")
+    parser.add_argument("url", help="URL alvo (GET), ou base dos caminhos de --mix")
+    parser.add_argument("--users", type=int, default=10, help="Usuários virtuais / máximo em voo")
+    parser.add_argument("--duration", type=float, default=30, help="Duração em segundos")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Segundos de subida da carga")
+    parser.add_argument("--rate", type=float, default=None, help="Requisições/seg (modelo aberto)")
+    parser.add_argument("--processes", type=int, default=1, help="Processos geradores de carga (0 = CPUs)")
+    parser.add_argument("--mix", help="Arquivo JSON com a lista de requisições (method, path/url, body, weight)")
+    parser.add_argument("--timeline-csv", help="CSV de saída com a série por segundo")
+    args = parser.parse_args(argv)
+
+    if args.mix:
+        with open(args.mix, "r", encoding="utf-8") as f:
+            requests = [RequestSpec.from_dict(item, base_url=args.url) for item in json.load(f)]
+    else:
+        requests = [RequestSpec("GET", args.url)]
+    result = run_distributed(requests, processes=args.processes or None, concurrency=args.users,
+                             duration=args.duration, ramp_up=args.ramp_up, rate=args.rate)
+    print(format_report(result, endpoint=args.url))
+    if args.timeline_csv:
+        write_timeline_csv(result, args.timeline_csv)
+        print(f"Série temporal salva em {args.timeline_csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
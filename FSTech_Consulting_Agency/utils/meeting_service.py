@@ -1,12 +1,19 @@
 import streamlit as st
 import time
-from datetime import datetime, timedelta
 from FSTech_Consulting_Agency.utils.app_helpers import add_log
-from FSTech_Consulting_Agency.Suporte_Administrativo.tools.appointment_scheduler_manager import schedule_meeting_calcom
+from FSTech_Consulting_Agency.utils.calcom_availability import (
+    CALCOM_EVENT_TYPE_ID, SlotUnavailableError, describe_suggestions, get_availability)
+from FSTech_Consulting_Agency.utils.calcom_client import create_booking
+from FSTech_Consulting_Agency.utils.transcript_ingest import (
+    ComponentAnalyzer, PainPointAnalyzer, TranscriptFormatError, ingest_transcript)
 
 def process_transcription_upload(file_upload, session_state):
     """
     Processa o upload de um arquivo de transcrição/resumo de reunião.
+
+    O arquivo é lido em streaming (utils/transcript_ingest.py): a codificação é detectada,
+    boilerplate e trechos repetidos são descartados e os pontos de dor e componentes citados
+    são extraídos durante a leitura. Só o texto limpo (limitado) fica no session_state.
     
     Args:
         file_upload: Objeto UploadedFile do Streamlit
@@ -16,20 +23,37 @@ def process_transcription_upload(file_upload, session_state):
         bool: Indica se o upload foi bem-sucedido
     """
     if file_upload is not None:
+        # O Streamlit chama esta função a cada rerun: o mesmo arquivo não é reprocessado
+        upload_id = getattr(file_upload, "file_id", None) or (getattr(file_upload, "name", None), getattr(file_upload, "size", None))
+        previous = session_state.get("reuniao_ingestao") if hasattr(session_state, "get") else None
+        if previous and previous.get("upload_id") == upload_id and session_state.get("reuniao_transcricao"):
+            return True, "Transcrição recebida com sucesso!"
         try:
-            # Ler conteúdo do arquivo
-            content = file_upload.read().decode("utf-8")
+            if hasattr(file_upload, "seek"):
+                file_upload.seek(0)
+            ingestor = ingest_transcript(file_upload, analyzers=[ComponentAnalyzer(), PainPointAnalyzer()])
+            stats = ingestor.stats
             
             # Verificar se o conteúdo é válido
-            if len(content.strip()) < 10:
+            if stats["chars_kept"] < 10:
                 return False, "O arquivo de transcrição parece estar vazio ou conter muito pouco texto."
             
-            # Salvar a transcrição no session_state
-            session_state.reuniao_transcricao = content
+            # Salvar a transcrição limpa e o que foi extraído dela no session_state
+            results = ingestor.results()
+            session_state.reuniao_transcricao = ingestor.text
+            session_state.reuniao_pontos_dor = results["pain_points"]["points"]
+            session_state.reuniao_ingestao = dict(stats, upload_id=upload_id, components=results["components"])
             
-            add_log(session_state, f"Transcrição da reunião recebida ({len(content)} caracteres)", "Sistema")
+            add_log(session_state, f"Transcrição da reunião recebida ({stats['bytes_read']} bytes, {stats['encoding']}): "
+                    f"{stats['segments']} trechos mantidos, {stats['duplicates']} repetidos e "
+                    f"{stats['boilerplate']} de marcação descartados", "Sistema")
+            if stats["truncated"]:
+                add_log(session_state, f"Transcrição longa: mantidos os primeiros {stats['chars_kept']} caracteres "
+                        "(componentes e pontos de dor foram extraídos do arquivo inteiro)", "Sistema")
             return True, "Transcrição recebida com sucesso!"
             
+        except TranscriptFormatError as e:
+            return False, str(e)
         except Exception as e:
             return False, f"Erro ao processar arquivo: {str(e)}"
     
@@ -53,32 +77,36 @@ def schedule_client_meeting(client_name, client_email, briefing, session_state):
         meeting_title = f"FSTech Agency - Reunião com {client_name}"
         meeting_description = f"Briefing: {briefing[:200]}..."
         
-        # Data e hora proposta (1 dia útil a partir de agora)
-        proposed_date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-        proposed_time = "14:00:00"  # 14h (horário comercial)
+        # Próximo horário livre do tipo de evento, calculado localmente a partir da disponibilidade em cache
+        availability = get_availability()
+        free_slots = availability.find_free_slots(CALCOM_EVENT_TYPE_ID, count=1)
+        if not free_slots:
+            return False, "Nenhum horário livre no Cal.com nos próximos dias.", None
+        slot = free_slots[0]
         
-        # Chamar a API do Cal.com para agendar
-        meeting_data = schedule_meeting_calcom(
-            attendee_name=client_name,
-            attendee_email=client_email,
-            title=meeting_title,
-            description=meeting_description,
-            date=proposed_date,
-            time=proposed_time
-        )
+        try:
+            meeting_data = availability.book(
+                CALCOM_EVENT_TYPE_ID, slot["start"], slot["end"], create_booking,
+                attendee_name=client_name,
+                attendee_email=client_email,
+                title=meeting_title,
+                description=meeting_description
+            )
+        except SlotUnavailableError as e:
+            return False, f"{e} Próximos horários livres: {describe_suggestions(e.suggestions)}.", None
         
-        if meeting_data and 'id' in meeting_data:
+        if meeting_data and (meeting_data.get('id') or meeting_data.get('uid')):
             # Salvar ID da reunião no session_state
-            session_state.meeting_id = meeting_data['id']
+            session_state.meeting_id = meeting_data.get('id') or meeting_data.get('uid')
             
             # Adicionar log
             add_log(
                 session_state, 
-                f"Reunião agendada com {client_name} para {proposed_date} às {proposed_time}", 
+                f"Reunião agendada com {client_name} para {slot['label']}", 
                 "Suporte Administrativo"
             )
             
-            return True, "Reunião agendada com sucesso!", meeting_data
+            return True, f"Reunião agendada com sucesso para {slot['label']}!", meeting_data
         else:
             return False, "Erro ao agendar reunião. API não retornou ID.", None
             
@@ -1,16 +1,14 @@
-import os
-from openai import OpenAI
+from FSTech_Consulting_Agency.utils.openai_gateway import chat_completion
+
+EXTRACTOR_SYSTEM_PROMPT = "Você é um assistente especialista em negócios e análise de demandas."
+EXTRACTOR_TEMPERATURE = 0.13
+EXTRACTOR_MAX_TOKENS = 2100
 
 def extract_industry_and_challenge(briefing, model="gpt-4.1"):
     """
     Usa o modelo OpenAI para extrair setor e principal desafio a partir de um briefing.
     Retorna (industry, main_challenge)
     """
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
-        raise ValueError("OPENAI_API_KEY não encontrado nas variáveis de ambiente.")
-    client = OpenAI(api_key=openai_api_key)
-
     prompt = f"""
 A seguir está um briefing de uma demanda de cliente. Extraia:
 1. O setor de atuação (ex: Esportes, Tecnologia, Saúde, etc.)
@@ -20,17 +18,16 @@ Responda no formato:
 Setor: <setor>
 Desafio: <desafio>
 """
-    
-    completion = client.chat.completions.create(
+
+    # Chamada via gateway compartilhado (cliente único, limites de taxa, retentativas e cache)
+    content = chat_completion(
+        prompt,
+        system_prompt=EXTRACTOR_SYSTEM_PROMPT,
+        task_type="analytical",
         model=model,
-        messages=[
-            {"role": "system", "content": "Você é um assistente especialista em negócios e análise de demandas."},
-            {"role": "user", "content": prompt}
-        ],
-        max_tokens=2100,
-        temperature=0.13
-    )
-    content = completion.choices[0].message.content
+        temperature=EXTRACTOR_TEMPERATURE,
+        max_tokens=EXTRACTOR_MAX_TOKENS
+    ) or ""
     # Parse simples
     industry = ""
     main_challenge = ""
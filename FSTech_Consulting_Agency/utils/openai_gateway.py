@@ -0,0 +1,265 @@
+"""
+Gateway compartilhado para chamadas à API OpenAI.
+
+Todas as ferramentas que usam LLM devem passar por aqui. O gateway mantém um único
+cliente de longa duração (com pool de conexões HTTP), limita requisições e tokens por
+minuto com token buckets, limita a concorrência, refaz chamadas com backoff exponencial
+com jitter (respeitando o cabeçalho Retry-After) e consulta o cache persistente de
+respostas (utils/llm_cache.py) antes de ir à API.
+
+Pontos de entrada:
+    chat_completion(...)   -> versão síncrona
+    achat_completion(...)  -> versão asyncio
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+import weakref
+
+import openai
+from openai import AsyncOpenAI, OpenAI
+
+from FSTech_Consulting_Agency.utils.ai_config import MAX_TOKENS, OPENAI_LIMITS, get_model_config
+from FSTech_Consulting_Agency.utils.llm_cache import LLM_CACHE_ENABLED, get_llm_cache, get_llm_cache_stats, make_cache_key
+from FSTech_Consulting_Agency.utils.rate_limiter import TokenBucket
+
+REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", OPENAI_LIMITS["requests_per_minute"]))
+TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", OPENAI_LIMITS["tokens_per_minute"]))
+MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", OPENAI_LIMITS["max_concurrency"]))
+MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", OPENAI_LIMITS["max_retries"]))
+TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", OPENAI_LIMITS["timeout_seconds"]))
+
+# Backoff exponencial: base * 2^tentativa, limitado a BACKOFF_MAX_SECONDS, com jitter
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+class OpenAIConfigError(ValueError):
+    """Configuração ausente ou inválida (ex: OPENAI_API_KEY não definida)."""
+
+
+_request_bucket = TokenBucket(REQUESTS_PER_MINUTE)
+_token_bucket = TokenBucket(TOKENS_PER_MINUTE)
+_sync_semaphore = threading.BoundedSemaphore(MAX_CONCURRENCY)
+_async_semaphores = weakref.WeakKeyDictionary()
+_async_clients = weakref.WeakKeyDictionary()
+_client = None
+_client_lock = threading.Lock()
+
+_stats = {"requests": 0, "retries": 0, "rate_limited": 0, "errors": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name, amount=1):
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def _api_key():
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise OpenAIConfigError("OPENAI_API_KEY não encontrado nas variáveis de ambiente.")
+    return api_key
+
+
+def get_openai_client():
+    """Retorna o cliente síncrono compartilhado (criado no primeiro uso)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # Retentativas são feitas pelo gateway, não pelo SDK
+                _client = OpenAI(api_key=_api_key(), max_retries=0, timeout=TIMEOUT_SECONDS)
+    return _client
+
+
+def get_async_openai_client():
+    """Retorna o cliente assíncrono do event loop atual (um por loop)."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncOpenAI(api_key=_api_key(), max_retries=0, timeout=TIMEOUT_SECONDS)
+        _async_clients[loop] = client
+    return client
+
+
+def _async_semaphore():
+    loop = asyncio.get_running_loop()
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        _async_semaphores[loop] = semaphore
+    return semaphore
+
+
+def _estimate_tokens(messages, max_tokens):
+    """Estimativa conservadora de tokens (~4 caracteres por token) para o limitador TPM."""
+    prompt_chars = sum(len(m.get("content") or "") for m in messages)
+    return prompt_chars // 4 + (max_tokens or MAX_TOKENS["short"])
+
+
+def _retry_after_seconds(exc):
+    """Extrai o tempo sugerido pelo servidor (Retry-After / retry-after-ms), se houver."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            return None
+    return None
+
+
+def _is_retryable(exc):
+    if isinstance(exc, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)):
+        return True
+    return isinstance(exc, openai.APIStatusError) and exc.status_code in _RETRYABLE_STATUS
+
+
+def _backoff_delay(attempt, exc):
+    """Calcula a espera antes da próxima tentativa (Retry-After tem prioridade)."""
+    retry_after = _retry_after_seconds(exc)
+    if retry_after is not None:
+        if isinstance(exc, openai.RateLimitError):
+            _request_bucket.penalize(retry_after)
+        return retry_after + random.uniform(0, BACKOFF_BASE_SECONDS)
+    ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+def _build_request(user_prompt, system_prompt, task_type, model, temperature, max_tokens, response_format):
+    config = get_model_config(task_type)
+    model = model or config["model"]
+    temperature = config["temperature"] if temperature is None else temperature
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": user_prompt})
+    kwargs = {"model": model, "messages": messages, "temperature": temperature}
+    if max_tokens:
+        kwargs["max_tokens"] = max_tokens
+    if response_format:
+        kwargs["response_format"] = {"type": response_format}
+    cache_key = make_cache_key(
+        model, temperature, system_prompt, user_prompt,
+        max_tokens=max_tokens, response_format=response_format
+    )
+    return kwargs, cache_key
+
+
+def chat_completion(user_prompt, system_prompt=None, task_type="balanced", model=None, temperature=None,
+                    max_tokens=None, response_format=None, use_cache=True):
+    """
+    Executa uma chamada de chat completion pelo gateway compartilhado.
+
+    Args:
+        user_prompt: Conteúdo da mensagem do usuário.
+        system_prompt: (Opcional) Conteúdo da mensagem de sistema.
+        task_type: Tipo de tarefa usado em get_model_config ('creative', 'balanced', 'analytical', 'factual').
+        model: (Opcional) Sobrescreve o modelo padrão.
+        temperature: (Opcional) Sobrescreve a temperatura do tipo de tarefa.
+        max_tokens: (Opcional) Limite de tokens da resposta.
+        response_format: (Opcional) Ex: 'json_object'.
+        use_cache: Se True, consulta/preenche o cache persistente de respostas.
+
+    Returns:
+        str: Texto da resposta do modelo.
+
+    Raises:
+        OpenAIConfigError: Se OPENAI_API_KEY não estiver configurada (e a resposta não estiver em cache).
+        openai.OpenAIError: Se a chamada falhar após todas as tentativas.
+    """
+    kwargs, cache_key = _build_request(user_prompt, system_prompt, task_type, model, temperature, max_tokens, response_format)
+    use_cache = use_cache and LLM_CACHE_ENABLED
+    if use_cache:
+        cached = get_llm_cache().get(cache_key)
+        if cached is not None:
+            return cached
+
+    client = get_openai_client()
+    estimated_tokens = _estimate_tokens(kwargs["messages"], max_tokens)
+    attempt = 0
+    while True:
+        _request_bucket.acquire()
+        _token_bucket.acquire(estimated_tokens)
+        try:
+            with _sync_semaphore:
+                _count("requests")
+                completion = client.chat.completions.create(**kwargs)
+            break
+        except openai.OpenAIError as e:
+            if not _is_retryable(e) or attempt >= MAX_RETRIES:
+                _count("errors")
+                raise
+            if isinstance(e, openai.RateLimitError):
+                _count("rate_limited")
+            _count("retries")
+            time.sleep(_backoff_delay(attempt, e))
+            attempt += 1
+
+    content = completion.choices[0].message.content
+    if use_cache and content is not None:
+        get_llm_cache().set(cache_key, content, model=kwargs["model"])
+    return content
+
+
+async def achat_completion(user_prompt, system_prompt=None, task_type="balanced", model=None, temperature=None,
+                           max_tokens=None, response_format=None, use_cache=True):
+    """Versão asyncio de `chat_completion` (mesmos argumentos e retorno)."""
+    kwargs, cache_key = _build_request(user_prompt, system_prompt, task_type, model, temperature, max_tokens, response_format)
+    use_cache = use_cache and LLM_CACHE_ENABLED
+    if use_cache:
+        cached = get_llm_cache().get(cache_key)
+        if cached is not None:
+            return cached
+
+    client = get_async_openai_client()
+    estimated_tokens = _estimate_tokens(kwargs["messages"], max_tokens)
+    attempt = 0
+    while True:
+        await _request_bucket.acquire_async()
+        await _token_bucket.acquire_async(estimated_tokens)
+        try:
+            async with _async_semaphore():
+                _count("requests")
+                completion = await client.chat.completions.create(**kwargs)
+            break
+        except openai.OpenAIError as e:
+            if not _is_retryable(e) or attempt >= MAX_RETRIES:
+                _count("errors")
+                raise
+            if isinstance(e, openai.RateLimitError):
+                _count("rate_limited")
+            _count("retries")
+            await asyncio.sleep(_backoff_delay(attempt, e))
+            attempt += 1
+
+    content = completion.choices[0].message.content
+    if use_cache and content is not None:
+        get_llm_cache().set(cache_key, content, model=kwargs["model"])
+    return content
+
+
+def get_gateway_stats():
+    """
+    Retorna contadores do gateway (requisições, retentativas, 429s, erros) e, em "cache",
+    os do cache de respostas (get_llm_cache_stats: acertos, erros, taxa de acerto, entradas).
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["cache"] = get_llm_cache_stats() if LLM_CACHE_ENABLED else None
+    return stats
@@ -0,0 +1,296 @@
+"""
+Construção, validação e serialização de especificações OpenAPI 3.0 (blueprints de API).
+
+A especificação é montada como documento estruturado (dicts/listas) a partir dos recursos e
+modelos de dados informados, validada (caminhos, parâmetros de caminho, operationIds únicos,
+referências a schemas) e serializada por um serializador de verdade: PyYAML quando instalado
+(com o dumper em C, se disponível) e, sem ele, JSON — que também é YAML válido. O custo é
+linear no número de operações.
+
+As especificações geradas ficam num cache LRU em memória, endereçado pelo hash SHA-256 de
+(api_name, resources, data_models, formato): pedir de novo o mesmo blueprint é instantâneo.
+
+Formato de entrada:
+    resources = [{"path": "/clientes", "methods": ["GET", "POST"], "model": "Cliente"},
+                 {"path": "/clientes/{id}", "methods": ["GET", "PUT", "DELETE"]}]
+    data_models = {"Cliente": {"properties": {"nome": {"type": "string"}}, "required": ["nome"]}}
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+BLUEPRINT_CACHE_SIZE = int(os.getenv("FSTECH_BLUEPRINT_CACHE_SIZE", "128"))
+
+OPENAPI_VERSION = "3.0.3"
+HTTP_METHODS = ("get", "post", "put", "patch", "delete", "head", "options")
+SCHEMA_TYPES = ("string", "number", "integer", "boolean", "array", "object")
+# Chaves de propriedade copiadas dos modelos de dados para o schema
+_PROPERTY_KEYS = ("type", "format", "description", "enum", "items", "example", "default", "nullable",
+                  "minimum", "maximum", "minLength", "maxLength", "pattern", "$ref")
+
+_PATH_PARAM = re.compile(r"{([^{}/]+)}")
+_NON_IDENTIFIER = re.compile(r"[^0-9A-Za-z]+")
+
+try:
+    import yaml
+except ImportError:  # PyYAML é opcional: sem ele, a saída é JSON
+    yaml = None
+
+
+class BlueprintError(ValueError):
+    """Entrada ou especificação inválida. `problems` lista todos os problemas encontrados."""
+
+    def __init__(self, problems):
+        self.problems = list(problems)
+        super().__init__("; ".join(self.problems))
+
+
+def _schema_ref(name):
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def _operation_id(method, path, used):
+    base = method + "".join(part[:1].upper() + part[1:] for part in _NON_IDENTIFIER.split(path) if part)
+    operation_id, suffix = base, 2
+    while operation_id in used:
+        operation_id, suffix = f"{base}{suffix}", suffix + 1
+    used.add(operation_id)
+    return operation_id
+
+
+def _operation(method, path, model, operation_id, parameters):
+    """Operação com as respostas usuais do método (lista em GET de coleção, 201 em POST, 204 em DELETE)."""
+    name = path.rstrip("/").split("/")[-1] if path != "/" else "root"
+    operation = {"summary": f"{method.capitalize()} {name}", "operationId": operation_id}
+    if parameters:
+        operation["parameters"] = [
+            {"name": param, "in": "path", "required": True, "schema": {"type": "string"}} for param in parameters
+        ]
+    is_item = bool(parameters) and path.rstrip("/").endswith("}")
+    if method in ("post", "put", "patch") and model:
+        operation["requestBody"] = {"required": True, "content": {"application/json": {"schema": _schema_ref(model)}}}
+
+    if method == "get":
+        schema = (_schema_ref(model) if is_item else {"type": "array", "items": _schema_ref(model)}) if model else None
+        responses = {"200": {"description": "Sucesso"}}
+        if schema:
+            responses["200"]["content"] = {"application/json": {"schema": schema}}
+    elif method == "post":
+        responses = {"201": {"description": "Criado"}}
+        if model:
+            responses["201"]["content"] = {"application/json": {"schema": _schema_ref(model)}}
+    elif method == "delete":
+        responses = {"204": {"description": "Removido"}}
+    else:
+        responses = {"200": {"description": "Sucesso"}}
+    if method in ("post", "put", "patch"):
+        responses["400"] = {"description": "Requisição inválida"}
+    if parameters:
+        responses["404"] = {"description": "Não encontrado"}
+    operation["responses"] = responses
+    return operation
+
+
+def _schema(details):
+    schema = {"type": details.get("type", "object")}
+    if details.get("description"):
+        schema["description"] = details["description"]
+    properties = details.get("properties") or {}
+    if properties:
+        schema["properties"] = {
+            name: {key: prop[key] for key in _PROPERTY_KEYS if key in prop} or {"type": "string"}
+            for name, prop in properties.items()
+        }
+        for prop in schema["properties"].values():
+            if "type" not in prop and "$ref" not in prop:
+                prop["type"] = "string"
+    if details.get("required"):
+        schema["required"] = list(details["required"])
+    return schema
+
+
+def build_openapi_spec(api_name, resources, data_models, version="1.0.0"):
+    """
+    Monta a especificação OpenAPI como dict.
+
+    Cada recurso aceita "path", "methods" (padrão ["GET"]) e, opcionalmente, "model" (nome do
+    schema usado em corpo e respostas; padrão: o primeiro modelo de data_models), "summary"
+    e "description".
+    """
+    words = str(api_name).split()
+    subject = words[-2] if len(words) > 2 else "Recursos"
+    default_model = next(iter(data_models), None)
+    used_ids = set()
+    paths = {}
+    for resource in resources:
+        path = resource.get("path", "/unknown")
+        model = resource.get("model", default_model)
+        parameters = _PATH_PARAM.findall(path)
+        item = paths.setdefault(path, {})
+        for method in resource.get("methods", ["GET"]):
+            method = str(method).lower()
+            operation = _operation(method, path, model, _operation_id(method, path, used_ids), parameters)
+            for key in ("summary", "description"):
+                if resource.get(key):
+                    operation[key] = resource[key]
+            item[method] = operation
+
+    return {
+        "openapi": OPENAPI_VERSION,
+        "info": {"title": api_name, "version": version, "description": f"API para gerenciar {subject} na FSTech."},
+        "paths": paths,
+        "components": {"schemas": {name: _schema(details or {}) for name, details in data_models.items()}},
+    }
+
+
+def _refs(node):
+    """Gera todos os valores de "$ref" do documento (iterativo, sem recursão)."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get("$ref"), str):
+                yield node["$ref"]
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def validate_openapi_spec(spec):
+    """Lista de problemas da especificação (vazia se válida)."""
+    problems = []
+    if not str(spec.get("openapi", "")).startswith("3."):
+        problems.append("Campo 'openapi' deve indicar a versão 3.x.")
+    info = spec.get("info") or {}
+    if not info.get("title") or not info.get("version"):
+        problems.append("'info' precisa de 'title' e 'version'.")
+
+    operation_ids = set()
+    for path, item in (spec.get("paths") or {}).items():
+        if not isinstance(path, str) or not path.startswith("/"):
+            problems.append(f"Caminho '{path}' deve começar com '/'.")
+        if not item:
+            problems.append(f"Caminho '{path}' não tem operações.")
+        template_params = set(_PATH_PARAM.findall(str(path)))
+        for method, operation in item.items():
+            if method not in HTTP_METHODS:
+                problems.append(f"Método HTTP inválido '{method.upper()}' em '{path}'.")
+                continue
+            operation_id = operation.get("operationId")
+            if operation_id in operation_ids:
+                problems.append(f"operationId repetido: '{operation_id}'.")
+            operation_ids.add(operation_id)
+            declared = {p["name"] for p in operation.get("parameters", []) if p.get("in") == "path"}
+            if declared != template_params:
+                problems.append(f"Parâmetros de caminho de {method.upper()} {path} não batem com o template.")
+            if not operation.get("responses"):
+                problems.append(f"{method.upper()} {path} não declara respostas.")
+
+    schemas = (spec.get("components") or {}).get("schemas") or {}
+    for name, schema in schemas.items():
+        for prop_name, prop in (schema.get("properties") or {}).items():
+            if "type" in prop and prop["type"] not in SCHEMA_TYPES:
+                problems.append(f"Tipo inválido '{prop['type']}' em {name}.{prop_name}.")
+            if prop.get("type") == "array" and "items" not in prop:
+                problems.append(f"{name}.{prop_name} é array e precisa de 'items'.")
+    for ref in set(_refs(spec)):
+        prefix = "#/components/schemas/"
+        if not ref.startswith(prefix) or ref[len(prefix):] not in schemas:
+            problems.append(f"Referência sem schema correspondente: '{ref}'.")
+    return problems
+
+
+if yaml is not None:
+    class _SpecDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+        """Dumper sem âncoras/aliases (&id001), que confundem leitores de OpenAPI."""
+
+        def ignore_aliases(self, data):
+            return True
+
+
+def effective_format(output_format="yaml"):
+    """Formato realmente produzido: "yaml" só com o PyYAML instalado; senão, "json"."""
+    return "yaml" if output_format == "yaml" and yaml is not None else "json"
+
+
+def dump_spec(spec, output_format="yaml"):
+    """Serializa a especificação em YAML (PyYAML) ou JSON. Sem PyYAML, "yaml" cai em JSON."""
+    if effective_format(output_format) == "yaml":
+        return yaml.dump(spec, Dumper=_SpecDumper, sort_keys=False, allow_unicode=True, width=120)
+    return json.dumps(spec, ensure_ascii=False, indent=2)
+
+
+def blueprint_cache_key(api_name, resources, data_models, output_format="yaml"):
+    raw = json.dumps([api_name, resources, data_models, output_format], sort_keys=True, ensure_ascii=False,
+                     default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class BlueprintCache:
+    """Cache LRU em memória das especificações já serializadas."""
+
+    def __init__(self, max_entries=BLUEPRINT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_blueprint_cache():
+    """Retorna o cache de blueprints compartilhado do processo."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = BlueprintCache()
+    return _cache
+
+
+def generate_openapi_document(api_name, resources, data_models, output_format="yaml", cache=None):
+    """
+    Especificação OpenAPI serializada, do cache quando a mesma entrada já foi gerada.
+
+    Raises:
+        BlueprintError: Se a especificação montada não passar na validação.
+    """
+    cache = cache or get_blueprint_cache()
+    key = blueprint_cache_key(api_name, resources, data_models, output_format)
+    document = cache.get(key)
+    if document is None:
+        spec = build_openapi_spec(api_name, resources, data_models)
+        problems = validate_openapi_spec(spec)
+        if problems:
+            raise BlueprintError(problems)
+        document = dump_spec(spec, output_format)
+        cache.set(key, document)
+    return document
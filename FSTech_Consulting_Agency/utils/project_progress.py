@@ -0,0 +1,243 @@
+"""
+Visão de progresso de projetos inteiros (listas/pastas do ClickUp).
+
+Todas as tarefas das listas do projeto são buscadas com o cliente assíncrono (várias
+listas e páginas em paralelo, com concorrência limitada) e agregadas por status,
+responsável e marco. O agregado fica em cache por alguns segundos
+(FSTECH_PROGRESS_CACHE_TTL_SECONDS): painéis e coordenadores consultando os mesmos
+projetos ao mesmo tempo disparam uma única busca por projeto.
+
+Marco de uma tarefa: o campo personalizado "Marco"/"Milestone" (texto ou lista suspensa),
+senão a tarefa-mãe (subtarefas agrupadas sob o marco), senão "Sem marco".
+"""
+
+import asyncio
+import os
+import threading
+import time
+import unicodedata
+
+from FSTech_Consulting_Agency.utils.clickup_async import CLICKUP_ASYNC_CONCURRENCY, AsyncClickUpClient
+
+PROGRESS_CACHE_TTL_SECONDS = float(os.getenv("FSTECH_PROGRESS_CACHE_TTL_SECONDS", "60"))
+
+DONE_STATUS_TYPES = {"closed", "done"}
+DONE_STATUS_NAMES = {"concluida", "concluido", "projeto concluido", "complete", "completed", "done", "closed"}
+MILESTONE_FIELD_NAMES = {"marco", "milestone"}
+NO_MILESTONE = "Sem marco"
+UNASSIGNED = "Sem responsável"
+
+
+def _normalize(value):
+    value = unicodedata.normalize("NFKD", str(value or "")).encode("ascii", "ignore").decode("ascii")
+    return value.strip().casefold()
+
+
+def is_done(task):
+    """Tarefa concluída: status do tipo fechado/concluído ou com nome de conclusão."""
+    status = task.get("status") or {}
+    return status.get("type") in DONE_STATUS_TYPES or _normalize(status.get("status")) in DONE_STATUS_NAMES
+
+
+def milestone_of(task, names_by_id):
+    """Nome do marco de uma tarefa (campo personalizado, tarefa-mãe ou NO_MILESTONE)."""
+    for field in task.get("custom_fields") or []:
+        if _normalize(field.get("name")) not in MILESTONE_FIELD_NAMES or field.get("value") in (None, ""):
+            continue
+        value = field["value"]
+        options = (field.get("type_config") or {}).get("options")
+        if options:
+            for index, option in enumerate(options):
+                if value in (option.get("id"), option.get("orderindex"), index):
+                    return option.get("name") or str(value)
+        return str(value)
+    parent = task.get("parent")
+    if parent:
+        return names_by_id.get(parent, parent)
+    return NO_MILESTONE
+
+
+def _bucket():
+    return {"total": 0, "done": 0}
+
+
+def _finish(buckets):
+    return {
+        name: dict(counts, completion_pct=round(100 * counts["done"] / counts["total"], 1) if counts["total"] else 0.0)
+        for name, counts in sorted(buckets.items(), key=lambda item: -item[1]["total"])
+    }
+
+
+def aggregate_progress(tasks, now_ms=None):
+    """
+    Agrega as tarefas de um projeto.
+
+    Returns:
+        dict: total, done, completion_pct, overdue, by_status {status: quantidade},
+        by_assignee e by_milestone ({nome: {total, done, completion_pct}}).
+    """
+    now_ms = now_ms or int(time.time() * 1000)
+    names_by_id = {task.get("id"): task.get("name") for task in tasks}
+    by_status, by_assignee, by_milestone = {}, {}, {}
+    done = overdue = 0
+    for task in tasks:
+        finished = is_done(task)
+        done += finished
+        due = task.get("due_date")
+        if due and not finished and str(due).isdigit() and int(due) < now_ms:
+            overdue += 1
+        status_name = (task.get("status") or {}).get("status") or "sem status"
+        by_status[status_name] = by_status.get(status_name, 0) + 1
+        assignees = [a.get("username") or str(a.get("id")) for a in task.get("assignees") or []] or [UNASSIGNED]
+        for name in assignees:
+            bucket = by_assignee.setdefault(name, _bucket())
+            bucket["total"] += 1
+            bucket["done"] += finished
+        bucket = by_milestone.setdefault(milestone_of(task, names_by_id), _bucket())
+        bucket["total"] += 1
+        bucket["done"] += finished
+    return {
+        "total": len(tasks),
+        "done": done,
+        "completion_pct": round(100 * done / len(tasks), 1) if tasks else 0.0,
+        "overdue": overdue,
+        "by_status": dict(sorted(by_status.items(), key=lambda item: -item[1])),
+        "by_assignee": _finish(by_assignee),
+        "by_milestone": _finish(by_milestone),
+    }
+
+
+class ProjectProgressTracker:
+    """
+    Busca e agrega o progresso de projetos com cache de TTL curto.
+
+    Args:
+        concurrency: Máximo de chamadas simultâneas ao ClickUp.
+        ttl_seconds: Validade do agregado em cache (0 desativa o cache).
+        http: (Opcional) HTTPClient a usar; padrão: o cliente compartilhado do ClickUp.
+    """
+
+    def __init__(self, concurrency=CLICKUP_ASYNC_CONCURRENCY, ttl_seconds=PROGRESS_CACHE_TTL_SECONDS, http=None):
+        self.concurrency = concurrency
+        self.ttl_seconds = ttl_seconds
+        self._http = http
+        self._cache = {}  # chave -> (expira_em, valor)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.stats = {"hits": 0, "misses": 0, "lists_fetched": 0}
+
+    # --- cache ---
+
+    def _cached(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.stats["hits"] += 1
+                return entry[1]
+        return None
+
+    def _store(self, key, value):
+        if self.ttl_seconds:
+            with self._lock:
+                self._cache[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def invalidate(self, list_id=None):
+        """Descarta o agregado de uma lista (ou todo o cache)."""
+        with self._lock:
+            if list_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(("list", str(list_id)), None)
+
+    # --- busca ---
+
+    async def _fetch(self, list_ids=(), folder_ids=()):
+        async with AsyncClickUpClient(concurrency=self.concurrency, http=self._http) as client:
+            folders = await asyncio.gather(*(client.get_folder_lists(folder_id) for folder_id in folder_ids))
+            folder_lists = {folder_id: [str(item["id"]) for item in lists] for folder_id, lists in zip(folder_ids, folders)}
+            all_lists = list(dict.fromkeys([*map(str, list_ids), *(lid for lists in folder_lists.values() for lid in lists)]))
+            tasks = await asyncio.gather(*(client.list_tasks(list_id) for list_id in all_lists))
+        return folder_lists, dict(zip(all_lists, tasks))
+
+    def _list_progress(self, list_id, tasks, elapsed):
+        progress = aggregate_progress(tasks)
+        progress.update(list_ids=[list_id], fetched_at=time.time(), elapsed_seconds=round(elapsed, 3))
+        return progress
+
+    def projects_progress(self, list_ids, refresh=False):
+        """
+        Progresso de vários projetos (um por lista), com as listas fora do cache buscadas em paralelo.
+
+        Returns:
+            dict: {list_id: agregado} (ver aggregate_progress).
+        """
+        list_ids = [str(list_id) for list_id in dict.fromkeys(list_ids)]
+        result = {}
+        missing = []
+        for list_id in list_ids:
+            cached = None if refresh else self._cached(("list", list_id))
+            if cached is not None:
+                result[list_id] = cached
+            else:
+                missing.append(list_id)
+        if missing:
+            with self._lock:
+                self.stats["misses"] += len(missing)
+                self.stats["lists_fetched"] += len(missing)
+            start = time.perf_counter()
+            _, tasks_by_list = asyncio.run(self._fetch(list_ids=missing))
+            elapsed = time.perf_counter() - start
+            for list_id in missing:
+                result[list_id] = self._list_progress(list_id, tasks_by_list[list_id], elapsed)
+                self._store(("list", list_id), result[list_id])
+        return {list_id: result[list_id] for list_id in list_ids}
+
+    def project_progress(self, list_id=None, folder_id=None, refresh=False):
+        """
+        Progresso de um projeto: uma lista ou todas as listas de uma pasta.
+
+        Buscas simultâneas do mesmo projeto aguardam a primeira em vez de repetir as chamadas.
+        """
+        if not list_id and not folder_id:
+            raise ValueError("Informe list_id ou folder_id.")
+        if list_id:
+            with self._key_lock(("list", str(list_id))):
+                return self.projects_progress([list_id], refresh=refresh)[str(list_id)]
+
+        key = ("folder", str(folder_id))
+        with self._key_lock(key):
+            cached = None if refresh else self._cached(key)
+            if cached is not None:
+                return cached
+            with self._lock:
+                self.stats["misses"] += 1
+            start = time.perf_counter()
+            folder_lists, tasks_by_list = asyncio.run(self._fetch(folder_ids=[str(folder_id)]))
+            elapsed = time.perf_counter() - start
+            list_ids = folder_lists[str(folder_id)]
+            with self._lock:
+                self.stats["lists_fetched"] += len(list_ids)
+            for lid in list_ids:
+                self._store(("list", lid), self._list_progress(lid, tasks_by_list[lid], elapsed))
+            progress = aggregate_progress([task for lid in list_ids for task in tasks_by_list[lid]])
+            progress.update(list_ids=list_ids, fetched_at=time.time(), elapsed_seconds=round(elapsed, 3))
+            self._store(key, progress)
+            return progress
+
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+
+def get_progress_tracker():
+    """Retorna o rastreador de progresso compartilhado (cache comum a todas as consultas do processo)."""
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = ProjectProgressTracker()
+    return _tracker
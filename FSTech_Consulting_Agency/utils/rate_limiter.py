@@ -0,0 +1,72 @@
+"""
+Limitador de taxa do tipo token bucket, compartilhável entre threads e corrotinas.
+
+Usado pelas integrações externas (OpenAI, ClickUp, Cal.com) para respeitar limites
+de requisições e de tokens por minuto.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket com reabastecimento contínuo.
+
+    A aquisição funciona por reserva: o custo é debitado imediatamente (o saldo pode
+    ficar negativo) e quem chamou espera o tempo necessário para o saldo ser reposto.
+    Isso mantém a ordem de chegada e evita espera ativa.
+    """
+
+    def __init__(self, rate_per_minute, capacity=None):
+        """
+        Args:
+            rate_per_minute: Quantidade reposta por minuto. None ou 0 desativa o limite.
+            capacity: Tamanho máximo da rajada (padrão: igual a rate_per_minute).
+        """
+        self.rate_per_second = (rate_per_minute or 0) / 60.0
+        self.capacity = capacity or rate_per_minute or 0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self):
+        return self.rate_per_second <= 0
+
+    def _reserve(self, amount):
+        """Debita `amount` e retorna quantos segundos é preciso aguardar."""
+        if self.unlimited:
+            return 0.0
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+            self._updated = now
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    def acquire(self, amount=1):
+        """Bloqueia até que `amount` unidades estejam disponíveis. Retorna o tempo aguardado."""
+        wait = self._reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, amount=1):
+        """Versão assíncrona de `acquire` (não bloqueia o event loop)."""
+        wait = self._reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, seconds):
+        """Esvazia o balde por `seconds` (ex: após um 429 com Retry-After)."""
+        if self.unlimited or seconds <= 0:
+            return
+        with self._lock:
+            self._tokens = min(self._tokens, -seconds * self.rate_per_second)
+            self._updated = time.monotonic()
@@ -0,0 +1,393 @@
+"""
+Scanner estático de segurança por regras, usado pelo Assistente de Auditoria do Arquiteto.
+
+Percorre uma árvore de código ou um pacote de configurações do cliente e aplica um conjunto
+de regras compiladas (SECURITY_RULES): segredos expostos, configurações inseguras e chamadas
+perigosas. Cada regra tem um "hint" literal barato, testado antes da expressão regular, e
+vale só para os tipos de arquivo que fazem sentido (ex: chamadas de shell só em .py); arquivos
+sem nenhuma regra aplicável nem são lidos.
+
+Desempenho:
+    - a partir de SECURITY_SCAN_PROCESS_THRESHOLD arquivos, os arquivos são escaneados em
+      blocos num pool de processos (cada processo recebe as regras compiladas uma vez);
+    - no modo incremental (padrão), o resultado de cada arquivo fica num cache em
+      data/security_scans/ com tamanho, mtime e SHA-256: arquivos com o mesmo tamanho/mtime
+      nem são relidos, e os com o mesmo conteúdo não são reescaneados. Reexecutar a auditoria
+      num repositório com dezenas de milhares de arquivos leva só o tempo de listar a árvore.
+Mudar as regras invalida o cache.
+
+Linhas com "nosec" ou "fstech: ignore" são ignoradas (falsos positivos conhecidos).
+
+Uso:
+    python -m FSTech_Consulting_Agency.utils.security_scanner caminho/do/repo --processes 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SECURITY_SCAN_CACHE_DIR = os.getenv("FSTECH_SECURITY_SCAN_CACHE_DIR", os.path.join(BASE_DIR, "data", "security_scans"))
+SECURITY_SCAN_PROCESS_THRESHOLD = int(os.getenv("FSTECH_SECURITY_SCAN_PROCESS_THRESHOLD", "300"))
+SECURITY_SCAN_CHUNK_SIZE = int(os.getenv("FSTECH_SECURITY_SCAN_CHUNK_SIZE", "100"))
+SECURITY_SCAN_MAX_FILE_BYTES = int(os.getenv("FSTECH_SECURITY_SCAN_MAX_FILE_BYTES", str(2 * 1024 * 1024)))
+
+SEVERITIES = ("Alto", "Médio", "Baixo", "Informativo")
+
+SKIP_DIRS = {".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv", ".tox", ".mypy_cache",
+             ".pytest_cache", "dist", "build", ".next", ".terraform"}
+BINARY_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".ico", ".webp", ".pdf", ".zip", ".gz", ".tgz", ".bz2",
+                     ".xz", ".7z", ".jar", ".war", ".class", ".so", ".dll", ".exe", ".dylib", ".pyc", ".pyo",
+                     ".woff", ".woff2", ".ttf", ".eot", ".mp3", ".mp4", ".mov", ".avi", ".sqlite", ".sqlite3",
+                     ".db", ".parquet", ".pickle", ".pkl", ".bin", ".lock"}
+
+_SUPPRESS = re.compile(r"nosec|fstech:\s*ignore", re.IGNORECASE)
+
+_PY = (".py",)
+_JS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs")
+_CONFIG = (".yaml", ".yml", ".json", ".toml", ".ini", ".cfg", ".conf", ".properties", ".tf", ".tfvars")
+_ENV = (".env",)  # também .env.local, .env.production etc. (ver _extension_key)
+# Valores de exemplo que não são segredos reais
+_PLACEHOLDERS = (r"(?i)your|sua_|seu_|aqui|example|exemplo|changeme|placeholder|xxxx|\*\*\*|\$\{|<[^>]+>|dummy|fake"
+                 r"|test|simulat|simulad|sample|os\.getenv")
+
+# Cada regra: id, título, severidade, categoria, regex, hint (literal obrigatório, minúsculo, ou
+# tupla de alternativas),
+# arquivos (extensões/nomes; None = qualquer texto), recomendação e, opcionalmente,
+# "secret" (mascarar o trecho) e "exclude" (regex de valores de exemplo a ignorar).
+SECURITY_RULES = [
+    # --- segredos ---
+    {"id": "aws-access-key", "title": "Chave de acesso AWS no código", "severity": "Alto", "category": "Segredos",
+     "pattern": r"\b(?:AKIA|ASIA)[0-9A-Z]{16}\b", "hint": None, "secret": True,
+     "recommendation": "Revogar a chave e usar IAM Roles ou um cofre de segredos (AWS Secrets Manager)."},
+    {"id": "private-key", "title": "Chave privada versionada", "severity": "Alto", "category": "Segredos",
+     "pattern": r"-----BEGIN (?:RSA |EC |DSA |OPENSSH |PGP |ENCRYPTED )?PRIVATE KEY-----", "hint": "private key",
+     "recommendation": "Remover a chave do repositório (inclusive do histórico) e gerar um novo par."},
+    {"id": "provider-token", "title": "Token de serviço (GitHub/Slack/OpenAI/Stripe) no código", "severity": "Alto",
+     "category": "Segredos", "secret": True, "hint": None,
+     "pattern": r"\b(?:gh[pousr]_[A-Za-z0-9]{36}|xox[baprs]-[0-9A-Za-z-]{10,}|sk-(?:proj-)?[A-Za-z0-9_-]{32,}"
+                r"|sk_live_[0-9A-Za-z]{16,})\b",
+     "recommendation": "Revogar o token e lê-lo de variável de ambiente ou cofre de segredos."},
+    {"id": "hardcoded-secret", "title": "Senha/segredo com valor fixo no código", "severity": "Médio",
+     "category": "Segredos", "secret": True, "hint": ("pass", "senha", "secret", "key", "token"),
+     # Prefixo do nome limitado e ancorado no início do identificador: sem isso, linhas longas
+     # de [\w.-] (bundles minificados, base64url) custam tempo quadrático
+     "pattern": r"(?i)(?<![\w.-])[\w.-]{0,64}?(?:password|passwd|senha|secret|api_?key|apikey|access_?token|auth_?token)\b['\"]?"
+                r"\s*[:=]\s*['\"][^'\"\s]{8,}['\"]",
+     "exclude": _PLACEHOLDERS,
+     "recommendation": "Mover o valor para variável de ambiente/cofre de segredos e rotacioná-lo."},
+    {"id": "env-file-secret", "title": "Arquivo .env com segredo preenchido", "severity": "Médio",
+     "category": "Segredos", "files": _ENV, "secret": True, "hint": None,
+     "pattern": r"(?im)^\s*(?:export\s+)?[A-Z0-9_]*(?:KEY|SECRET|TOKEN|PASSWORD|SENHA)[A-Z0-9_]*\s*=\s*['\"]?[^\s'\"#]{6,}",
+     "exclude": _PLACEHOLDERS,
+     "recommendation": "Não versionar .env com valores reais; manter apenas um .env.example."},
+    # --- configurações inseguras ---
+    {"id": "tls-verify-disabled", "title": "Verificação de certificado TLS desativada", "severity": "Alto",
+     "category": "Configuração", "files": _PY + _JS, "hint": None,
+     "pattern": r"verify\s*=\s*False|CERT_NONE|_create_unverified_context|rejectUnauthorized\s*:\s*false"  # nosec
+                r"|NODE_TLS_REJECT_UNAUTHORIZED",  # nosec
+     "recommendation": "Manter a verificação de certificados ativa; usar um bundle de CA próprio se necessário."},
+    {"id": "debug-enabled", "title": "Modo debug habilitado", "severity": "Médio", "category": "Configuração",
+     "files": _PY + _CONFIG + _ENV, "hint": "debug",
+     "pattern": r"(?im)^\s*[\"']?DEBUG[\"']?\s*[:=]\s*[\"']?(?:true|1|on|yes)\b|\.run\([^)]*debug\s*=\s*True",
+     "recommendation": "Desativar o modo debug em produção (expõe stack traces e consoles interativos)."},
+    {"id": "cors-wildcard", "title": "CORS liberado para qualquer origem", "severity": "Médio",
+     "category": "Configuração", "files": _PY + _JS + _CONFIG, "hint": "*",
+     "pattern": r"(?i)access-control-allow-origin[\"']?\s*[:,=]\s*[\"']\*|allow_origins\s*=\s*\[\s*[\"']\*"
+                r"|origin\s*:\s*[\"']\*[\"']|CORS_ORIGIN_ALLOW_ALL\s*=\s*True",
+     "recommendation": "Restringir as origens permitidas às aplicações conhecidas."},
+    {"id": "open-ingress", "title": "Acesso liberado para 0.0.0.0/0", "severity": "Alto", "category": "Configuração",
+     "files": _CONFIG, "hint": "0.0.0.0/0", "pattern": r"0\.0\.0\.0/0",
+     "recommendation": "Limitar regras de entrada (security groups/firewall) a faixas de IP conhecidas."},
+    {"id": "public-bucket", "title": "Bucket/objeto com ACL pública", "severity": "Alto", "category": "Configuração",
+     "files": _CONFIG, "hint": "public-read", "pattern": r"public-read(?:-write)?",
+     "recommendation": "Bloquear acesso público aos buckets e servir arquivos por URLs assinadas/CDN."},
+    {"id": "privileged-container", "title": "Container privilegiado ou executando como root", "severity": "Alto",
+     "category": "Configuração", "files": _CONFIG + ("dockerfile",), "hint": None,
+     "pattern": r"(?im)privileged\s*:\s*true|^\s*USER\s+root\s*$|runAsNonRoot\s*:\s*false",
+     "recommendation": "Executar containers sem privilégios e com usuário não-root."},
+    # --- chamadas perigosas ---
+    {"id": "eval-exec", "title": "Uso de eval/exec", "severity": "Alto", "category": "Código",
+     "files": _PY + _JS, "hint": None, "pattern": r"(?<![\w.])(?:eval|exec)\s*\(|new\s+Function\s*\(",
+     "recommendation": "Evitar eval/exec com dados externos; usar parsers específicos (ex: ast.literal_eval, JSON)."},
+    {"id": "shell-injection", "title": "Comando de shell montado em tempo de execução", "severity": "Alto",
+     "category": "Código", "files": _PY + _JS, "hint": None,
+     "pattern": r"shell\s*=\s*True|os\.system\s*\(|os\.popen\s*\(|child_process\.exec(?:Sync)?\s*\(",
+     "recommendation": "Usar subprocess com lista de argumentos (sem shell) e validar as entradas."},
+    {"id": "unsafe-deserialization", "title": "Desserialização insegura", "severity": "Alto", "category": "Código",
+     "files": _PY, "hint": None,
+     "pattern": r"pickle\.loads?\s*\(|marshal\.loads?\s*\(|yaml\.load\s*\((?![^)]*Loader\s*=\s*(?:yaml\.)?C?SafeLoader)"
+                r"|yaml\.unsafe_load\s*\(",
+     "recommendation": "Não desserializar dados não confiáveis com pickle; usar yaml.safe_load e JSON."},
+    {"id": "sql-string-format", "title": "SQL montado com formatação de string", "severity": "Médio",
+     "category": "Código", "files": _PY, "hint": "execute",
+     "pattern": r"(?i)\.execute(?:many)?\s*\(\s*(?:f[\"'][^\"']*\{|[\"'][^\"']*[\"']\s*(?:%|\+|\.format\())",
+     "recommendation": "Usar consultas parametrizadas (placeholders do driver) em vez de formatar o SQL."},
+    {"id": "weak-hash", "title": "Hash fraco (MD5/SHA-1)", "severity": "Baixo", "category": "Código",
+     "files": _PY + _JS, "hint": None, "pattern": r"hashlib\.(?:md5|sha1)\s*\(|createHash\([\"'](?:md5|sha1)[\"']\)",
+     "recommendation": "Para senhas, usar bcrypt/argon2; para integridade, SHA-256 ou superior."},
+    {"id": "inner-html", "title": "Atribuição direta a innerHTML", "severity": "Médio", "category": "Código",
+     "files": _JS + (".html",), "hint": None, "pattern": r"\.innerHTML\s*=|dangerouslySetInnerHTML",
+     "recommendation": "Evitar HTML não sanitizado (XSS); usar textContent ou sanitizar (DOMPurify)."},
+]
+
+
+class SecurityRule:
+    """Regra compilada (picklable: pode ser enviada aos processos do pool)."""
+
+    def __init__(self, spec):
+        self.id = spec["id"]
+        self.title = spec["title"]
+        self.severity = spec["severity"]
+        self.category = spec["category"]
+        self.recommendation = spec["recommendation"]
+        self.regex = re.compile(spec["pattern"])
+        hint = spec.get("hint")
+        self.hint = (hint,) if isinstance(hint, str) else tuple(hint) if hint else None
+        self.files = tuple(spec["files"]) if spec.get("files") else None
+        self.secret = bool(spec.get("secret"))
+        self.exclude = re.compile(spec["exclude"]) if spec.get("exclude") else None
+        if self.severity not in SEVERITIES:
+            raise ValueError(f"Severidade inválida na regra {self.id}: {self.severity}")
+
+
+def compile_rules(rules=None):
+    return [SecurityRule(spec) for spec in (rules or SECURITY_RULES)]
+
+
+def rules_fingerprint(rules):
+    """Hash das regras (o cache incremental só vale para o mesmo conjunto de regras)."""
+    raw = json.dumps([(r.id, r.regex.pattern, r.files, r.hint, r.exclude and r.exclude.pattern) for r in rules])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _extension_key(name):
+    lower = name.lower()
+    if lower == ".env" or lower.startswith(".env."):
+        # .env.example/.sample/.template documentam as variáveis, sem valores reais
+        return ".env.example" if lower.endswith((".example", ".sample", ".template")) else ".env"
+    if lower == "dockerfile" or lower.startswith("dockerfile."):
+        return "dockerfile"
+    return os.path.splitext(lower)[1]
+
+
+def applicable_rules(name, rules):
+    key = _extension_key(name)
+    return [rule for rule in rules if rule.files is None or key in rule.files]
+
+
+def _mask(text):
+    return text[:4] + "*" * min(12, max(4, len(text) - 4))
+
+
+def scan_text(text, path, rules):
+    """Achados de um texto: [{"rule", "title", "severity", "category", "path", "line", "snippet"}]."""
+    findings = []
+    lowered = None
+    for rule in rules:
+        if rule.hint:
+            lowered = lowered if lowered is not None else text.lower()
+            if not any(hint in lowered for hint in rule.hint):
+                continue
+        for match in rule.regex.finditer(text):
+            if rule.exclude and rule.exclude.search(match.group(0)):
+                continue
+            start = text.rfind("\n", 0, match.start()) + 1
+            end = text.find("\n", match.end())
+            line_text = text[start:end if end >= 0 else len(text)]
+            if _SUPPRESS.search(line_text):
+                continue
+            snippet = line_text.strip()
+            if rule.secret:
+                snippet = snippet.replace(match.group(0).strip(), _mask(match.group(0).strip()))
+            findings.append({
+                "rule": rule.id, "title": rule.title, "severity": rule.severity, "category": rule.category,
+                "path": path, "line": text.count("\n", 0, match.start()) + 1, "snippet": snippet[:200],
+            })
+    return findings
+
+
+_worker_rules = None
+
+
+def _init_worker(rules):
+    global _worker_rules
+    _worker_rules = rules
+
+
+def _scan_file(root, relpath, cached_sha, rules):
+    """Escaneia um arquivo. Retorna a entrada de cache ({"sha256", "findings"} ou {"skipped"})."""
+    path = os.path.join(root, relpath)
+    try:
+        with open(path, "rb") as f:
+            data = f.read(SECURITY_SCAN_MAX_FILE_BYTES + 1)
+    except OSError as e:
+        return {"skipped": f"ilegível ({e.__class__.__name__})"}
+    if len(data) > SECURITY_SCAN_MAX_FILE_BYTES:
+        return {"skipped": "grande demais"}
+    if b"\0" in data[:8192]:
+        return {"skipped": "binário"}
+    sha = hashlib.sha256(data).hexdigest()
+    if sha == cached_sha:
+        return {"sha256": sha, "unchanged": True}
+    rules = applicable_rules(os.path.basename(relpath), rules)
+    return {"sha256": sha, "findings": scan_text(data.decode("utf-8", errors="replace"), relpath, rules),
+            "bytes": len(data)}
+
+
+def _scan_chunk(root, items, rules=None):
+    rules = rules or _worker_rules
+    return [(relpath, _scan_file(root, relpath, cached_sha, rules)) for relpath, cached_sha in items]
+
+
+def iter_source_files(root, rules):
+    """Gera (caminho relativo, os.stat_result) dos arquivos com alguma regra aplicável."""
+    for current, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in BINARY_EXTENSIONS or not applicable_rules(name, rules):
+                continue
+            path = os.path.join(current, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            yield os.path.relpath(path, root).replace(os.sep, "/"), stat
+
+
+def _cache_path(root, cache_dir):
+    digest = hashlib.sha256(os.path.abspath(root).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def _load_cache(path, fingerprint):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get("files", {}) if data.get("rules") == fingerprint else {}
+
+
+def _save_cache(path, root, fingerprint, files):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"root": os.path.abspath(root), "rules": fingerprint, "updated_at": time.time(), "files": files},
+                  f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def scan_tree(root, rules=None, processes=None, incremental=True, cache_dir=SECURITY_SCAN_CACHE_DIR,
+              chunk_size=SECURITY_SCAN_CHUNK_SIZE):
+    """
+    Escaneia uma árvore de arquivos.
+
+    Args:
+        root: Diretório (repositório ou pacote de configurações) a auditar.
+        rules: Regras compiladas (padrão: compile_rules()).
+        processes: Processos do pool (padrão: os.cpu_count()); 1 escaneia no processo atual.
+            O pool só é usado a partir de SECURITY_SCAN_PROCESS_THRESHOLD arquivos a escanear.
+        incremental: Reaproveita o cache de execuções anteriores (e o atualiza).
+        cache_dir: Diretório do cache incremental.
+
+    Returns:
+        dict: {"root", "findings" (ordenados por severidade), "severity_counts", "stats"}.
+    """
+    if not os.path.isdir(root):
+        raise FileNotFoundError(f"Diretório não encontrado: {root}")
+    start = time.perf_counter()
+    rules = rules or compile_rules()
+    fingerprint = rules_fingerprint(rules)
+    cache_file = _cache_path(root, cache_dir)
+    cached = _load_cache(cache_file, fingerprint) if incremental else {}
+
+    entries, pending = {}, []
+    for relpath, stat in iter_source_files(root, rules):
+        previous = cached.get(relpath)
+        signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        if previous and previous.get("size") == stat.st_size and previous.get("mtime_ns") == stat.st_mtime_ns:
+            entries[relpath] = previous
+        else:
+            entries[relpath] = dict(previous or {}, **signature)
+            pending.append((relpath, (previous or {}).get("sha256")))
+
+    processes = processes or os.cpu_count() or 1
+    workers = 1
+    if processes > 1 and len(pending) >= SECURITY_SCAN_PROCESS_THRESHOLD:
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        workers = min(processes, len(chunks))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rules,)) as pool:
+            results = [item for chunk in pool.map(_scan_chunk, [root] * len(chunks), chunks) for item in chunk]
+    else:
+        results = _scan_chunk(root, pending, rules)
+
+    stats = {"files": len(entries), "scanned": 0, "unchanged": 0, "reused": len(entries) - len(pending),
+             "skipped": 0, "bytes_scanned": 0}
+    for relpath, result in results:
+        entry = entries[relpath]
+        if "skipped" in result:
+            stats["skipped"] += 1
+            entry.pop("sha256", None)
+            entry["findings"] = []
+            entry["skipped"] = result["skipped"]
+        elif result.get("unchanged"):
+            stats["unchanged"] += 1
+        else:
+            stats["scanned"] += 1
+            stats["bytes_scanned"] += result["bytes"]
+            entry.pop("skipped", None)
+            entry.update(sha256=result["sha256"], findings=result["findings"])
+
+    if incremental:
+        _save_cache(cache_file, root, fingerprint, entries)
+
+    order = {severity: index for index, severity in enumerate(SEVERITIES)}
+    findings = sorted((finding for entry in entries.values() for finding in entry.get("findings", [])),
+                      key=lambda f: (order[f["severity"]], f["path"], f["line"]))
+    stats.update(processes=workers, elapsed_seconds=round(time.perf_counter() - start, 3))
+    return {
+        "root": os.path.abspath(root),
+        "findings": findings,
+        "severity_counts": {severity: sum(1 for f in findings if f["severity"] == severity) for severity in SEVERITIES},
+        "stats": stats,
+    }
+
+
+def recommendations_for(findings, rules=None):
+    """Recomendações (uma por regra disparada), na ordem dos achados."""
+    by_id = {rule.id: rule for rule in (rules or compile_rules())}
+    seen = dict.fromkeys(finding["rule"] for finding in findings)
+    return [f"{by_id[rule_id].title}: {by_id[rule_id].recommendation}" for rule_id in seen if rule_id in by_id]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Auditoria estática de segurança por regras.")
+    parser.add_argument("root", help="Diretório a escanear")
+    parser.add_argument("--processes", type=int, default=None, help="Processos do pool (padrão: CPUs)")
+    parser.add_argument("--full", action="store_true", help="Ignora o cache e reescaneia todos os arquivos")
+    parser.add_argument("--json", help="Grava os achados em JSON")
+    args = parser.parse_args(argv)
+
+    result = scan_tree(args.root, processes=args.processes, incremental=not args.full)
+    stats = result["stats"]
+    print(f"{stats['files']} arquivos em {stats['elapsed_seconds']}s ({stats['scanned']} escaneados, "
+          f"{stats['reused'] + stats['unchanged']} do cache, {stats['skipped']} ignorados, "
+          f"{stats['processes']} processo(s)).")
+    print(f"Achados por severidade: {result['severity_counts']}")
+    for finding in result["findings"][:50]:
+        print(f"[{finding['severity']}] {finding['path']}:{finding['line']} {finding['title']} — {finding['snippet']}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"Resultado salvo em {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+"""
+Motor de execução de grafos de etapas (DAG) para os fluxos da FSTech.
+
+Cada etapa declara explicitamente as chaves de contexto que consome (inputs) e as que
+produz (outputs). O motor executa em paralelo, num pool de threads, todas as etapas
+cujas entradas já estão disponíveis — etapas independentes (ex: criação da lead no
+ClickUp e extração de setor/desafio via IA) rodam ao mesmo tempo.
+
+Opcionalmente, um checkpoint (ex: utils/lead_checkpoint.LeadCheckpoint) permite retomar
+um grafo interrompido: etapas já concluídas com as mesmas entradas não são executadas.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class StageGraphError(Exception):
+    """Erro de definição do grafo ou falha de uma etapa sem fallback."""
+
+    def __init__(self, message, stage=None):
+        super().__init__(message)
+        self.stage = stage
+
+
+class Stage:
+    """
+    Etapa de um grafo de execução.
+
+    Args:
+        name: Nome único da etapa.
+        func: Função chamada com as entradas como argumentos nomeados; deve retornar
+            um dict contendo todas as chaves listadas em `outputs`.
+        inputs: Chaves de contexto necessárias para executar a etapa.
+        outputs: Chaves de contexto produzidas pela etapa.
+        fallback: (Opcional) Função chamada como fallback(erro, **entradas) quando `func`
+            falha; deve retornar o mesmo dict de saídas. Sem fallback, a falha interrompe o grafo.
+        restore_check: (Opcional) Função chamada com as saídas restauradas do checkpoint; se
+            retornar False (ex: o arquivo gerado foi apagado), a etapa é executada de novo.
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), fallback=None, restore_check=None):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.fallback = fallback
+        self.restore_check = restore_check
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, inputs={list(self.inputs)}, outputs={list(self.outputs)})"
+
+
+def validate_stage_graph(stages, available_keys=()):
+    """
+    Verifica se o grafo é executável: nomes e saídas únicos, entradas satisfeitas e ausência de ciclos.
+
+    Args:
+        stages: Lista de Stage.
+        available_keys: Chaves já presentes no contexto inicial.
+
+    Returns:
+        list: Nomes das etapas em uma ordem topológica válida.
+
+    Raises:
+        StageGraphError: Se o grafo for inválido.
+    """
+    producers = {}
+    names = set()
+    for stage in stages:
+        if stage.name in names:
+            raise StageGraphError(f"Etapa duplicada: {stage.name}", stage.name)
+        names.add(stage.name)
+        for key in stage.outputs:
+            if key in producers:
+                raise StageGraphError(f"Chave '{key}' produzida por mais de uma etapa ({producers[key]}, {stage.name})", stage.name)
+            producers[key] = stage.name
+
+    available = set(available_keys)
+    for stage in stages:
+        for key in stage.inputs:
+            if key not in available and key not in producers:
+                raise StageGraphError(f"Entrada '{key}' da etapa '{stage.name}' não é produzida por nenhuma etapa", stage.name)
+
+    order = []
+    done = set(available)
+    remaining = list(stages)
+    while remaining:
+        ready = [s for s in remaining if all(k in done for k in s.inputs)]
+        if not ready:
+            raise StageGraphError(f"Ciclo detectado entre as etapas: {[s.name for s in remaining]}")
+        for stage in ready:
+            order.append(stage.name)
+            done.update(stage.outputs)
+            remaining.remove(stage)
+    return order
+
+
+def _run_stage(stage, context):
+    kwargs = {key: context[key] for key in stage.inputs}
+    start = time.perf_counter()
+    used_fallback = False
+    try:
+        outputs = stage.func(**kwargs)
+    except Exception as e:
+        if stage.fallback is None:
+            raise
+        print(f"⚠️ Etapa '{stage.name}' falhou ({e}); usando fallback.")
+        outputs = stage.fallback(e, **kwargs)
+        used_fallback = True
+    elapsed = time.perf_counter() - start
+    outputs = outputs or {}
+    missing = [key for key in stage.outputs if key not in outputs]
+    if missing:
+        raise StageGraphError(f"Etapa '{stage.name}' não produziu as saídas: {missing}", stage.name)
+    return {key: outputs[key] for key in stage.outputs}, elapsed, used_fallback
+
+
+def _restore_stage(stage, context, checkpoint):
+    """Retorna as saídas gravadas no checkpoint para a etapa, se válidas para as entradas atuais."""
+    if checkpoint is None:
+        return None
+    outputs = checkpoint.load(stage.name, {key: context[key] for key in stage.inputs})
+    if outputs is None or any(key not in outputs for key in stage.outputs):
+        return None
+    outputs = {key: outputs[key] for key in stage.outputs}
+    if stage.restore_check is not None and not stage.restore_check(outputs):
+        return None
+    return outputs
+
+
+def run_stage_graph(stages, context, max_workers=4, on_stage_complete=None, checkpoint=None):
+    """
+    Executa um grafo de etapas, rodando em paralelo as etapas independentes.
+
+    Args:
+        stages: Lista de Stage.
+        context: Dict com as chaves iniciais (ex: briefing, ata_reuniao).
+        max_workers: Número máximo de etapas simultâneas.
+        on_stage_complete: (Opcional) Callback chamado como
+            on_stage_complete(nome_da_etapa, saidas, segundos) após cada etapa.
+        checkpoint: (Opcional) Objeto com load(etapa, entradas) -> saidas|None e
+            save(etapa, entradas, saidas). Etapas restauradas não são executadas
+            (o callback recebe segundos=0.0); saídas de fallback não são gravadas.
+
+    Returns:
+        dict: Novo contexto com as chaves iniciais e todas as saídas produzidas.
+
+    Raises:
+        StageGraphError: Se o grafo for inválido ou uma etapa sem fallback falhar.
+    """
+    context = dict(context)
+    validate_stage_graph(stages, context.keys())
+
+    pending = list(stages)
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stage") as executor:
+        while pending or running:
+            restored = True
+            while restored:
+                restored = False
+                for stage in [s for s in pending if all(k in context for k in s.inputs)]:
+                    pending.remove(stage)
+                    outputs = _restore_stage(stage, context, checkpoint)
+                    if outputs is None:
+                        snapshot = dict(context)
+                        running[executor.submit(_run_stage, stage, snapshot)] = (stage, snapshot)
+                        continue
+                    # Etapa restaurada do checkpoint: libera imediatamente as dependentes
+                    context.update(outputs)
+                    restored = True
+                    if on_stage_complete:
+                        on_stage_complete(stage.name, outputs, 0.0)
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, stage_context = running.pop(future)
+                try:
+                    outputs, elapsed, used_fallback = future.result()
+                except StageGraphError:
+                    _cancel(running, checkpoint)
+                    raise
+                except Exception as e:
+                    _cancel(running, checkpoint)
+                    raise StageGraphError(f"Etapa '{stage.name}' falhou: {e}", stage.name) from e
+                context.update(outputs)
+                if not used_fallback:
+                    _save_checkpoint(checkpoint, stage, stage_context, outputs)
+                if on_stage_complete:
+                    on_stage_complete(stage.name, outputs, elapsed)
+    return context
+
+
+def _save_checkpoint(checkpoint, stage, stage_context, outputs):
+    if checkpoint is not None:
+        checkpoint.save(stage.name, {key: stage_context[key] for key in stage.inputs}, outputs)
+
+
+def _cancel(running, checkpoint=None):
+    """Cancela as etapas ainda não iniciadas; com checkpoint, aguarda as em execução e grava as concluídas."""
+    for future in running:
+        future.cancel()
+    if checkpoint is None:
+        return
+    for future, (stage, stage_context) in running.items():
+        if future.cancelled():
+            continue
+        try:
+            outputs, _, used_fallback = future.result()
+        except Exception:
+            continue
+        if not used_fallback:
+            _save_checkpoint(checkpoint, stage, stage_context, outputs)
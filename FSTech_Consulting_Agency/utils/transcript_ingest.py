@@ -0,0 +1,340 @@
+"""
+Ingestão em streaming de transcrições de reunião, com memória limitada.
+
+Transcrições de workshops gravados chegam a vários MB (legendas .vtt/.srt exportadas, atas
+coladas de ferramentas de gravação). Em vez de `read().decode()` do arquivo inteiro:
+    - o arquivo é lido em blocos de TRANSCRIPT_CHUNK_BYTES e decodificado incrementalmente
+      (BOM UTF-8/UTF-16; sem BOM, UTF-8 e, se o início não for UTF-8 válido, cp1252);
+    - o texto vira segmentos (linhas normalizadas em NFC, espaços colapsados, linhas muito
+      longas quebradas), com a linha parcial carregada de um bloco para o outro;
+    - segmentos de "boilerplate" (cabeçalho WEBVTT, índices de legenda seguidos de intervalo de
+      tempo, tempos de SRT, marcações como [inaudível]) são descartados e carimbos de tempo no início da linha, removidos;
+    - segmentos repetidos (legendas "rolantes", trechos colados duas vezes) são descartados
+      com uma janela LRU de TRANSCRIPT_DEDUP_WINDOW hashes;
+    - cada segmento alimenta os analisadores (componentes do catálogo, pontos de dor) na hora,
+      e só os primeiros TRANSCRIPT_MAX_CHARS caracteres do texto limpo são guardados.
+
+Uso:
+    ingestor = ingest_transcript(arquivo, analyzers=[ComponentAnalyzer(), PainPointAnalyzer()])
+    ingestor.text, ingestor.results(), ingestor.stats
+"""
+
+import codecs
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+
+from FSTech_Consulting_Agency.utils.keyword_matcher import KeywordMatcher, normalize_text, tokenize
+
+TRANSCRIPT_CHUNK_BYTES = int(os.getenv("FSTECH_TRANSCRIPT_CHUNK_BYTES", "65536"))
+TRANSCRIPT_MAX_CHARS = int(os.getenv("FSTECH_TRANSCRIPT_MAX_CHARS", "500000"))
+TRANSCRIPT_DEDUP_WINDOW = int(os.getenv("FSTECH_TRANSCRIPT_DEDUP_WINDOW", "4096"))
+TRANSCRIPT_MAX_SEGMENT_CHARS = 2000
+TRANSCRIPT_MAX_PAIN_POINTS = 20
+
+# Marcas de ordem de bytes (a de UTF-8 precisa vir antes das de UTF-16 na verificação)
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Amostra usada para decidir entre UTF-8 e cp1252
+_DETECT_BYTES = 4096
+
+_TIMESTAMP = r"\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d{1,3})?"
+_TIME_RANGE = re.compile(rf"^{_TIMESTAMP}\s*-->\s*{_TIMESTAMP}")
+_CUE_NUMBER = re.compile(r"^\d+$")
+_TIMESTAMP_PREFIX = re.compile(rf"^[\[(]?{_TIMESTAMP}[\])]?\s*(?:[-–]\s*)?")
+_BOILERPLATE = re.compile(
+    r"^(?:webvtt\b.*|note\b.*|kind:.*|language:.*"
+    r"|\[(?:inaudivel|musica|risos|silencio|ruido|aplausos|pausa)\]"
+    r"|transcricao gerada automaticamente.*|esta transcricao foi gerada automaticamente.*)$"
+)
+
+
+class TranscriptFormatError(ValueError):
+    """Arquivo que não é uma transcrição em texto (ex: PDF)."""
+
+
+def _first_bytes(stream, chunk_bytes):
+    """Início do arquivo com ao menos _DETECT_BYTES bytes (BOM, assinatura e amostra para a codificação)."""
+    head = stream.read(chunk_bytes) or b""
+    while 0 < len(head) < _DETECT_BYTES:
+        more = stream.read(chunk_bytes)
+        if not more:
+            break
+        head += more
+    return head
+
+
+def _detect_encoding(head):
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
+
+
+def iter_text_chunks(stream, chunk_bytes=TRANSCRIPT_CHUNK_BYTES, stats=None):
+    """
+    Lê o arquivo binário em blocos e gera o texto decodificado incrementalmente.
+
+    Args:
+        stream: Objeto com read(n) em bytes (ex: UploadedFile do Streamlit, arquivo aberto em 'rb').
+        chunk_bytes: Tamanho de cada leitura.
+        stats: dict opcional atualizado com "encoding" e "bytes_read".
+
+    Raises:
+        TranscriptFormatError: Se o arquivo for um PDF.
+    """
+    stats = stats if stats is not None else {}
+    head = _first_bytes(stream, chunk_bytes)
+    if head.startswith(b"%PDF"):
+        raise TranscriptFormatError("Arquivos PDF não são suportados; envie a transcrição em .txt ou .md.")
+    encoding = _detect_encoding(head)
+    stats["encoding"] = encoding
+    stats["bytes_read"] = len(head)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    chunk = head
+    while chunk:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+        chunk = stream.read(chunk_bytes)
+        stats["bytes_read"] += len(chunk or b"")
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _split_long(line, max_chars):
+    while len(line) > max_chars:
+        cut = line.rfind(" ", 0, max_chars)
+        cut = cut if cut > 0 else max_chars
+        yield line[:cut]
+        line = line[cut:].lstrip()
+    if line:
+        yield line
+
+
+def iter_segments(text_chunks, max_segment_chars=TRANSCRIPT_MAX_SEGMENT_CHARS):
+    """Gera as linhas do texto (NFC, espaços colapsados, sem linhas vazias), bloco a bloco."""
+    carry = ""
+    for chunk in text_chunks:
+        lines = (carry + chunk).replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        carry = lines.pop()
+        if len(carry) > max_segment_chars:
+            # Linha sem quebra maior que um segmento: emite o que já dá e guarda o resto
+            pieces = list(_split_long(carry, max_segment_chars))
+            carry = pieces.pop() if pieces else ""
+            lines.extend(pieces)
+        for line in lines:
+            line = " ".join(unicodedata.normalize("NFC", line).split())
+            if line:
+                yield from _split_long(line, max_segment_chars)
+    carry = " ".join(unicodedata.normalize("NFC", carry).split())
+    if carry:
+        yield from _split_long(carry, max_segment_chars)
+
+
+def drop_cue_numbers(segments, stats=None):
+    """
+    Descarta os índices de legenda (SRT/VTT): linhas só com dígitos seguidas de um intervalo de
+    tempo ("00:01 --> 00:04"). Números soltos em atas comuns ("2024", "150000") são mantidos.
+    """
+    pending = None
+    for segment in segments:
+        if pending is not None:
+            if _TIME_RANGE.match(segment):
+                if stats is not None:
+                    stats["boilerplate"] = stats.get("boilerplate", 0) + 1
+            else:
+                yield pending
+            pending = None
+        if _CUE_NUMBER.match(segment):
+            pending = segment
+            continue
+        yield segment
+    if pending is not None:
+        yield pending
+
+
+def clean_segment(segment):
+    """Segmento sem carimbo de tempo inicial, ou None se for boilerplate."""
+    if _TIME_RANGE.match(segment):
+        return None
+    segment = _TIMESTAMP_PREFIX.sub("", segment, count=1).strip()
+    if not segment or _BOILERPLATE.match(normalize_text(segment)):
+        return None
+    return segment
+
+
+class ComponentAnalyzer:
+    """
+    Detecta, incrementalmente, os componentes do catálogo citados na transcrição.
+
+    As últimas palavras de cada segmento são reaproveitadas no seguinte, para que palavras-chave
+    de várias palavras quebradas entre linhas ("banco de" / "dados") também sejam encontradas.
+    """
+
+    name = "components"
+
+    def __init__(self, catalog=None):
+        if catalog is None:
+            from FSTech_Consulting_Agency.utils.component_catalog import get_component_catalog
+            catalog = get_component_catalog()
+        self.catalog = catalog
+        self._overlap = max((len(tokenize(k)) for k in catalog.matcher.keywords), default=1) - 1
+        self._tail = []
+        self._found = set()
+
+    def feed(self, segment):
+        tokens = self._tail + tokenize(segment)
+        self._found.update(index for _, index in self.catalog.matcher.scan_tokens(tokens))
+        self._tail = tokens[-self._overlap:] if self._overlap else []
+
+    def result(self):
+        hits, total = self.catalog.score_keywords(self._found)
+        return {
+            "components": [self.catalog.components[index] for index, _ in hits],
+            "component_scores": {self.catalog.components[index]: score for index, score in hits},
+            "score": total,
+            "complexity_level": self.catalog.complexity_level(total),
+        }
+
+
+class PainPointAnalyzer:
+    """Guarda os primeiros segmentos que descrevem dores do cliente (por palavras-gatilho)."""
+
+    name = "pain_points"
+
+    CUES = (
+        "problema", "problemas", "dificuldade", "dificuldades", "dor", "dores", "gargalo", "gargalos",
+        "demora", "demorado", "lento", "atraso", "atrasos", "manual", "manualmente", "retrabalho",
+        "erro", "erros", "perda", "perdemos", "custo alto", "caro", "reclamação", "reclamações",
+        "não conseguimos", "não temos", "falta de", "precisamos",
+    )
+
+    def __init__(self, limit=TRANSCRIPT_MAX_PAIN_POINTS, max_chars=300, cues=CUES):
+        self.limit = limit
+        self.max_chars = max_chars
+        self.matcher = KeywordMatcher(cues)
+        self.points = []
+        self.total = 0
+
+    def feed(self, segment):
+        if next(self.matcher.scan(segment), None) is None:
+            return
+        self.total += 1
+        if len(self.points) < self.limit:
+            self.points.append(segment[:self.max_chars])
+
+    def result(self):
+        return {"points": list(self.points), "total": self.total}
+
+
+class TranscriptIngestor:
+    """
+    Pipeline de ingestão: decodifica, segmenta, limpa, deduplica e alimenta os analisadores.
+
+    Args:
+        analyzers: Objetos com `name`, `feed(segmento)` e `result()`.
+        max_chars: Máximo de caracteres do texto limpo mantidos em `text` (os analisadores
+            veem o arquivo inteiro).
+        dedup_window: Quantos segmentos recentes são lembrados para descartar repetições.
+        chunk_bytes: Tamanho de cada leitura do arquivo.
+    """
+
+    def __init__(self, analyzers=None, max_chars=TRANSCRIPT_MAX_CHARS, dedup_window=TRANSCRIPT_DEDUP_WINDOW,
+                 chunk_bytes=TRANSCRIPT_CHUNK_BYTES):
+        self.analyzers = list(analyzers or [])
+        self.max_chars = max_chars
+        self.dedup_window = dedup_window
+        self.chunk_bytes = chunk_bytes
+        self._seen = OrderedDict()
+        self._parts = []
+        self.stats = {
+            "encoding": None, "bytes_read": 0, "segments": 0, "duplicates": 0, "boilerplate": 0,
+            "chars_kept": 0, "truncated": False, "elapsed_seconds": 0.0,
+        }
+
+    @property
+    def text(self):
+        """Texto limpo (até max_chars caracteres), um segmento por linha."""
+        return "\n".join(self._parts)
+
+    def _is_duplicate(self, segment):
+        key = hash(" ".join(tokenize(segment)))
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return True
+        self._seen[key] = None
+        if len(self._seen) > self.dedup_window:
+            self._seen.popitem(last=False)
+        return False
+
+    def feed_segment(self, segment):
+        """Processa um segmento já decodificado. Retorna True se ele foi mantido."""
+        segment = clean_segment(segment)
+        if segment is None:
+            self.stats["boilerplate"] += 1
+            return False
+        if self._is_duplicate(segment):
+            self.stats["duplicates"] += 1
+            return False
+        self.stats["segments"] += 1
+        for analyzer in self.analyzers:
+            analyzer.feed(segment)
+        if not self.stats["truncated"]:
+            needed = len(segment) + (1 if self._parts else 0)
+            if self.stats["chars_kept"] + needed <= self.max_chars:
+                self._parts.append(segment)
+                self.stats["chars_kept"] += needed
+            else:
+                self.stats["truncated"] = True
+        return True
+
+    def ingest(self, stream):
+        """Consome o arquivo inteiro, bloco a bloco. Raises: TranscriptFormatError."""
+        start = time.perf_counter()
+        segments = iter_segments(iter_text_chunks(stream, self.chunk_bytes, self.stats))
+        for segment in drop_cue_numbers(segments, self.stats):
+            self.feed_segment(segment)
+        self.stats["elapsed_seconds"] = round(self.stats["elapsed_seconds"] + time.perf_counter() - start, 3)
+        return self
+
+    def results(self):
+        """{nome do analisador: resultado}."""
+        return {analyzer.name: analyzer.result() for analyzer in self.analyzers}
+
+
+def ingest_transcript(stream, analyzers=None, **kwargs):
+    """Atalho: cria um TranscriptIngestor, consome o arquivo e o devolve."""
+    return TranscriptIngestor(analyzers, **kwargs).ingest(stream)
+
+
+def extract_pain_points(text, limit=TRANSCRIPT_MAX_PAIN_POINTS):
+    """Pontos de dor de uma transcrição já em memória (ex: resumo colado manualmente)."""
+    analyzer = PainPointAnalyzer(limit=limit)
+    for segment in drop_cue_numbers(iter_segments([text or ""])):
+        segment = clean_segment(segment)
+        if segment:
+            analyzer.feed(segment)
+    return analyzer.points
+
+
+def context_preview(context, max_chars=200):
+    """Cópia rasa do contexto para log, com textos longos abreviados ("início... (N caracteres)")."""
+    def shorten(value):
+        if isinstance(value, str) and len(value) > max_chars:
+            return f"{value[:max_chars]}... ({len(value)} caracteres)"
+        if isinstance(value, list) and any(isinstance(item, str) and len(item) > max_chars for item in value):
+            return [shorten(item) for item in value]
+        return value
+    return {key: shorten(value) for key, value in (context or {}).items()}
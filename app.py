@@ -11,22 +11,14 @@ project_path = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(project_path)
 
 # Import the orquestrador and other modules
-from FSTech_Consulting_Agency.orquestrador_fstech import (
-    fluxo_fstech, 
-    consultor_agent, 
-    suporte_agent, 
-    gerente_marketing_agent, 
-    coordenador_agent, 
-    especialista_agent, 
-    arquiteto_agent, 
-    ceo_agent,
-    analista_roi_agent,
-    orquestrador
-)
+# (agentes e ferramentas são carregados sob demanda pelo registro, não no início do script)
+from FSTech_Consulting_Agency.orquestrador_fstech import fluxo_fstech
+from FSTech_Consulting_Agency.utils.agent_registry import agent_tool_names, list_agents
 
-# Import ClickUp and Cal.com integrations
-from FSTech_Consulting_Agency.utils.clickup_client import create_crm_task, update_task_status
-from FSTech_Consulting_Agency.Suporte_Administrativo.tools.appointment_scheduler_manager import schedule_meeting_calcom
+# Import ClickUp integration
+# Atualizações de status vão para a fila write-behind: a interface não espera o ClickUp.
+# Cal.com, webhooks e ingestão de transcrições são importados só na etapa que os usa.
+from FSTech_Consulting_Agency.utils.clickup_client import create_crm_task, enqueue_task_status
 
 # Inicializar session_state com valores padrão
 from FSTech_Consulting_Agency.utils.app_helpers import initialize_session_state
@@ -35,6 +27,15 @@ initialize_session_state(st.session_state)
 # Importar funções auxiliares
 from FSTech_Consulting_Agency.utils.app_helpers import add_log, reset_session
 
+def _ensure_webhook_server():
+    """
+    Sobe o receptor embutido de webhooks do ClickUp (status das tarefas por push, sem polling)
+    quando a sessão passa a acompanhar uma tarefa do CRM. Uma única vez por processo, e só se
+    CLICKUP_WEBHOOK_SECRET estiver configurado.
+    """
+    from FSTech_Consulting_Agency.utils.clickup_webhook import start_webhook_server
+    start_webhook_server()
+
 # Wrappers para manter compatibilidade (opcional)
 def _add_log(message, agent="Sistema"):
     add_log(st.session_state, message, agent)
@@ -42,6 +43,17 @@ def _add_log(message, agent="Sistema"):
 def _reset_session():
     reset_session(st.session_state)
 
+def _queue_crm_status(status_key, status_name):
+    """Agenda a mudança de status da tarefa da sessão no CRM e registra no log se foi aceita ou recusada."""
+    try:
+        if enqueue_task_status(st.session_state.task_id, status_key):
+            _add_log(f"Status atualizado no CRM para '{status_name}'", "CRM")
+        else:
+            _add_log(f"Mudança de status no CRM para '{status_name}' recusada: transição não permitida "
+                     "a partir do status atual da tarefa", "Sistema")
+    except Exception as e:
+        _add_log(f"Erro ao atualizar status no CRM: {str(e)}", "Sistema")
+
 # Streamlit UI
 st.set_page_config(
     page_title="FSTech Consulting Agency",
@@ -92,34 +104,15 @@ st.sidebar.markdown("---")
 
 # Display available agents in sidebar
 st.sidebar.markdown("<h2 class='sub-header'>Agentes Disponíveis</h2>", unsafe_allow_html=True)
-agents = {
-    "Consultor de Diagnóstico": consultor_agent,
-    "Suporte Administrativo": suporte_agent,
-    "Gerente de Marketing Digital": gerente_marketing_agent,
-    "Coordenador de Projetos": coordenador_agent,
-    "Especialista Técnico": especialista_agent,
-    "Arquiteto de Software": arquiteto_agent,
-    "CEO": ceo_agent,
-    "Analista de ROI": analista_roi_agent
-}
+agents = {name: key for key, name in list_agents().items()}
 
 selected_agent = st.sidebar.selectbox("Visualizar detalhes do agente:", list(agents.keys()))
 with st.sidebar.expander(f"Detalhes: {selected_agent}", expanded=False):
-    agent = agents[selected_agent]
-    st.write(f"**Nome:** {agent.name}")
-    
-    # Get tools from the agent
-    tools_list = []
-    for tool in agent.tools:
-        if hasattr(tool, "__name__"):
-            tools_list.append(tool.__name__)
-        elif hasattr(tool, "__func__"):
-            tools_list.append(tool.__func__.__name__)
-        else:
-            tools_list.append(str(tool))
+    st.write(f"**Nome:** {selected_agent}")
     
+    # Ferramentas listadas a partir da especificação do agente (sem instanciá-lo)
     st.write("**Ferramentas:**")
-    for tool in tools_list:
+    for tool in agent_tool_names(agents[selected_agent]):
         st.write(f"- {tool}")
 
 # Main content
@@ -175,6 +168,7 @@ with tab_fluxo:
                         if task_id:
                             st.session_state.task_id = task_id
                             _add_log(f"Lead criado no CRM ClickUp com ID: {task_id}", "CRM")
+                            _ensure_webhook_server()
                         else:
                             _add_log("Não foi possível criar o registro no CRM. Continuando sem integração.", "Sistema")
                     except Exception as e:
@@ -279,11 +273,7 @@ Equipe FSTech Consulting Agency"""
                     if st.button("Confirmar Envio da Mensagem", type="primary"):
                         # Atualizar status no ClickUp para Contato Realizado
                         if st.session_state.task_id:
-                            try:
-                                update_task_status(st.session_state.task_id, "contato_realizado")
-                                _add_log("Status atualizado no CRM para 'Contato Realizado'", "CRM")
-                            except Exception as e:
-                                _add_log(f"Erro ao atualizar status no CRM: {str(e)}", "Sistema")
+                            _queue_crm_status("contato_realizado", "Contato Realizado")
                         
                         _add_log("Mensagem de abordagem enviada ao cliente", "Consultor de Diagnóstico")
                         st.success("Mensagem enviada! Status atualizado no CRM. Aguarde a resposta do cliente para agendar a reunião.")
@@ -337,11 +327,7 @@ Equipe FSTech Consulting Agency"""
                         if st.button("Sim, Reunião Confirmada✅", type="primary"):
                             # Update ClickUp task status
                             if st.session_state.task_id:
-                                try:
-                                    update_task_status(st.session_state.task_id, "reuniao_agendada")
-                                    _add_log("Status atualizado no CRM para 'Reunião Agendada'", "CRM")
-                                except Exception as e:
-                                    _add_log(f"Erro ao atualizar status no CRM: {str(e)}", "Sistema")
+                                _queue_crm_status("reuniao_agendada", "Reunião Agendada")
                             
                             # Salvar as informações de data e hora para reutilizar na etapa formal
                             st.session_state.data_reuniao_salva = st.session_state.data_proposta
@@ -406,6 +392,13 @@ Equipe FSTech Consulting Agency"""
                 # Usando o ID fixo do Cal.com (1585329)
                 event_type_id = 1585329
                 st.info(f"Usando ID de Evento do Cal.com: {event_type_id}")
+                # Próximos horários livres (disponibilidade em cache, calculada localmente)
+                try:
+                    from FSTech_Consulting_Agency.utils.calcom_availability import describe_suggestions, get_availability
+                    proximos = get_availability().find_free_slots(event_type_id, duration_minutes=60, count=3)
+                    st.caption(f"Próximos horários livres: {describe_suggestions(proximos)}")
+                except Exception as e:
+                    st.caption(f"Disponibilidade do Cal.com indisponível no momento: {e}")
             with col2:
                 hora_reuniao = st.time_input("Hora da Reunião", 
                                            value=st.session_state.get("hora_reuniao_salva", datetime.now().time()))
@@ -468,6 +461,7 @@ Equipe FSTech Consulting Agency"""
                                 st.error(f"Email '{email}' parece inválido. Por favor, verifique o formato do email.")
                             else:
                                 # Chamar a API do Cal.com
+                                from FSTech_Consulting_Agency.Suporte_Administrativo.tools.appointment_scheduler_manager import schedule_meeting_calcom
                                 result = schedule_meeting_calcom(
                                     event_type_id=int(event_type_id),
                                     start_time=start_iso,
@@ -526,11 +520,7 @@ Equipe FSTech Consulting Agency"""
                                 
                                 # Update ClickUp task status
                                 if st.session_state.task_id:
-                                    try:
-                                        update_task_status(st.session_state.task_id, "reuniao_agendada")
-                                        _add_log("Status atualizado no CRM para 'Reunião Agendada'", "CRM")
-                                    except Exception as e:
-                                        _add_log(f"Erro ao atualizar status no CRM: {str(e)}", "Sistema")
+                                    _queue_crm_status("reuniao_agendada", "Reunião Agendada")
                                 
                                 st.success(f"Reunião agendada com sucesso para {data_reuniao} às {hora_reuniao}")
                                 st.session_state.current_step = 4
@@ -550,11 +540,7 @@ Equipe FSTech Consulting Agency"""
                     
                     # Update ClickUp task status even for manual scheduling
                     if st.session_state.task_id:
-                        try:
-                            update_task_status(st.session_state.task_id, "reuniao_agendada")
-                            _add_log("Status atualizado no CRM para 'Reunião Agendada'", "CRM")
-                        except Exception as e:
-                            _add_log(f"Erro ao atualizar status no CRM: {str(e)}", "Sistema")
+                        _queue_crm_status("reuniao_agendada", "Reunião Agendada")
                             
                     st.success(f"Reunião agendada manualmente para {data_hora}")
                     st.session_state.current_step = 4
@@ -621,6 +607,7 @@ Equipe FSTech Consulting Agency"""
             # Se a reunião foi confirmada como realizada, solicitar upload de transcrição/resumo antes da proposta
             if 'reuniao_realizada' in st.session_state and st.session_state.reuniao_realizada:
                 from FSTech_Consulting_Agency.utils.meeting_service import process_transcription_upload
+                from FSTech_Consulting_Agency.utils.transcript_ingest import extract_pain_points
                 
                 st.markdown("#### Faça upload da transcrição e resumo da reunião realizada")
                 uploaded_file = st.file_uploader("Transcrição/Resumo da Reunião (.txt, .md, .pdf)", type=["txt", "md", "pdf"])
@@ -638,6 +625,8 @@ Equipe FSTech Consulting Agency"""
                 elif resumo_manual.strip():
                     if len(resumo_manual.strip()) > 10:  # Verificação mínima de conteúdo
                         st.session_state.reuniao_transcricao = resumo_manual.strip()
+                        st.session_state.reuniao_pontos_dor = extract_pain_points(st.session_state.reuniao_transcricao)
+                        st.session_state.reuniao_ingestao = None
                         _add_log(f"Resumo manual da reunião registrado ({len(resumo_manual)} caracteres)", "Sistema")
                         st.success("Resumo manual salvo com sucesso!")
                     else:
@@ -705,11 +694,7 @@ Equipe FSTech Consulting Agency"""
                         
                         # Update ClickUp task status
                         if st.session_state.task_id:
-                            try:
-                                update_task_status(st.session_state.task_id, "proposta_enviada")
-                                _add_log("Status atualizado no CRM para 'Proposta Enviada'", "CRM")
-                            except Exception as e:
-                                _add_log(f"Erro ao atualizar status no CRM: {str(e)}", "Sistema")
+                            _queue_crm_status("proposta_enviada", "Proposta Enviada")
                         
                         _add_log(f"Proposta gerada no valor de R$ {valor_proposta:.2f}", "Consultor de Diagnóstico")
                         time.sleep(1)  # Pequena pausa para feedback visual
@@ -750,16 +735,10 @@ Equipe FSTech Consulting Agency"""
                 if proposta_enviada:
                     # Update ClickUp task status to Proposta Enviada
                     if st.session_state.task_id:
-                        try:
-                            update_task_status(st.session_state.task_id, "proposta_enviada")
-                            _add_log("Status atualizado no CRM para 'Proposta Enviada'", "CRM")
-                            
-                            # Após confirmar o envio, automaticamente atualizar para Aguardando Resposta
-                            time.sleep(1) # Pequena pausa
-                            update_task_status(st.session_state.task_id, "aguardando_resposta")
-                            _add_log("Status atualizado no CRM para 'Aguardando Resposta'", "CRM")
-                        except Exception as e:
-                            _add_log(f"Erro ao atualizar status no CRM: {str(e)}", "Sistema")
+                        _queue_crm_status("proposta_enviada", "Proposta Enviada")
+                        # Após confirmar o envio, automaticamente atualizar para Aguardando Resposta
+                        # (a fila coalesce as duas transições em um único PUT)
+                        _queue_crm_status("aguardando_resposta", "Aguardando Resposta")
                     
                     _add_log("Proposta enviada ao cliente. Aguardando resposta.", "Consultor de Diagnóstico")
                     st.success("Status atualizado: Proposta enviada e aguardando resposta do cliente.")
@@ -783,11 +762,7 @@ Equipe FSTech Consulting Agency"""
                     if proposta_aceita:
                         # Update ClickUp status to Proposta Aceita
                         if st.session_state.task_id:
-                            try:
-                                update_task_status(st.session_state.task_id, "proposta_aceita")
-                                _add_log("Status atualizado no CRM para 'Proposta Aceita'", "CRM")
-                            except Exception as e:
-                                _add_log(f"Erro ao atualizar status no CRM: {str(e)}", "Sistema")
+                            _queue_crm_status("proposta_aceita", "Proposta Aceita")
                         
                         _add_log("🎉 Proposta aceita pelo cliente!", "Sistema")
                         st.success("Proposta aceita pelo cliente! Prosseguindo para confirmação de pagamento.")
@@ -827,11 +802,7 @@ Equipe FSTech Consulting Agency"""
                     if pagamento_realizado:
                         # Update ClickUp status to Venda Realizada
                         if st.session_state.task_id:
-                            try:
-                                update_task_status(st.session_state.task_id, "venda_realizada")
-                                _add_log("Status atualizado no CRM para 'Venda Realizada'", "CRM")
-                            except Exception as e:
-                                _add_log(f"Erro ao atualizar status no CRM: {str(e)}", "Sistema")
+                            _queue_crm_status("venda_realizada", "Venda Realizada")
                         
                         _add_log("💰 Pagamento recebido! Venda concluída com sucesso.", "Sistema")
                         st.success("Pagamento confirmado! A venda foi realizada com sucesso.")